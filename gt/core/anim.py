@@ -6,7 +6,11 @@ Code Namespace:
 """
 
 from gt.core.feedback import FeedbackMessage
+from dataclasses import dataclass, field
+import maya.api.OpenMayaAnim as apiOpenMayaAnim
+import maya.api.OpenMaya as apiOpenMaya
 import maya.cmds as cmds
+from array import array
 import logging
 
 # Logging Setup
@@ -113,6 +117,695 @@ def delete_double_keyframes():
         cmds.undoInfo(closeChunk=True, chunkName=function_name)
 
 
+# ------------------------------------------- Anim Curve Data -------------------------------------------
+# Tangent type names used by "cmds.keyTangent" and their "MFnAnimCurve" constants
+TANGENT_TYPE_NAMES = {
+    "fixed": apiOpenMayaAnim.MFnAnimCurve.kTangentFixed,
+    "linear": apiOpenMayaAnim.MFnAnimCurve.kTangentLinear,
+    "flat": apiOpenMayaAnim.MFnAnimCurve.kTangentFlat,
+    "spline": apiOpenMayaAnim.MFnAnimCurve.kTangentSmooth,
+    "step": apiOpenMayaAnim.MFnAnimCurve.kTangentStep,
+    "slow": apiOpenMayaAnim.MFnAnimCurve.kTangentSlow,
+    "fast": apiOpenMayaAnim.MFnAnimCurve.kTangentFast,
+    "clamped": apiOpenMayaAnim.MFnAnimCurve.kTangentClamped,
+    "plateau": apiOpenMayaAnim.MFnAnimCurve.kTangentPlateau,
+    "stepnext": apiOpenMayaAnim.MFnAnimCurve.kTangentStepNext,
+    "auto": apiOpenMayaAnim.MFnAnimCurve.kTangentAuto,
+}
+DEFAULT_TANGENT_TYPE = "auto"  # Also used for global (unresolved) tangents and unknown names
+TIME_ANIM_CURVE_TYPES = ["animCurveTA", "animCurveTL", "animCurveTT", "animCurveTU"]
+
+
+def get_tangent_type_name(tangent_type):
+    """
+    Gets the name of a tangent type. (The name used by "cmds.keyTangent")
+
+    Args:
+        tangent_type (int): Tangent type constant. e.g. "MFnAnimCurve.kTangentLinear"
+
+    Returns:
+        str: Tangent type name. e.g. "linear". Unknown types return "auto"
+    """
+    for name, value in TANGENT_TYPE_NAMES.items():
+        if value == tangent_type:
+            return name
+    return DEFAULT_TANGENT_TYPE
+
+
+def get_tangent_type_value(tangent_name):
+    """
+    Gets the tangent type constant from its name. (The name used by "cmds.keyTangent")
+
+    Args:
+        tangent_name (str): Tangent type name. e.g. "linear"
+
+    Returns:
+        int: Tangent type constant. e.g. "MFnAnimCurve.kTangentLinear". Unknown names return "kTangentAuto"
+    """
+    return TANGENT_TYPE_NAMES.get(tangent_name, TANGENT_TYPE_NAMES.get(DEFAULT_TANGENT_TYPE))
+
+
+def get_anim_curve_type_from_attr(attr_path):
+    """
+    Gets the type of time anim curve used to animate an attribute. e.g. "animCurveTA" for a rotation channel.
+
+    Args:
+        attr_path (str): Path to the attribute. e.g. "pCube1.rotateX"
+
+    Returns:
+        str: "animCurveTA" (angle), "animCurveTL" (distance), "animCurveTT" (time) or "animCurveTU" (other)
+    """
+    attr_type = cmds.getAttr(attr_path, type=True)
+    return {"doubleAngle": "animCurveTA", "doubleLinear": "animCurveTL", "time": "animCurveTT"}.get(
+        attr_type, "animCurveTU"
+    )
+
+
+def _get_value_internal_factor(curve_type):
+    """
+    Gets the factor that converts a key value from UI units to internal units. (UI * factor = Internal)
+    Values are stored in UI units (same as "cmds.keyframe"), but "MFnAnimCurve" uses internal units.
+
+    Args:
+        curve_type (str): Anim curve type. e.g. "animCurveTA"
+
+    Returns:
+        float: Conversion factor. 1.0 for unitless curves.
+    """
+    if curve_type in ("animCurveTA", "animCurveUA"):
+        return apiOpenMaya.MAngle(1.0, apiOpenMaya.MAngle.uiUnit()).asRadians()
+    if curve_type in ("animCurveTL", "animCurveUL"):
+        return apiOpenMaya.MDistance(1.0, apiOpenMaya.MDistance.uiUnit()).asCentimeters()
+    if curve_type in ("animCurveTT", "animCurveUT"):
+        return apiOpenMaya.MTime(1.0, apiOpenMaya.MTime.uiUnit()).asUnits(apiOpenMaya.MTime.kSeconds)
+    return 1.0
+
+
+@dataclass
+class AnimCurveData:
+    """
+    Compact description of an anim curve. Each key property is stored in its own array (one item per key).
+    Times and values use UI units (same as "cmds.keyframe"), tangent angles use degrees.
+
+    Attributes:
+        curve_type (str, optional): Anim curve node type. e.g. "animCurveTA". (When applied, the type comes from the
+                                    target attribute)
+        times (array): Key times (frames) or inputs for driven keys (unitless curves)
+        values (array): Key values.
+        in_angles (array): In tangent angles (degrees)
+        out_angles (array): Out tangent angles (degrees)
+        in_weights (array): In tangent weights.
+        out_weights (array): Out tangent weights.
+        in_tangent_types (array): In tangent types. ("MFnAnimCurve" constants, see "TANGENT_TYPE_NAMES")
+        out_tangent_types (array): Out tangent types. ("MFnAnimCurve" constants, see "TANGENT_TYPE_NAMES")
+        tangents_locked (array): Tangent lock state (0 or 1)
+        weights_locked (array): Weight lock state (0 or 1)
+        is_weighted (bool): If the curve uses weighted tangents.
+        pre_infinity (int): Pre-infinity type. ("MFnAnimCurve" constant, e.g. "kConstant")
+        post_infinity (int): Post-infinity type. ("MFnAnimCurve" constant, e.g. "kConstant")
+    """
+
+    curve_type: str = field(default=None)
+    times: array = field(default_factory=lambda: array("d"))
+    values: array = field(default_factory=lambda: array("d"))
+    in_angles: array = field(default_factory=lambda: array("d"))
+    out_angles: array = field(default_factory=lambda: array("d"))
+    in_weights: array = field(default_factory=lambda: array("d"))
+    out_weights: array = field(default_factory=lambda: array("d"))
+    in_tangent_types: array = field(default_factory=lambda: array("i"))
+    out_tangent_types: array = field(default_factory=lambda: array("i"))
+    tangents_locked: array = field(default_factory=lambda: array("b"))
+    weights_locked: array = field(default_factory=lambda: array("b"))
+    is_weighted: bool = field(default=False)
+    pre_infinity: int = field(default=0)
+    post_infinity: int = field(default=0)
+
+    _key_arrays = (
+        "times",
+        "values",
+        "in_angles",
+        "out_angles",
+        "in_weights",
+        "out_weights",
+        "in_tangent_types",
+        "out_tangent_types",
+        "tangents_locked",
+        "weights_locked",
+    )
+
+    def __len__(self):
+        """
+        Gets the number of keys.
+
+        Returns:
+            int: Number of keys in the curve data.
+        """
+        return len(self.times)
+
+    def add_key(
+        self,
+        time,
+        value,
+        in_angle=0.0,
+        out_angle=0.0,
+        in_weight=1.0,
+        out_weight=1.0,
+        in_tangent_type=DEFAULT_TANGENT_TYPE,
+        out_tangent_type=DEFAULT_TANGENT_TYPE,
+        tangents_locked=True,
+        weights_locked=False,
+    ):
+        """
+        Adds a key to the end of the curve data. (Keys are expected to be added in time order)
+
+        Args:
+            time (float): Key time (frame)
+            value (float): Key value (UI units)
+            in_angle (float, optional): In tangent angle (degrees)
+            out_angle (float, optional): Out tangent angle (degrees)
+            in_weight (float, optional): In tangent weight.
+            out_weight (float, optional): Out tangent weight.
+            in_tangent_type (str, int, optional): In tangent type. Name (e.g. "linear") or "MFnAnimCurve" constant.
+            out_tangent_type (str, int, optional): Out tangent type. Name (e.g. "linear") or "MFnAnimCurve" constant.
+            tangents_locked (bool, optional): If the in and out tangents are locked.
+            weights_locked (bool, optional): If the tangent weights are locked.
+        """
+        if isinstance(in_tangent_type, str):
+            in_tangent_type = get_tangent_type_value(in_tangent_type)
+        if isinstance(out_tangent_type, str):
+            out_tangent_type = get_tangent_type_value(out_tangent_type)
+        self.times.append(time)
+        self.values.append(value)
+        self.in_angles.append(in_angle)
+        self.out_angles.append(out_angle)
+        self.in_weights.append(in_weight)
+        self.out_weights.append(out_weight)
+        self.in_tangent_types.append(int(in_tangent_type))
+        self.out_tangent_types.append(int(out_tangent_type))
+        self.tangents_locked.append(int(bool(tangents_locked)))
+        self.weights_locked.append(int(bool(weights_locked)))
+
+    def invert_values(self):
+        """
+        Inverts values and tangent angles, so the curve is mirrored vertically. (e.g. 5 becomes -5)
+        Weights are lengths, so they are not affected.
+        """
+        self.values = array("d", [-value for value in self.values])
+        self.in_angles = array("d", [-angle for angle in self.in_angles])
+        self.out_angles = array("d", [-angle for angle in self.out_angles])
+
+    def remove_keys(self, start_time, end_time):
+        """
+        Removes the keys found within a time range (inclusive). e.g. Before merging a baked range into a curve.
+
+        Args:
+            start_time (float): First time of the range (frame)
+            end_time (float): Last time of the range (frame)
+        """
+        kept_indices = [index for index, time in enumerate(self.times) if time < start_time or time > end_time]
+        for name in self._key_arrays:
+            values = getattr(self, name)
+            setattr(self, name, array(values.typecode, [values[index] for index in kept_indices]))
+
+    def merge(self, other):
+        """
+        Merges the keys of another curve data into this one. Keys at the same time are replaced by the other keys.
+
+        Args:
+            other (AnimCurveData): Curve data to merge into this one.
+        """
+        keys = {time: (self, index) for index, time in enumerate(self.times)}
+        keys.update({time: (other, index) for index, time in enumerate(other.times)})
+        merged = {name: array(getattr(self, name).typecode) for name in self._key_arrays}
+        for time in sorted(keys):
+            source, index = keys.get(time)
+            for name in self._key_arrays:
+                merged[name].append(getattr(source, name)[index])
+        for name, values in merged.items():
+            setattr(self, name, values)
+        self.is_weighted = self.is_weighted or other.is_weighted
+
+    def to_dict(self):
+        """
+        Gets the curve data as a dictionary that can be serialized. (e.g. JSON)
+
+        Returns:
+            dict: Curve data. Tangent types are stored using their names. e.g. "linear"
+        """
+        data = {name: list(getattr(self, name)) for name in self._key_arrays}
+        data["in_tangent_types"] = [get_tangent_type_name(value) for value in self.in_tangent_types]
+        data["out_tangent_types"] = [get_tangent_type_name(value) for value in self.out_tangent_types]
+        data["curve_type"] = self.curve_type
+        data["is_weighted"] = self.is_weighted
+        data["pre_infinity"] = self.pre_infinity
+        data["post_infinity"] = self.post_infinity
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Creates curve data from a dictionary. (See "to_dict")
+
+        Args:
+            data (dict): Curve data dictionary.
+
+        Returns:
+            AnimCurveData: The new curve data object.
+        """
+        curve_data = cls(
+            curve_type=data.get("curve_type"),
+            is_weighted=bool(data.get("is_weighted", False)),
+            pre_infinity=int(data.get("pre_infinity", 0)),
+            post_infinity=int(data.get("post_infinity", 0)),
+        )
+        for name in cls._key_arrays:
+            values = data.get(name, [])
+            if name in ("in_tangent_types", "out_tangent_types"):
+                values = [get_tangent_type_value(value) if isinstance(value, str) else value for value in values]
+            setattr(curve_data, name, array(getattr(curve_data, name).typecode, values))
+        return curve_data
+
+    def to_key_rows(self):
+        """
+        Gets the curve data as one row per key. Format used by the "biped_rig_interface" ".anim" files:
+        (time, value, in_angle, out_angle, weights_locked, in_weight, out_weight, in_tangent_type, out_tangent_type)
+
+        Returns:
+            list: A list of tuples, one per key. Tangent types are stored using their names.
+        """
+        return [
+            (
+                self.times[index],
+                self.values[index],
+                self.in_angles[index],
+                self.out_angles[index],
+                bool(self.weights_locked[index]),
+                self.in_weights[index],
+                self.out_weights[index],
+                get_tangent_type_name(self.in_tangent_types[index]),
+                get_tangent_type_name(self.out_tangent_types[index]),
+            )
+            for index in range(len(self))
+        ]
+
+    @classmethod
+    def from_key_rows(cls, rows, curve_type=None):
+        """
+        Creates curve data from one row per key. (See "to_key_rows")
+
+        Args:
+            rows (list): A list of rows (lists or tuples), one per key.
+            curve_type (str, optional): Anim curve node type. e.g. "animCurveTA"
+
+        Returns:
+            AnimCurveData: The new curve data object.
+        """
+        curve_data = cls(curve_type=curve_type)
+        for row in sorted(rows, key=lambda key_row: key_row[0]):
+            time, value, in_angle, out_angle, weights_locked, in_weight, out_weight, in_type, out_type = row
+            curve_data.add_key(
+                time=time,
+                value=value,
+                in_angle=in_angle,
+                out_angle=out_angle,
+                in_weight=in_weight,
+                out_weight=out_weight,
+                in_tangent_type=in_type,
+                out_tangent_type=out_type,
+                weights_locked=weights_locked,
+            )
+        return curve_data
+
+
+def _get_depend_node(node_name):
+    """
+    Gets the MObject of a node from its name.
+
+    Args:
+        node_name (str): Name of the node.
+
+    Returns:
+        MObject: The node MObject.
+    """
+    selection = apiOpenMaya.MSelectionList()
+    selection.add(node_name)
+    return selection.getDependNode(0)
+
+
+def get_anim_curve_data(anim_curve):
+    """
+    Reads all keys of an anim curve in a single "MFnAnimCurve" pass.
+    (Replaces querying "cmds.keyframe" and "cmds.keyTangent" once per key property)
+
+    Args:
+        anim_curve (str): Name of the anim curve node. e.g. "pCube1_translateX"
+
+    Returns:
+        AnimCurveData or None: The curve data, or None if the node is missing or not an anim curve.
+    """
+    try:
+        curve_obj = _get_depend_node(anim_curve)
+        curve_fn = apiOpenMayaAnim.MFnAnimCurve(curve_obj)
+    except Exception as e:
+        logger.debug(f'Unable to read anim curve "{anim_curve}". Issue: {e}')
+        return None
+    curve_type = apiOpenMaya.MFnDependencyNode(curve_obj).typeName
+    value_factor = _get_value_internal_factor(curve_type)
+    ui_time_unit = apiOpenMaya.MTime.uiUnit()
+    is_unitless_input = curve_fn.isUnitlessInput
+
+    num_keys = curve_fn.numKeys
+    times = array("d", [0.0]) * num_keys
+    values = array("d", [0.0]) * num_keys
+    in_angles = array("d", [0.0]) * num_keys
+    out_angles = array("d", [0.0]) * num_keys
+    in_weights = array("d", [0.0]) * num_keys
+    out_weights = array("d", [0.0]) * num_keys
+    in_tangent_types = array("i", [0]) * num_keys
+    out_tangent_types = array("i", [0]) * num_keys
+    tangents_locked = array("b", [0]) * num_keys
+    weights_locked = array("b", [0]) * num_keys
+    for index in range(num_keys):
+        if is_unitless_input:
+            times[index] = curve_fn.unitlessInput(index)
+        else:
+            times[index] = curve_fn.input(index).asUnits(ui_time_unit)
+        values[index] = curve_fn.value(index) / value_factor
+        in_angle, in_weight = curve_fn.getTangentAngleWeight(index, True)
+        out_angle, out_weight = curve_fn.getTangentAngleWeight(index, False)
+        in_angles[index] = in_angle.asDegrees()
+        out_angles[index] = out_angle.asDegrees()
+        in_weights[index] = in_weight
+        out_weights[index] = out_weight
+        in_tangent_types[index] = curve_fn.inTangentType(index)
+        out_tangent_types[index] = curve_fn.outTangentType(index)
+        tangents_locked[index] = curve_fn.tangentsLocked(index)
+        weights_locked[index] = curve_fn.weightsLocked(index)
+
+    return AnimCurveData(
+        curve_type=curve_type,
+        times=times,
+        values=values,
+        in_angles=in_angles,
+        out_angles=out_angles,
+        in_weights=in_weights,
+        out_weights=out_weights,
+        in_tangent_types=in_tangent_types,
+        out_tangent_types=out_tangent_types,
+        tangents_locked=tangents_locked,
+        weights_locked=weights_locked,
+        is_weighted=curve_fn.isWeighted,
+        pre_infinity=curve_fn.preInfinityType,
+        post_infinity=curve_fn.postInfinityType,
+    )
+
+
+def get_attr_anim_curve(attr_path):
+    """
+    Gets the anim curve connected directly to an attribute.
+
+    Args:
+        attr_path (str): Path to the attribute. e.g. "pCube1.translateX"
+
+    Returns:
+        str or None: Name of the anim curve node, or None if the attribute is not animated.
+    """
+    try:
+        anim_curves = cmds.listConnections(attr_path, source=True, destination=False, type="animCurve") or []
+    except Exception as e:
+        logger.debug(f'Unable to list anim curves of "{attr_path}". Issue: {e}')
+        return None
+    if anim_curves:
+        return anim_curves[0]
+
+
+def get_attr_anim_curve_data(attr_path):
+    """
+    Reads the anim curve connected to an attribute. See "get_anim_curve_data"
+
+    Args:
+        attr_path (str): Path to the attribute. e.g. "pCube1.translateX"
+
+    Returns:
+        AnimCurveData or None: The curve data, or None if the attribute is not animated.
+    """
+    anim_curve = get_attr_anim_curve(attr_path)
+    if anim_curve:
+        return get_anim_curve_data(anim_curve)
+
+
+def get_anim_curves_data(obj, include_driven=False):
+    """
+    Reads all anim curves connected to an object.
+
+    Args:
+        obj (str): Name of the object. e.g. "pCube1"
+        include_driven (bool, optional): If active, driven key curves (unitless input) are included.
+
+    Returns:
+        dict: Attribute paths as keys and "AnimCurveData" as values. e.g. {"pCube1.translateX": AnimCurveData}
+    """
+    connections = cmds.listConnections(obj, source=True, destination=False, type="animCurve", connections=True) or []
+    curves_data = {}
+    for attr_path, anim_curve in zip(connections[::2], connections[1::2]):
+        if not include_driven and cmds.nodeType(anim_curve) not in TIME_ANIM_CURVE_TYPES:
+            continue
+        curve_data = get_anim_curve_data(anim_curve)
+        if curve_data is not None:
+            curves_data[attr_path] = curve_data
+    return curves_data
+
+
+def _apply_anim_curve_data(anim_curve, curve_data):
+    """
+    Writes curve data into an empty anim curve using "MFnAnimCurve" bulk operations.
+
+    Args:
+        anim_curve (str): Name of the empty anim curve node.
+        curve_data (AnimCurveData): Data to write. (Values are converted using the type of the anim curve node)
+    """
+    curve_obj = _get_depend_node(anim_curve)
+    curve_fn = apiOpenMayaAnim.MFnAnimCurve(curve_obj)
+    value_factor = _get_value_internal_factor(apiOpenMaya.MFnDependencyNode(curve_obj).typeName)
+    ui_time_unit = apiOpenMaya.MTime.uiUnit()
+    times = apiOpenMaya.MTimeArray([apiOpenMaya.MTime(time, ui_time_unit) for time in curve_data.times])
+    values = apiOpenMaya.MDoubleArray([value * value_factor for value in curve_data.values])
+    curve_fn.addKeys(times, values)
+    curve_fn.setIsWeighted(bool(curve_data.is_weighted))
+    for index in range(len(curve_data)):
+        # Unlocked first, so setting the in tangent doesn't affect the out tangent
+        curve_fn.setTangentsLocked(index, False)
+        curve_fn.setWeightsLocked(index, False)
+        in_angle = apiOpenMaya.MAngle(curve_data.in_angles[index], apiOpenMaya.MAngle.kDegrees)
+        out_angle = apiOpenMaya.MAngle(curve_data.out_angles[index], apiOpenMaya.MAngle.kDegrees)
+        curve_fn.setTangent(index, in_angle, curve_data.in_weights[index], True)
+        curve_fn.setTangent(index, out_angle, curve_data.out_weights[index], False)
+        curve_fn.setInTangentType(index, curve_data.in_tangent_types[index])
+        curve_fn.setOutTangentType(index, curve_data.out_tangent_types[index])
+        curve_fn.setTangentsLocked(index, bool(curve_data.tangents_locked[index]))
+        curve_fn.setWeightsLocked(index, bool(curve_data.weights_locked[index]))
+    curve_fn.setPreInfinityType(curve_data.pre_infinity)
+    curve_fn.setPostInfinityType(curve_data.post_infinity)
+
+
+def _set_anim_curve_data(attr_path, curve_data, replace=True):
+    """
+    Sets the animation of an attribute. (See "set_anim_curve_data" - This one doesn't open an undo chunk)
+
+    Returns:
+        str or None: Name of the anim curve driving the attribute, None if the data couldn't be applied.
+    """
+    existing_curve = get_attr_anim_curve(attr_path)
+    if not existing_curve:
+        sources = cmds.listConnections(attr_path, source=True, destination=False, skipConversionNodes=True) or []
+        if sources:  # e.g. Anim layers (animBlend), constraints or expressions
+            logger.warning(f'Unable to set animation for "{attr_path}". It is driven by "{sources[0]}".')
+            return None
+    if existing_curve and not replace:
+        existing_data = get_anim_curve_data(existing_curve)
+        if existing_data is not None:
+            existing_data.merge(curve_data)
+            curve_data = existing_data
+
+    if existing_curve:
+        _edit_anim_curve_keys(existing_curve, curve_data)
+        return existing_curve
+
+    # API edits are not recorded by the undo queue, so keys are only written (in bulk) to a new curve.
+    # Creating and connecting nodes is undoable, which makes the whole operation undoable.
+    curve_name = attr_path.split("|")[-1].replace(".", "_")
+    new_curve = cmds.createNode(get_anim_curve_type_from_attr(attr_path), name=f"{curve_name}_temp", skipSelect=True)
+    _apply_anim_curve_data(new_curve, curve_data)
+    cmds.connectAttr(f"{new_curve}.output", attr_path)
+    return cmds.rename(new_curve, curve_name)
+
+
+def _edit_anim_curve_keys(anim_curve, curve_data):
+    """
+    Replaces the keys of an existing anim curve in bulk using undoable commands.
+    Keys are written (in bulk) to a temporary curve, then its key attributes ("keyTimeValue", tangent types, tangent
+    directions and locks) are copied to the existing curve with one "setAttr" per attribute covering all keys.
+    The curve is edited in place, keeping its connections, references and anim layers intact.
+    The keyframe clipboard is not used, so keys copied by the user are not affected.
+
+    Args:
+        anim_curve (str): Name of the anim curve node.
+        curve_data (AnimCurveData): Data to write. (Values are in UI units, same as "cmds.setKeyframe")
+    """
+    key_attributes = (
+        "keyTimeValue",
+        "keyTanInType",
+        "keyTanOutType",
+        "keyTanInX",
+        "keyTanInY",
+        "keyTanOutX",
+        "keyTanOutY",
+        "keyTanLocked",
+        "keyWeightLocked",
+    )
+    key_count = len(curve_data)
+    key_range = f"[0:{key_count - 1}]"
+    existing_key_count = cmds.keyframe(anim_curve, query=True, keyframeCount=True) or 0
+    if existing_key_count > key_count:  # Extra keys removed at once (the curve keeps at least one key)
+        cmds.cutKey(anim_curve, index=(key_count, existing_key_count - 1), clear=True)
+
+    temp_curve = cmds.createNode(cmds.nodeType(anim_curve), name=f"{anim_curve}_temp", skipSelect=True)
+    try:
+        _apply_anim_curve_data(temp_curve, curve_data)
+        cmds.setAttr(f"{anim_curve}.weightedTangents", bool(curve_data.is_weighted))
+        for attr in key_attributes:
+            values = cmds.getAttr(f"{temp_curve}.{attr}{key_range}")
+            if not isinstance(values, list):
+                values = [values]
+            if attr == "keyTimeValue":  # Pairs of time and value
+                values = [item for time_value in values for item in time_value]
+            cmds.setAttr(f"{anim_curve}.{attr}{key_range}", *values)
+    finally:
+        cmds.delete(temp_curve)
+    cmds.setAttr(f"{anim_curve}.preInfinity", curve_data.pre_infinity)
+    cmds.setAttr(f"{anim_curve}.postInfinity", curve_data.post_infinity)
+
+
+def set_anim_curve_data(attr_path, curve_data, replace=True):
+    """
+    Sets the animation of an attribute using curve data. Keys are added in bulk ("MFnAnimCurve.addKeys") and the
+    operation is undoable as a single step. Existing anim curves are edited in place (same node and connections),
+    with one "setAttr" per key attribute covering all keys.
+    Attributes driven by other nodes (e.g. anim layers, constraints or expressions) are skipped.
+
+    Args:
+        attr_path (str): Path to the attribute. e.g. "pCube1.translateX"
+        curve_data (AnimCurveData): Data describing the curve.
+        replace (bool, optional): If active, existing keys are removed. Otherwise, the new keys are merged into the
+                                  existing curve, replacing only keys at the same time.
+
+    Returns:
+        str or None: Name of the anim curve driving the attribute, None if the data couldn't be applied.
+    """
+    return set_anim_curves_data({attr_path: curve_data}, replace=replace).get(attr_path)
+
+
+def set_anim_curves_data(curves_data, replace=True):
+    """
+    Sets the animation of multiple attributes. (See "set_anim_curve_data")
+    All curves are written in a single undo chunk.
+
+    Args:
+        curves_data (dict): Attribute paths as keys and "AnimCurveData" as values.
+                            e.g. {"pCube1.translateX": AnimCurveData}
+        replace (bool, optional): If active, existing keys are removed. Otherwise, the new keys are merged into the
+                                  existing curves, replacing only keys at the same time.
+
+    Returns:
+        dict: Attribute paths as keys and the name of their anim curves as values. Failed attributes are not included.
+    """
+    function_name = "Set Anim Curves Data"
+    cmds.undoInfo(openChunk=True, chunkName=function_name)
+    anim_curves = {}
+    try:
+        for attr_path, curve_data in curves_data.items():
+            if curve_data is None or not len(curve_data):
+                continue
+            if curve_data.curve_type and curve_data.curve_type not in TIME_ANIM_CURVE_TYPES:
+                logger.debug(f'Skipped "{attr_path}". Only time anim curves can be set. (e.g. "animCurveTA")')
+                continue
+            try:
+                anim_curves[attr_path] = _set_anim_curve_data(attr_path, curve_data, replace=replace)
+            except Exception as e:
+                logger.debug(f'Unable to set animation for "{attr_path}". Issue: {e}')
+    finally:
+        cmds.undoInfo(closeChunk=True, chunkName=function_name)
+    return anim_curves
+
+
+# --------------------------------------------- Sampling ----------------------------------------------
+def evaluate_plug_at_time(plug, time_value):
+    """
+    Evaluates a plug at the provided time without changing the current time (no timeline scrubbing)
+
+    Args:
+        plug (OpenMaya.MPlug): Plug to evaluate (API 2.0)
+        time_value (float): Frame used for the evaluation (UI time unit)
+
+    Returns:
+        OpenMaya.MObject: The data of the plug at the provided time. e.g. Matrix data for "worldMatrix[0]"
+    """
+    context = apiOpenMaya.MDGContext(apiOpenMaya.MTime(time_value, apiOpenMaya.MTime.uiUnit()))
+    if hasattr(context, "makeCurrent"):  # Maya 2019+ (Context argument deprecated)
+        previous_context = context.makeCurrent()
+        try:
+            return plug.asMObject()
+        finally:
+            previous_context.makeCurrent()
+    return plug.asMObject(context)
+
+
+def get_plug_matrices_at_times(plugs, time_list):
+    """
+    Samples matrix plugs at every provided time without changing the current time (no timeline scrubbing).
+    Each frame is evaluated once for all plugs using a DG context.
+
+    Args:
+        plugs (list): Matrix plugs (OpenMaya.MPlug - API 2.0) e.g. The plug for "pCube1.worldMatrix[0]"
+        time_list (list): List of frames (UI time unit)
+
+    Returns:
+        list: One list of matrices (OpenMaya.MMatrix) per plug (same order), one matrix per frame.
+    """
+    matrices = [[] for _ in plugs]
+    for time_value in time_list:
+        context = apiOpenMaya.MDGContext(apiOpenMaya.MTime(time_value, apiOpenMaya.MTime.uiUnit()))
+        previous_context = context.makeCurrent() if hasattr(context, "makeCurrent") else None
+        try:
+            for plug, plug_matrices in zip(plugs, matrices):
+                data = plug.asMObject() if previous_context else plug.asMObject(context)
+                plug_matrices.append(apiOpenMaya.MFnMatrixData(data).matrix())
+        finally:
+            if previous_context:
+                previous_context.makeCurrent()
+    return matrices
+
+
+def get_matrices_at_times(attr_paths, time_list):
+    """
+    Samples matrix attributes at every provided time without changing the current time (no timeline scrubbing).
+    See "get_plug_matrices_at_times"
+
+    Args:
+        attr_paths (list): Paths to matrix attributes. e.g. ["pCube1.worldMatrix[0]", "pCube1.matrix"]
+        time_list (list): List of frames (UI time unit)
+
+    Returns:
+        dict: Attribute path as key, list of matrices (OpenMaya.MMatrix) as value, one matrix per frame.
+    """
+    plugs = []
+    for attr_path in attr_paths:
+        selection = apiOpenMaya.MSelectionList()
+        selection.add(attr_path)
+        plugs.append(selection.getPlug(0))
+    return dict(zip(attr_paths, get_plug_matrices_at_times(plugs, time_list)))
+
+
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
     from pprint import pprint
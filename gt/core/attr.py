@@ -7,6 +7,7 @@ Code Namespace:
 
 import gt.core.feedback as core_fback
 import gt.core.str as core_str
+import maya.api.OpenMaya as apiOpenMaya
 import maya.cmds as cmds
 import logging
 
@@ -18,6 +19,7 @@ logger.setLevel(logging.INFO)
 DEFAULT_CHANNELS = ["t", "r", "s"]
 DEFAULT_DIMENSIONS = ["x", "y", "z"]
 DEFAULT_ATTRS = ["tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz", "v"]
+BULK_ATTR_MIN_COUNT = 10  # Number of attributes needed before "get_multiple_attr" uses plugs (get_attr_values)
 
 
 # -------------------------------------------- Setters ---------------------------------------------
@@ -49,6 +51,10 @@ def set_attr(
         log_level (int, optional): The logging level to use when verbose is True. Default is logging.INFO.
         raise_exceptions (bool, optional): If active, the function will raise an exceptions whenever something fails.
 
+    Note:
+        When many attributes are provided (see "BULK_ATTR_MIN_COUNT") and Maya's undo queue is disabled,
+        the values are set using plugs instead. (see "set_attr_values")
+
     Examples:
         # Set a single attribute value
         set_attr(attribute_path="myObject.myAttribute", value=10)
@@ -74,6 +80,18 @@ def set_attr(
             for obj in obj_list:
                 attributes_to_set.add(f"{obj}.{attr}")
 
+    # Set Attribute (Plugs) - Only when changes can't be undone anyway
+    if len(attributes_to_set) >= BULK_ATTR_MIN_COUNT and not cmds.undoInfo(query=True, state=True):
+        set_attr_values(
+            attr_values={attr_path: value for attr_path in attributes_to_set},
+            clamp=clamp,
+            force_unlock=force_unlock,
+            verbose=verbose,
+            log_level=log_level,
+            raise_exceptions=raise_exceptions,
+        )
+        return
+
     # Set Attribute
     for attr_path in attributes_to_set:
         try:
@@ -504,6 +522,7 @@ def get_multiple_attr(
 
     Returns:
         dict: A dictionary containing attribute paths as keys and their corresponding values.
+              When many attributes are provided (see "BULK_ATTR_MIN_COUNT"), values are read using plugs.
 
     Examples:
         # Get a single attribute value
@@ -514,6 +533,25 @@ def get_multiple_attr(
     """
     attribute_values = {}
 
+    # Get Attributes (Plugs) - Many attributes, resolved and read in a single pass
+    if isinstance(obj_list, str):
+        obj_list = [obj_list]
+    if isinstance(attr_list, str):
+        attr_list = [attr_list]
+    attr_paths = []
+    if attribute_path and isinstance(attribute_path, str):
+        attr_paths.append(attribute_path)
+    if obj_list and attr_list and isinstance(obj_list, list) and isinstance(attr_list, list):
+        attr_paths.extend(f"{obj}.{attr}" for attr in attr_list for obj in obj_list)
+    if len(attr_paths) >= BULK_ATTR_MIN_COUNT:
+        return get_attr_values(
+            attr_paths,
+            enum_as_string=enum_as_string,
+            verbose=verbose,
+            log_level=log_level,
+            raise_exceptions=raise_exceptions,
+        )
+
     # Add One Line Attribute
     if attribute_path and isinstance(attribute_path, str):
         try:
@@ -759,6 +797,311 @@ def list_user_defined_attr(obj, skip_nested=False, skip_parents=True):
     return result
 
 
+# ---------------------------------------------- Plugs ----------------------------------------------
+def get_plugs(attr_paths, verbose=True, log_level=logging.INFO, raise_exceptions=False):
+    """
+    Resolves a list of attribute paths into plugs (OpenMaya) using a single selection list.
+
+    Args:
+        attr_paths (list): A list of attribute paths in the format "object.attribute". e.g. ["cube1.tx", "cube2.v"]
+        verbose (bool, optional): If True, log messages will be displayed for attributes that can't be found.
+        log_level (int, optional): The logging level to use when verbose is True. Default is logging.INFO.
+        raise_exceptions (bool, optional): If active, the function will raise exceptions whenever something fails.
+
+    Returns:
+        dict: A dictionary with attribute paths as keys and "MPlug" objects as values. Missing attributes are skipped.
+    """
+    plugs = {}
+    selection = apiOpenMaya.MSelectionList()
+    added_paths = []
+    for attr_path in attr_paths:
+        try:
+            selection.add(attr_path)
+            added_paths.append(attr_path)
+        except Exception as e:
+            message = f'Unable to find attribute "{attr_path}". Issue: "{e}".'
+            core_fback.log_when_true(logger, message, do_log=verbose, level=log_level)
+            if raise_exceptions:
+                raise ValueError(message)
+    if selection.length() == len(added_paths):
+        for index, attr_path in enumerate(added_paths):
+            plugs[attr_path] = selection.getPlug(index)
+        return plugs
+    # Same plug provided more than once (e.g. "cube.tx" and "|cube.translateX"), selection list merged them
+    for attr_path in added_paths:
+        single_selection = apiOpenMaya.MSelectionList()
+        single_selection.add(attr_path)
+        plugs[attr_path] = single_selection.getPlug(0)
+    return plugs
+
+
+def _get_plug_path(plug):
+    """
+    Gets the path to a plug using the full path of its node. e.g. "|group|cube.translateX"
+
+    Args:
+        plug (MPlug): The plug to get the path from.
+
+    Returns:
+        str: Path to the plug. (Unique, even when the node name is not)
+    """
+    node = plug.node()
+    if node.hasFn(apiOpenMaya.MFn.kDagNode):
+        node_path = apiOpenMaya.MFnDagNode(node).fullPathName()
+    else:
+        node_path = apiOpenMaya.MFnDependencyNode(node).name()
+    return f"{node_path}.{plug.partialName(useLongNames=True, useFullAttributePath=True)}"
+
+
+def _get_plug_value_type(plug):
+    """
+    Gets the value type of a plug. Used to determine how values are read and written.
+
+    Args:
+        plug (MPlug): The plug to check.
+
+    Returns:
+        str or None: "bool", "int", "double", "distance", "angle", "time", "enum", "string" or "compound".
+                     None for types without a fast path. (e.g. arrays, matrices or meshes)
+    """
+    if plug.isArray:
+        return None
+    attribute = plug.attribute()
+    if attribute.hasFn(apiOpenMaya.MFn.kEnumAttribute):
+        return "enum"
+    if attribute.hasFn(apiOpenMaya.MFn.kUnitAttribute):
+        unit_type = apiOpenMaya.MFnUnitAttribute(attribute).unitType()
+        return {
+            apiOpenMaya.MFnUnitAttribute.kDistance: "distance",
+            apiOpenMaya.MFnUnitAttribute.kAngle: "angle",
+            apiOpenMaya.MFnUnitAttribute.kTime: "time",
+        }.get(unit_type)
+    if attribute.hasFn(apiOpenMaya.MFn.kNumericAttribute):
+        numeric_type = apiOpenMaya.MFnNumericAttribute(attribute).numericType()
+        if numeric_type == apiOpenMaya.MFnNumericData.kBoolean:
+            return "bool"
+        if numeric_type in (
+            apiOpenMaya.MFnNumericData.kByte,
+            apiOpenMaya.MFnNumericData.kChar,
+            apiOpenMaya.MFnNumericData.kShort,
+            apiOpenMaya.MFnNumericData.kInt,
+            apiOpenMaya.MFnNumericData.kInt64,
+        ):
+            return "int"
+        if numeric_type in (apiOpenMaya.MFnNumericData.kFloat, apiOpenMaya.MFnNumericData.kDouble):
+            return "double"
+    if attribute.hasFn(apiOpenMaya.MFn.kTypedAttribute):
+        if apiOpenMaya.MFnTypedAttribute(attribute).attrType() == apiOpenMaya.MFnData.kString:
+            return "string"
+        return None
+    if plug.isCompound and plug.numChildren() == 3:  # e.g. double3, float3, translate, rotate, color
+        for index in range(3):
+            if _get_plug_value_type(plug.child(index)) not in ("bool", "int", "double", "distance", "angle"):
+                return None
+        return "compound"
+    return None
+
+
+def get_plug_value(plug, enum_as_string=False):
+    """
+    Gets the value of a plug using the same units and types returned by "get_attr". (e.g. UI units, degrees)
+    Compound attributes with three children (double3) return a tuple. e.g. (0.0, 1.0, 0.0)
+
+    Args:
+        plug (MPlug): The plug to read.
+        enum_as_string (bool, optional): If True and the attribute is of the type "enum", return its field name.
+
+    Returns:
+        any: The value of the plug.
+    """
+    value_type = _get_plug_value_type(plug)
+    if value_type == "double":
+        return plug.asDouble()
+    if value_type == "distance":
+        return plug.asMDistance().asUnits(apiOpenMaya.MDistance.uiUnit())
+    if value_type == "angle":
+        return plug.asMAngle().asUnits(apiOpenMaya.MAngle.uiUnit())
+    if value_type == "bool":
+        return plug.asBool()
+    if value_type == "int":
+        return plug.asInt()
+    if value_type == "enum":
+        value = plug.asShort()
+        if enum_as_string:
+            return apiOpenMaya.MFnEnumAttribute(plug.attribute()).fieldName(value)
+        return value
+    if value_type == "string":
+        return plug.asString()
+    if value_type == "time":
+        return plug.asMTime().asUnits(apiOpenMaya.MTime.uiUnit())
+    if value_type == "compound":
+        value = tuple(get_plug_value(plug.child(index)) for index in range(3))
+        attribute = plug.attribute()
+        if attribute.hasFn(apiOpenMaya.MFn.kNumericAttribute):
+            numeric_type = apiOpenMaya.MFnNumericAttribute(attribute).numericType()
+            if numeric_type in (
+                apiOpenMaya.MFnNumericData.k3Float,
+                apiOpenMaya.MFnNumericData.k3Int,
+                apiOpenMaya.MFnNumericData.k3Short,
+            ):
+                return [value]  # Same as "get_attr", only "double3" values are returned without a list
+        return value
+    return get_attr(attribute_path=_get_plug_path(plug), enum_as_string=enum_as_string)  # No fast path, use cmds
+
+
+def set_plug_value(plug, value, clamp=False, modifier=None):
+    """
+    Sets the value of a plug. Values use the same units accepted by "cmds.setAttr". (e.g. UI units, degrees)
+
+    Args:
+        plug (MPlug): The plug to write.
+        value (any): The new value. Compound attributes with three children (double3) expect a tuple or a list.
+                     Enum attributes also accept field names. e.g. "On"
+        clamp (bool, optional): If True, numeric values are clamped to the attribute's minimum and maximum values.
+        modifier (MDGModifier, optional): If provided, the change is recorded in the modifier instead of applied.
+                                          Use "modifier.doIt()" to apply and "modifier.undoIt()" to revert it.
+    """
+    value_type = _get_plug_value_type(plug)
+    if value_type is None or plug.isDestination:  # No fast path or connected (cmds handles animated plugs)
+        if modifier:
+            modifier.doIt()  # Keep the order of the recorded changes
+        set_attr(attribute_path=_get_plug_path(plug), value=value, clamp=clamp, raise_exceptions=True)
+        return
+    if value_type == "compound":
+        if len(value) != 3:
+            raise ValueError(f'Unable to set "{_get_plug_path(plug)}". Expected three values, received {len(value)}.')
+        for index in range(3):
+            set_plug_value(plug.child(index), value[index], clamp=clamp, modifier=modifier)
+        return
+    if value_type == "enum" and isinstance(value, str):
+        value = apiOpenMaya.MFnEnumAttribute(plug.attribute()).fieldValue(value)
+    if clamp and value_type in ("int", "double", "distance", "angle"):
+        numeric_fn = apiOpenMaya.MFnNumericAttribute(plug.attribute()) if value_type in ("int", "double") else None
+        if numeric_fn and numeric_fn.hasMin():
+            value = max(value, numeric_fn.getMin())
+        if numeric_fn and numeric_fn.hasMax():
+            value = min(value, numeric_fn.getMax())
+
+    if value_type == "double":
+        _set_plug_value_with_modifier(plug, float(value), "Double", modifier)
+    elif value_type == "distance":
+        distance = apiOpenMaya.MDistance(float(value), apiOpenMaya.MDistance.uiUnit())
+        _set_plug_value_with_modifier(plug, distance, "MDistance", modifier)
+    elif value_type == "angle":
+        angle = apiOpenMaya.MAngle(float(value), apiOpenMaya.MAngle.uiUnit())
+        _set_plug_value_with_modifier(plug, angle, "MAngle", modifier)
+    elif value_type == "bool":
+        _set_plug_value_with_modifier(plug, bool(value), "Bool", modifier)
+    elif value_type == "int":
+        _set_plug_value_with_modifier(plug, int(value), "Int", modifier)
+    elif value_type == "enum":
+        _set_plug_value_with_modifier(plug, int(value), "Short", modifier)
+    elif value_type == "string":
+        _set_plug_value_with_modifier(plug, str(value), "String", modifier)
+    elif value_type == "time":
+        time_value = apiOpenMaya.MTime(float(value), apiOpenMaya.MTime.uiUnit())
+        _set_plug_value_with_modifier(plug, time_value, "MTime", modifier)
+
+
+def _set_plug_value_with_modifier(plug, value, value_type_name, modifier=None):
+    """
+    Sets a plug value directly or records it in a modifier.
+
+    Args:
+        plug (MPlug): The plug to write.
+        value (any): Value already converted to the expected type.
+        value_type_name (str): Suffix of the "MPlug.set<type>" and "MDGModifier.newPlugValue<type>" functions.
+                               e.g. "Double", "MDistance", "Bool"
+        modifier (MDGModifier, optional): If provided, the change is recorded in the modifier instead of applied.
+    """
+    if modifier:
+        getattr(modifier, f"newPlugValue{value_type_name}")(plug, value)
+    else:
+        getattr(plug, f"set{value_type_name}")(value)
+
+
+def get_attr_values(attr_paths, enum_as_string=False, verbose=True, log_level=logging.INFO, raise_exceptions=False):
+    """
+    Gets the values of many attributes in a single pass. Plugs are resolved once (see "get_plugs") and read
+    through type-aware fast paths (double, double3, bool, enum, string), returning the same values as "get_attr".
+
+    Args:
+        attr_paths (list): A list of attribute paths in the format "object.attribute". e.g. ["cube1.tx", "cube2.v"]
+        enum_as_string (bool, optional): If True and attribute is of type "enum", return the enum value as a string.
+        verbose (bool, optional): If True, log messages will be displayed for each attribute that fails.
+        log_level (int, optional): The logging level to use when verbose is True. Default is logging.INFO.
+        raise_exceptions (bool, optional): If active, the function will raise exceptions whenever something fails.
+
+    Returns:
+        dict: A dictionary containing attribute paths as keys and their corresponding values.
+              Attributes that could not be found or read have "None" as their value.
+    """
+    plugs = get_plugs(attr_paths, verbose=verbose, log_level=log_level, raise_exceptions=raise_exceptions)
+    attribute_values = {}
+    for attr_path in attr_paths:
+        plug = plugs.get(attr_path)
+        if plug is None:
+            attribute_values[attr_path] = None
+            continue
+        try:
+            attribute_values[attr_path] = get_plug_value(plug, enum_as_string=enum_as_string)
+        except Exception as e:
+            attribute_values[attr_path] = None
+            message = f'Unable to retrieve attribute "{attr_path}" value. Issue: "{e}".'
+            core_fback.log_when_true(logger, message, do_log=verbose, level=log_level)
+            if raise_exceptions:
+                raise e
+    return attribute_values
+
+
+def set_attr_values(
+    attr_values,
+    clamp=False,
+    force_unlock=False,
+    modifier=None,
+    verbose=False,
+    log_level=logging.INFO,
+    raise_exceptions=False,
+):
+    """
+    Sets the values of many attributes in a single pass. Plugs are resolved once (see "get_plugs") and written
+    through type-aware fast paths (double, double3, bool, enum, string).
+    Note: Plug changes are not added to Maya's undo queue. Provide a "modifier" to be able to revert all changes
+    at once (modifier.undoIt()) or use "set_attr" when the change must be undone through Maya's undo.
+
+    Args:
+        attr_values (dict): Attribute paths as keys and their new values as values. e.g. {"cube1.tx": 1, "cube2.v": 0}
+        clamp (bool, optional): If True, numeric values are clamped to the attribute's minimum and maximum values.
+        force_unlock (bool, optional): If active, this function unlock locked attributes before settings their values.
+        modifier (MDGModifier, optional): If provided, all changes are recorded in this modifier (and applied)
+                                          so they can be reverted at once using "modifier.undoIt()".
+        verbose (bool, optional): If True, log messages will be displayed for each attribute that fails.
+        log_level (int, optional): The logging level to use when verbose is True. Default is logging.INFO.
+        raise_exceptions (bool, optional): If active, the function will raise exceptions whenever something fails.
+
+    Returns:
+        list: A list of attribute paths that were set.
+    """
+    plugs = get_plugs(list(attr_values), verbose=verbose, log_level=log_level, raise_exceptions=raise_exceptions)
+    set_paths = []
+    for attr_path, plug in plugs.items():
+        try:
+            if plug.isLocked:
+                if not force_unlock:
+                    raise RuntimeError(f'The attribute "{attr_path}" is locked.')
+                plug.isLocked = False
+            set_plug_value(plug, attr_values.get(attr_path), clamp=clamp, modifier=modifier)
+            set_paths.append(attr_path)
+        except Exception as e:
+            message = f'Unable to set attribute "{attr_path}". Issue: "{e}".'
+            core_fback.log_when_true(logger, message, do_log=verbose, level=log_level)
+            if raise_exceptions:
+                raise e
+    if modifier:
+        modifier.doIt()
+    return set_paths
+
+
 # -------------------------------------------- Management -------------------------------------------
 def add_attr_double_three(obj, attr_name, suffix="RGB", keyable=True):
     """
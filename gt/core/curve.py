@@ -7,7 +7,8 @@ Code Namespace:
 
 from gt.core.naming import get_short_name, NamingConstants
 from gt.core.attr import add_separator_attr, set_attr
-from gt.core.io import read_json_dict, write_json
+from gt.core.io import read_json_dict, write_json, array_to_bytes, bytes_to_array
+from gt.core.io import write_packed_file, read_packed_file_header, read_packed_file_data
 from gt.core.transform import Transform, Vector3
 from gt.core.io import DataDirConstants
 from gt.core.math import remap_value
@@ -16,6 +17,7 @@ import maya.OpenMaya as OpenMaya
 from decimal import Decimal
 import maya.cmds as cmds
 import logging
+import zlib
 import sys
 import os
 
@@ -32,6 +34,15 @@ CURVE_FILE_EXTENSION = "crv"
 PROJECTION_AXIS_KEY = "projectionAxis"
 PROJECTION_SCALE_KEY = "projectionScale"
 PROJECTION_FIT_KEY = "projectionFit"
+CURVE_MANIFEST_FILE_NAME = "curves_manifest.json"
+CURVE_PACK_FILE_NAME = "curves.pack"
+
+# Cached manifests - Key: manifest path, Value: manifest dictionary
+_curve_manifest_cache = {}
+# Cached pack headers - Key: pack path, Value: tuple with header dictionary and data start position
+_curve_pack_cache = {}
+# Validated pack sources - Key: curve file path, Value: tuple with a key (size, mtime, pack checksum) and the result
+_curve_pack_source_cache = {}
 
 
 def get_curve_file_path(file_name):
@@ -92,11 +103,186 @@ def get_curve(file_name, curve_dir=None):
             _curve_dir = curve_dir
         else:
             logger.debug(f"Missing custom directory curve directory. Attempting to use package directory instead.")
+    if _curve_dir == DataDirConstants.DIR_CURVES:
+        curve_data = read_curve_data_from_pack(file_name)
+        if curve_data:
+            return Curve(data_from_dict=curve_data)
     path_to_curve = os.path.join(_curve_dir, file_name)
     if os.path.exists(path_to_curve):
         return Curve(data_from_file=path_to_curve)
 
 
+def get_curve_manifest_path(curve_dir=None):
+    """
+    Get the path to the curve library manifest file. The manifest describes every curve in a directory (names,
+    shape counts and metadata) so the library can be listed without reading the point data of every curve file.
+    Args:
+        curve_dir (str, optional): Path to the curve folder. If not provided, the package "curves" directory is used.
+    Returns:
+        str: Path to the manifest file. (It might not exist)
+    """
+    if not curve_dir:
+        curve_dir = DataDirConstants.DIR_CURVES
+    return os.path.join(curve_dir, CURVE_MANIFEST_FILE_NAME)
+
+
+def get_curve_manifest(curve_dir=None, use_cache=True):
+    """
+    Gets the curve library manifest for the provided directory.
+    The manifest is a dictionary where the key is the curve file name (without extension) and the value is a
+    dictionary describing the curve. e.g. {"circle": {"name": "circle", "shapes": 1, "metadata": {...}}}
+    Args:
+        curve_dir (str, optional): Path to the curve folder. If not provided, the package "curves" directory is used.
+        use_cache (bool, optional): If active, a manifest that was already read will be reused.
+    Returns:
+        dict: The manifest dictionary. Empty dictionary if a manifest file is not available.
+    """
+    manifest_path = get_curve_manifest_path(curve_dir=curve_dir)
+    if use_cache and manifest_path in _curve_manifest_cache:
+        return _curve_manifest_cache.get(manifest_path)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        manifest = read_json_dict(manifest_path)
+    _curve_manifest_cache[manifest_path] = manifest
+    return manifest
+
+
+def get_curve_manifest_entry_from_data(curve_data):
+    """
+    Creates a manifest entry (description of a curve without its point data) using curve data.
+    Args:
+        curve_data (dict): A curve dictionary, as read from a curve file. (See "Curve.get_data_as_dict")
+    Returns:
+        dict: A manifest entry. e.g. {"name": "circle", "shapes": 1, "metadata": {"projectionAxis": "y"}}
+    """
+    shapes = curve_data.get("shapes") or []
+    entry = {
+        "name": curve_data.get("name"),
+        "shapes": len(shapes),
+        "points": sum(len(shape.get("points") or []) for shape in shapes),
+    }
+    if curve_data.get("metadata"):
+        entry["metadata"] = curve_data.get("metadata")
+    return entry
+
+
+def get_curve_pack_path(curve_dir=None):
+    """
+    Get the path to the curve pack file. The pack is a binary cache generated from the ".crv" files of a directory.
+    Its header describes every curve (same as the ".crv" files, without points and knots) and its data section stores
+    the points and knots of every curve as doubles, so a curve can be read without parsing its JSON file.
+    Args:
+        curve_dir (str, optional): Path to the curve folder. If not provided, the package "curves" directory is used.
+    Returns:
+        str: Path to the pack file. (It might not exist)
+    """
+    if not curve_dir:
+        curve_dir = DataDirConstants.DIR_CURVES
+    return os.path.join(curve_dir, CURVE_PACK_FILE_NAME)
+
+
+def get_curve_pack_header(curve_dir=None, use_cache=True):
+    """
+    Gets the header of the curve pack for the provided directory. (See "get_curve_pack_path")
+    Args:
+        curve_dir (str, optional): Path to the curve folder. If not provided, the package "curves" directory is used.
+        use_cache (bool, optional): If active, a header that was already read will be reused.
+    Returns:
+        tuple: A tuple with the header dictionary and the position where the data section starts. e.g. ({...}, 128)
+               If a pack is not available, an empty dictionary and None are returned. e.g. ({}, None)
+    """
+    pack_path = get_curve_pack_path(curve_dir=curve_dir)
+    if use_cache and pack_path in _curve_pack_cache:
+        return _curve_pack_cache.get(pack_path)
+    header, data_start = {}, None
+    if os.path.exists(pack_path):
+        header, data_start = read_packed_file_header(pack_path)
+    _curve_pack_cache[pack_path] = (header, data_start)
+    return header, data_start
+
+
+def get_curve_pack_source_entry(file_path):
+    """
+    Describes a curve file so the curve pack can detect if the file changed after the pack was generated.
+    Line endings are normalized, so a checkout using different line endings still matches the pack.
+    Args:
+        file_path (str): Path to the curve file.
+    Returns:
+        dict: A dictionary with the size and checksum (CRC-32) of the file. e.g. {"size": 1024, "crc": 3632233996}
+    """
+    with open(file_path, "rb") as curve_file:
+        content = curve_file.read().replace(b"\r\n", b"\n")
+    return {"size": len(content), "crc": zlib.crc32(content)}
+
+
+def is_curve_pack_source_valid(source_entry, file_path):
+    """
+    Checks if a curve file still matches the description stored in the curve pack. (See "get_curve_pack_source_entry")
+    The file size is checked first (it can only grow with different line endings), then the checksum.
+    Results are cached until the file (size or modification time) or the stored checksum changes.
+    Args:
+        source_entry (dict): The source description stored in the pack. e.g. {"size": 1024, "crc": 3632233996}
+        file_path (str): Path to the curve file.
+    Returns:
+        bool: True if the file matches the pack (pack data can be used), False otherwise.
+    """
+    if not source_entry:
+        return False
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return False
+    if file_stat.st_size < source_entry.get("size", 0):
+        return False
+    cache_key = (file_stat.st_size, file_stat.st_mtime_ns, source_entry.get("crc"))
+    cached = _curve_pack_source_cache.get(file_path)
+    if cached and cached[0] == cache_key:
+        return cached[1]
+    is_valid = get_curve_pack_source_entry(file_path) == source_entry
+    _curve_pack_source_cache[file_path] = (cache_key, is_valid)
+    return is_valid
+
+
+def read_curve_data_from_pack(file_name, curve_dir=None):
+    """
+    Reads the data of a curve from the curve pack. (See "get_curve_pack_path")
+    The pack is only used while the curve file still matches it, so edited curve files are never shadowed by it.
+    Args:
+        file_name (str): Curve file name (not path). It doesn't need to contain its extension as it will always be "crv"
+        curve_dir (str, optional): Path to the curve folder. If not provided, the package "curves" directory is used.
+    Returns:
+        dict or None: Curve data dictionary, same as the content of the curve file.
+                      None if not found in the pack or if the curve file changed after the pack was generated.
+    """
+    if file_name.endswith(f".{CURVE_FILE_EXTENSION}"):
+        file_name = file_name[: -len(f".{CURVE_FILE_EXTENSION}")]
+    header, data_start = get_curve_pack_header(curve_dir=curve_dir)
+    entry = header.get("curves", {}).get(file_name)
+    if not entry:
+        return
+    file_path = os.path.join(curve_dir or DataDirConstants.DIR_CURVES, f"{file_name}.{CURVE_FILE_EXTENSION}")
+    if not is_curve_pack_source_valid(entry.get("source"), file_path):
+        logger.debug(f'Curve file "{file_path}" changed after the curve pack was generated. Ignoring pack data.')
+        return
+    pack_path = get_curve_pack_path(curve_dir=curve_dir)
+    data = read_packed_file_data(pack_path, data_start, offset=entry.get("offset"), length=entry.get("length"))
+    values = bytes_to_array(data, typecode="d")
+    curve_data = {key: value for key, value in entry.items() if key not in ["offset", "length", "shapes", "source"]}
+    shapes = []
+    index = 0
+    for shape_entry in entry.get("shapes"):
+        shape_data = dict(shape_entry)
+        points_end = index + shape_entry.get("points") * 3
+        shape_data["points"] = [values[i : i + 3].tolist() for i in range(index, points_end, 3)]
+        index = points_end
+        if shape_entry.get("knot") is not None:
+            shape_data["knot"] = values[index : index + shape_entry.get("knot")].tolist()
+            index += shape_entry.get("knot")
+        shapes.append(shape_data)
+    curve_data["shapes"] = shapes
+    return curve_data
+
+
 def combine_curves_list(curve_list, convert_bezier_to_nurbs=True):
     """
     Moves the shape objects of all elements in the provided input (curve_list) to a single group
@@ -965,443 +1151,530 @@ class CurveShape:
         return self.build(replace_crv=target_curve)
 
 
+class LazyCurve(Curve):
+    def __init__(self, file_name, curve_dir=None):
+        """
+        Initializes a Curve object that only reads its data when the curve data (shapes or transform) is first needed.
+        The name and metadata are retrieved from the curve manifest, so the curve can be listed without being read.
+        If the curve is not found in the manifest, the data is read immediately.
+        Data is read from the curve pack when available (faster), otherwise from the curve file.
+        Args:
+            file_name (str): File name (not path). It doesn't need to contain its extension as it will always be "crv"
+            curve_dir (str, optional): Path to the curve folder where it should look for the file. Default is None
+                                       When not provided, it's assumed to be the package "curves" directory.
+        """
+        if file_name.endswith(f".{CURVE_FILE_EXTENSION}"):
+            file_name = file_name[: -len(f".{CURVE_FILE_EXTENSION}")]
+        self._is_loaded = False
+        self._shapes = None
+        self._transform = None
+        self._file_name = file_name
+        self._curve_dir = curve_dir
+        super().__init__()
+        manifest_entry = get_curve_manifest(curve_dir=curve_dir).get(file_name)
+        self._shape_count = 0
+        if manifest_entry:
+            self.name = manifest_entry.get("name")
+            self._shape_count = manifest_entry.get("shapes") or 0
+            if manifest_entry.get("metadata"):
+                self.metadata = dict(manifest_entry.get("metadata"))
+        else:
+            self.load()
+
+    @property
+    def shapes(self):
+        self.load()
+        return self._shapes
+
+    @shapes.setter
+    def shapes(self, shapes):
+        if shapes is not None:  # Data was explicitly set, file no longer needed.
+            self._is_loaded = True
+        self._shapes = shapes
+
+    @property
+    def transform(self):
+        self.load()
+        return self._transform
+
+    @transform.setter
+    def transform(self, transform):
+        if transform is not None:
+            self._is_loaded = True
+        self._transform = transform
+
+    def load(self):
+        """
+        Reads the curve data in case it hasn't been read yet. (Curve pack first, then curve file)
+        """
+        if self._is_loaded:
+            return
+        self._is_loaded = True
+        curve_data = read_curve_data_from_pack(file_name=self._file_name, curve_dir=self._curve_dir)
+        if curve_data:
+            self.set_data_from_dict(curve_data)
+            return
+        curve_dir = self._curve_dir or DataDirConstants.DIR_CURVES
+        self.read_curve_from_file(file_path=os.path.join(curve_dir, f"{self._file_name}.{CURVE_FILE_EXTENSION}"))
+
+    def is_loaded(self):
+        """
+        Checks if the curve file was already read.
+        Returns:
+            bool: True if the curve data was loaded, False if it's still only described by the manifest.
+        """
+        return self._is_loaded
+
+    def is_curve_valid(self):
+        """
+        Checks if the Curve object has enough data to create/generate a curve.
+        When not yet loaded, the manifest shape count is used, so the file is not read.
+        Returns:
+            bool: True if it's valid (can create a curve), False if invalid.
+        """
+        if not self._is_loaded and self._shape_count and isinstance(self.name, str):
+            return True
+        return super().is_curve_valid()
+
+
 class Curves:
     def __init__(self):
         """
         A library of curve objects.
         Use "build()" to create them in Maya.
+        Curves are initialized as "LazyCurve" objects, so their files are only read when first used.
         """
 
-    arrow_circle_to_head = get_curve(file_name="arrow_circle_to_head")
-    arrow_content_moved = get_curve(file_name="arrow_content_moved")
-    arrow_corner_broken = get_curve(file_name="arrow_corner_broken")
-    arrow_curved_converge = get_curve(file_name="arrow_curved_converge")
-    arrow_curved_return = get_curve(file_name="arrow_curved_return")
-    arrow_direction_eight_sides = get_curve(file_name="arrow_direction_eight_sides")
-    arrow_direction_four_sides = get_curve(file_name="arrow_direction_four_sides")
-    arrow_direction_four_sides_skinny = get_curve(file_name="arrow_direction_four_sides_skinny")
-    arrow_direction_two_sides = get_curve(file_name="arrow_direction_two_sides")
-    arrow_direction_two_sides_skinny = get_curve(file_name="arrow_direction_two_sides_skinny")
-    arrow_direction_two_sides_skinny_heads = get_curve(file_name="arrow_direction_two_sides_skinny_heads")
-    arrow_direction_two_sides_small = get_curve(file_name="arrow_direction_two_sides_small")
-    arrow_direction_two_sides_smaller = get_curve(file_name="arrow_direction_two_sides_smaller")
-    arrow_eight_detailed = get_curve(file_name="arrow_eight_detailed")
-    arrow_fletching_nock_flat = get_curve(file_name="arrow_fletching_nock_flat")
-    arrow_four_maximize = get_curve(file_name="arrow_four_maximize")
-    arrow_head_aim_flat_four_sides = get_curve(file_name="arrow_head_aim_flat_four_sides")
-    arrow_head_candy_corn_smooth = get_curve(file_name="arrow_head_candy_corn_smooth")
-    arrow_head_flat_aim = get_curve(file_name="arrow_head_flat_aim")
-    arrow_head_flat_concave = get_curve(file_name="arrow_head_flat_concave")
-    arrow_head_flat_triangle = get_curve(file_name="arrow_head_flat_triangle")
-    arrow_head_flat_triangle_small = get_curve(file_name="arrow_head_flat_triangle_small")
-    arrow_head_outline_no_base = get_curve(file_name="arrow_head_outline_no_base")
-    arrow_head_stylized = get_curve(file_name="arrow_head_stylized")
-    arrow_long = get_curve(file_name="arrow_long")
-    arrow_loop_infinite = get_curve(file_name="arrow_loop_infinite")
-    arrow_return_squared_back = get_curve(file_name="arrow_return_squared_back")
-    arrow_return_squared_full = get_curve(file_name="arrow_return_squared_full")
-    arrow_skinny = get_curve(file_name="arrow_skinny")
-    arrow_suit_spades_beet = get_curve(file_name="arrow_suit_spades_beet")
-    arrow_symbol_refresh = get_curve(file_name="arrow_symbol_refresh")
-    arrow_symbol_refresh1 = get_curve(file_name="arrow_symbol_refresh1")
-    arrow_symbol_return = get_curve(file_name="arrow_symbol_return")
-    arrow_thick_small = get_curve(file_name="arrow_thick_small")
-    arrow_two_compressing = get_curve(file_name="arrow_two_compressing")
-    circle = get_curve(file_name="circle")
-    circle_arrow = get_curve(file_name="circle_arrow")
-    circle_arrow_rotation_half = get_curve(file_name="circle_arrow_rotation_half")
-    circle_arrow_rotation_half_skinny = get_curve(file_name="circle_arrow_rotation_half_skinny")
-    circle_arrow_rotation_half_thick = get_curve(file_name="circle_arrow_rotation_half_thick")
-    circle_arrow_rotation_short = get_curve(file_name="circle_arrow_rotation_short")
-    circle_arrow_rotation_short_skinny = get_curve(file_name="circle_arrow_rotation_short_skinny")
-    circle_arrow_rotation_short_thick = get_curve(file_name="circle_arrow_rotation_short_thick")
-    circle_flower_six_sides = get_curve(file_name="circle_flower_six_sides")
-    circle_four_arrows = get_curve(file_name="circle_four_arrows")
-    circle_four_arrows_detached = get_curve(file_name="circle_four_arrows_detached")
-    circle_four_arrows_stylized = get_curve(file_name="circle_four_arrows_stylized")
-    circle_four_arrows_thick = get_curve(file_name="circle_four_arrows_thick")
-    circle_fractal_hexagon = get_curve(file_name="circle_fractal_hexagon")
-    circle_pipe = get_curve(file_name="circle_pipe")
-    circle_pizza_missing_slice = get_curve(file_name="circle_pizza_missing_slice")
-    circle_rotation_arrow_skinny = get_curve(file_name="circle_rotation_arrow_skinny")
-    circle_saw_detailed = get_curve(file_name="circle_saw_detailed")
-    circle_saw_eight_sides = get_curve(file_name="circle_saw_eight_sides")
-    circle_six_blobs = get_curve(file_name="circle_six_blobs")
-    circle_sun_eight_triangles = get_curve(file_name="circle_sun_eight_triangles")
-    circle_wavy_eight_sides = get_curve(file_name="circle_wavy_eight_sides")
-    circle_wavy_eight_sides_sun = get_curve(file_name="circle_wavy_eight_sides_sun")
-    circle_wavy_hips = get_curve(file_name="circle_wavy_hips")
-    circle_wavy_ten_sides = get_curve(file_name="circle_wavy_ten_sides")
-    coffee_mug_plate_side = get_curve(file_name="coffee_mug_plate_side")
-    concave_crescent = get_curve(file_name="concave_crescent")
-    concave_crescent_handle = get_curve(file_name="concave_crescent_handle")
-    concave_crescent_skinny = get_curve(file_name="concave_crescent_skinny")
-    creature_batman_symbol = get_curve(file_name="creature_batman_symbol")
-    creature_bat_simplified = get_curve(file_name="creature_bat_simplified")
-    creature_bat_simplified_two = get_curve(file_name="creature_bat_simplified_two")
-    creature_bird_seagull_side = get_curve(file_name="creature_bird_seagull_side")
-    creature_bird_side_stylized = get_curve(file_name="creature_bird_side_stylized")
-    creature_bird_symbol_side = get_curve(file_name="creature_bird_symbol_side")
-    creature_bull_side = get_curve(file_name="creature_bull_side")
-    creature_butterfly_top = get_curve(file_name="creature_butterfly_top")
-    creature_cat_side = get_curve(file_name="creature_cat_side")
-    creature_cat_stylized_front = get_curve(file_name="creature_cat_stylized_front")
-    creature_claw_horny_nail_bird = get_curve(file_name="creature_claw_horny_nail_bird")
-    creature_cow_front = get_curve(file_name="creature_cow_front")
-    creature_crab_top = get_curve(file_name="creature_crab_top")
-    creature_deer_side = get_curve(file_name="creature_deer_side")
-    creature_dinosaur_pterodactyl = get_curve(file_name="creature_dinosaur_pterodactyl")
-    creature_dinosaur_trex = get_curve(file_name="creature_dinosaur_trex")
-    creature_dog_face_front = get_curve(file_name="creature_dog_face_front")
-    creature_dog_schnauzer = get_curve(file_name="creature_dog_schnauzer")
-    creature_dog_side = get_curve(file_name="creature_dog_side")
-    creature_dog_sitting_side = get_curve(file_name="creature_dog_sitting_side")
-    creature_dragonfly_top = get_curve(file_name="creature_dragonfly_top")
-    creature_dragon_bat_wing = get_curve(file_name="creature_dragon_bat_wing")
-    creature_dragon_side = get_curve(file_name="creature_dragon_side")
-    creature_dragon_side_body = get_curve(file_name="creature_dragon_side_body")
-    creature_duck_stylized = get_curve(file_name="creature_duck_stylized")
-    creature_evil_boss_blood = get_curve(file_name="creature_evil_boss_blood")
-    creature_evil_cell_virus = get_curve(file_name="creature_evil_cell_virus")
-    creature_fish_eating = get_curve(file_name="creature_fish_eating")
-    creature_fish_side_small = get_curve(file_name="creature_fish_side_small")
-    creature_frog_persp = get_curve(file_name="creature_frog_persp")
-    creature_frog_webbed_feet_paw = get_curve(file_name="creature_frog_webbed_feet_paw")
-    creature_gecko_lizard_top = get_curve(file_name="creature_gecko_lizard_top")
-    creature_giraffe_persp = get_curve(file_name="creature_giraffe_persp")
-    creature_gorilla = get_curve(file_name="creature_gorilla")
-    creature_heads_hydra_dragon = get_curve(file_name="creature_heads_hydra_dragon")
-    creature_horse_head_front = get_curve(file_name="creature_horse_head_front")
-    creature_lion_side = get_curve(file_name="creature_lion_side")
-    creature_llama_side = get_curve(file_name="creature_llama_side")
-    creature_long_dragon = get_curve(file_name="creature_long_dragon")
-    creature_lower_teeth_vampire = get_curve(file_name="creature_lower_teeth_vampire")
-    creature_octopus = get_curve(file_name="creature_octopus")
-    creature_paw = get_curve(file_name="creature_paw")
-    creature_paw_claw = get_curve(file_name="creature_paw_claw")
-    creature_paw_four_toes = get_curve(file_name="creature_paw_four_toes")
-    creature_pig_side = get_curve(file_name="creature_pig_side")
-    creature_rabbit_side = get_curve(file_name="creature_rabbit_side")
-    creature_rabbit_side_outline = get_curve(file_name="creature_rabbit_side_outline")
-    creature_reptile_lizard_side = get_curve(file_name="creature_reptile_lizard_side")
-    creature_shark_teeth = get_curve(file_name="creature_shark_teeth")
-    creature_sheep_side = get_curve(file_name="creature_sheep_side")
-    creature_side_bird_dove = get_curve(file_name="creature_side_bird_dove")
-    creature_snake_front = get_curve(file_name="creature_snake_front")
-    creature_snake_side = get_curve(file_name="creature_snake_side")
-    creature_snake_top = get_curve(file_name="creature_snake_top")
-    creature_spider_top = get_curve(file_name="creature_spider_top")
-    creature_tentacle = get_curve(file_name="creature_tentacle")
-    creature_tentacle_inside_suckers = get_curve(file_name="creature_tentacle_inside_suckers")
-    creature_tentacle_spiky = get_curve(file_name="creature_tentacle_spiky")
-    creature_tentacle_suckers = get_curve(file_name="creature_tentacle_suckers")
-    creature_three_heads_hydra = get_curve(file_name="creature_three_heads_hydra")
-    creature_tutle_top = get_curve(file_name="creature_tutle_top")
-    creature_unicorn = get_curve(file_name="creature_unicorn")
-    creature_whale_side = get_curve(file_name="creature_whale_side")
-    creature_wings_angel = get_curve(file_name="creature_wings_angel")
-    creature_wings_fairy = get_curve(file_name="creature_wings_fairy")
-    creature_wing_bat_dragon = get_curve(file_name="creature_wing_bat_dragon")
-    creature_wing_thin_side = get_curve(file_name="creature_wing_thin_side")
-    creature_wolf_side_dog = get_curve(file_name="creature_wolf_side_dog")
-    creature_wolf_stylized = get_curve(file_name="creature_wolf_stylized")
-    cross_circle_heads = get_curve(file_name="cross_circle_heads")
-    cross_plus_add = get_curve(file_name="cross_plus_add")
-    cross_plus_small = get_curve(file_name="cross_plus_small")
-    dice_die_six_four = get_curve(file_name="dice_die_six_four")
-    dice_die_six_give = get_curve(file_name="dice_die_six_give")
-    dice_die_six_one = get_curve(file_name="dice_die_six_one")
-    dice_die_six_six = get_curve(file_name="dice_die_six_six")
-    dice_die_six_three = get_curve(file_name="dice_die_six_three")
-    dice_die_six_two = get_curve(file_name="dice_die_six_two")
-    extrude_profile_baseboard_a = get_curve(file_name="extrude_profile_baseboard_a")
-    extrude_profile_faucet_pipe_a = get_curve(file_name="extrude_profile_faucet_pipe_a")
-    four_leaf_clover = get_curve(file_name="four_leaf_clover")
-    gear_crown_eight_sides = get_curve(file_name="gear_crown_eight_sides")
-    gear_eight_sides = get_curve(file_name="gear_eight_sides")
-    gear_eight_sides_smooth = get_curve(file_name="gear_eight_sides_smooth")
-    gear_four_sides = get_curve(file_name="gear_four_sides")
-    gear_sharp_smooth = get_curve(file_name="gear_sharp_smooth")
-    gear_sixteen_sides = get_curve(file_name="gear_sixteen_sides")
-    gear_six_sides = get_curve(file_name="gear_six_sides")
-    gear_twelve_sides = get_curve(file_name="gear_twelve_sides")
-    gear_twenty_sides = get_curve(file_name="gear_twenty_sides")
-    human_arm_strong_side = get_curve(file_name="human_arm_strong_side")
-    human_baby_symbol = get_curve(file_name="human_baby_symbol")
-    human_ear = get_curve(file_name="human_ear")
-    human_enlight_shine_man = get_curve(file_name="human_enlight_shine_man")
-    human_eye_front_active = get_curve(file_name="human_eye_front_active")
-    human_eye_front_inactive = get_curve(file_name="human_eye_front_inactive")
-    human_eye_iris_closeup = get_curve(file_name="human_eye_iris_closeup")
-    human_face_side = get_curve(file_name="human_face_side")
-    human_foot_outline = get_curve(file_name="human_foot_outline")
-    human_foot_shoe_heel = get_curve(file_name="human_foot_shoe_heel")
-    human_foot_stylized = get_curve(file_name="human_foot_stylized")
-    human_hand_fist_stylized = get_curve(file_name="human_hand_fist_stylized")
-    human_hand_open_fingers = get_curve(file_name="human_hand_open_fingers")
-    human_hand_raising = get_curve(file_name="human_hand_raising")
-    human_hand_side = get_curve(file_name="human_hand_side")
-    human_hand_simplified = get_curve(file_name="human_hand_simplified")
-    human_hand_squared = get_curve(file_name="human_hand_squared")
-    human_hand_stylized = get_curve(file_name="human_hand_stylized")
-    human_head_gears_thinking = get_curve(file_name="human_head_gears_thinking")
-    human_head_outline_front = get_curve(file_name="human_head_outline_front")
-    human_head_outline_side = get_curve(file_name="human_head_outline_side")
-    human_man_open_arms = get_curve(file_name="human_man_open_arms")
-    human_man_running = get_curve(file_name="human_man_running")
-    human_man_torso_front = get_curve(file_name="human_man_torso_front")
-    human_man_walking = get_curve(file_name="human_man_walking")
-    human_man_wc = get_curve(file_name="human_man_wc")
-    human_man_ws_short = get_curve(file_name="human_man_ws_short")
-    human_mouth_lips = get_curve(file_name="human_mouth_lips")
-    human_skull_side = get_curve(file_name="human_skull_side")
-    human_strong_man_front = get_curve(file_name="human_strong_man_front")
-    human_symbol_eye_side = get_curve(file_name="human_symbol_eye_side")
-    human_walking_dog = get_curve(file_name="human_walking_dog")
-    human_woman_outline_front = get_curve(file_name="human_woman_outline_front")
-    human_woman_running = get_curve(file_name="human_woman_running")
-    human_woman_walking = get_curve(file_name="human_woman_walking")
-    human_woman_wc = get_curve(file_name="human_woman_wc")
-    icon_apple = get_curve(file_name="icon_apple")
-    icon_autodesk = get_curve(file_name="icon_autodesk")
-    icon_blender = get_curve(file_name="icon_blender")
-    icon_code_c_plus_plus = get_curve(file_name="icon_code_c_plus_plus")
-    icon_code_c_sharp = get_curve(file_name="icon_code_c_sharp")
-    icon_code_js_javascript = get_curve(file_name="icon_code_js_javascript")
-    icon_cursor = get_curve(file_name="icon_cursor")
-    icon_github_octocat = get_curve(file_name="icon_github_octocat")
-    icon_github_octocat_detailed = get_curve(file_name="icon_github_octocat_detailed")
-    icon_godot_logo = get_curve(file_name="icon_godot_logo")
-    icon_hand_click_index = get_curve(file_name="icon_hand_click_index")
-    icon_houdini_sidefx = get_curve(file_name="icon_houdini_sidefx")
-    icon_maya_autodesk_retro_word = get_curve(file_name="icon_maya_autodesk_retro_word")
-    icon_python = get_curve(file_name="icon_python")
-    icon_raspberry_pi = get_curve(file_name="icon_raspberry_pi")
-    icon_review_star = get_curve(file_name="icon_review_star")
-    icon_review_star_half = get_curve(file_name="icon_review_star_half")
-    icon_splash = get_curve(file_name="icon_splash")
-    icon_unity_logo = get_curve(file_name="icon_unity_logo")
-    icon_unity_logo_retro = get_curve(file_name="icon_unity_logo_retro")
-    icon_unreal_engine = get_curve(file_name="icon_unreal_engine")
-    icon_windows = get_curve(file_name="icon_windows")
-    icon_zbrush_maxon = get_curve(file_name="icon_zbrush_maxon")
-    letter_asterisk = get_curve(file_name="letter_asterisk")
-    line_two_points = get_curve(file_name="line_two_points")
-    locator = get_curve(file_name="locator")
-    locator_handle_arrows = get_curve(file_name="locator_handle_arrows")
-    locator_handle_xyz = get_curve(file_name="locator_handle_xyz")
-    locator_with_axis = get_curve(file_name="locator_with_axis")
-    peanut = get_curve(file_name="peanut")
-    pin = get_curve(file_name="pin")
-    pin_arrow_to_circle = get_curve(file_name="pin_arrow_to_circle")
-    pin_arrow_to_target = get_curve(file_name="pin_arrow_to_target")
-    pin_circle_to_arrow = get_curve(file_name="pin_circle_to_arrow")
-    pin_diamond_six_sides = get_curve(file_name="pin_diamond_six_sides")
-    pin_flag = get_curve(file_name="pin_flag")
-    pin_four_sides_flat_pyramids = get_curve(file_name="pin_four_sides_flat_pyramids")
-    pin_hollow_two_sides = get_curve(file_name="pin_hollow_two_sides")
-    pin_large = get_curve(file_name="pin_large")
-    pin_large_four_sides = get_curve(file_name="pin_large_four_sides")
-    pin_large_two_sides = get_curve(file_name="pin_large_two_sides")
-    pin_speech_bubble = get_curve(file_name="pin_speech_bubble")
-    pin_target_to_arrow = get_curve(file_name="pin_target_to_arrow")
-    primitive_cone = get_curve(file_name="primitive_cone")
-    primitive_cube = get_curve(file_name="primitive_cube")
-    primitive_diamond = get_curve(file_name="primitive_diamond")
-    primitive_hexagonal_tube = get_curve(file_name="primitive_hexagonal_tube")
-    primitive_pyramid = get_curve(file_name="primitive_pyramid")
-    primitive_pyramid_half = get_curve(file_name="primitive_pyramid_half")
-    primitive_tube = get_curve(file_name="primitive_tube")
-    primitive_tube_half = get_curve(file_name="primitive_tube_half")
-    primitive_tube_ring = get_curve(file_name="primitive_tube_ring")
-    revolve_profile_bottle_a = get_curve(file_name="revolve_profile_bottle_a")
-    revolve_profile_bowl_a = get_curve(file_name="revolve_profile_bowl_a")
-    revolve_profile_bowl_b = get_curve(file_name="revolve_profile_bowl_b")
-    revolve_profile_cork_a = get_curve(file_name="revolve_profile_cork_a")
-    revolve_profile_faucet_base_a = get_curve(file_name="revolve_profile_faucet_base_a")
-    revolve_profile_faucet_head_a = get_curve(file_name="revolve_profile_faucet_head_a")
-    revolve_profile_plate_b = get_curve(file_name="revolve_profile_plate_b")
-    revolve_profile_plate_c = get_curve(file_name="revolve_profile_plate_c")
-    rhombus = get_curve(file_name="rhombus")
-    rhombus_long = get_curve(file_name="rhombus_long")
-    sphere_dome = get_curve(file_name="sphere_dome")
-    sphere_four_directions = get_curve(file_name="sphere_four_directions")
-    sphere_half_arrow = get_curve(file_name="sphere_half_arrow")
-    sphere_half_double_arrows = get_curve(file_name="sphere_half_double_arrows")
-    sphere_half_double_arrows_skinny = get_curve(file_name="sphere_half_double_arrows_skinny")
-    sphere_half_four_arrows = get_curve(file_name="sphere_half_four_arrows")
-    sphere_half_top_four_arrows = get_curve(file_name="sphere_half_top_four_arrows")
-    sphere_half_two_arrows = get_curve(file_name="sphere_half_two_arrows")
-    sphere_joint = get_curve(file_name="sphere_joint")
-    sphere_joint_loc = get_curve(file_name="sphere_joint_loc")
-    sphere_joint_smooth = get_curve(file_name="sphere_joint_smooth")
-    sphere_two_directions = get_curve(file_name="sphere_two_directions")
-    spring = get_curve(file_name="spring")
-    spring_high_frequency = get_curve(file_name="spring_high_frequency")
-    spring_low_frequency = get_curve(file_name="spring_low_frequency")
-    square = get_curve(file_name="square")
-    squares_connected = get_curve(file_name="squares_connected")
-    square_corner_flat = get_curve(file_name="square_corner_flat")
-    square_corner_flat_skinny = get_curve(file_name="square_corner_flat_skinny")
-    swirl_five_spaces = get_curve(file_name="swirl_five_spaces")
-    swirl_thick_round_four_spaces = get_curve(file_name="swirl_thick_round_four_spaces")
-    swirl_thick_squared_four_spaces = get_curve(file_name="swirl_thick_squared_four_spaces")
-    swirl_two_spaces = get_curve(file_name="swirl_two_spaces")
-    switch_ik_fk_left = get_curve(file_name="switch_ik_fk_left")
-    switch_ik_fk_right = get_curve(file_name="switch_ik_fk_right")
-    symbol_attach_clip = get_curve(file_name="symbol_attach_clip")
-    symbol_attach_clip_squared = get_curve(file_name="symbol_attach_clip_squared")
-    symbol_batman_simplified = get_curve(file_name="symbol_batman_simplified")
-    symbol_bell = get_curve(file_name="symbol_bell")
-    symbol_bones_crossed = get_curve(file_name="symbol_bones_crossed")
-    symbol_bones_crossed_bottom = get_curve(file_name="symbol_bones_crossed_bottom")
-    symbol_bone_simple = get_curve(file_name="symbol_bone_simple")
-    symbol_bug_low_res_retro = get_curve(file_name="symbol_bug_low_res_retro")
-    symbol_bug_smoth = get_curve(file_name="symbol_bug_smoth")
-    symbol_camera_front = get_curve(file_name="symbol_camera_front")
-    symbol_camera_hollow = get_curve(file_name="symbol_camera_hollow")
-    symbol_camera_simple = get_curve(file_name="symbol_camera_simple")
-    symbol_canada_maple_leaf = get_curve(file_name="symbol_canada_maple_leaf")
-    symbol_card_suits_clover_clubs = get_curve(file_name="symbol_card_suits_clover_clubs")
-    symbol_card_suits_spades_pikes = get_curve(file_name="symbol_card_suits_spades_pikes")
-    symbol_chain_constraint = get_curve(file_name="symbol_chain_constraint")
-    symbol_chess_pawn_side = get_curve(file_name="symbol_chess_pawn_side")
-    symbol_chess_tower_rook = get_curve(file_name="symbol_chess_tower_rook")
-    symbol_code = get_curve(file_name="symbol_code")
-    symbol_computer_desktop = get_curve(file_name="symbol_computer_desktop")
-    symbol_connected_four = get_curve(file_name="symbol_connected_four")
-    symbol_connected_three_webhook = get_curve(file_name="symbol_connected_three_webhook")
-    symbol_controller_old = get_curve(file_name="symbol_controller_old")
-    symbol_control_pad = get_curve(file_name="symbol_control_pad")
-    symbol_cube_vertex_connected = get_curve(file_name="symbol_cube_vertex_connected")
-    symbol_danger_energy = get_curve(file_name="symbol_danger_energy")
-    symbol_diamond = get_curve(file_name="symbol_diamond")
-    symbol_dollar_sign_money = get_curve(file_name="symbol_dollar_sign_money")
-    symbol_eighteen_plus = get_curve(file_name="symbol_eighteen_plus")
-    symbol_emoji_one_hundred = get_curve(file_name="symbol_emoji_one_hundred")
-    symbol_emoji_poop = get_curve(file_name="symbol_emoji_poop")
-    symbol_emoji_robot = get_curve(file_name="symbol_emoji_robot")
-    symbol_emoji_skull = get_curve(file_name="symbol_emoji_skull")
-    symbol_emoji_smiley_face = get_curve(file_name="symbol_emoji_smiley_face")
-    symbol_emoji_smiley_ghost = get_curve(file_name="symbol_emoji_smiley_ghost")
-    symbol_emoji_smiley_missing = get_curve(file_name="symbol_emoji_smiley_missing")
-    symbol_emoji_thumbs_up = get_curve(file_name="symbol_emoji_thumbs_up")
-    symbol_family_holding_hands = get_curve(file_name="symbol_family_holding_hands")
-    symbol_female = get_curve(file_name="symbol_female")
-    symbol_filter = get_curve(file_name="symbol_filter")
-    symbol_flag_brazil = get_curve(file_name="symbol_flag_brazil")
-    symbol_flag_canada = get_curve(file_name="symbol_flag_canada")
-    symbol_flag_usa = get_curve(file_name="symbol_flag_usa")
-    symbol_flag_usa_simplified = get_curve(file_name="symbol_flag_usa_simplified")
-    symbol_flames = get_curve(file_name="symbol_flames")
-    symbol_focus_a = get_curve(file_name="symbol_focus_a")
-    symbol_food_fork_knife = get_curve(file_name="symbol_food_fork_knife")
-    symbol_four_loops = get_curve(file_name="symbol_four_loops")
-    symbol_frame_photo = get_curve(file_name="symbol_frame_photo")
-    symbol_game_controller_retro = get_curve(file_name="symbol_game_controller_retro")
-    symbol_heart = get_curve(file_name="symbol_heart")
-    symbol_heart_squared_smooth = get_curve(file_name="symbol_heart_squared_smooth")
-    symbol_hold_weapon_sword = get_curve(file_name="symbol_hold_weapon_sword")
-    symbol_human_dress = get_curve(file_name="symbol_human_dress")
-    symbol_human_man_touch = get_curve(file_name="symbol_human_man_touch")
-    symbol_human_shirt = get_curve(file_name="symbol_human_shirt")
-    symbol_icon_keyframe = get_curve(file_name="symbol_icon_keyframe")
-    symbol_infinite = get_curve(file_name="symbol_infinite")
-    symbol_key = get_curve(file_name="symbol_key")
-    symbol_key_front_simple = get_curve(file_name="symbol_key_front_simple")
-    symbol_key_side_detailed = get_curve(file_name="symbol_key_side_detailed")
-    symbol_key_side_round = get_curve(file_name="symbol_key_side_round")
-    symbol_key_side_squared = get_curve(file_name="symbol_key_side_squared")
-    symbol_key_squared = get_curve(file_name="symbol_key_squared")
-    symbol_kunai_knife = get_curve(file_name="symbol_kunai_knife")
-    symbol_letter = get_curve(file_name="symbol_letter")
-    symbol_lighting_energy_simple = get_curve(file_name="symbol_lighting_energy_simple")
-    symbol_lighting_energy_smooth = get_curve(file_name="symbol_lighting_energy_smooth")
-    symbol_lock_locked = get_curve(file_name="symbol_lock_locked")
-    symbol_lock_unlocked = get_curve(file_name="symbol_lock_unlocked")
-    symbol_magic_wand = get_curve(file_name="symbol_magic_wand")
-    symbol_male = get_curve(file_name="symbol_male")
-    symbol_man_fencing_sword = get_curve(file_name="symbol_man_fencing_sword")
-    symbol_man_front = get_curve(file_name="symbol_man_front")
-    symbol_man_strong = get_curve(file_name="symbol_man_strong")
-    symbol_music_two_notes = get_curve(file_name="symbol_music_two_notes")
-    symbol_music_two_notes_same = get_curve(file_name="symbol_music_two_notes_same")
-    symbol_old_sign = get_curve(file_name="symbol_old_sign")
-    symbol_omega = get_curve(file_name="symbol_omega")
-    symbol_paint_bucket = get_curve(file_name="symbol_paint_bucket")
-    symbol_parameters = get_curve(file_name="symbol_parameters")
-    symbol_pirate = get_curve(file_name="symbol_pirate")
-    symbol_pirate_skull_bones_crossed = get_curve(file_name="symbol_pirate_skull_bones_crossed")
-    symbol_pirate_sword_skull = get_curve(file_name="symbol_pirate_sword_skull")
-    symbol_plant_fin_grow = get_curve(file_name="symbol_plant_fin_grow")
-    symbol_plug = get_curve(file_name="symbol_plug")
-    symbol_plug_side = get_curve(file_name="symbol_plug_side")
-    symbol_pointy_sun = get_curve(file_name="symbol_pointy_sun")
-    symbol_puzzle = get_curve(file_name="symbol_puzzle")
-    symbol_question_mark = get_curve(file_name="symbol_question_mark")
-    symbol_radioactive = get_curve(file_name="symbol_radioactive")
-    symbol_radioactive_circle = get_curve(file_name="symbol_radioactive_circle")
-    symbol_shield_simple = get_curve(file_name="symbol_shield_simple")
-    symbol_smelly_poop = get_curve(file_name="symbol_smelly_poop")
-    symbol_snowflake = get_curve(file_name="symbol_snowflake")
-    symbol_snowflake_complex = get_curve(file_name="symbol_snowflake_complex")
-    symbol_snowflake_simplified = get_curve(file_name="symbol_snowflake_simplified")
-    symbol_speech_bubble = get_curve(file_name="symbol_speech_bubble")
-    symbol_squared_lock_locked = get_curve(file_name="symbol_squared_lock_locked")
-    symbol_squared_lock_unlocked = get_curve(file_name="symbol_squared_lock_unlocked")
-    symbol_sun_light = get_curve(file_name="symbol_sun_light")
-    symbol_sword = get_curve(file_name="symbol_sword")
-    symbol_tag_simple = get_curve(file_name="symbol_tag_simple")
-    symbol_tag_x = get_curve(file_name="symbol_tag_x")
-    symbol_tech_fan = get_curve(file_name="symbol_tech_fan")
-    symbol_tech_fan_case = get_curve(file_name="symbol_tech_fan_case")
-    symbol_three_hexagons = get_curve(file_name="symbol_three_hexagons")
-    symbol_tool_hammer = get_curve(file_name="symbol_tool_hammer")
-    symbol_uv_unwrapped = get_curve(file_name="symbol_uv_unwrapped")
-    symbol_virus_proteins = get_curve(file_name="symbol_virus_proteins")
-    symbol_wand_magic_star = get_curve(file_name="symbol_wand_magic_star")
-    symbol_wc_woman_front = get_curve(file_name="symbol_wc_woman_front")
-    symbol_woman_arms_up = get_curve(file_name="symbol_woman_arms_up")
-    symbol_wrench = get_curve(file_name="symbol_wrench")
-    symbol_zoom_in_plus = get_curve(file_name="symbol_zoom_in_plus")
-    target_aim_circle = get_curve(file_name="target_aim_circle")
-    target_aim_circle_drain = get_curve(file_name="target_aim_circle_drain")
-    target_circle = get_curve(file_name="target_circle")
-    target_circle_barrel_detailed = get_curve(file_name="target_circle_barrel_detailed")
-    target_squared = get_curve(file_name="target_squared")
-    target_squared_thick = get_curve(file_name="target_squared_thick")
-    target_square_circle_thick = get_curve(file_name="target_square_circle_thick")
-    target_wheel_helm_complex = get_curve(file_name="target_wheel_helm_complex")
-    target_wheel_helm_simple = get_curve(file_name="target_wheel_helm_simple")
-    tool_dial_caliper_measure = get_curve(file_name="tool_dial_caliper_measure")
-    tool_grass_cutter = get_curve(file_name="tool_grass_cutter")
-    tool_magnet = get_curve(file_name="tool_magnet")
-    tool_pair_scissors = get_curve(file_name="tool_pair_scissors")
-    tool_pickaxe = get_curve(file_name="tool_pickaxe")
-    tool_robot_arm_side = get_curve(file_name="tool_robot_arm_side")
-    tool_ruler = get_curve(file_name="tool_ruler")
-    tool_screwdriver = get_curve(file_name="tool_screwdriver")
-    tool_shovel = get_curve(file_name="tool_shovel")
-    tool_wrench = get_curve(file_name="tool_wrench")
-    triangle_pyramid_flat_four_arrows = get_curve(file_name="triangle_pyramid_flat_four_arrows")
-    triangle_pyramid_flat_two_arrows = get_curve(file_name="triangle_pyramid_flat_two_arrows")
-    ui_attention_exclamation = get_curve(file_name="ui_attention_exclamation")
-    weapon_battle_axe_side = get_curve(file_name="weapon_battle_axe_side")
-    weapon_dagger_top = get_curve(file_name="weapon_dagger_top")
-    weapon_grenade_launcher = get_curve(file_name="weapon_grenade_launcher")
-    weapon_hook_lance_teeth_thorn = get_curve(file_name="weapon_hook_lance_teeth_thorn")
-    weapon_mp4_rifle = get_curve(file_name="weapon_mp4_rifle")
-    weapon_pistols_crossed = get_curve(file_name="weapon_pistols_crossed")
-    weapon_pistol_modern_side = get_curve(file_name="weapon_pistol_modern_side")
-    weapon_pistol_side = get_curve(file_name="weapon_pistol_side")
-    weapon_rifle_modern = get_curve(file_name="weapon_rifle_modern")
-    weapon_shrunken_five = get_curve(file_name="weapon_shrunken_five")
-    weapon_shrunken_four = get_curve(file_name="weapon_shrunken_four")
-    weapon_shrunken_four_blades = get_curve(file_name="weapon_shrunken_four_blades")
-    weapon_sword_rapier = get_curve(file_name="weapon_sword_rapier")
-    weapon_symbol_bomb = get_curve(file_name="weapon_symbol_bomb")
-    weapon_symbol_bomb_two = get_curve(file_name="weapon_symbol_bomb_two")
-    weapon_symbol_grenade = get_curve(file_name="weapon_symbol_grenade")
+    arrow_circle_to_head = LazyCurve(file_name="arrow_circle_to_head")
+    arrow_content_moved = LazyCurve(file_name="arrow_content_moved")
+    arrow_corner_broken = LazyCurve(file_name="arrow_corner_broken")
+    arrow_curved_converge = LazyCurve(file_name="arrow_curved_converge")
+    arrow_curved_return = LazyCurve(file_name="arrow_curved_return")
+    arrow_direction_eight_sides = LazyCurve(file_name="arrow_direction_eight_sides")
+    arrow_direction_four_sides = LazyCurve(file_name="arrow_direction_four_sides")
+    arrow_direction_four_sides_skinny = LazyCurve(file_name="arrow_direction_four_sides_skinny")
+    arrow_direction_two_sides = LazyCurve(file_name="arrow_direction_two_sides")
+    arrow_direction_two_sides_skinny = LazyCurve(file_name="arrow_direction_two_sides_skinny")
+    arrow_direction_two_sides_skinny_heads = LazyCurve(file_name="arrow_direction_two_sides_skinny_heads")
+    arrow_direction_two_sides_small = LazyCurve(file_name="arrow_direction_two_sides_small")
+    arrow_direction_two_sides_smaller = LazyCurve(file_name="arrow_direction_two_sides_smaller")
+    arrow_eight_detailed = LazyCurve(file_name="arrow_eight_detailed")
+    arrow_fletching_nock_flat = LazyCurve(file_name="arrow_fletching_nock_flat")
+    arrow_four_maximize = LazyCurve(file_name="arrow_four_maximize")
+    arrow_head_aim_flat_four_sides = LazyCurve(file_name="arrow_head_aim_flat_four_sides")
+    arrow_head_candy_corn_smooth = LazyCurve(file_name="arrow_head_candy_corn_smooth")
+    arrow_head_flat_aim = LazyCurve(file_name="arrow_head_flat_aim")
+    arrow_head_flat_concave = LazyCurve(file_name="arrow_head_flat_concave")
+    arrow_head_flat_triangle = LazyCurve(file_name="arrow_head_flat_triangle")
+    arrow_head_flat_triangle_small = LazyCurve(file_name="arrow_head_flat_triangle_small")
+    arrow_head_outline_no_base = LazyCurve(file_name="arrow_head_outline_no_base")
+    arrow_head_stylized = LazyCurve(file_name="arrow_head_stylized")
+    arrow_long = LazyCurve(file_name="arrow_long")
+    arrow_loop_infinite = LazyCurve(file_name="arrow_loop_infinite")
+    arrow_return_squared_back = LazyCurve(file_name="arrow_return_squared_back")
+    arrow_return_squared_full = LazyCurve(file_name="arrow_return_squared_full")
+    arrow_skinny = LazyCurve(file_name="arrow_skinny")
+    arrow_suit_spades_beet = LazyCurve(file_name="arrow_suit_spades_beet")
+    arrow_symbol_refresh = LazyCurve(file_name="arrow_symbol_refresh")
+    arrow_symbol_refresh1 = LazyCurve(file_name="arrow_symbol_refresh1")
+    arrow_symbol_return = LazyCurve(file_name="arrow_symbol_return")
+    arrow_thick_small = LazyCurve(file_name="arrow_thick_small")
+    arrow_two_compressing = LazyCurve(file_name="arrow_two_compressing")
+    circle = LazyCurve(file_name="circle")
+    circle_arrow = LazyCurve(file_name="circle_arrow")
+    circle_arrow_rotation_half = LazyCurve(file_name="circle_arrow_rotation_half")
+    circle_arrow_rotation_half_skinny = LazyCurve(file_name="circle_arrow_rotation_half_skinny")
+    circle_arrow_rotation_half_thick = LazyCurve(file_name="circle_arrow_rotation_half_thick")
+    circle_arrow_rotation_short = LazyCurve(file_name="circle_arrow_rotation_short")
+    circle_arrow_rotation_short_skinny = LazyCurve(file_name="circle_arrow_rotation_short_skinny")
+    circle_arrow_rotation_short_thick = LazyCurve(file_name="circle_arrow_rotation_short_thick")
+    circle_flower_six_sides = LazyCurve(file_name="circle_flower_six_sides")
+    circle_four_arrows = LazyCurve(file_name="circle_four_arrows")
+    circle_four_arrows_detached = LazyCurve(file_name="circle_four_arrows_detached")
+    circle_four_arrows_stylized = LazyCurve(file_name="circle_four_arrows_stylized")
+    circle_four_arrows_thick = LazyCurve(file_name="circle_four_arrows_thick")
+    circle_fractal_hexagon = LazyCurve(file_name="circle_fractal_hexagon")
+    circle_pipe = LazyCurve(file_name="circle_pipe")
+    circle_pizza_missing_slice = LazyCurve(file_name="circle_pizza_missing_slice")
+    circle_rotation_arrow_skinny = LazyCurve(file_name="circle_rotation_arrow_skinny")
+    circle_saw_detailed = LazyCurve(file_name="circle_saw_detailed")
+    circle_saw_eight_sides = LazyCurve(file_name="circle_saw_eight_sides")
+    circle_six_blobs = LazyCurve(file_name="circle_six_blobs")
+    circle_sun_eight_triangles = LazyCurve(file_name="circle_sun_eight_triangles")
+    circle_wavy_eight_sides = LazyCurve(file_name="circle_wavy_eight_sides")
+    circle_wavy_eight_sides_sun = LazyCurve(file_name="circle_wavy_eight_sides_sun")
+    circle_wavy_hips = LazyCurve(file_name="circle_wavy_hips")
+    circle_wavy_ten_sides = LazyCurve(file_name="circle_wavy_ten_sides")
+    coffee_mug_plate_side = LazyCurve(file_name="coffee_mug_plate_side")
+    concave_crescent = LazyCurve(file_name="concave_crescent")
+    concave_crescent_handle = LazyCurve(file_name="concave_crescent_handle")
+    concave_crescent_skinny = LazyCurve(file_name="concave_crescent_skinny")
+    creature_batman_symbol = LazyCurve(file_name="creature_batman_symbol")
+    creature_bat_simplified = LazyCurve(file_name="creature_bat_simplified")
+    creature_bat_simplified_two = LazyCurve(file_name="creature_bat_simplified_two")
+    creature_bird_seagull_side = LazyCurve(file_name="creature_bird_seagull_side")
+    creature_bird_side_stylized = LazyCurve(file_name="creature_bird_side_stylized")
+    creature_bird_symbol_side = LazyCurve(file_name="creature_bird_symbol_side")
+    creature_bull_side = LazyCurve(file_name="creature_bull_side")
+    creature_butterfly_top = LazyCurve(file_name="creature_butterfly_top")
+    creature_cat_side = LazyCurve(file_name="creature_cat_side")
+    creature_cat_stylized_front = LazyCurve(file_name="creature_cat_stylized_front")
+    creature_claw_horny_nail_bird = LazyCurve(file_name="creature_claw_horny_nail_bird")
+    creature_cow_front = LazyCurve(file_name="creature_cow_front")
+    creature_crab_top = LazyCurve(file_name="creature_crab_top")
+    creature_deer_side = LazyCurve(file_name="creature_deer_side")
+    creature_dinosaur_pterodactyl = LazyCurve(file_name="creature_dinosaur_pterodactyl")
+    creature_dinosaur_trex = LazyCurve(file_name="creature_dinosaur_trex")
+    creature_dog_face_front = LazyCurve(file_name="creature_dog_face_front")
+    creature_dog_schnauzer = LazyCurve(file_name="creature_dog_schnauzer")
+    creature_dog_side = LazyCurve(file_name="creature_dog_side")
+    creature_dog_sitting_side = LazyCurve(file_name="creature_dog_sitting_side")
+    creature_dragonfly_top = LazyCurve(file_name="creature_dragonfly_top")
+    creature_dragon_bat_wing = LazyCurve(file_name="creature_dragon_bat_wing")
+    creature_dragon_side = LazyCurve(file_name="creature_dragon_side")
+    creature_dragon_side_body = LazyCurve(file_name="creature_dragon_side_body")
+    creature_duck_stylized = LazyCurve(file_name="creature_duck_stylized")
+    creature_evil_boss_blood = LazyCurve(file_name="creature_evil_boss_blood")
+    creature_evil_cell_virus = LazyCurve(file_name="creature_evil_cell_virus")
+    creature_fish_eating = LazyCurve(file_name="creature_fish_eating")
+    creature_fish_side_small = LazyCurve(file_name="creature_fish_side_small")
+    creature_frog_persp = LazyCurve(file_name="creature_frog_persp")
+    creature_frog_webbed_feet_paw = LazyCurve(file_name="creature_frog_webbed_feet_paw")
+    creature_gecko_lizard_top = LazyCurve(file_name="creature_gecko_lizard_top")
+    creature_giraffe_persp = LazyCurve(file_name="creature_giraffe_persp")
+    creature_gorilla = LazyCurve(file_name="creature_gorilla")
+    creature_heads_hydra_dragon = LazyCurve(file_name="creature_heads_hydra_dragon")
+    creature_horse_head_front = LazyCurve(file_name="creature_horse_head_front")
+    creature_lion_side = LazyCurve(file_name="creature_lion_side")
+    creature_llama_side = LazyCurve(file_name="creature_llama_side")
+    creature_long_dragon = LazyCurve(file_name="creature_long_dragon")
+    creature_lower_teeth_vampire = LazyCurve(file_name="creature_lower_teeth_vampire")
+    creature_octopus = LazyCurve(file_name="creature_octopus")
+    creature_paw = LazyCurve(file_name="creature_paw")
+    creature_paw_claw = LazyCurve(file_name="creature_paw_claw")
+    creature_paw_four_toes = LazyCurve(file_name="creature_paw_four_toes")
+    creature_pig_side = LazyCurve(file_name="creature_pig_side")
+    creature_rabbit_side = LazyCurve(file_name="creature_rabbit_side")
+    creature_rabbit_side_outline = LazyCurve(file_name="creature_rabbit_side_outline")
+    creature_reptile_lizard_side = LazyCurve(file_name="creature_reptile_lizard_side")
+    creature_shark_teeth = LazyCurve(file_name="creature_shark_teeth")
+    creature_sheep_side = LazyCurve(file_name="creature_sheep_side")
+    creature_side_bird_dove = LazyCurve(file_name="creature_side_bird_dove")
+    creature_snake_front = LazyCurve(file_name="creature_snake_front")
+    creature_snake_side = LazyCurve(file_name="creature_snake_side")
+    creature_snake_top = LazyCurve(file_name="creature_snake_top")
+    creature_spider_top = LazyCurve(file_name="creature_spider_top")
+    creature_tentacle = LazyCurve(file_name="creature_tentacle")
+    creature_tentacle_inside_suckers = LazyCurve(file_name="creature_tentacle_inside_suckers")
+    creature_tentacle_spiky = LazyCurve(file_name="creature_tentacle_spiky")
+    creature_tentacle_suckers = LazyCurve(file_name="creature_tentacle_suckers")
+    creature_three_heads_hydra = LazyCurve(file_name="creature_three_heads_hydra")
+    creature_tutle_top = LazyCurve(file_name="creature_tutle_top")
+    creature_unicorn = LazyCurve(file_name="creature_unicorn")
+    creature_whale_side = LazyCurve(file_name="creature_whale_side")
+    creature_wings_angel = LazyCurve(file_name="creature_wings_angel")
+    creature_wings_fairy = LazyCurve(file_name="creature_wings_fairy")
+    creature_wing_bat_dragon = LazyCurve(file_name="creature_wing_bat_dragon")
+    creature_wing_thin_side = LazyCurve(file_name="creature_wing_thin_side")
+    creature_wolf_side_dog = LazyCurve(file_name="creature_wolf_side_dog")
+    creature_wolf_stylized = LazyCurve(file_name="creature_wolf_stylized")
+    cross_circle_heads = LazyCurve(file_name="cross_circle_heads")
+    cross_plus_add = LazyCurve(file_name="cross_plus_add")
+    cross_plus_small = LazyCurve(file_name="cross_plus_small")
+    dice_die_six_four = LazyCurve(file_name="dice_die_six_four")
+    dice_die_six_give = LazyCurve(file_name="dice_die_six_give")
+    dice_die_six_one = LazyCurve(file_name="dice_die_six_one")
+    dice_die_six_six = LazyCurve(file_name="dice_die_six_six")
+    dice_die_six_three = LazyCurve(file_name="dice_die_six_three")
+    dice_die_six_two = LazyCurve(file_name="dice_die_six_two")
+    extrude_profile_baseboard_a = LazyCurve(file_name="extrude_profile_baseboard_a")
+    extrude_profile_faucet_pipe_a = LazyCurve(file_name="extrude_profile_faucet_pipe_a")
+    four_leaf_clover = LazyCurve(file_name="four_leaf_clover")
+    gear_crown_eight_sides = LazyCurve(file_name="gear_crown_eight_sides")
+    gear_eight_sides = LazyCurve(file_name="gear_eight_sides")
+    gear_eight_sides_smooth = LazyCurve(file_name="gear_eight_sides_smooth")
+    gear_four_sides = LazyCurve(file_name="gear_four_sides")
+    gear_sharp_smooth = LazyCurve(file_name="gear_sharp_smooth")
+    gear_sixteen_sides = LazyCurve(file_name="gear_sixteen_sides")
+    gear_six_sides = LazyCurve(file_name="gear_six_sides")
+    gear_twelve_sides = LazyCurve(file_name="gear_twelve_sides")
+    gear_twenty_sides = LazyCurve(file_name="gear_twenty_sides")
+    human_arm_strong_side = LazyCurve(file_name="human_arm_strong_side")
+    human_baby_symbol = LazyCurve(file_name="human_baby_symbol")
+    human_ear = LazyCurve(file_name="human_ear")
+    human_enlight_shine_man = LazyCurve(file_name="human_enlight_shine_man")
+    human_eye_front_active = LazyCurve(file_name="human_eye_front_active")
+    human_eye_front_inactive = LazyCurve(file_name="human_eye_front_inactive")
+    human_eye_iris_closeup = LazyCurve(file_name="human_eye_iris_closeup")
+    human_face_side = LazyCurve(file_name="human_face_side")
+    human_foot_outline = LazyCurve(file_name="human_foot_outline")
+    human_foot_shoe_heel = LazyCurve(file_name="human_foot_shoe_heel")
+    human_foot_stylized = LazyCurve(file_name="human_foot_stylized")
+    human_hand_fist_stylized = LazyCurve(file_name="human_hand_fist_stylized")
+    human_hand_open_fingers = LazyCurve(file_name="human_hand_open_fingers")
+    human_hand_raising = LazyCurve(file_name="human_hand_raising")
+    human_hand_side = LazyCurve(file_name="human_hand_side")
+    human_hand_simplified = LazyCurve(file_name="human_hand_simplified")
+    human_hand_squared = LazyCurve(file_name="human_hand_squared")
+    human_hand_stylized = LazyCurve(file_name="human_hand_stylized")
+    human_head_gears_thinking = LazyCurve(file_name="human_head_gears_thinking")
+    human_head_outline_front = LazyCurve(file_name="human_head_outline_front")
+    human_head_outline_side = LazyCurve(file_name="human_head_outline_side")
+    human_man_open_arms = LazyCurve(file_name="human_man_open_arms")
+    human_man_running = LazyCurve(file_name="human_man_running")
+    human_man_torso_front = LazyCurve(file_name="human_man_torso_front")
+    human_man_walking = LazyCurve(file_name="human_man_walking")
+    human_man_wc = LazyCurve(file_name="human_man_wc")
+    human_man_ws_short = LazyCurve(file_name="human_man_ws_short")
+    human_mouth_lips = LazyCurve(file_name="human_mouth_lips")
+    human_skull_side = LazyCurve(file_name="human_skull_side")
+    human_strong_man_front = LazyCurve(file_name="human_strong_man_front")
+    human_symbol_eye_side = LazyCurve(file_name="human_symbol_eye_side")
+    human_walking_dog = LazyCurve(file_name="human_walking_dog")
+    human_woman_outline_front = LazyCurve(file_name="human_woman_outline_front")
+    human_woman_running = LazyCurve(file_name="human_woman_running")
+    human_woman_walking = LazyCurve(file_name="human_woman_walking")
+    human_woman_wc = LazyCurve(file_name="human_woman_wc")
+    icon_apple = LazyCurve(file_name="icon_apple")
+    icon_autodesk = LazyCurve(file_name="icon_autodesk")
+    icon_blender = LazyCurve(file_name="icon_blender")
+    icon_code_c_plus_plus = LazyCurve(file_name="icon_code_c_plus_plus")
+    icon_code_c_sharp = LazyCurve(file_name="icon_code_c_sharp")
+    icon_code_js_javascript = LazyCurve(file_name="icon_code_js_javascript")
+    icon_cursor = LazyCurve(file_name="icon_cursor")
+    icon_github_octocat = LazyCurve(file_name="icon_github_octocat")
+    icon_github_octocat_detailed = LazyCurve(file_name="icon_github_octocat_detailed")
+    icon_godot_logo = LazyCurve(file_name="icon_godot_logo")
+    icon_hand_click_index = LazyCurve(file_name="icon_hand_click_index")
+    icon_houdini_sidefx = LazyCurve(file_name="icon_houdini_sidefx")
+    icon_maya_autodesk_retro_word = LazyCurve(file_name="icon_maya_autodesk_retro_word")
+    icon_python = LazyCurve(file_name="icon_python")
+    icon_raspberry_pi = LazyCurve(file_name="icon_raspberry_pi")
+    icon_review_star = LazyCurve(file_name="icon_review_star")
+    icon_review_star_half = LazyCurve(file_name="icon_review_star_half")
+    icon_splash = LazyCurve(file_name="icon_splash")
+    icon_unity_logo = LazyCurve(file_name="icon_unity_logo")
+    icon_unity_logo_retro = LazyCurve(file_name="icon_unity_logo_retro")
+    icon_unreal_engine = LazyCurve(file_name="icon_unreal_engine")
+    icon_windows = LazyCurve(file_name="icon_windows")
+    icon_zbrush_maxon = LazyCurve(file_name="icon_zbrush_maxon")
+    letter_asterisk = LazyCurve(file_name="letter_asterisk")
+    line_two_points = LazyCurve(file_name="line_two_points")
+    locator = LazyCurve(file_name="locator")
+    locator_handle_arrows = LazyCurve(file_name="locator_handle_arrows")
+    locator_handle_xyz = LazyCurve(file_name="locator_handle_xyz")
+    locator_with_axis = LazyCurve(file_name="locator_with_axis")
+    peanut = LazyCurve(file_name="peanut")
+    pin = LazyCurve(file_name="pin")
+    pin_arrow_to_circle = LazyCurve(file_name="pin_arrow_to_circle")
+    pin_arrow_to_target = LazyCurve(file_name="pin_arrow_to_target")
+    pin_circle_to_arrow = LazyCurve(file_name="pin_circle_to_arrow")
+    pin_diamond_six_sides = LazyCurve(file_name="pin_diamond_six_sides")
+    pin_flag = LazyCurve(file_name="pin_flag")
+    pin_four_sides_flat_pyramids = LazyCurve(file_name="pin_four_sides_flat_pyramids")
+    pin_hollow_two_sides = LazyCurve(file_name="pin_hollow_two_sides")
+    pin_large = LazyCurve(file_name="pin_large")
+    pin_large_four_sides = LazyCurve(file_name="pin_large_four_sides")
+    pin_large_two_sides = LazyCurve(file_name="pin_large_two_sides")
+    pin_speech_bubble = LazyCurve(file_name="pin_speech_bubble")
+    pin_target_to_arrow = LazyCurve(file_name="pin_target_to_arrow")
+    primitive_cone = LazyCurve(file_name="primitive_cone")
+    primitive_cube = LazyCurve(file_name="primitive_cube")
+    primitive_diamond = LazyCurve(file_name="primitive_diamond")
+    primitive_hexagonal_tube = LazyCurve(file_name="primitive_hexagonal_tube")
+    primitive_pyramid = LazyCurve(file_name="primitive_pyramid")
+    primitive_pyramid_half = LazyCurve(file_name="primitive_pyramid_half")
+    primitive_tube = LazyCurve(file_name="primitive_tube")
+    primitive_tube_half = LazyCurve(file_name="primitive_tube_half")
+    primitive_tube_ring = LazyCurve(file_name="primitive_tube_ring")
+    revolve_profile_bottle_a = LazyCurve(file_name="revolve_profile_bottle_a")
+    revolve_profile_bowl_a = LazyCurve(file_name="revolve_profile_bowl_a")
+    revolve_profile_bowl_b = LazyCurve(file_name="revolve_profile_bowl_b")
+    revolve_profile_cork_a = LazyCurve(file_name="revolve_profile_cork_a")
+    revolve_profile_faucet_base_a = LazyCurve(file_name="revolve_profile_faucet_base_a")
+    revolve_profile_faucet_head_a = LazyCurve(file_name="revolve_profile_faucet_head_a")
+    revolve_profile_plate_b = LazyCurve(file_name="revolve_profile_plate_b")
+    revolve_profile_plate_c = LazyCurve(file_name="revolve_profile_plate_c")
+    rhombus = LazyCurve(file_name="rhombus")
+    rhombus_long = LazyCurve(file_name="rhombus_long")
+    sphere_dome = LazyCurve(file_name="sphere_dome")
+    sphere_four_directions = LazyCurve(file_name="sphere_four_directions")
+    sphere_half_arrow = LazyCurve(file_name="sphere_half_arrow")
+    sphere_half_double_arrows = LazyCurve(file_name="sphere_half_double_arrows")
+    sphere_half_double_arrows_skinny = LazyCurve(file_name="sphere_half_double_arrows_skinny")
+    sphere_half_four_arrows = LazyCurve(file_name="sphere_half_four_arrows")
+    sphere_half_top_four_arrows = LazyCurve(file_name="sphere_half_top_four_arrows")
+    sphere_half_two_arrows = LazyCurve(file_name="sphere_half_two_arrows")
+    sphere_joint = LazyCurve(file_name="sphere_joint")
+    sphere_joint_loc = LazyCurve(file_name="sphere_joint_loc")
+    sphere_joint_smooth = LazyCurve(file_name="sphere_joint_smooth")
+    sphere_two_directions = LazyCurve(file_name="sphere_two_directions")
+    spring = LazyCurve(file_name="spring")
+    spring_high_frequency = LazyCurve(file_name="spring_high_frequency")
+    spring_low_frequency = LazyCurve(file_name="spring_low_frequency")
+    square = LazyCurve(file_name="square")
+    squares_connected = LazyCurve(file_name="squares_connected")
+    square_corner_flat = LazyCurve(file_name="square_corner_flat")
+    square_corner_flat_skinny = LazyCurve(file_name="square_corner_flat_skinny")
+    swirl_five_spaces = LazyCurve(file_name="swirl_five_spaces")
+    swirl_thick_round_four_spaces = LazyCurve(file_name="swirl_thick_round_four_spaces")
+    swirl_thick_squared_four_spaces = LazyCurve(file_name="swirl_thick_squared_four_spaces")
+    swirl_two_spaces = LazyCurve(file_name="swirl_two_spaces")
+    switch_ik_fk_left = LazyCurve(file_name="switch_ik_fk_left")
+    switch_ik_fk_right = LazyCurve(file_name="switch_ik_fk_right")
+    symbol_attach_clip = LazyCurve(file_name="symbol_attach_clip")
+    symbol_attach_clip_squared = LazyCurve(file_name="symbol_attach_clip_squared")
+    symbol_batman_simplified = LazyCurve(file_name="symbol_batman_simplified")
+    symbol_bell = LazyCurve(file_name="symbol_bell")
+    symbol_bones_crossed = LazyCurve(file_name="symbol_bones_crossed")
+    symbol_bones_crossed_bottom = LazyCurve(file_name="symbol_bones_crossed_bottom")
+    symbol_bone_simple = LazyCurve(file_name="symbol_bone_simple")
+    symbol_bug_low_res_retro = LazyCurve(file_name="symbol_bug_low_res_retro")
+    symbol_bug_smoth = LazyCurve(file_name="symbol_bug_smoth")
+    symbol_camera_front = LazyCurve(file_name="symbol_camera_front")
+    symbol_camera_hollow = LazyCurve(file_name="symbol_camera_hollow")
+    symbol_camera_simple = LazyCurve(file_name="symbol_camera_simple")
+    symbol_canada_maple_leaf = LazyCurve(file_name="symbol_canada_maple_leaf")
+    symbol_card_suits_clover_clubs = LazyCurve(file_name="symbol_card_suits_clover_clubs")
+    symbol_card_suits_spades_pikes = LazyCurve(file_name="symbol_card_suits_spades_pikes")
+    symbol_chain_constraint = LazyCurve(file_name="symbol_chain_constraint")
+    symbol_chess_pawn_side = LazyCurve(file_name="symbol_chess_pawn_side")
+    symbol_chess_tower_rook = LazyCurve(file_name="symbol_chess_tower_rook")
+    symbol_code = LazyCurve(file_name="symbol_code")
+    symbol_computer_desktop = LazyCurve(file_name="symbol_computer_desktop")
+    symbol_connected_four = LazyCurve(file_name="symbol_connected_four")
+    symbol_connected_three_webhook = LazyCurve(file_name="symbol_connected_three_webhook")
+    symbol_controller_old = LazyCurve(file_name="symbol_controller_old")
+    symbol_control_pad = LazyCurve(file_name="symbol_control_pad")
+    symbol_cube_vertex_connected = LazyCurve(file_name="symbol_cube_vertex_connected")
+    symbol_danger_energy = LazyCurve(file_name="symbol_danger_energy")
+    symbol_diamond = LazyCurve(file_name="symbol_diamond")
+    symbol_dollar_sign_money = LazyCurve(file_name="symbol_dollar_sign_money")
+    symbol_eighteen_plus = LazyCurve(file_name="symbol_eighteen_plus")
+    symbol_emoji_one_hundred = LazyCurve(file_name="symbol_emoji_one_hundred")
+    symbol_emoji_poop = LazyCurve(file_name="symbol_emoji_poop")
+    symbol_emoji_robot = LazyCurve(file_name="symbol_emoji_robot")
+    symbol_emoji_skull = LazyCurve(file_name="symbol_emoji_skull")
+    symbol_emoji_smiley_face = LazyCurve(file_name="symbol_emoji_smiley_face")
+    symbol_emoji_smiley_ghost = LazyCurve(file_name="symbol_emoji_smiley_ghost")
+    symbol_emoji_smiley_missing = LazyCurve(file_name="symbol_emoji_smiley_missing")
+    symbol_emoji_thumbs_up = LazyCurve(file_name="symbol_emoji_thumbs_up")
+    symbol_family_holding_hands = LazyCurve(file_name="symbol_family_holding_hands")
+    symbol_female = LazyCurve(file_name="symbol_female")
+    symbol_filter = LazyCurve(file_name="symbol_filter")
+    symbol_flag_brazil = LazyCurve(file_name="symbol_flag_brazil")
+    symbol_flag_canada = LazyCurve(file_name="symbol_flag_canada")
+    symbol_flag_usa = LazyCurve(file_name="symbol_flag_usa")
+    symbol_flag_usa_simplified = LazyCurve(file_name="symbol_flag_usa_simplified")
+    symbol_flames = LazyCurve(file_name="symbol_flames")
+    symbol_focus_a = LazyCurve(file_name="symbol_focus_a")
+    symbol_food_fork_knife = LazyCurve(file_name="symbol_food_fork_knife")
+    symbol_four_loops = LazyCurve(file_name="symbol_four_loops")
+    symbol_frame_photo = LazyCurve(file_name="symbol_frame_photo")
+    symbol_game_controller_retro = LazyCurve(file_name="symbol_game_controller_retro")
+    symbol_heart = LazyCurve(file_name="symbol_heart")
+    symbol_heart_squared_smooth = LazyCurve(file_name="symbol_heart_squared_smooth")
+    symbol_hold_weapon_sword = LazyCurve(file_name="symbol_hold_weapon_sword")
+    symbol_human_dress = LazyCurve(file_name="symbol_human_dress")
+    symbol_human_man_touch = LazyCurve(file_name="symbol_human_man_touch")
+    symbol_human_shirt = LazyCurve(file_name="symbol_human_shirt")
+    symbol_icon_keyframe = LazyCurve(file_name="symbol_icon_keyframe")
+    symbol_infinite = LazyCurve(file_name="symbol_infinite")
+    symbol_key = LazyCurve(file_name="symbol_key")
+    symbol_key_front_simple = LazyCurve(file_name="symbol_key_front_simple")
+    symbol_key_side_detailed = LazyCurve(file_name="symbol_key_side_detailed")
+    symbol_key_side_round = LazyCurve(file_name="symbol_key_side_round")
+    symbol_key_side_squared = LazyCurve(file_name="symbol_key_side_squared")
+    symbol_key_squared = LazyCurve(file_name="symbol_key_squared")
+    symbol_kunai_knife = LazyCurve(file_name="symbol_kunai_knife")
+    symbol_letter = LazyCurve(file_name="symbol_letter")
+    symbol_lighting_energy_simple = LazyCurve(file_name="symbol_lighting_energy_simple")
+    symbol_lighting_energy_smooth = LazyCurve(file_name="symbol_lighting_energy_smooth")
+    symbol_lock_locked = LazyCurve(file_name="symbol_lock_locked")
+    symbol_lock_unlocked = LazyCurve(file_name="symbol_lock_unlocked")
+    symbol_magic_wand = LazyCurve(file_name="symbol_magic_wand")
+    symbol_male = LazyCurve(file_name="symbol_male")
+    symbol_man_fencing_sword = LazyCurve(file_name="symbol_man_fencing_sword")
+    symbol_man_front = LazyCurve(file_name="symbol_man_front")
+    symbol_man_strong = LazyCurve(file_name="symbol_man_strong")
+    symbol_music_two_notes = LazyCurve(file_name="symbol_music_two_notes")
+    symbol_music_two_notes_same = LazyCurve(file_name="symbol_music_two_notes_same")
+    symbol_old_sign = LazyCurve(file_name="symbol_old_sign")
+    symbol_omega = LazyCurve(file_name="symbol_omega")
+    symbol_paint_bucket = LazyCurve(file_name="symbol_paint_bucket")
+    symbol_parameters = LazyCurve(file_name="symbol_parameters")
+    symbol_pirate = LazyCurve(file_name="symbol_pirate")
+    symbol_pirate_skull_bones_crossed = LazyCurve(file_name="symbol_pirate_skull_bones_crossed")
+    symbol_pirate_sword_skull = LazyCurve(file_name="symbol_pirate_sword_skull")
+    symbol_plant_fin_grow = LazyCurve(file_name="symbol_plant_fin_grow")
+    symbol_plug = LazyCurve(file_name="symbol_plug")
+    symbol_plug_side = LazyCurve(file_name="symbol_plug_side")
+    symbol_pointy_sun = LazyCurve(file_name="symbol_pointy_sun")
+    symbol_puzzle = LazyCurve(file_name="symbol_puzzle")
+    symbol_question_mark = LazyCurve(file_name="symbol_question_mark")
+    symbol_radioactive = LazyCurve(file_name="symbol_radioactive")
+    symbol_radioactive_circle = LazyCurve(file_name="symbol_radioactive_circle")
+    symbol_shield_simple = LazyCurve(file_name="symbol_shield_simple")
+    symbol_smelly_poop = LazyCurve(file_name="symbol_smelly_poop")
+    symbol_snowflake = LazyCurve(file_name="symbol_snowflake")
+    symbol_snowflake_complex = LazyCurve(file_name="symbol_snowflake_complex")
+    symbol_snowflake_simplified = LazyCurve(file_name="symbol_snowflake_simplified")
+    symbol_speech_bubble = LazyCurve(file_name="symbol_speech_bubble")
+    symbol_squared_lock_locked = LazyCurve(file_name="symbol_squared_lock_locked")
+    symbol_squared_lock_unlocked = LazyCurve(file_name="symbol_squared_lock_unlocked")
+    symbol_sun_light = LazyCurve(file_name="symbol_sun_light")
+    symbol_sword = LazyCurve(file_name="symbol_sword")
+    symbol_tag_simple = LazyCurve(file_name="symbol_tag_simple")
+    symbol_tag_x = LazyCurve(file_name="symbol_tag_x")
+    symbol_tech_fan = LazyCurve(file_name="symbol_tech_fan")
+    symbol_tech_fan_case = LazyCurve(file_name="symbol_tech_fan_case")
+    symbol_three_hexagons = LazyCurve(file_name="symbol_three_hexagons")
+    symbol_tool_hammer = LazyCurve(file_name="symbol_tool_hammer")
+    symbol_uv_unwrapped = LazyCurve(file_name="symbol_uv_unwrapped")
+    symbol_virus_proteins = LazyCurve(file_name="symbol_virus_proteins")
+    symbol_wand_magic_star = LazyCurve(file_name="symbol_wand_magic_star")
+    symbol_wc_woman_front = LazyCurve(file_name="symbol_wc_woman_front")
+    symbol_woman_arms_up = LazyCurve(file_name="symbol_woman_arms_up")
+    symbol_wrench = LazyCurve(file_name="symbol_wrench")
+    symbol_zoom_in_plus = LazyCurve(file_name="symbol_zoom_in_plus")
+    target_aim_circle = LazyCurve(file_name="target_aim_circle")
+    target_aim_circle_drain = LazyCurve(file_name="target_aim_circle_drain")
+    target_circle = LazyCurve(file_name="target_circle")
+    target_circle_barrel_detailed = LazyCurve(file_name="target_circle_barrel_detailed")
+    target_squared = LazyCurve(file_name="target_squared")
+    target_squared_thick = LazyCurve(file_name="target_squared_thick")
+    target_square_circle_thick = LazyCurve(file_name="target_square_circle_thick")
+    target_wheel_helm_complex = LazyCurve(file_name="target_wheel_helm_complex")
+    target_wheel_helm_simple = LazyCurve(file_name="target_wheel_helm_simple")
+    tool_dial_caliper_measure = LazyCurve(file_name="tool_dial_caliper_measure")
+    tool_grass_cutter = LazyCurve(file_name="tool_grass_cutter")
+    tool_magnet = LazyCurve(file_name="tool_magnet")
+    tool_pair_scissors = LazyCurve(file_name="tool_pair_scissors")
+    tool_pickaxe = LazyCurve(file_name="tool_pickaxe")
+    tool_robot_arm_side = LazyCurve(file_name="tool_robot_arm_side")
+    tool_ruler = LazyCurve(file_name="tool_ruler")
+    tool_screwdriver = LazyCurve(file_name="tool_screwdriver")
+    tool_shovel = LazyCurve(file_name="tool_shovel")
+    tool_wrench = LazyCurve(file_name="tool_wrench")
+    triangle_pyramid_flat_four_arrows = LazyCurve(file_name="triangle_pyramid_flat_four_arrows")
+    triangle_pyramid_flat_two_arrows = LazyCurve(file_name="triangle_pyramid_flat_two_arrows")
+    ui_attention_exclamation = LazyCurve(file_name="ui_attention_exclamation")
+    weapon_battle_axe_side = LazyCurve(file_name="weapon_battle_axe_side")
+    weapon_dagger_top = LazyCurve(file_name="weapon_dagger_top")
+    weapon_grenade_launcher = LazyCurve(file_name="weapon_grenade_launcher")
+    weapon_hook_lance_teeth_thorn = LazyCurve(file_name="weapon_hook_lance_teeth_thorn")
+    weapon_mp4_rifle = LazyCurve(file_name="weapon_mp4_rifle")
+    weapon_pistols_crossed = LazyCurve(file_name="weapon_pistols_crossed")
+    weapon_pistol_modern_side = LazyCurve(file_name="weapon_pistol_modern_side")
+    weapon_pistol_side = LazyCurve(file_name="weapon_pistol_side")
+    weapon_rifle_modern = LazyCurve(file_name="weapon_rifle_modern")
+    weapon_shrunken_five = LazyCurve(file_name="weapon_shrunken_five")
+    weapon_shrunken_four = LazyCurve(file_name="weapon_shrunken_four")
+    weapon_shrunken_four_blades = LazyCurve(file_name="weapon_shrunken_four_blades")
+    weapon_sword_rapier = LazyCurve(file_name="weapon_sword_rapier")
+    weapon_symbol_bomb = LazyCurve(file_name="weapon_symbol_bomb")
+    weapon_symbol_bomb_two = LazyCurve(file_name="weapon_symbol_bomb_two")
+    weapon_symbol_grenade = LazyCurve(file_name="weapon_symbol_grenade")
 
 
 # ------------------------------ Curves Class Utilities Start ------------------------------
@@ -1702,7 +1975,7 @@ def print_code_for_crv_files(target_dir=None, ignore_private=True, use_output_wi
     for file in os.listdir(target_dir):
         if file.endswith(".crv"):
             file_stripped = file.replace(".crv", "")
-            line = f'{file_stripped} = get_curve(file_name="{file_stripped}")'
+            line = f'{file_stripped} = LazyCurve(file_name="{file_stripped}")'
             if file.startswith("_") and ignore_private:
                 continue
             print_lines.append(line)
@@ -1730,6 +2003,74 @@ def print_code_for_crv_files(target_dir=None, ignore_private=True, use_output_wi
     return output
 
 
+def write_curve_manifest(target_dir=None):
+    """
+    Internal function used to (re)generate the curve manifest for every ".crv" file found in the "target_dir".
+    The manifest allows the "Curves" class (through "LazyCurve") to list curves without reading their point data.
+    It should be regenerated whenever a curve file is added, removed or modified.
+    Args:
+        target_dir (str, optional): If provided, this path will be used instead of the default "core/data/curves" path.
+    Returns:
+        str or None: Path to the written manifest file. None if it failed.
+    """
+    if not target_dir:
+        target_dir = DataDirConstants.DIR_CURVES
+    manifest = {}
+    for file in sorted(os.listdir(target_dir)):
+        if file.endswith(f".{CURVE_FILE_EXTENSION}"):
+            curve_data = read_json_dict(os.path.join(target_dir, file))
+            manifest[file[: -len(f".{CURVE_FILE_EXTENSION}")]] = get_curve_manifest_entry_from_data(curve_data)
+    manifest_path = get_curve_manifest_path(curve_dir=target_dir)
+    _curve_manifest_cache.pop(manifest_path, None)
+    return write_json(path=manifest_path, data=manifest)
+
+
+def write_curve_pack(target_dir=None):
+    """
+    Internal function used to (re)generate the curve pack for every ".crv" file found in the "target_dir".
+    The ".crv" files remain the source of truth, the pack is only a faster way to read them. (See "get_curve_pack_path")
+    It should be regenerated whenever a curve file is added, removed or modified. Until then, modified files are read
+    directly. (See "is_curve_pack_source_valid")
+    Args:
+        target_dir (str, optional): If provided, this path will be used instead of the default "core/data/curves" path.
+    Returns:
+        str or None: Path to the written pack file. None if it failed.
+    """
+    if not target_dir:
+        target_dir = DataDirConstants.DIR_CURVES
+    curves = {}
+    data = bytearray()
+    for file in sorted(os.listdir(target_dir)):
+        if not file.endswith(f".{CURVE_FILE_EXTENSION}"):
+            continue
+        file_path = os.path.join(target_dir, file)
+        curve_data = read_json_dict(file_path)
+        entry = {key: value for key, value in curve_data.items() if key != "shapes"}
+        values = []
+        shape_entries = []
+        for shape_data in curve_data.get("shapes") or []:
+            shape_entry = dict(shape_data)
+            points = shape_data.get("points") or []
+            for point in points:
+                values.extend(point)
+            shape_entry["points"] = len(points)
+            knot = shape_data.get("knot")
+            if knot is not None:
+                values.extend(knot)
+                shape_entry["knot"] = len(knot)
+            shape_entries.append(shape_entry)
+        curve_bytes = array_to_bytes(values, typecode="d")
+        entry["shapes"] = shape_entries
+        entry["source"] = get_curve_pack_source_entry(file_path)
+        entry["offset"] = len(data)
+        entry["length"] = len(curve_bytes)
+        data.extend(curve_bytes)
+        curves[file[: -len(f".{CURVE_FILE_EXTENSION}")]] = entry
+    pack_path = get_curve_pack_path(curve_dir=target_dir)
+    _curve_pack_cache.pop(pack_path, None)
+    return write_packed_file(path=pack_path, header={"curves": curves}, data=bytes(data))
+
+
 # ------------------------------ Curves Collection Utilities End ------------------------------
 
 
@@ -1999,6 +2340,8 @@ if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
     # add_thumbnail_metadata_attr_to_selection()
     # print_code_for_crv_files()
+    # write_curve_manifest()
+    # write_curve_pack()
     # write_curve_files_from_selection(target_dir=DataDirConstants.DIR_CURVES, overwrite=True)  # Extract Curve
     # generate_curves_thumbnails(target_dir=None, force=True)  # Generate Thumbnails - (target_dir=None = Desktop)
     crv_transform = cmds.ls(selection=True)[0]
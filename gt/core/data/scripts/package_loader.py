@@ -6,6 +6,7 @@ e.g. Windows: "Documents/maya/gt-tools"
 import maya.utils as utils
 import maya.cmds as cmds
 import logging
+import time
 import sys
 import os
 
@@ -25,7 +26,9 @@ def load_package_menu(package_path=None):
     if package_path not in sys.path:
         sys.path.append(package_path)
     try:
+        start_time = time.perf_counter()
         from gt.tools.package_setup import gt_tools_maya_menu
+        gt_tools_maya_menu.record_startup_timing("loader_import", time.perf_counter() - start_time)
         gt_tools_maya_menu.load_menu()
         from gt.tools.package_updater import silently_check_for_updates
         silently_check_for_updates()
@@ -8,9 +8,12 @@ Code Namespace:
 
 import zipfile
 import logging
+import struct
 import shutil
+import array
 import stat
 import json
+import sys
 import os
 
 # Logging Setup
@@ -18,6 +21,11 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Packed Files - Signature, format version, header length (little-endian)
+PACKED_FILE_SIGNATURE = b"GTPK"
+PACKED_FILE_VERSION = 1
+PACKED_FILE_PREFIX = struct.Struct("<4sHI")
+
 
 class DataDirConstants:
     def __init__(self):
@@ -433,5 +441,140 @@ def is_json_serializable(data, allow_none=True):
         return False
 
 
+def array_to_bytes(values, typecode="d"):
+    """
+    Converts a sequence of numbers to little-endian bytes. (Used to store numeric data in packed files)
+
+    Args:
+        values (array.array, list, tuple): Numbers to convert. If an array is provided, its typecode is used.
+        typecode (str, optional): The array typecode used when "values" is not an array. e.g. "d" (double), "i" (int)
+
+    Returns:
+        bytes: The values as little-endian bytes.
+    """
+    if not isinstance(values, array.array):
+        values = array.array(typecode, values)
+    if sys.byteorder != "little":
+        values = array.array(values.typecode, values)  # Copy, so the input is not modified
+        values.byteswap()
+    return values.tobytes()
+
+
+def bytes_to_array(data, typecode="d"):
+    """
+    Converts little-endian bytes (see "array_to_bytes") back to an array of numbers.
+
+    Args:
+        data (bytes): Bytes to convert.
+        typecode (str, optional): The array typecode used to interpret the data. e.g. "d" (double), "i" (int)
+
+    Returns:
+        array.array: An array with the converted values.
+    """
+    values = array.array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def write_packed_file(path, header, data):
+    """
+    Writes a packed file. A packed file is a small JSON header (index) followed by a binary data section.
+    The header usually describes where each element is stored in the data section (offsets and lengths), so
+    elements can be read individually without parsing the whole file. (See "read_packed_file_data")
+
+    Args:
+        path (str): The file path where the data will be saved. Existing files are overwritten.
+        header (dict): A JSON serializable dictionary describing the data section.
+        data (bytes): The binary data section.
+
+    Returns:
+        str or None: If successful, returns the path where the data was saved. None if it failed.
+    """
+    try:
+        header_bytes = json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        prefix = PACKED_FILE_PREFIX.pack(PACKED_FILE_SIGNATURE, PACKED_FILE_VERSION, len(header_bytes))
+        with open(path, "wb") as packed_file:
+            packed_file.write(prefix)
+            packed_file.write(header_bytes)
+            packed_file.write(data)
+        return path
+    except PermissionError:
+        logger.warning(f"Error: Permission denied when writing to '{path}'.")
+    except Exception as e:
+        logger.warning(f"An error occurred while writing packed file to {path}: {e}")
+
+
+def is_packed_file(path):
+    """
+    Checks if the provided path is a packed file. (See "write_packed_file")
+
+    Args:
+        path (str): Path to the file to check.
+
+    Returns:
+        bool: True if the file exists and starts with the packed file signature, False otherwise.
+    """
+    try:
+        with open(path, "rb") as packed_file:
+            return packed_file.read(len(PACKED_FILE_SIGNATURE)) == PACKED_FILE_SIGNATURE
+    except (OSError, TypeError):
+        return False
+
+
+def read_packed_file_header(path):
+    """
+    Reads the header of a packed file. (See "write_packed_file")
+
+    Args:
+        path (str): Path to the packed file.
+
+    Returns:
+        tuple: A tuple with the header dictionary and the position where the data section starts. e.g. ({...}, 128)
+               If the file could not be read, an empty dictionary and None are returned. e.g. ({}, None)
+    """
+    try:
+        with open(path, "rb") as packed_file:
+            signature, version, header_length = PACKED_FILE_PREFIX.unpack(packed_file.read(PACKED_FILE_PREFIX.size))
+            if signature != PACKED_FILE_SIGNATURE:
+                logger.warning(f"Error: '{path}' is not a packed file.")
+                return {}, None
+            if version > PACKED_FILE_VERSION:
+                logger.warning(f"Error: Unsupported packed file version ({version}) in '{path}'.")
+                return {}, None
+            header = json.loads(packed_file.read(header_length).decode("utf-8"))
+        return header, PACKED_FILE_PREFIX.size + header_length
+    except FileNotFoundError:
+        logger.warning(f"Error: The file '{path}' was not found.")
+    except Exception as e:
+        logger.warning(f"An error occurred while reading packed file header from {path}: {e}")
+    return {}, None
+
+
+def read_packed_file_data(path, data_start, offset=0, length=None):
+    """
+    Reads a portion of the data section of a packed file. (See "write_packed_file" and "read_packed_file_header")
+
+    Args:
+        path (str): Path to the packed file.
+        data_start (int): Position where the data section starts. (Returned by "read_packed_file_header")
+        offset (int, optional): Offset (in bytes) relative to the start of the data section.
+        length (int, optional): Number of bytes to read. If not provided, everything after the offset is read.
+
+    Returns:
+        bytes: The requested data. Empty bytes if it failed.
+    """
+    try:
+        with open(path, "rb") as packed_file:
+            packed_file.seek(data_start + offset)
+            if length is None:
+                return packed_file.read()
+            return packed_file.read(length)
+    except Exception as e:
+        logger.warning(f"An error occurred while reading packed file data from {path}: {e}")
+    return b""
+
+
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
@@ -10,6 +10,7 @@ import gt.core.node as core_node
 import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
 import logging
+import math
 
 # Logging Setup
 logging.basicConfig()
@@ -18,7 +19,13 @@ logger.setLevel(logging.INFO)
 
 
 def orient_joint(
-    joint_list, aim_axis=(1, 0, 0), up_axis=(0, 1, 0), up_dir=(0, 1, 0), detect_up_dir=False, world_aligned=False
+    joint_list,
+    aim_axis=(1, 0, 0),
+    up_axis=(0, 1, 0),
+    up_dir=(0, 1, 0),
+    detect_up_dir=False,
+    world_aligned=False,
+    use_constraints=False,
 ):
     """
     Orient a list of joints in a predictable way.
@@ -31,6 +38,25 @@ def orient_joint(
         up_dir (tuple, optional): The up direction vector. Defaults to (0, 1, 0).
         detect_up_dir (bool, optional): If True, attempt to auto-detect the up direction. Defaults to False.
         world_aligned (bool, optional): If True, it keeps the aim_axis and up_axis given aligning with world axis.
+        use_constraints (bool, optional): If True, it uses the previous method (temporary aim constraints, un-parenting
+                                          and freeze transformations for every joint) instead of the math solver.
+    """
+    orient_kwargs = {
+        "aim_axis": aim_axis,
+        "up_axis": up_axis,
+        "up_dir": up_dir,
+        "detect_up_dir": detect_up_dir,
+        "world_aligned": world_aligned,
+    }
+    if use_constraints:
+        _orient_joint_with_constraints(joint_list, **orient_kwargs)
+    else:
+        _orient_joint_with_solver(joint_list, **orient_kwargs)
+
+
+def _orient_joint_with_constraints(joint_list, aim_axis, up_axis, up_dir, detect_up_dir, world_aligned):
+    """
+    Orient a list of joints using temporary aim constraints. (See "orient_joint" for arguments)
     """
     stored_selection = cmds.ls(selection=True) or []
     starting_up = OpenMaya.MVector((0, 0, 0))
@@ -129,6 +155,211 @@ def orient_joint(
             logger.debug(f"Unable to retrieve previous selection. Issue: {e}")
 
 
+def _get_world_matrix(obj):
+    """
+    Gets the world matrix of a DAG object.
+
+    Args:
+        obj (str): Name or path of the DAG object.
+
+    Returns:
+        OpenMaya.MMatrix: World matrix (inclusive matrix) of the object.
+    """
+    selection = OpenMaya.MSelectionList()
+    selection.add(obj)
+    return selection.getDagPath(0).inclusiveMatrix()
+
+
+def _get_position(matrix):
+    """
+    Gets the translation of a matrix.
+
+    Args:
+        matrix (OpenMaya.MMatrix): Source matrix.
+
+    Returns:
+        OpenMaya.MVector: Translation part of the matrix.
+    """
+    return OpenMaya.MVector(matrix[12], matrix[13], matrix[14])
+
+
+def _orient_joint_with_solver(joint_list, aim_axis, up_axis, up_dir, detect_up_dir, world_aligned):
+    """
+    Orient a list of joints without creating temporary nodes or changing the hierarchy. (See "orient_joint")
+    All world matrices are read once, the new orientations are computed in memory and the resulting
+    "jointOrient" (and translate) values are written in a single pass at the end.
+    Same result as "_orient_joint_with_constraints". Children are kept in place (world-space),
+    joints are expected to have no scale.
+    """
+    world_matrices = {}  # Original world matrices (long name as key)
+    oriented_matrices = {}  # New world matrices of the oriented joints
+
+    def get_world_matrix(path):
+        if path in oriented_matrices:
+            return oriented_matrices.get(path)
+        if path not in world_matrices:
+            world_matrices[path] = _get_world_matrix(path)
+        return world_matrices.get(path)
+
+    tolerance = 0.0001
+    joint_parents = {}
+    preserved_children = []
+    starting_up = OpenMaya.MVector((0, 0, 0))
+    for index, jnt in enumerate(joint_list):
+        jnt = (cmds.ls(str(jnt), long=True) or [str(jnt)])[0]
+        parent = (cmds.listRelatives(jnt, parent=True, fullPath=True) or [""])[0]
+        joint_parents[jnt] = parent
+        children = cmds.listRelatives(jnt, children=True, typ="transform", fullPath=True) or []
+        children += cmds.listRelatives(jnt, children=True, typ="joint", fullPath=True) or []
+        pos_jnt_ws = _get_position(get_world_matrix(jnt))
+
+        # Determine aim position (if available)
+        aim_target = ""
+        aim_position = None
+        if world_aligned:
+            aim_position = pos_jnt_ws + OpenMaya.MVector(0, 1, 0)
+        else:
+            for child in children:
+                if cmds.nodeType(child) == "joint":
+                    aim_target = child
+            if aim_target:
+                aim_position = _get_position(get_world_matrix(aim_target))
+
+        rotation_matrix = None
+        if aim_position is not None:
+            up_vec = (0, 0, 0)
+            if detect_up_dir:
+                pos_parent_ws = pos_jnt_ws  # Use itself in case it doesn't have a parent
+                if parent != "":
+                    pos_parent_ws = _get_position(get_world_matrix(parent))
+                if parent == "" or (pos_jnt_ws - pos_parent_ws).length() <= tolerance:
+                    aim_children = []
+                    if aim_target:
+                        aim_children = cmds.listRelatives(aim_target, children=True, fullPath=True) or []
+                    aim_child = ""
+                    for child in aim_children:
+                        if cmds.nodeType(child) == "joint":
+                            aim_child = child
+                    if aim_child:
+                        pos_aim_child_ws = _get_position(get_world_matrix(aim_child))
+                        up_vec = core_math.cross_product_differences(pos_jnt_ws, aim_position, pos_aim_child_ws)
+                        up_vec = tuple(up_vec.normal())
+                else:
+                    up_vec = core_math.cross_product_differences(pos_parent_ws, pos_jnt_ws, aim_position)
+                    up_vec = tuple(up_vec.normal())
+
+            if not detect_up_dir or (up_vec[0] == 0.0 and up_vec[1] == 0.0 and up_vec[2] == 0.0):
+                up_vec = up_dir
+
+            current_up = OpenMaya.MVector(up_vec).normal()
+            dot = core_math.dot_product(current_up, starting_up)
+            starting_up = OpenMaya.MVector(up_vec).normal()
+
+            # Flip in case dot is negative (wrong way) - Same as rotating it 180 degrees around the aim axis
+            if index > 0 and dot <= 0.0:
+                up_vec = -OpenMaya.MVector(up_vec)
+                starting_up *= -1.0
+
+            rotation_matrix = core_math.get_aim_rotation_matrix(
+                aim_direction=aim_position - pos_jnt_ws, up_direction=up_vec, aim_axis=aim_axis, up_axis=up_axis
+            )
+        elif parent != "":
+            parent_rotation = OpenMaya.MTransformationMatrix(get_world_matrix(parent)).rotation(asQuaternion=True)
+            rotation_matrix = parent_rotation.asMatrix()
+
+        if rotation_matrix is None:
+            continue
+        # Children keep their world transforms (same as un-parenting and re-parenting them)
+        for child in children:
+            get_world_matrix(child)
+            preserved_children.append(child)
+        oriented_matrix = OpenMaya.MTransformationMatrix(rotation_matrix)
+        oriented_matrix.setTranslation(pos_jnt_ws, OpenMaya.MSpace.kWorld)
+        oriented_matrices[jnt] = oriented_matrix.asMatrix()
+
+    # Write Joint Orients
+    for jnt, oriented_matrix in oriented_matrices.items():
+        parent = joint_parents.get(jnt)
+        local_matrix = oriented_matrix
+        if parent:
+            local_matrix = oriented_matrix * get_world_matrix(parent).inverse()
+        _set_joint_local_matrix(jnt, local_matrix, keep_rotation=False)
+
+    # Restore Children
+    for child in preserved_children:
+        if child in oriented_matrices:
+            continue
+        parent = (cmds.listRelatives(child, parent=True, fullPath=True) or [""])[0]
+        local_matrix = world_matrices.get(child) * get_world_matrix(parent).inverse()
+        if cmds.nodeType(child) == "joint":
+            _set_joint_local_matrix(child, local_matrix, keep_rotation=True)
+        else:
+            cmds.xform(child, matrix=list(local_matrix), objectSpace=True)
+
+
+def _get_joint_orient_from_matrix(matrix):
+    """
+    Gets the XYZ rotation (joint orient) of a rotation matrix. From the two equivalent solutions, the one with the
+    smallest total rotation is used (same values as the ones produced by "makeIdentity"). e.g. (0, 225, 0) instead
+    of (180, -45, 180).
+
+    Args:
+        matrix (OpenMaya.MMatrix): Rotation matrix (no scale).
+
+    Returns:
+        tuple: X, Y and Z rotation in radians.
+    """
+    sin_y = max(-1.0, min(1.0, -matrix.getElement(0, 2)))
+    cos_y = math.sqrt(matrix.getElement(0, 0) ** 2 + matrix.getElement(0, 1) ** 2)
+    rotate_y = math.atan2(sin_y, cos_y)
+    if cos_y > 1e-8:
+        rotate_x = math.atan2(matrix.getElement(1, 2), matrix.getElement(2, 2))
+        rotate_z = math.atan2(matrix.getElement(0, 1), matrix.getElement(0, 0))
+    else:  # Gimbal lock
+        rotate_x = 0.0
+        rotate_z = math.atan2(-matrix.getElement(1, 0), matrix.getElement(1, 1))
+
+    def wrap_angle(angle):
+        return angle - 2 * math.pi if angle > math.pi else angle
+
+    solution = (rotate_x, rotate_y, rotate_z)
+    alternate = (wrap_angle(rotate_x + math.pi), math.pi - rotate_y, wrap_angle(rotate_z + math.pi))
+    if sum(abs(value) for value in alternate) < sum(abs(value) for value in solution) - 1e-8:
+        return alternate
+    return solution
+
+
+def _set_joint_local_matrix(jnt, local_matrix, keep_rotation=False):
+    """
+    Sets the translation and orientation of a joint using a local (parent-space) matrix.
+
+    Args:
+        jnt (str): Name or path of the joint.
+        local_matrix (OpenMaya.MMatrix): Local matrix (scale is ignored)
+        keep_rotation (bool, optional): If True, "rotate" and "rotateAxis" are kept and only "jointOrient" receives the
+                                        new orientation. If False, they are zeroed. (Same as freezing the joint)
+    """
+    transform_matrix = OpenMaya.MTransformationMatrix(local_matrix)
+    rotation_matrix = transform_matrix.rotation(asQuaternion=True).asMatrix()
+    if keep_rotation:
+        rotation = OpenMaya.MEulerRotation(
+            [OpenMaya.MAngle.uiToInternal(value) for value in cmds.getAttr(f"{jnt}.rotate")[0]],
+            cmds.getAttr(f"{jnt}.rotateOrder"),
+        )
+        rotate_axis = OpenMaya.MEulerRotation(
+            [OpenMaya.MAngle.uiToInternal(value) for value in cmds.getAttr(f"{jnt}.rotateAxis")[0]]
+        )
+        rotation_matrix = (rotate_axis.asMatrix() * rotation.asMatrix()).inverse() * rotation_matrix
+    else:
+        cmds.setAttr(f"{jnt}.rotate", 0, 0, 0)
+        cmds.setAttr(f"{jnt}.rotateAxis", 0, 0, 0)
+    joint_orient = [OpenMaya.MAngle.internalToUI(value) for value in _get_joint_orient_from_matrix(rotation_matrix)]
+    translation = transform_matrix.translation(OpenMaya.MSpace.kTransform)
+    translation = [OpenMaya.MDistance.internalToUI(value) for value in translation]
+    cmds.setAttr(f"{jnt}.jointOrient", *joint_orient)
+    cmds.setAttr(f"{jnt}.translate", *translation)
+
+
 def copy_parent_orients(joint_list):
     """
     Copy the orientations from its world (parent)
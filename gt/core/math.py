@@ -5,6 +5,7 @@ Code Namespace:
     core_math  # import gt.core.math as core_math
 """
 
+import gt.core.transform_math as core_trans_math
 import maya.api.OpenMaya as OpenMaya
 import maya.cmds as cmds
 import logging
@@ -18,7 +19,7 @@ logger.setLevel(logging.INFO)
 
 def matrix_mult(mat1, mat2):
     """
-    Multiply two matrices.
+    Multiply two matrices. 4x4 matrices are multiplied by the transform math kernel (unrolled multiplication).
 
     Args:
         mat1 (list of lists): The first matrix.
@@ -27,6 +28,12 @@ def matrix_mult(mat1, mat2):
     Returns:
         list of lists: The result of matrix multiplication.
     """
+    if len(mat1) == 4 and len(mat2) == 4 and all(len(row) == 4 for row in (*mat1, *mat2)):
+        matrix = core_trans_math.multiply_matrices(
+            (*mat1[0], *mat1[1], *mat1[2], *mat1[3]), (*mat2[0], *mat2[1], *mat2[2], *mat2[3])
+        )
+        return [list(matrix[0:4]), list(matrix[4:8]), list(matrix[8:12]), list(matrix[12:16])]
+
     result = []
     for i in range(len(mat1)):
         row = []
@@ -50,14 +57,11 @@ def dot_product(vector_a, vector_b):
     Returns:
         float: The dot product of the two input vectors.
     """
-    from gt.core.transform import Vector3
-
-    if isinstance(vector_a, Vector3):
+    if hasattr(vector_a, "get_as_tuple"):  # Vector3
         vector_a = vector_a.get_as_tuple()
-    if isinstance(vector_b, Vector3):
+    if hasattr(vector_b, "get_as_tuple"):  # Vector3
         vector_b = vector_b.get_as_tuple()
-    _dot_product = sum(a * b for a, b in zip(vector_a, vector_b))
-    return _dot_product
+    return sum(a * b for a, b in zip(vector_a, vector_b))
 
 
 def is_float_equal(x, y, tolerance=0.00001):
@@ -196,24 +200,25 @@ def dist_path_sum(input_list):
         )
         return total_distance
 
-    for index in range(num_elements - 1):
-        element_a = input_list[index]
-        element_b = input_list[index + 1]
-        if isinstance(element_a, str):
-            element_a = cmds.xform(element_a, q=True, ws=True, t=True)
-        if isinstance(element_b, str):
-            element_b = cmds.xform(element_b, q=True, ws=True, t=True)
-        if isinstance(element_a, (tuple, list)) and isinstance(element_b, (tuple, list)):
-            distance = dist_xyz_to_xyz(
-                element_a[0], element_a[1], element_a[2], element_b[0], element_b[1], element_b[2]  # A: XYZ
-            )  # B: XYZ
-        else:
+    positions = []
+    for element in input_list:
+        if isinstance(element, str):
+            element = cmds.xform(element, q=True, ws=True, t=True)
+        positions.append(element if isinstance(element, (tuple, list)) else None)
+
+    if None not in positions:
+        return core_trans_math.get_path_length(positions)
+
+    for position_a, position_b in zip(positions, positions[1:]):
+        if position_a is None or position_b is None:
             logger.warning(
                 "Unsupported types detected. Total distance might not be accurate. "
                 "Please provide only Maya paths (str) or XYZ positions. (tuple/list)"
             )
             continue
-        total_distance += distance
+        total_distance += dist_xyz_to_xyz(
+            position_a[0], position_a[1], position_a[2], position_b[0], position_b[1], position_b[2]
+        )
     return total_distance
 
 
@@ -289,35 +294,14 @@ def get_transforms_center_position(transform_list):
     Returns:
         tuple: Center position as a tuple (x, y, z).
     """
-    # Initialize variables to store total position and count
-    total_position = [0, 0, 0]
-    num_transforms = 0
-
-    # Iterate through each transform
-    for transform_name in transform_list:
-        # Check if the transform exists
-        if cmds.objExists(transform_name):
-            # Get the translation values of the transform
-            transform_position = cmds.xform(transform_name, query=True, translation=True, worldSpace=True)
-            # Add the position values to the total
-            total_position[0] += transform_position[0]
-            total_position[1] += transform_position[1]
-            total_position[2] += transform_position[2]
-            num_transforms += 1  # Increment the count of existing transforms
-
-    # Check if any transforms exist
-    if num_transforms == 0:
-        # If no transforms exist, return the origin
+    positions = [
+        cmds.xform(transform_name, query=True, translation=True, worldSpace=True)
+        for transform_name in transform_list
+        if cmds.objExists(transform_name)
+    ]
+    if not positions:  # If no transforms exist, return the origin
         return 0, 0, 0
-
-    # Calculate the average position by dividing the total by the number of existing transforms
-    center_position = (
-        total_position[0] / num_transforms,
-        total_position[1] / num_transforms,
-        total_position[2] / num_transforms,
-    )
-
-    return center_position
+    return core_trans_math.get_average_position(positions)
 
 
 def remap_value(value, old_range, new_range):
@@ -339,5 +323,50 @@ def remap_value(value, old_range, new_range):
     return (value - old_range[0]) * (new_range[1] - new_range[0]) / (old_range[1] - old_range[0]) + new_range[0]
 
 
+def get_aim_rotation_matrix(aim_direction, up_direction, aim_axis=(1, 0, 0), up_axis=(0, 1, 0), tolerance=1e-8):
+    """
+    Gets the rotation matrix that points "aim_axis" towards "aim_direction" while "up_axis" faces "up_direction"
+    as much as possible. Same result as an "aimConstraint" using the "vector" world up type.
+
+    Args:
+        aim_direction (tuple, list, MVector): World direction to aim at.
+        up_direction (tuple, list, MVector): World up vector.
+        aim_axis (tuple, optional): The local axis that aims towards "aim_direction". Defaults to X+ (1, 0, 0).
+        up_axis (tuple, optional): The local axis that faces "up_direction". Defaults to Y+ (0, 1, 0).
+        tolerance (float, optional): Shorter directions are considered zero.
+
+    Returns:
+        OpenMaya.MMatrix or None: Rotation matrix. None if the aim direction has no length.
+    """
+    aim = OpenMaya.MVector(aim_direction)
+    if aim.length() <= tolerance:
+        return None
+    aim.normalize()
+    up = OpenMaya.MVector(up_direction)
+    up -= aim * (up * aim)
+    if up.length() <= tolerance:  # Up parallel to aim, use the world axis that is the least aligned with it
+        world_axes = [OpenMaya.MVector.kXaxisVector, OpenMaya.MVector.kYaxisVector, OpenMaya.MVector.kZaxisVector]
+        up = min(world_axes, key=lambda axis: abs(axis * aim))
+        up = up - aim * (up * aim)
+    up.normalize()
+    local_aim = OpenMaya.MVector(aim_axis).normal()
+    local_up = OpenMaya.MVector(up_axis)
+    local_up = (local_up - local_aim * (local_up * local_aim)).normal()
+
+    def get_axes_matrix(axis_x, axis_y, axis_z):
+        return OpenMaya.MMatrix(
+            [
+                (axis_x.x, axis_x.y, axis_x.z, 0),
+                (axis_y.x, axis_y.y, axis_y.z, 0),
+                (axis_z.x, axis_z.y, axis_z.z, 0),
+                (0, 0, 0, 1),
+            ]
+        )
+
+    local_matrix = get_axes_matrix(local_aim, local_up, local_aim ^ local_up)
+    world_matrix = get_axes_matrix(aim, up, aim ^ up)
+    return local_matrix.transpose() * world_matrix
+
+
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
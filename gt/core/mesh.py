@@ -10,8 +10,12 @@ from gt.core.io import DataDirConstants
 from collections import namedtuple
 from gt.utils import system
 from gt.core import iterable
+import maya.api.OpenMaya as apiOpenMaya
 import maya.cmds as cmds
 import logging
+import array
+import math
+import zlib
 import ast
 import sys
 import os
@@ -27,6 +31,12 @@ MESH_TYPE_DEFAULT = "mesh"
 MESH_TYPE_SURFACE = "nurbsSurface"
 MESH_TYPES = [MESH_TYPE_DEFAULT, MESH_TYPE_SURFACE]
 MESH_FILE_EXTENSION = "obj"
+SYMMETRY_AXES = ["x", "y", "z"]
+SYMMETRY_SPACE_OBJECT = "object"
+SYMMETRY_SPACE_WORLD = "world"
+
+# Symmetry Maps - Cached per mesh, axis and space. Rebuilt when the mesh topology or vertex positions change.
+_symmetry_map_cache = {}
 
 
 def get_mesh_file_path(file_name):
@@ -328,6 +338,422 @@ def extract_components_from_face(face_name):
         return
 
 
+def _build_kd_tree(points, indices, depth=0):
+    """
+    Builds a KD-tree (nested tuples) used to find the closest point to a position.
+
+    Args:
+        points (list): A list of positions. e.g. [(1, 0, 0), (-1, 0, 0)]
+        indices (list): Indices of the points stored in this branch of the tree.
+        depth (int, optional): Depth of the branch. Used to determine the split axis.
+
+    Returns:
+        tuple or None: Tree node (point_index, split_axis, lower_branch, upper_branch, min_bounds, max_bounds).
+                       None for empty branches.
+    """
+    if not indices:
+        return None
+    split_axis = depth % 3
+    indices = sorted(indices, key=lambda point_index: points[point_index][split_axis])
+    median = len(indices) // 2
+    min_bounds = tuple(min(points[point_index][i] for point_index in indices) for i in range(3))
+    max_bounds = tuple(max(points[point_index][i] for point_index in indices) for i in range(3))
+    return (
+        indices[median],
+        split_axis,
+        _build_kd_tree(points, indices[:median], depth + 1),
+        _build_kd_tree(points, indices[median + 1 :], depth + 1),
+        min_bounds,
+        max_bounds,
+    )
+
+
+def _get_kd_tree_closest(points, tree, position):
+    """
+    Finds the closest point to a position using a KD-tree created with "_build_kd_tree".
+
+    Args:
+        points (list): The list of positions used to build the tree.
+        tree (tuple): The root of the tree.
+        position (list, tuple): The position to search from. e.g. (1, 0, 0)
+
+    Returns:
+        tuple: Index of the closest point and its squared distance to the position. e.g. (1, 0.25)
+    """
+
+    def get_bounds_distance_sq(node):
+        if node is None:
+            return float("inf")
+        distance_sq = 0.0
+        for i in range(3):
+            if position[i] < node[4][i]:
+                distance_sq += (node[4][i] - position[i]) ** 2
+            elif position[i] > node[5][i]:
+                distance_sq += (position[i] - node[5][i]) ** 2
+        return distance_sq
+
+    closest_index = None
+    closest_distance_sq = float("inf")
+    pending = [(tree, 0.0)]  # Branches to visit and the squared distance to their bounds
+    while pending:
+        node, bounds_distance_sq = pending.pop()
+        if bounds_distance_sq >= closest_distance_sq:
+            continue
+        point_index, split_axis, lower_branch, upper_branch = node[:4]
+        point = points[point_index]
+        distance_sq = (
+            (point[0] - position[0]) ** 2 + (point[1] - position[1]) ** 2 + (point[2] - position[2]) ** 2
+        )
+        if distance_sq < closest_distance_sq:
+            closest_index = point_index
+            closest_distance_sq = distance_sq
+        # Closest branch is visited first (pushed last), so the other one is often skipped
+        branches = [(get_bounds_distance_sq(lower_branch), lower_branch)]
+        branches.append((get_bounds_distance_sq(upper_branch), upper_branch))
+        if branches[0][0] < branches[1][0]:
+            branches.reverse()
+        for branch_distance_sq, branch in branches:
+            if branch_distance_sq < closest_distance_sq:
+                pending.append((branch, branch_distance_sq))
+    return closest_index, closest_distance_sq
+
+
+def get_symmetry_indices(points, axis="x", tolerance=0.001):
+    """
+    Finds the mirrored point for every point in the provided list. (Closest point to its mirrored position)
+    Points are hashed into a grid, so every point is resolved through the cells around its mirrored position.
+    Points without a mirrored point within the tolerance are resolved in a single KD-tree pass afterwards.
+
+    Args:
+        points (list): A list of positions. e.g. [(1, 0, 0), (-1, 0, 0)]
+        axis (str, optional): Mirror axis. "x", "y" or "z". Positions are mirrored by negating this axis.
+        tolerance (float, optional): Maximum distance between a mirrored position and its closest point.
+                                     Points further than that are still paired, but also returned as unmatched.
+
+    Returns:
+        tuple: Two lists (mirror_indices, unmatched_indices).
+               "mirror_indices" has the index of the mirrored point for every point. e.g. [1, 0]
+               "unmatched_indices" has the indices of the points without a mirrored point within the tolerance.
+    """
+    if axis not in SYMMETRY_AXES:
+        raise ValueError(f'Invalid mirror axis: "{axis}". Expected one of these: {SYMMETRY_AXES}')
+    axis_index = SYMMETRY_AXES.index(axis)
+    if not points:
+        return [], []
+
+    # Cell Size - Meshes are surfaces, so points are spread over an area (not a volume)
+    min_bounds = [min(point[i] for point in points) for i in range(3)]
+    max_bounds = [max(point[i] for point in points) for i in range(3)]
+    max_extent = max(max_bounds[i] - min_bounds[i] for i in range(3))
+    cell_size = max(max_extent / max(1.0, len(points) ** 0.5), tolerance, 1e-6)
+
+    def get_cell(position):
+        return tuple(int((position[i] - min_bounds[i]) // cell_size) for i in range(3))
+
+    grid = {}
+    for index, point in enumerate(points):
+        grid.setdefault(get_cell(point), []).append(index)
+    # Points within the tolerance are never more than this many cells away from the mirrored position
+    max_ring = math.ceil(tolerance / cell_size) + 1
+    tolerance_sq = tolerance**2
+
+    mirror_indices = []
+    mirrored_positions = []
+    for index, point in enumerate(points):
+        mirrored = list(point)
+        mirrored[axis_index] = -mirrored[axis_index]
+        mirrored_positions.append(mirrored)
+        cell_x, cell_y, cell_z = get_cell(mirrored)
+        closest_index = None
+        closest_distance_sq = float("inf")
+        for ring in range(max_ring + 1):
+            # Walk only the cells on the shell of the cube (previous rings were already visited)
+            for offset_x in range(-ring, ring + 1):
+                for offset_y in range(-ring, ring + 1):
+                    if abs(offset_x) == ring or abs(offset_y) == ring:
+                        offsets_z = range(-ring, ring + 1)
+                    else:
+                        offsets_z = (-ring, ring) if ring else (0,)
+                    for offset_z in offsets_z:
+                        for other_index in grid.get((cell_x + offset_x, cell_y + offset_y, cell_z + offset_z), ()):
+                            other = points[other_index]
+                            distance_sq = (
+                                (other[0] - mirrored[0]) ** 2
+                                + (other[1] - mirrored[1]) ** 2
+                                + (other[2] - mirrored[2]) ** 2
+                            )
+                            if distance_sq < closest_distance_sq:
+                                closest_index = other_index
+                                closest_distance_sq = distance_sq
+            # Points in the next rings are at least "ring * cell_size" away
+            if closest_index is not None and closest_distance_sq <= (ring * cell_size) ** 2:
+                break
+        if closest_distance_sq > tolerance_sq:
+            closest_index = None
+        mirror_indices.append(closest_index)
+
+    # Unmatched Points - Still paired with their closest point, found through a single KD-tree pass
+    unmatched_indices = [index for index, mirror_index in enumerate(mirror_indices) if mirror_index is None]
+    if unmatched_indices:
+        tree = _build_kd_tree(points, list(range(len(points))))
+        for index in unmatched_indices:
+            mirror_indices[index] = _get_kd_tree_closest(points, tree, mirrored_positions[index])[0]
+    return mirror_indices, unmatched_indices
+
+
+def get_symmetry_sides(points, axis="x", tolerance=0.001):
+    """
+    Gets the side of the mirror plane where every point is found.
+
+    Args:
+        points (list): A list of positions. e.g. [(1, 0, 0), (-1, 0, 0)]
+        axis (str, optional): Mirror axis. "x", "y" or "z"
+        tolerance (float, optional): Points closer than this to the mirror plane are considered center points.
+
+    Returns:
+        list: The side of every point. 1 (positive), -1 (negative) or 0 (center). e.g. [1, -1]
+    """
+    if axis not in SYMMETRY_AXES:
+        raise ValueError(f'Invalid mirror axis: "{axis}". Expected one of these: {SYMMETRY_AXES}')
+    axis_index = SYMMETRY_AXES.index(axis)
+    return [1 if point[axis_index] > tolerance else -1 if point[axis_index] < -tolerance else 0 for point in points]
+
+
+def get_mesh_topology_key(mesh):
+    """
+    Gets a key describing the topology of a mesh. Meshes with the same vertex count and face connections
+    share the same key, so it can be used to know when data computed for a mesh (e.g. symmetry) is outdated.
+
+    Args:
+        mesh (str): Name of the mesh (transform or shape)
+
+    Returns:
+        tuple: Topology key (vertex_count, face_count, connections_checksum)
+    """
+    selection = apiOpenMaya.MSelectionList()
+    selection.add(mesh)
+    mesh_fn = apiOpenMaya.MFnMesh(selection.getDagPath(0))
+    polygon_vertex_counts, polygon_connects = mesh_fn.getVertices()
+    checksum = zlib.crc32(array.array("i", polygon_vertex_counts).tobytes())
+    checksum = zlib.crc32(array.array("i", polygon_connects).tobytes(), checksum)
+    return mesh_fn.numVertices, mesh_fn.numPolygons, checksum
+
+
+def get_points_checksum(points):
+    """
+    Gets a checksum of a list of positions. Used to know when data computed from positions (e.g. symmetry) is outdated.
+
+    Args:
+        points (list): A list of positions. e.g. [(1, 0, 0), (-1, 0, 0)]
+
+    Returns:
+        int: Checksum of the positions.
+    """
+    return zlib.crc32(array.array("d", [value for point in points for value in point]).tobytes())
+
+
+class SymmetryMap:
+    def __init__(
+        self,
+        mesh,
+        mirror_indices,
+        unmatched_indices=None,
+        axis="x",
+        space=SYMMETRY_SPACE_OBJECT,
+        topology_key=None,
+        sides=None,
+        points_checksum=None,
+    ):
+        """
+        Initializes a SymmetryMap object. It describes the mirrored vertex of every vertex of a mesh.
+        Use "get_symmetry_map" to create (or get a cached) map from a mesh in the scene.
+
+        Args:
+            mesh (str): Name of the mesh the map was created from (long name)
+            mirror_indices (list): Index of the mirrored vertex for every vertex. e.g. [1, 0, 2]
+            unmatched_indices (list, optional): Vertices without a mirrored vertex within the tolerance.
+            axis (str, optional): Mirror axis used to create the map. "x", "y" or "z"
+            space (str, optional): Space used to read the vertex positions. "object" or "world"
+            topology_key (tuple, optional): Topology key of the mesh when the map was created.
+                                            See "get_mesh_topology_key" for more details.
+            sides (list, optional): Side of every vertex. 1 (positive), -1 (negative) or 0 (center)
+                                    See "get_symmetry_sides" for more details.
+            points_checksum (int, optional): Checksum of the vertex positions when the map was created.
+                                             See "get_points_checksum" for more details.
+        """
+        self.mesh = mesh
+        self.mirror_indices = mirror_indices
+        self.unmatched_indices = unmatched_indices or []
+        self.axis = axis
+        self.space = space
+        self.topology_key = topology_key
+        self.sides = sides
+        self.points_checksum = points_checksum
+
+    def __len__(self):
+        return len(self.mirror_indices)
+
+    def __repr__(self):
+        return f'SymmetryMap(mesh="{self.mesh}", axis="{self.axis}", vertices={len(self.mirror_indices)})'
+
+    def get_mirrored_index(self, index):
+        """
+        Gets the index of the mirrored vertex.
+
+        Args:
+            index (int): Vertex index.
+
+        Returns:
+            int: Index of the mirrored vertex.
+        """
+        return self.mirror_indices[index]
+
+    def get_axis_index(self):
+        """
+        Gets the index of the mirror axis. e.g. "x" is 0
+
+        Returns:
+            int: Index of the mirror axis.
+        """
+        return SYMMETRY_AXES.index(self.axis)
+
+    def get_side_indices(self, side):
+        """
+        Gets the vertices found on one side of the mirror plane.
+
+        Args:
+            side (int): 1 (positive), -1 (negative) or 0 (center)
+
+        Returns:
+            list: A list of vertex indices.
+        """
+        if self.sides is None:
+            raise ValueError("Symmetry map was created without side information.")
+        return [index for index, vertex_side in enumerate(self.sides) if vertex_side == side]
+
+    def get_side_weights(self, side, center_weight=0.5):
+        """
+        Gets vertex weights describing one side of the mesh. Useful to split data in two. e.g. Blend shape targets
+
+        Args:
+            side (int): 1 (positive) or -1 (negative)
+            center_weight (float, optional): Weight of center vertices. 0.5 makes both sides add up to the original.
+
+        Returns:
+            dict: Vertex index as key, weight as value. e.g. {0: 1.0, 3: 0.5}
+        """
+        if self.sides is None:
+            raise ValueError("Symmetry map was created without side information.")
+        vertex_weights = {}
+        for index, vertex_side in enumerate(self.sides):
+            if vertex_side == side:
+                vertex_weights[index] = 1.0
+            elif vertex_side == 0 and center_weight:
+                vertex_weights[index] = center_weight
+        return vertex_weights
+
+    def get_mirrored_component(self, component):
+        """
+        Gets the mirrored vertex component for the provided vertex component.
+
+        Args:
+            component (str): Vertex component. e.g. "pSphere1.vtx[12]"
+
+        Returns:
+            str: Mirrored vertex component. e.g. "pSphere1.vtx[15]"
+        """
+        component_name, index = re.match(r"^(.*)\[(\d+)\]$", component).groups()
+        return f"{component_name}[{self.mirror_indices[int(index)]}]"
+
+    def mirror_index_values(self, index_values):
+        """
+        Moves values stored per vertex index to their mirrored vertex index.
+        Useful for sparse data, such as cluster weights. When two vertices share the same mirrored vertex,
+        the value of the last one is kept.
+
+        Args:
+            index_values (dict): Vertex index as key, any value as value. e.g. {0: 0.5, 3: 1.0}
+
+        Returns:
+            dict: Mirrored vertex index as key, value as value. e.g. {1: 0.5, 2: 1.0}
+        """
+        return {self.mirror_indices[index]: value for index, value in index_values.items()}
+
+    def flip_values(self, values):
+        """
+        Flips a list with one value per vertex, so every vertex receives the value of its mirrored vertex.
+        Useful for dense data, such as skin weights of one influence or blend shape target weights.
+
+        Args:
+            values (list): One value per vertex. Its length must match the number of vertices in the map.
+
+        Returns:
+            list: Flipped values.
+        """
+        if len(values) != len(self.mirror_indices):
+            raise ValueError(f"Expected {len(self.mirror_indices)} values, but received {len(values)}.")
+        return [values[mirrored_index] for mirrored_index in self.mirror_indices]
+
+
+def get_symmetry_map(mesh, axis="x", space=SYMMETRY_SPACE_OBJECT, tolerance=0.001, use_cache=True):
+    """
+    Gets a symmetry map for the provided mesh. Vertex positions are read only once (MFnMesh.getPoints).
+    Maps are cached per mesh, axis and space and reused while the topology and vertex positions remain the same.
+
+    Args:
+        mesh (str): Name of the mesh (transform or shape)
+        axis (str, optional): Mirror axis. "x", "y" or "z"
+        space (str, optional): Space used to read the vertex positions. "object" or "world"
+        tolerance (float, optional): Maximum distance between a mirrored position and its closest vertex.
+        use_cache (bool, optional): If active, a cached map with matching topology and positions is returned.
+
+    Returns:
+        SymmetryMap: Symmetry map for the provided mesh.
+    """
+    if not cmds.objExists(mesh):
+        raise ValueError(f'The mesh "{mesh}" does not exist.')
+    selection = apiOpenMaya.MSelectionList()
+    selection.add(mesh)
+    dag_path = selection.getDagPath(0)
+    dag_path.extendToShape()
+    mesh_long_name = dag_path.fullPathName()
+    topology_key = get_mesh_topology_key(mesh_long_name)
+    mesh_fn = apiOpenMaya.MFnMesh(dag_path)
+    mspace = apiOpenMaya.MSpace.kWorld if space == SYMMETRY_SPACE_WORLD else apiOpenMaya.MSpace.kObject
+    points = [(point.x, point.y, point.z) for point in mesh_fn.getPoints(mspace)]
+    points_checksum = get_points_checksum(points)
+
+    cache_key = (mesh_long_name, axis, space)
+    cached_map = _symmetry_map_cache.get(cache_key)
+    if use_cache and cached_map and cached_map.topology_key == topology_key:
+        if cached_map.points_checksum == points_checksum:  # Points moved (e.g. sculpted) make the map outdated
+            return cached_map
+
+    mirror_indices, unmatched_indices = get_symmetry_indices(points, axis=axis, tolerance=tolerance)
+    if unmatched_indices:
+        logger.debug(f'"{mesh}" has {len(unmatched_indices)} vertices without a mirrored vertex (tolerance).')
+
+    symmetry_map = SymmetryMap(
+        mesh=mesh_long_name,
+        mirror_indices=mirror_indices,
+        unmatched_indices=unmatched_indices,
+        axis=axis,
+        space=space,
+        topology_key=topology_key,
+        sides=get_symmetry_sides(points, axis=axis, tolerance=tolerance),
+        points_checksum=points_checksum,
+    )
+    _symmetry_map_cache[cache_key] = symmetry_map
+    return symmetry_map
+
+
+def clear_symmetry_map_cache():
+    """
+    Removes all cached symmetry maps. (See "get_symmetry_map")
+    """
+    _symmetry_map_cache.clear()
+
+
 class MeshFile:
     def __init__(self, file_path=None, metadata=None):
         """
@@ -1,13 +1,873 @@
 """
-Morphing Module
+Morphing Module - Blend shape targets as data (sparse deltas) instead of duplicated meshes.
+Targets are read from and written to the blend shape node ("inputPointsTarget" and "inputComponentsTarget"),
+so operations like flip, mirror, scale, combine and extract happen in memory.
 
 Code Namespace:
     core_morph  # import gt.core.morphing as core_morph
 """
 
+import maya.api.OpenMaya as apiOpenMaya
+import gt.core.mesh as core_mesh
+import gt.core.io as core_io
+import maya.cmds as cmds
 import logging
+import array
+import zlib
 
 # Logging Setup
 logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
+
+# Blend Shape Attributes
+BLEND_TARGET_ITEM_INDEX = 6000  # "inputTargetItem" index of a target at full weight (5000 + 1000 * weight)
+
+# Blend Shape Library Files
+BLEND_SHAPE_LIBRARY_EXTENSION = "bsl"
+BLEND_SHAPE_LIBRARY_FORMAT = "gt_blend_shape_library"
+BLEND_SHAPE_LIBRARY_VERSION = 1
+
+
+class BlendTargetData:
+    def __init__(self, name=None, indices=None, deltas=None, weight=0.0):
+        """
+        Sparse blend shape target. Only vertices that move are stored.
+        The deltas are stored in a flat array, three values (x, y, z) per stored vertex, same order as "indices".
+        e.g. The delta of the vertex "indices[1]" is found at the "deltas" indices 3, 4 and 5.
+
+        Args:
+            name (str, optional): Name of the target. (Blend shape weight alias) e.g. "smile"
+            indices (array.array, list, optional): Indices of the vertices affected by the target.
+            deltas (array.array, list, optional): Flat list of deltas (object space). Length must be: indices * 3
+            weight (float, optional): Weight (value) of the target.
+        """
+        self.name = name
+        self.indices = array.array("I", indices if indices is not None else [])
+        self.deltas = array.array("d", deltas if deltas is not None else [])
+        self.weight = weight
+
+    def __repr__(self):
+        """
+        Generates a custom string message to return a proper sentence when printing or casting this object to string.
+        """
+        return f"BlendTargetData(name={self.name}, points={self.get_point_count()}, weight={self.weight})"
+
+    def get_name(self):
+        """
+        Gets the name of the target.
+        Returns:
+            str or None: Name of the target.
+        """
+        return self.name
+
+    def get_indices(self):
+        """
+        Gets the indices of the vertices affected by this target.
+        Returns:
+            array.array: Vertex indices.
+        """
+        return self.indices
+
+    def get_deltas(self):
+        """
+        Gets the flat array of deltas. (Three values per stored vertex)
+        Returns:
+            array.array: Deltas. Length is: indices * 3
+        """
+        return self.deltas
+
+    def get_point_count(self):
+        """
+        Gets the number of vertices stored in this target.
+        Returns:
+            int: Number of stored vertices.
+        """
+        return len(self.indices)
+
+    def get_delta(self, vertex_index):
+        """
+        Gets the delta of a vertex.
+        Args:
+            vertex_index (int): Index of the vertex. (Mesh vertex index, not the position in the "indices" array)
+        Returns:
+            tuple: Delta (x, y, z). Vertices not affected by the target return (0, 0, 0).
+        """
+        try:
+            start = self.indices.index(vertex_index) * 3
+        except ValueError:
+            return 0.0, 0.0, 0.0
+        return tuple(self.deltas[start : start + 3])
+
+    def to_dict(self):
+        """
+        Gets the deltas as a dictionary.
+        Returns:
+            dict: Vertex indices as keys and deltas (x, y, z) as values. e.g. {0: (0.0, 1.0, 0.0)}
+        """
+        deltas = self.deltas
+        return {
+            index: (deltas[pos * 3], deltas[pos * 3 + 1], deltas[pos * 3 + 2]) for pos, index in enumerate(self.indices)
+        }
+
+    @classmethod
+    def from_dict(cls, delta_dict, name=None, weight=0.0, tolerance=1e-6):
+        """
+        Creates a target using a dictionary of deltas. (See "to_dict")
+        Args:
+            delta_dict (dict): Vertex indices as keys and deltas (x, y, z) as values.
+            name (str, optional): Name of the target.
+            weight (float, optional): Weight (value) of the target.
+            tolerance (float, optional): Deltas with all components below this value are not stored.
+        Returns:
+            BlendTargetData: A new target. Vertices are stored in ascending order.
+        """
+        indices = array.array("I")
+        deltas = array.array("d")
+        for index in sorted(delta_dict):
+            delta = delta_dict.get(index)
+            if abs(delta[0]) < tolerance and abs(delta[1]) < tolerance and abs(delta[2]) < tolerance:
+                continue
+            indices.append(int(index))
+            deltas.extend(delta)
+        return cls(name=name, indices=indices, deltas=deltas, weight=weight)
+
+    def to_dense(self, vertex_count):
+        """
+        Gets the deltas of every vertex. (Dense representation)
+        Args:
+            vertex_count (int): Number of vertices of the mesh.
+        Returns:
+            array.array: Flat array of deltas. Length is: vertex_count * 3
+        """
+        dense = array.array("d", [0.0]) * (vertex_count * 3)
+        deltas = self.deltas
+        for pos, index in enumerate(self.indices):
+            dense[index * 3 : index * 3 + 3] = deltas[pos * 3 : pos * 3 + 3]
+        return dense
+
+    @classmethod
+    def from_dense(cls, dense_deltas, name=None, weight=0.0, tolerance=1e-6):
+        """
+        Creates a sparse target using the deltas of every vertex. (See "to_dense")
+        Args:
+            dense_deltas (array.array, list): Flat list of deltas. Three values per vertex.
+            name (str, optional): Name of the target.
+            weight (float, optional): Weight (value) of the target.
+            tolerance (float, optional): Deltas with all components below this value are not stored.
+        Returns:
+            BlendTargetData: A new target.
+        """
+        indices = array.array("I")
+        deltas = array.array("d")
+        for index in range(len(dense_deltas) // 3):
+            delta = dense_deltas[index * 3 : index * 3 + 3]
+            if abs(delta[0]) < tolerance and abs(delta[1]) < tolerance and abs(delta[2]) < tolerance:
+                continue
+            indices.append(index)
+            deltas.extend(delta)
+        return cls(name=name, indices=indices, deltas=deltas, weight=weight)
+
+    def to_numpy(self):
+        """
+        Gets the indices and deltas as NumPy arrays. Requires NumPy.
+        Returns:
+            tuple or None: Indices with the shape (points,) and deltas with the shape (points, 3).
+                           None if NumPy is not available.
+        """
+        try:
+            import numpy
+        except ImportError:
+            logger.warning("Unable to convert blend target. NumPy is not available.")
+            return
+        indices = numpy.frombuffer(self.indices, dtype=numpy.uint32).copy()
+        return indices, numpy.frombuffer(self.deltas, dtype=numpy.float64).reshape(-1, 3).copy()
+
+    def get_copy(self, name=None):
+        """
+        Gets a copy of this target.
+        Args:
+            name (str, optional): Name of the copy. If not provided, the current name is used.
+        Returns:
+            BlendTargetData: A new target with the same deltas.
+        """
+        return BlendTargetData(name=name or self.name, indices=self.indices, deltas=self.deltas, weight=self.weight)
+
+    def get_scaled(self, factor, name=None):
+        """
+        Gets a copy of this target with scaled deltas. e.g. A factor of 0.5 creates a target that moves half as much.
+        Args:
+            factor (float): Multiplier applied to the deltas.
+            name (str, optional): Name of the new target. If not provided, the current name is used.
+        Returns:
+            BlendTargetData: A new target with the scaled deltas.
+        """
+        deltas = array.array("d", [value * factor for value in self.deltas])
+        return BlendTargetData(name=name or self.name, indices=self.indices, deltas=deltas, weight=self.weight)
+
+    def get_extracted(self, vertex_weights, name=None):
+        """
+        Gets a copy of this target affecting only part of the mesh. e.g. Extract the left side of a smile.
+        Args:
+            vertex_weights (dict, list): Vertex indices as keys and weights (multipliers) as values.
+                                         A list of vertex indices is also accepted (weight of 1.0).
+                                         Vertices not included are removed from the new target.
+            name (str, optional): Name of the new target. If not provided, the current name is used.
+        Returns:
+            BlendTargetData: A new target only affecting the provided vertices.
+        """
+        if not isinstance(vertex_weights, dict):
+            vertex_weights = dict.fromkeys(vertex_weights, 1.0)
+        delta_dict = {}
+        for index, delta in self.to_dict().items():
+            vertex_weight = vertex_weights.get(index)
+            if vertex_weight:
+                delta_dict[index] = (delta[0] * vertex_weight, delta[1] * vertex_weight, delta[2] * vertex_weight)
+        return BlendTargetData.from_dict(delta_dict, name=name or self.name, weight=self.weight)
+
+    def get_flipped(self, symmetry_map, name=None):
+        """
+        Gets a copy of this target moved to the other side of the mesh. e.g. "smile_L" becomes "smile_R"
+        Vertices without an opposite vertex (unmatched) are not included in the new target.
+        Args:
+            symmetry_map (core_mesh.SymmetryMap): Symmetry of the mesh. (See "get_blend_shape_symmetry_map")
+            name (str, optional): Name of the new target. If not provided, the current name is used.
+        Returns:
+            BlendTargetData: The flipped target.
+        """
+        axis = symmetry_map.get_axis_index()
+        mirror_indices = symmetry_map.mirror_indices
+        unmatched = set(symmetry_map.unmatched_indices)
+        delta_dict = {}
+        skipped_count = 0
+        for index, delta in self.to_dict().items():
+            if index in unmatched:
+                skipped_count += 1
+                continue
+            flipped_delta = list(delta)
+            flipped_delta[axis] = -flipped_delta[axis]
+            delta_dict[mirror_indices[index]] = flipped_delta
+        if skipped_count:
+            logger.warning(f'{skipped_count} vertices of "{self.name}" don\'t have an opposite vertex. Not flipped.')
+        return BlendTargetData.from_dict(delta_dict, name=name or self.name, weight=self.weight)
+
+    def get_mirrored(self, symmetry_map, direction="-", name=None):
+        """
+        Gets a copy of this target where one side is copied (flipped) onto the other side.
+        Source vertices without an opposite vertex (unmatched) keep their delta, but are not copied.
+        Args:
+            symmetry_map (core_mesh.SymmetryMap): Symmetry of the mesh. (See "get_blend_shape_symmetry_map")
+            direction (str, optional): Side used as source. "-" copies the negative side to the positive side,
+                                       "+" copies the positive side to the negative side.
+            name (str, optional): Name of the new target. If not provided, the current name is used.
+        Returns:
+            BlendTargetData: The mirrored target. Center vertices can't move across the symmetry plane.
+        """
+        if symmetry_map.sides is None:
+            raise ValueError("Unable to mirror target. The symmetry map doesn't describe the side of each vertex.")
+        source_side = 1 if direction == "+" else -1
+        axis = symmetry_map.get_axis_index()
+        mirror_indices = symmetry_map.mirror_indices
+        sides = symmetry_map.sides
+        unmatched = set(symmetry_map.unmatched_indices)
+        delta_dict = {}
+        skipped_count = 0
+        for index, delta in self.to_dict().items():
+            side = sides[index]
+            if side == 0:
+                center_delta = list(delta)
+                center_delta[axis] = 0.0
+                delta_dict[index] = center_delta
+            elif side == source_side:
+                delta_dict[index] = delta
+                if index in unmatched:
+                    skipped_count += 1
+                    continue
+                mirrored_delta = list(delta)
+                mirrored_delta[axis] = -mirrored_delta[axis]
+                delta_dict[mirror_indices[index]] = mirrored_delta
+        if skipped_count:
+            logger.warning(f'{skipped_count} vertices of "{self.name}" don\'t have an opposite vertex. Not mirrored.')
+        return BlendTargetData.from_dict(delta_dict, name=name or self.name, weight=self.weight)
+
+
+def combine_blend_targets(targets, name, weights=None, tolerance=1e-6):
+    """
+    Combines multiple targets into a single target. (Sum of their deltas)
+
+    Args:
+        targets (list): A list of targets (BlendTargetData).
+        name (str): Name of the combined target.
+        weights (list, optional): Multiplier for each target. If not provided, every target uses 1.0.
+        tolerance (float, optional): Deltas with all components below this value are not stored.
+
+    Returns:
+        BlendTargetData: The combined target.
+    """
+    if weights is None:
+        weights = [1.0] * len(targets)
+    delta_dict = {}
+    for target, target_weight in zip(targets, weights):
+        if not target_weight:
+            continue
+        deltas = target.deltas
+        for pos, index in enumerate(target.indices):
+            current = delta_dict.get(index, (0.0, 0.0, 0.0))
+            delta_dict[index] = (
+                current[0] + deltas[pos * 3] * target_weight,
+                current[1] + deltas[pos * 3 + 1] * target_weight,
+                current[2] + deltas[pos * 3 + 2] * target_weight,
+            )
+    return BlendTargetData.from_dict(delta_dict, name=name, tolerance=tolerance)
+
+
+class BlendShapeData:
+    def __init__(self, targets=None, vertex_count=0, mesh=None):
+        """
+        Collection of blend shape targets. (A whole blend shape node or a library file)
+
+        Args:
+            targets (list, optional): A list of targets (BlendTargetData). Targets are stored by name.
+            vertex_count (int, optional): Number of vertices of the base mesh.
+            mesh (str, optional): Name of the base mesh.
+        """
+        self.targets = {}
+        self.vertex_count = vertex_count
+        self.mesh = mesh
+        for target in targets or []:
+            self.add_target(target)
+
+    def __repr__(self):
+        """
+        Generates a custom string message to return a proper sentence when printing or casting this object to string.
+        """
+        return f"BlendShapeData(mesh={self.mesh}, vertices={self.vertex_count}, targets={self.get_target_names()})"
+
+    def __len__(self):
+        """
+        Gets the number of targets.
+        """
+        return len(self.targets)
+
+    def get_target_names(self):
+        """
+        Gets the names of the targets in the order they were added.
+        Returns:
+            list: A list of target names.
+        """
+        return list(self.targets)
+
+    def get_targets(self):
+        """
+        Gets the targets in the order they were added.
+        Returns:
+            list: A list of targets (BlendTargetData).
+        """
+        return list(self.targets.values())
+
+    def get_target(self, name):
+        """
+        Gets a target using its name.
+        Args:
+            name (str): Name of the target.
+        Returns:
+            BlendTargetData or None: The target. None if not found.
+        """
+        return self.targets.get(name)
+
+    def add_target(self, target):
+        """
+        Adds a target. Targets with the same name are replaced.
+        Args:
+            target (BlendTargetData): Target to add.
+        """
+        self.targets[target.name] = target
+
+    def remove_target(self, name):
+        """
+        Removes a target using its name.
+        Args:
+            name (str): Name of the target.
+        Returns:
+            BlendTargetData or None: The removed target. None if not found.
+        """
+        return self.targets.pop(name, None)
+
+    def get_combined_target(self, name, weights=None):
+        """
+        Combines every target into a single target. (See "combine_blend_targets")
+        Args:
+            name (str): Name of the combined target.
+            weights (dict, optional): Target names as keys and multipliers as values. Targets not included are ignored.
+                                      If not provided, the current weight of each target is used. (Current state)
+        Returns:
+            BlendTargetData: The combined target.
+        """
+        targets = self.get_targets()
+        if weights is None:
+            target_weights = [target.weight for target in targets]
+        else:
+            target_weights = [weights.get(target.name, 0.0) for target in targets]
+        return combine_blend_targets(targets, name=name, weights=target_weights)
+
+
+# -------------------------------------------------- Scene --------------------------------------------------
+def _get_plug(attr_path):
+    """
+    Gets an MPlug using an attribute path.
+    Args:
+        attr_path (str): Path to the attribute. e.g. "blendShape1.input[0].inputGeometry"
+    Returns:
+        MPlug: The plug of the attribute.
+    """
+    sel_list = apiOpenMaya.MSelectionList()
+    sel_list.add(attr_path)
+    return sel_list.getPlug(0)
+
+
+def _points_to_array(point_array):
+    """
+    Converts an MPointArray to a flat array. (Three values per point, "w" is ignored)
+    """
+    return array.array("d", [value for point in point_array for value in (point.x, point.y, point.z)])
+
+
+def get_mesh_points(mesh):
+    """
+    Gets the positions (object space) of every vertex of a mesh.
+
+    Args:
+        mesh (str): Name of the mesh (transform or shape).
+
+    Returns:
+        array.array: Flat array of positions. Three values (x, y, z) per vertex.
+    """
+    sel_list = apiOpenMaya.MSelectionList()
+    sel_list.add(mesh)
+    mfn_mesh = apiOpenMaya.MFnMesh(sel_list.getDagPath(0).extendToShape())
+    return _points_to_array(mfn_mesh.getPoints(apiOpenMaya.MSpace.kObject))
+
+
+def get_blend_shape_base_points(blend_node, base_index=0):
+    """
+    Gets the positions of the geometry received by the blend shape node. (Before any target is applied)
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        base_index (int, optional): Index of the base geometry. (For blend shapes deforming multiple meshes)
+
+    Returns:
+        array.array: Flat array of positions. Three values (x, y, z) per vertex.
+    """
+    geometry = _get_plug(f"{blend_node}.input[{base_index}].inputGeometry").asMObject()
+    return _points_to_array(apiOpenMaya.MFnMesh(geometry).getPoints())
+
+
+def get_blend_shape_base_mesh(blend_node, base_index=0):
+    """
+    Gets the mesh providing the undeformed geometry of a blend shape node. (Usually the "Orig" intermediate shape)
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        base_index (int, optional): Index of the base geometry. (For blend shapes deforming multiple meshes)
+
+    Raises:
+        ValueError: If the blend shape node doesn't deform a geometry with the provided index.
+
+    Returns:
+        str: Name of the original shape. If the mesh doesn't have an original shape, the deformed mesh is returned.
+    """
+    meshes = cmds.blendShape(blend_node, query=True, geometry=True) or []
+    if base_index >= len(meshes):
+        raise ValueError(f'"{blend_node}" does not have a base geometry with the index "{base_index}".')
+    original_geometry = cmds.deformableShape(meshes[base_index], originalGeometry=True) or []
+    if original_geometry and original_geometry[0]:
+        return original_geometry[0].split(".")[0]
+    return meshes[base_index]
+
+
+def get_blend_shape_symmetry_map(blend_node, axis="x", tolerance=0.001, base_index=0):
+    """
+    Gets the symmetry of the base geometry of a blend shape node. (See "core_mesh.get_symmetry_map")
+    The undeformed geometry is used, so the current target weights don't affect the result.
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        axis (str, optional): Symmetry axis. "x", "y" or "z"
+        tolerance (float, optional): Maximum distance between a vertex and the mirrored position of its opposite.
+        base_index (int, optional): Index of the base geometry. (For blend shapes deforming multiple meshes)
+
+    Returns:
+        core_mesh.SymmetryMap: The symmetry of the base geometry.
+    """
+    base_mesh = get_blend_shape_base_mesh(blend_node, base_index=base_index)
+    return core_mesh.get_symmetry_map(base_mesh, axis=axis, tolerance=tolerance)
+
+
+def get_blend_target_names(blend_node):
+    """
+    Gets the names (aliases) of the targets of a blend shape node.
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+
+    Returns:
+        dict: Target names as keys and target indices as values. e.g. {"smile": 0, "frown": 1}
+    """
+    alias_list = cmds.aliasAttr(blend_node, query=True) or []
+    target_indices = {}
+    for alias, attr in zip(alias_list[::2], alias_list[1::2]):
+        if attr.startswith("weight["):
+            target_indices[alias] = int(attr.split("[")[-1].split("]")[0])
+    return dict(sorted(target_indices.items(), key=lambda item: item[1]))
+
+
+def _get_target_item_path(blend_node, target_index, base_index=0):
+    """
+    Gets the path to the target item storing the deltas of a target at full weight.
+    """
+    return (
+        f"{blend_node}.inputTarget[{base_index}].inputTargetGroup[{target_index}]"
+        f".inputTargetItem[{BLEND_TARGET_ITEM_INDEX}]"
+    )
+
+
+def get_blend_target_data(blend_node, target, base_index=0):
+    """
+    Reads the deltas of a blend shape target. ("inputPointsTarget" and "inputComponentsTarget")
+    Only the full weight item is read. (In-betweens are ignored)
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        target (str, int): Name (alias) or index of the target.
+        base_index (int, optional): Index of the base geometry. (For blend shapes deforming multiple meshes)
+
+    Raises:
+        ValueError: If the target is not found.
+
+    Returns:
+        BlendTargetData: The sparse deltas of the target.
+    """
+    target_names = get_blend_target_names(blend_node)
+    if isinstance(target, str):
+        if target not in target_names:
+            raise ValueError(f'Target "{target}" not found in "{blend_node}".')
+        target_index = target_names.get(target)
+    else:
+        target_index = target
+        target = next((name for name, index in target_names.items() if index == target_index), None)
+    item_path = _get_target_item_path(blend_node, target_index, base_index)
+    if cmds.listConnections(f"{item_path}.inputGeomTarget", source=True, destination=False):
+        logger.debug(f'Target "{target}" has a live geometry connection. Reading the deltas stored in the node.')
+    weight = cmds.getAttr(f"{blend_node}.weight[{target_index}]")
+
+    try:
+        points = apiOpenMaya.MFnPointArrayData(_get_plug(f"{item_path}.inputPointsTarget").asMObject()).array()
+        components = apiOpenMaya.MFnComponentListData(_get_plug(f"{item_path}.inputComponentsTarget").asMObject())
+    except RuntimeError:  # Target without stored deltas
+        return BlendTargetData(name=target, weight=weight)
+    indices = array.array("I")
+    for component_index in range(components.length()):
+        indices.extend(apiOpenMaya.MFnSingleIndexedComponent(components.get(component_index)).getElements())
+    return BlendTargetData(name=target, indices=indices, deltas=_points_to_array(points), weight=weight)
+
+
+def get_blend_shape_data(blend_node, base_index=0):
+    """
+    Reads every target of a blend shape node. (See "get_blend_target_data")
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        base_index (int, optional): Index of the base geometry. (For blend shapes deforming multiple meshes)
+
+    Returns:
+        BlendShapeData: Targets of the blend shape node, in index order.
+    """
+    target_indices = get_blend_target_names(blend_node).values()
+    targets = [get_blend_target_data(blend_node, index, base_index) for index in target_indices]
+    vertex_count = len(get_blend_shape_base_points(blend_node, base_index)) // 3
+    meshes = cmds.blendShape(blend_node, query=True, geometry=True) or []
+    mesh = meshes[base_index] if base_index < len(meshes) else None
+    return BlendShapeData(targets=targets, vertex_count=vertex_count, mesh=mesh)
+
+
+def _get_component_ranges(indices):
+    """
+    Compresses sorted vertex indices into component strings. e.g. [0, 1, 2, 5] becomes ["vtx[0:2]", "vtx[5]"]
+    """
+    components = []
+    start = previous = None
+    for index in indices:
+        if previous is not None and index == previous + 1:
+            previous = index
+            continue
+        if start is not None:
+            components.append(f"vtx[{start}]" if start == previous else f"vtx[{start}:{previous}]")
+        start = previous = index
+    if start is not None:
+        components.append(f"vtx[{start}]" if start == previous else f"vtx[{start}:{previous}]")
+    return components
+
+
+def _add_empty_blend_target(blend_node, target_name, base_index=0):
+    """
+    Adds a target to a blend shape node without a target mesh. The target entry is created directly:
+    a weight alias and an empty full weight target item. (No geometry is connected, so no DG cycles are created)
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        target_name (str): Name (alias) of the new target.
+        base_index (int, optional): Index of the base geometry. (For blend shapes deforming multiple meshes)
+
+    Returns:
+        int: Index of the new target.
+    """
+    weight_indices = cmds.getAttr(f"{blend_node}.weight", multiIndices=True) or []
+    target_index = max(weight_indices) + 1 if weight_indices else 0
+    cmds.setAttr(f"{blend_node}.weight[{target_index}]", 0)
+    cmds.aliasAttr(target_name, f"{blend_node}.weight[{target_index}]")
+    item_path = _get_target_item_path(blend_node, target_index, base_index)
+    cmds.setAttr(f"{item_path}.inputPointsTarget", 0, type="pointArray")
+    cmds.setAttr(f"{item_path}.inputComponentsTarget", 0, type="componentList")
+    return target_index
+
+
+def set_blend_target_data(blend_node, target_data, base_index=0, set_weight=False):
+    """
+    Writes the deltas of a target to a blend shape node. No meshes are created.
+    If a target with the same name exists, its deltas are replaced, otherwise a new target is created.
+    (New targets get a weight alias and a full weight target item, so they're listed like any other target)
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        target_data (BlendTargetData): Target to write. Its name is used as the target alias.
+        base_index (int, optional): Index of the base geometry. (For blend shapes deforming multiple meshes)
+        set_weight (bool, optional): If active, the weight stored in the target data is also applied.
+
+    Returns:
+        str: Path to the weight attribute of the target. e.g. "blendShape1.smile"
+    """
+    target_names = get_blend_target_names(blend_node)
+    target_index = target_names.get(target_data.name)
+    if target_index is None:
+        target_index = _add_empty_blend_target(blend_node, target_data.name, base_index)
+
+    item_path = _get_target_item_path(blend_node, target_index, base_index)
+    geometry_sources = cmds.listConnections(f"{item_path}.inputGeomTarget", source=True, plugs=True) or []
+    for source in geometry_sources:  # Live geometry would replace the written deltas
+        cmds.disconnectAttr(source, f"{item_path}.inputGeomTarget")
+
+    delta_dict = target_data.to_dict()
+    indices = sorted(delta_dict)  # Points must follow the order of the components
+    points = [tuple(delta_dict.get(index)) + (1.0,) for index in indices]
+    components = _get_component_ranges(indices)
+    cmds.setAttr(f"{item_path}.inputPointsTarget", len(points), *points, type="pointArray")
+    cmds.setAttr(f"{item_path}.inputComponentsTarget", len(components), *components, type="componentList")
+    if set_weight:
+        cmds.setAttr(f"{blend_node}.weight[{target_index}]", target_data.weight)
+    return f"{blend_node}.{target_data.name}"
+
+
+def set_blend_shape_data(blend_node, blend_shape_data, target_names=None, base_index=0, set_weight=False):
+    """
+    Writes multiple targets to a blend shape node in a single undo chunk. (See "set_blend_target_data")
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        blend_shape_data (BlendShapeData): Targets to write.
+        target_names (list, optional): Only targets with these names are written. If not provided, all are written.
+        base_index (int, optional): Index of the base geometry. (For blend shapes deforming multiple meshes)
+        set_weight (bool, optional): If active, the weights stored in the targets are also applied.
+
+    Returns:
+        list: Paths to the weight attributes of the written targets. e.g. ["blendShape1.smile"]
+    """
+    vertex_count = len(get_blend_shape_base_points(blend_node, base_index)) // 3
+    if blend_shape_data.vertex_count and blend_shape_data.vertex_count != vertex_count:
+        logger.warning(
+            f'Vertex count mismatch. Data: {blend_shape_data.vertex_count}, "{blend_node}": {vertex_count}. '
+            f"Targets might not match the mesh."
+        )
+    function_name = "Set Blend Shape Data"
+    cmds.undoInfo(openChunk=True, chunkName=function_name)
+    written_targets = []
+    try:
+        for target_data in blend_shape_data.get_targets():
+            if target_names is not None and target_data.name not in target_names:
+                continue
+            try:
+                written_targets.append(set_blend_target_data(blend_node, target_data, base_index, set_weight))
+            except Exception as e:
+                logger.warning(f'Unable to set target "{target_data.name}". Issue: {e}')
+    finally:
+        cmds.undoInfo(closeChunk=True, chunkName=function_name)
+    return written_targets
+
+
+def flip_blend_target(blend_node, target, new_name=None, symmetry_axis="x", tolerance=0.001):
+    """
+    Flips a target to the other side of the mesh without duplicating meshes. (See "BlendTargetData.get_flipped")
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        target (str): Name of the target to flip.
+        new_name (str, optional): Name of the flipped target. If not provided, the target is flipped in place.
+        symmetry_axis (str, optional): Symmetry axis. "x", "y" or "z"
+        tolerance (float, optional): Tolerance used to find opposite vertices. (See "core_mesh.get_symmetry_map")
+
+    Returns:
+        str: Path to the weight attribute of the flipped target. e.g. "blendShape1.smile_R"
+    """
+    symmetry_map = get_blend_shape_symmetry_map(blend_node, axis=symmetry_axis, tolerance=tolerance)
+    target_data = get_blend_target_data(blend_node, target).get_flipped(symmetry_map, name=new_name)
+    return set_blend_target_data(blend_node, target_data)
+
+
+def mirror_blend_target(blend_node, target, new_name=None, symmetry_axis="x", direction="-", tolerance=0.001):
+    """
+    Mirrors a target (one side copied onto the other) without duplicating meshes. (See "BlendTargetData.get_mirrored")
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        target (str): Name of the target to mirror.
+        new_name (str, optional): Name of the mirrored target. If not provided, the target is mirrored in place.
+        symmetry_axis (str, optional): Symmetry axis. "x", "y" or "z"
+        direction (str, optional): Side used as source. "-" (negative to positive) or "+" (positive to negative)
+        tolerance (float, optional): Tolerance used to find opposite vertices. (See "core_mesh.get_symmetry_map")
+
+    Returns:
+        str: Path to the weight attribute of the mirrored target. e.g. "blendShape1.smile_mirrored"
+    """
+    symmetry_map = get_blend_shape_symmetry_map(blend_node, axis=symmetry_axis, tolerance=tolerance)
+    target_data = get_blend_target_data(blend_node, target)
+    return set_blend_target_data(blend_node, target_data.get_mirrored(symmetry_map, direction, name=new_name))
+
+
+# -------------------------------------------------- Files --------------------------------------------------
+def write_blend_shape_library(file_path, blend_shape_data, compress=True, single_precision=True):
+    """
+    Writes blend shape targets to a binary file. (See "read_blend_shape_library")
+    The header describes the mesh and where the arrays of each target are stored, so targets can be read individually.
+
+    Args:
+        file_path (str): Path to the file. Existing files are overwritten.
+        blend_shape_data (BlendShapeData): Targets to write.
+        compress (bool, optional): If active, the arrays are compressed using zlib.
+        single_precision (bool, optional): If active, deltas are stored as 32-bit floats. (Half the size)
+
+    Returns:
+        str or None: Path to the written file. None if it failed.
+    """
+    data = bytearray()
+    targets_header = []
+    for target_data in blend_shape_data.get_targets():
+        deltas = target_data.deltas
+        if single_precision:
+            deltas = array.array("f", deltas)
+        target_header = {"name": target_data.name, "weight": target_data.weight}
+        for array_name, values in [("indices", target_data.indices), ("deltas", deltas)]:
+            array_bytes = core_io.array_to_bytes(values)
+            if compress:
+                array_bytes = zlib.compress(array_bytes)
+            target_header[array_name] = {"typecode": values.typecode, "offset": len(data), "length": len(array_bytes)}
+            data.extend(array_bytes)
+        targets_header.append(target_header)
+    header = {
+        "format": BLEND_SHAPE_LIBRARY_FORMAT,
+        "version": BLEND_SHAPE_LIBRARY_VERSION,
+        "mesh": blend_shape_data.mesh,
+        "vertex_count": blend_shape_data.vertex_count,
+        "compression": "zlib" if compress else None,
+        "targets": targets_header,
+    }
+    return core_io.write_packed_file(path=file_path, header=header, data=bytes(data))
+
+
+def read_blend_shape_library_header(file_path):
+    """
+    Reads only the header of a blend shape library file. (See "write_blend_shape_library")
+
+    Args:
+        file_path (str): Path to a blend shape library file.
+
+    Returns:
+        dict: The header dictionary. e.g. {"mesh": "head", "vertex_count": 10, "targets": [...], ...}
+              Empty dictionary if the file is not a blend shape library file.
+    """
+    header, _ = core_io.read_packed_file_header(file_path)
+    if header.get("format") != BLEND_SHAPE_LIBRARY_FORMAT:
+        return {}
+    return header
+
+
+def read_blend_shape_library(file_path, target_names=None):
+    """
+    Reads blend shape targets from a binary file. (See "write_blend_shape_library")
+
+    Args:
+        file_path (str): Path to a blend shape library file.
+        target_names (list, optional): Only targets with these names are read. If not provided, all are read.
+
+    Returns:
+        BlendShapeData or None: Targets found in the file. None if the file could not be read.
+    """
+    header, data_start = core_io.read_packed_file_header(file_path)
+    if header.get("format") != BLEND_SHAPE_LIBRARY_FORMAT or data_start is None:
+        logger.warning(f'Unable to read blend shape library. Unexpected file format: "{file_path}".')
+        return
+    blend_shape_data = BlendShapeData(vertex_count=header.get("vertex_count"), mesh=header.get("mesh"))
+    for target_header in header.get("targets"):
+        if target_names is not None and target_header.get("name") not in target_names:
+            continue
+        arrays = []
+        for array_name in ["indices", "deltas"]:
+            array_header = target_header.get(array_name)
+            array_bytes = core_io.read_packed_file_data(
+                file_path, data_start, offset=array_header.get("offset"), length=array_header.get("length")
+            )
+            if header.get("compression") == "zlib":
+                array_bytes = zlib.decompress(array_bytes)
+            arrays.append(core_io.bytes_to_array(array_bytes, typecode=array_header.get("typecode")))
+        target_data = BlendTargetData(
+            name=target_header.get("name"), indices=arrays[0], deltas=arrays[1], weight=target_header.get("weight")
+        )
+        blend_shape_data.add_target(target_data)
+    return blend_shape_data
+
+
+def export_blend_shape_library(blend_node, file_path, compress=True):
+    """
+    Writes every target of a blend shape node to a blend shape library file.
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        file_path (str): Path to the file. Existing files are overwritten.
+        compress (bool, optional): If active, the arrays are compressed using zlib.
+
+    Returns:
+        str or None: Path to the written file. None if it failed.
+    """
+    return write_blend_shape_library(file_path, get_blend_shape_data(blend_node), compress=compress)
+
+
+def import_blend_shape_library(blend_node, file_path, target_names=None, set_weight=False):
+    """
+    Reads a blend shape library file and writes its targets to a blend shape node. (See "set_blend_shape_data")
+
+    Args:
+        blend_node (str): Name of the blend shape node.
+        file_path (str): Path to a blend shape library file.
+        target_names (list, optional): Only targets with these names are imported. If not provided, all are imported.
+        set_weight (bool, optional): If active, the weights stored in the file are also applied.
+
+    Returns:
+        list: Paths to the weight attributes of the imported targets. e.g. ["blendShape1.smile"]
+    """
+    blend_shape_data = read_blend_shape_library(file_path, target_names=target_names)
+    if not blend_shape_data:
+        return []
+    return set_blend_shape_data(blend_node, blend_shape_data, set_weight=set_weight)
+
+
+if __name__ == "__main__":
+    logger.setLevel(logging.DEBUG)
@@ -8,6 +8,7 @@ Code Namespace:
 from gt.core.namespace import get_namespace_hierarchy_list
 from gt.core.uuid import get_uuid, get_object_from_uuid
 from gt.core.naming import get_short_name
+import maya.api.OpenMaya as apiOpenMaya
 import maya.cmds as cmds
 import logging
 
@@ -16,6 +17,57 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Path Generation - Incremented when any node is renamed or reparented (Invalidates paths cached by "Node")
+_path_generation = 0
+_path_callback_ids = []
+
+
+def _increment_path_generation(*args):
+    """
+    Callback used to invalidate the paths cached by all "Node" objects. (Any rename or DAG change)
+    Args:
+        *args: Callback arguments. (Ignored)
+    """
+    global _path_generation
+    _path_generation += 1
+
+
+def register_path_callbacks():
+    """
+    Registers the callbacks used to know when the paths cached by "Node" objects are outdated.
+    Called automatically when a "Node" object is created. Nothing happens if they are already registered.
+
+    Returns:
+        bool: True if the callbacks are registered, False if they could not be registered.
+              Without callbacks, nodes resolve their paths every time they are requested.
+    """
+    if _path_callback_ids:
+        return True
+    try:
+        _path_callback_ids.append(
+            apiOpenMaya.MNodeMessage.addNameChangedCallback(apiOpenMaya.MObject.kNullObj, _increment_path_generation)
+        )
+        _path_callback_ids.append(apiOpenMaya.MDagMessage.addAllDagChangesCallback(_increment_path_generation))
+    except Exception as e:
+        logger.debug(f"Unable to register node path callbacks. Issue: {str(e)}")
+        remove_path_callbacks()
+        return False
+    return True
+
+
+def remove_path_callbacks():
+    """
+    Removes the callbacks registered by "register_path_callbacks" and invalidates all cached paths.
+    """
+    global _path_generation
+    for callback_id in _path_callback_ids:
+        try:
+            apiOpenMaya.MMessage.removeCallback(callback_id)
+        except Exception as e:
+            logger.debug(f"Unable to remove node path callback. Issue: {str(e)}")
+    del _path_callback_ids[:]
+    _path_generation += 1
+
 
 class Node:
     """
@@ -40,9 +92,10 @@ class Node:
     def __init__(self, path):
         """
         Initialize a Node instance.
-        A node object uses the UUID of the Maya node retrieve data, so once initialized it doesn't depend on the
+        A node object uses an MObjectHandle to retrieve data, so once initialized it doesn't depend on the
         string path of the object. When used as a string, it will return the full path to the object, even if not
-        unique.
+        unique. The path is cached and only resolved again after a rename or DAG change.
+        The UUID of the Maya node is also stored, so the handle can be recovered. (e.g. after reopening a scene)
 
         Args:
            path (str): The path to the Maya node.
@@ -52,6 +105,34 @@ class Node:
         if not cmds.objExists(path):
             raise Exception(f'Unable to read node. Object "{path}" could not be found in the scene.')
         self.uuid = get_uuid(path)
+        self._handle = None
+        self._is_dag = False
+        self._cached_path = None
+        self._cached_generation = None
+        register_path_callbacks()
+        self._acquire_handle()
+
+    def __getstate__(self):
+        """
+        Gets the state used when copying or pickling the node. Handles can't be copied, only the UUID is kept.
+
+        Returns:
+            dict: Node state.
+        """
+        return {"uuid": self.uuid}
+
+    def __setstate__(self, state):
+        """
+        Restores the state of a copied or unpickled node. The handle is recovered from the UUID when needed.
+
+        Args:
+            state (dict): Node state.
+        """
+        self.uuid = state.get("uuid")
+        self._handle = None
+        self._is_dag = False
+        self._cached_path = None
+        self._cached_generation = None
 
     @property
     def __class__(self):
@@ -175,17 +256,47 @@ class Node:
         """
         return self.uuid
 
-    def get_long_name(self):
+    def _acquire_handle(self):
         """
-        Get the long name of the Maya node.
+        Gets a new MObjectHandle for the node using its UUID.
 
         Returns:
-           str or None: The long name of the Maya node. None if not found.
+            bool: True if the node was found and the handle was updated, False otherwise.
         """
+        self._handle = None
+        self._cached_path = None
         long_name = get_object_from_uuid(uuid_string=str(self.uuid))
-        if long_name:
-            return long_name
-        return ""
+        if not long_name:
+            return False
+        selection = apiOpenMaya.MSelectionList()
+        selection.add(long_name)
+        mobject = selection.getDependNode(0)
+        self._handle = apiOpenMaya.MObjectHandle(mobject)
+        self._is_dag = mobject.hasFn(apiOpenMaya.MFn.kDagNode)
+        return True
+
+    def get_long_name(self):
+        """
+        Get the long name of the Maya node.
+        The path is cached and only resolved again (from the MObjectHandle) after a rename or DAG change.
+        If the handle is no longer valid (e.g. a new scene was opened), the UUID is used to find the node again.
+
+        Returns:
+           str: The long name of the Maya node. Empty string if not found.
+        """
+        if self._handle is None or not self._handle.isValid():
+            if not self._acquire_handle():
+                return ""
+        if self._cached_path is not None and self._cached_generation == _path_generation and _path_callback_ids:
+            return self._cached_path
+        mobject = self._handle.object()
+        if self._is_dag:
+            long_name = apiOpenMaya.MFnDagNode(mobject).fullPathName()
+        else:
+            long_name = apiOpenMaya.MFnDependencyNode(mobject).name()
+        self._cached_path = long_name
+        self._cached_generation = _path_generation
+        return long_name
 
     def get_short_name(self):
         """
@@ -9,10 +9,13 @@ from gt.core.session import is_script_in_py_maya, filter_loaded_modules_path_con
 from gt.utils.system import get_available_maya_preferences_dirs, load_package_menu
 from gt.core.session import remove_modules_startswith, get_maya_version
 from gt.core.session import get_loaded_package_module_paths
-from gt.core.io import DataDirConstants, delete_paths
+from gt.core.io import DataDirConstants, delete_paths, write_json, read_json_dict
 from gt.core.feedback import print_when_true
+from concurrent.futures import ThreadPoolExecutor
 import maya.cmds as cmds
 import logging
+import hashlib
+import fnmatch
 import shutil
 import sys
 import os
@@ -29,6 +32,8 @@ PACKAGE_DIRS = ["core", "tools", "ui", "utils"]
 PACKAGE_ENTRY_LINE = 'python("import gt_tools_loader");'
 PACKAGE_LEGACY_LINE = 'source "gt_tools_menu.mel";'
 PACKAGE_USER_SETUP = "userSetup.mel"
+PACKAGE_MANIFEST = "package_manifest.json"  # Written inside the main module of an installation
+PACKAGE_IGNORE_PATTERNS = ["*.pyc", "__pycache__", "tests"]
 
 
 def get_maya_preferences_dir():
@@ -94,10 +99,186 @@ def copy_package_requirements(target_folder, package_requirements):
                 src=requirement_path,
                 dst=os.path.join(target_folder, requirement),
                 # dirs_exist_ok=True,  # Not needed + Only available on Python 3.8+
-                ignore=shutil.ignore_patterns("*.pyc", "__pycache__", "tests"),
+                ignore=shutil.ignore_patterns(*PACKAGE_IGNORE_PATTERNS),
             )
         elif os.path.isfile(requirement_path):  # Files
-            shutil.copy(requirement_path, target_folder)
+            shutil.copy2(requirement_path, target_folder)  # Preserves modification time (See "build_package_manifest")
+
+
+def _is_ignored_install_path(name):
+    """
+    Checks if a file or directory name should be ignored when installing. (See "PACKAGE_IGNORE_PATTERNS")
+    Args:
+        name (str): Name of the file or directory. e.g. "__pycache__"
+    Returns:
+        bool: True if it should be ignored, False otherwise.
+    """
+    return any(fnmatch.fnmatch(name, pattern) for pattern in PACKAGE_IGNORE_PATTERNS)
+
+
+def get_file_hash(file_path, chunk_size=1048576):
+    """
+    Gets the hash (sha1 hex digest) of a file. Used to compare files when size and modification time are not enough.
+    Args:
+        file_path (str): Path to the file.
+        chunk_size (int, optional): The size of each read chunk in bytes.
+    Returns:
+        str: The sha1 hex digest of the file content.
+    """
+    file_hash = hashlib.sha1()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def build_package_manifest(package_requirements, use_hash=False):
+    """
+    Builds a content manifest for the provided requirements. Ignored files are skipped (See "PACKAGE_IGNORE_PATTERNS")
+    Args:
+        package_requirements (dict): Dictionary containing key:"element name" and value:"element path"
+                                     e.g {"gt": "C:/package/gt"} - See "get_package_requirements()"
+        use_hash (bool, optional): If active, a hash of the content is added to every file entry.
+                                   Slower, but detects changes even when the modification time is not preserved.
+    Returns:
+        dict: A dictionary with relative paths (always using "/") as keys and file entries as values.
+              e.g. {"gt/__init__.py": {"size": 250, "mtime": 1700000000.0}}
+    """
+    manifest = {}
+
+    def add_entry(file_path, relative_path, stat_result):
+        entry = {"size": stat_result.st_size, "mtime": stat_result.st_mtime}
+        if use_hash:
+            entry["hash"] = get_file_hash(file_path)
+        manifest[relative_path] = entry
+
+    def scan_dir(dir_path, relative_dir):
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if _is_ignored_install_path(entry.name) or entry.name == PACKAGE_MANIFEST:
+                    continue
+                relative_path = f"{relative_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    scan_dir(entry.path, relative_path)
+                elif entry.is_file():
+                    add_entry(entry.path, relative_path, entry.stat())
+
+    for requirement, requirement_path in package_requirements.items():
+        if os.path.isdir(requirement_path):
+            scan_dir(requirement_path, requirement)
+        elif os.path.isfile(requirement_path):
+            add_entry(requirement_path, requirement, os.stat(requirement_path))
+    return manifest
+
+
+def get_package_manifest_path(package_target_folder):
+    """
+    Gets the path to the manifest file of an installation.
+    Args:
+        package_target_folder (str): Path to the installation folder. e.g. ".../maya/gt-tools"
+    Returns:
+        str: Path to the manifest file. e.g. ".../maya/gt-tools/gt/package_manifest.json"
+    """
+    return os.path.join(package_target_folder, PACKAGE_MAIN_MODULE, PACKAGE_MANIFEST)
+
+
+def write_package_manifest(package_target_folder, manifest):
+    """
+    Writes the manifest of an installation. (See "build_package_manifest")
+    Args:
+        package_target_folder (str): Path to the installation folder.
+        manifest (dict): Manifest describing the installed files.
+    Returns:
+        str or None: Path to the written manifest, None if it failed.
+    """
+    manifest_path = get_package_manifest_path(package_target_folder)
+    if not os.path.isdir(os.path.dirname(manifest_path)):
+        return
+    return write_json(path=manifest_path, data={"files": manifest})
+
+
+def read_package_manifest(package_target_folder):
+    """
+    Reads the manifest of an installation. (See "write_package_manifest")
+    Args:
+        package_target_folder (str): Path to the installation folder.
+    Returns:
+        dict: The manifest describing the installed files. Empty dictionary if not found.
+    """
+    manifest_path = get_package_manifest_path(package_target_folder)
+    if not os.path.isfile(manifest_path):
+        return {}
+    return read_json_dict(manifest_path).get("files", {})
+
+
+def _is_manifest_entry_changed(source_entry, target_entry):
+    """
+    Compares two manifest entries. (See "build_package_manifest")
+    Args:
+        source_entry (dict): Entry of the source file.
+        target_entry (dict, None): Entry of the target file. None if the file is missing.
+    Returns:
+        bool: True if the file needs to be copied, False if it's unchanged.
+    """
+    if not target_entry or source_entry.get("size") != target_entry.get("size"):
+        return True
+    if "hash" in source_entry and "hash" in target_entry:
+        return source_entry.get("hash") != target_entry.get("hash")
+    return source_entry.get("mtime") != target_entry.get("mtime")
+
+
+def copy_package_requirements_incremental(target_folder, package_requirements, use_hash=False, max_workers=8):
+    """
+    Copies only the files that changed from the provided package_requirements to the target folder.
+    Source and target manifests are compared (size and modification time, or hash), changed files are copied
+    in parallel and files that are no longer part of the requirements are removed (stale files).
+    Args:
+        target_folder (str): Target folder. That's where the files will be copied to.
+        package_requirements (dict): Dictionary containing key:"element name" and value:"element path"
+                                     e.g {"tools": "C:/tools"} - See "get_package_requirements()"
+        use_hash (bool, optional): If active, files are compared using a hash of their content.
+        max_workers (int, optional): Maximum number of threads used to copy files.
+    Returns:
+        dict: The manifest of the source files (now installed). See "build_package_manifest"
+    """
+    if not os.path.isdir(target_folder):
+        raise NotADirectoryError(f'Unable to copy package requirements. "{target_folder}" is not a directory')
+    source_manifest = build_package_manifest(package_requirements, use_hash=use_hash)
+    target_requirements = {name: os.path.join(target_folder, name) for name in package_requirements}
+    target_manifest = build_package_manifest(target_requirements, use_hash=use_hash)
+
+    # Remove stale files
+    for relative_path in target_manifest:
+        if relative_path not in source_manifest:
+            os.remove(os.path.join(target_folder, *relative_path.split("/")))
+    for target_path in target_requirements.values():  # Remove empty directories (bottom-up)
+        if not os.path.isdir(target_path):
+            continue
+        for root, dirs, files in os.walk(target_path, topdown=False):
+            if root != target_path and not _is_ignored_install_path(os.path.basename(root)) and not os.listdir(root):
+                os.rmdir(root)
+
+    # Copy changed files
+    files_to_copy = []
+    for relative_path, source_entry in source_manifest.items():
+        if _is_manifest_entry_changed(source_entry, target_manifest.get(relative_path)):
+            files_to_copy.append(relative_path)
+
+    def copy_file(relative_path):
+        requirement, _, sub_path = relative_path.partition("/")
+        source_path = package_requirements.get(requirement)
+        if sub_path:
+            source_path = os.path.join(source_path, *sub_path.split("/"))
+        target_path = os.path.join(target_folder, *relative_path.split("/"))
+        target_dir = os.path.dirname(target_path)
+        if not os.path.isdir(target_dir):
+            os.makedirs(target_dir, exist_ok=True)
+        shutil.copy2(source_path, target_path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(copy_file, files_to_copy))  # "list" raises exceptions found in the threads
+    logger.debug(f"Incremental install: {len(files_to_copy)} file(s) copied out of {len(source_manifest)}.")
+    return source_manifest
 
 
 def remove_previous_install(target_path, clear_prefs=False):
@@ -128,18 +309,30 @@ def remove_previous_install(target_path, clear_prefs=False):
             delete_paths(target_path)
 
 
-def check_installation_integrity(package_target_folder):
+def check_installation_integrity(package_target_folder, use_manifest=True):
     """
     Checks if all requirements were copied to the installation folder
+    If a manifest is found (written during installation), all files listed in it are validated too (size).
 
     Args:
         package_target_folder (str): Path to the installation folder
+        use_manifest (bool, optional): If active and a manifest is available, files are validated against it.
 
     Returns:
         bool: True if all requirements were found. False otherwise.
     """
     if not package_target_folder or not os.path.isdir(package_target_folder):
         return False
+    manifest = read_package_manifest(package_target_folder) if use_manifest else {}
+    for relative_path, entry in manifest.items():
+        file_path = os.path.join(package_target_folder, *relative_path.split("/"))
+        try:
+            is_valid = os.stat(file_path).st_size == entry.get("size")
+        except OSError:
+            is_valid = False
+        if not is_valid:
+            print(f'Missing or modified installed file: "{relative_path}"')
+            return False
     package_target_contents = os.listdir(package_target_folder)
     missing_list = []
     for requirement in PACKAGE_REQUIREMENTS:
@@ -435,18 +628,21 @@ def prepend_sys_path_with_default_install_location(remove_paths=None):
     return True
 
 
-def install_package(clean_install=True, verbose=True, callbacks=None):
+def install_package(clean_install=True, verbose=True, callbacks=None, incremental=False):
     """
     Installs package in the Maya Settings directory
     Args:
         clean_install (optional, bool): Will first delete the package folder before copying files. (No overwrite)
                                         Only deletes if the folder matches the name of the package. Default: True
+                                        Ignored when using "incremental" (stale files are removed instead)
         verbose (bool, optional): If active, script will print steps as it's going through it - Default: True
         callbacks (list, callable, optional): A list of callable functions that will be called with the
                                               feedback of the installation as their first argument.
                                               e.g. If I provide [my_func], then the script will call
                                               my_func("Fetching requirements...") and so on as it goes
                                               through the operation.
+        incremental (bool, optional): If active, only files that changed are copied and stale files are removed.
+                                      (See "copy_package_requirements_incremental")
     Returns:
         bool: True if function reached the end successfully
     """
@@ -480,15 +676,23 @@ def install_package(clean_install=True, verbose=True, callbacks=None):
 
     # Clean install
     package_target_folder = os.path.normpath(os.path.join(maya_preferences_dir, PACKAGE_NAME))
-    if clean_install:
+    if incremental:
+        print_when_true("Comparing installed files...", do_print=verbose, callbacks=callbacks)
+    elif clean_install:
         print_when_true("Removing previous install...", do_print=verbose, callbacks=callbacks)
         remove_previous_install(package_target_folder)
     # Create Package Folder
     if not os.path.exists(package_target_folder):
         os.makedirs(package_target_folder)
     # Copy files and directories
-    print_when_true("Copying required files...", do_print=verbose, callbacks=callbacks)
-    copy_package_requirements(package_target_folder, package_requirements)
+    if incremental:
+        print_when_true("Copying changed files...", do_print=verbose, callbacks=callbacks)
+        manifest = copy_package_requirements_incremental(package_target_folder, package_requirements)
+    else:
+        print_when_true("Copying required files...", do_print=verbose, callbacks=callbacks)
+        copy_package_requirements(package_target_folder, package_requirements)
+        manifest = build_package_manifest(package_requirements)  # "copytree" preserves modification times
+    write_package_manifest(package_target_folder, manifest)
     # Add Entry Point and loader script
     print_when_true("Adding entry point to userSetup...", do_print=verbose, callbacks=callbacks)
     add_entry_point_to_maya_installs()
@@ -7,6 +7,7 @@ Code Namespace:
 
 import maya.api.OpenMayaAnim as apiOpenMayaAnim
 import maya.api.OpenMaya as apiOpenMaya
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import gt.core.feedback as core_fback
 import maya.OpenMaya as OpenMaya
 import gt.core.io as core_io
@@ -14,12 +15,21 @@ import maya.cmds as cmds
 import maya.mel as mel
 import os.path
 import logging
+import array
+import zlib
 
 # Logging Setup
 logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Skin Weights Files
+SKIN_WEIGHTS_FILE_PREFIX = "weights_"
+SKIN_WEIGHTS_JSON_EXTENSION = "json"
+SKIN_WEIGHTS_BINARY_EXTENSION = "skw"
+SKIN_WEIGHTS_BINARY_FORMAT = "gt_skin_weights"
+SKIN_WEIGHTS_BINARY_VERSION = 1
+
 
 def is_mesh_bound(obj):
     """
@@ -158,12 +168,270 @@ def get_geos_from_skin_cluster(skin_cluster):
     return affected_geometry_list
 
 
+class SkinWeightsData:
+    def __init__(self, weights=None, influences=None):
+        """
+        Dense skin weights representation. One row per vertex and one column per influence.
+        The weights are stored in a flat (row-major) array, the same layout used by "MFnSkinCluster.getWeights".
+        e.g. For two influences, the weights of the vertex 1 are found at the indices 2 and 3.
+
+        Args:
+            weights (array.array, list, optional): Flat list of weights. Length must be: vertices * influences
+            influences (list, optional): A list of influence names (columns). e.g. ["joint1", "joint2"]
+        """
+        self.weights = array.array("d", weights or [])
+        self.influences = list(influences or [])
+
+    def __repr__(self):
+        """
+        Generates a custom string message to return a proper sentence when printing or casting this object to string.
+        """
+        return (
+            f"SkinWeightsData(vertices={self.get_vertex_count()}, influences={len(self.influences)}, "
+            f"influence_names={self.influences})"
+        )
+
+    def get_influences(self):
+        """
+        Gets the influence names. (Columns)
+        Returns:
+            list: A list of influence names. e.g. ["joint1", "joint2"]
+        """
+        return self.influences
+
+    def get_weights(self):
+        """
+        Gets the flat (row-major) array of weights.
+        Returns:
+            array.array: The weights array. Length is: vertices * influences
+        """
+        return self.weights
+
+    def get_vertex_count(self):
+        """
+        Gets the number of vertices (rows) described by this data.
+        Returns:
+            int: Number of vertices.
+        """
+        if not self.influences:
+            return 0
+        return len(self.weights) // len(self.influences)
+
+    def get_vertex_weights(self, vertex_index):
+        """
+        Gets the weights of a vertex. (One row)
+        Args:
+            vertex_index (int): Index of the vertex.
+        Returns:
+            list: A list of weights, one per influence (same order as "get_influences").
+        """
+        influence_count = len(self.influences)
+        start = vertex_index * influence_count
+        return self.weights[start : start + influence_count].tolist()
+
+    def get_influence_weights(self, influence):
+        """
+        Gets the weights of an influence for every vertex. (One column)
+        Args:
+            influence (str): Name of the influence.
+        Returns:
+            list: A list of weights, one per vertex.
+        Raises:
+            ValueError: If the influence is not part of this data.
+        """
+        column = self.influences.index(influence)
+        return self.weights[column :: len(self.influences)].tolist()
+
+    def get_used_influences(self):
+        """
+        Gets the influences that have at least one non-zero weight.
+        Influences with only zero weights (e.g. kept in the file after pruning) don't affect the deformation.
+        Returns:
+            list: A list of influence names, same order as "get_influences". e.g. ["joint1"]
+        """
+        influence_count = len(self.influences)
+        return [
+            name for column, name in enumerate(self.influences) if any(self.weights[column::influence_count])
+        ]
+
+    def get_remapped(self, influences):
+        """
+        Gets a copy of this data using a different influence order. (Columns)
+        Influences not found in this data receive zero weights. Influences not found in "influences" are dropped.
+        Args:
+            influences (list): The new influence order. e.g. ["joint2", "joint1"]
+        Returns:
+            SkinWeightsData: A new object using the provided influence order.
+        """
+        vertex_count = self.get_vertex_count()
+        old_count = len(self.influences)
+        new_count = len(influences)
+        weights = array.array("d", [0.0]) * (vertex_count * new_count)
+        for new_column, name in enumerate(influences):
+            if name not in self.influences:
+                continue
+            old_column = self.influences.index(name)
+            weights[new_column::new_count] = self.weights[old_column::old_count]
+        return SkinWeightsData(weights=weights, influences=influences)
+
+    def to_dict(self, include_zero=False):
+        """
+        Builds the sparse dictionary representation of the weights. (Same pattern used by "get_skin_weights")
+        Args:
+            include_zero (bool, optional): If active, influences with a weight of zero are included in the dictionary.
+        Returns:
+            dict: Sparse weights dictionary. e.g. {0: {'joint1': 0.75, 'joint2': 0.25}, 1: {'joint2': 1.0}}
+        """
+        influence_count = len(self.influences)
+        skin_data = {}
+        for vertex_index in range(self.get_vertex_count()):
+            start = vertex_index * influence_count
+            row = self.weights[start : start + influence_count]
+            skin_data[vertex_index] = {
+                name: weight for name, weight in zip(self.influences, row) if weight or include_zero
+            }
+        return skin_data
+
+    def to_sparse_arrays(self):
+        """
+        Gets the weights in a compressed sparse row (CSR) layout. Only non-zero weights are included.
+        Returns:
+            tuple: A tuple with three arrays (offsets, influence_indices, weights).
+                   "offsets" has one element per vertex plus one. The non-zero weights of the vertex "n" are found
+                   between "offsets[n]" and "offsets[n + 1]" in the "influence_indices" and "weights" arrays.
+        """
+        influence_count = len(self.influences)
+        offsets = array.array("I", [0])
+        influence_indices = array.array("I")
+        weights = array.array("d")
+        for vertex_index in range(self.get_vertex_count()):
+            start = vertex_index * influence_count
+            for column, weight in enumerate(self.weights[start : start + influence_count]):
+                if weight:
+                    influence_indices.append(column)
+                    weights.append(weight)
+            offsets.append(len(weights))
+        return offsets, influence_indices, weights
+
+    @classmethod
+    def from_sparse_arrays(cls, offsets, influence_indices, weights, influences):
+        """
+        Creates a dense representation using compressed sparse row (CSR) arrays. (See "to_sparse_arrays")
+        Args:
+            offsets (array.array, list): Start of each vertex in the other arrays. One element per vertex plus one.
+            influence_indices (array.array, list): Influence (column) of each non-zero weight.
+            weights (array.array, list): Non-zero weights.
+            influences (list): A list of influence names (columns).
+        Returns:
+            SkinWeightsData: The dense representation of the provided arrays.
+        """
+        influence_count = len(influences)
+        dense_weights = array.array("d", [0.0]) * ((len(offsets) - 1) * influence_count)
+        for vertex_index in range(len(offsets) - 1):
+            start = vertex_index * influence_count
+            for item_index in range(offsets[vertex_index], offsets[vertex_index + 1]):
+                dense_weights[start + influence_indices[item_index]] = weights[item_index]
+        return cls(weights=dense_weights, influences=influences)
+
+    def to_numpy(self):
+        """
+        Gets the weights as a NumPy array with the shape (vertices, influences). Requires NumPy.
+        Returns:
+            numpy.ndarray or None: Array of weights. None if NumPy is not available.
+        """
+        try:
+            import numpy
+        except ImportError:
+            logger.warning("Unable to convert skin weights. NumPy is not available.")
+            return
+        return numpy.frombuffer(self.weights, dtype=numpy.float64).reshape(self.get_vertex_count(), -1).copy()
+
+    @classmethod
+    def from_dict(cls, skin_data, influences=None):
+        """
+        Creates a dense representation using a sparse weights dictionary. (Pattern described in "get_skin_weights")
+        Vertices missing from the dictionary receive zero weights.
+        Args:
+            skin_data (dict): Sparse weights dictionary. Keys can be integers or strings (JSON)
+            influences (list, optional): Influence order (columns). If not provided, influences found in the
+                                         dictionary are used in alphabetical order.
+        Returns:
+            SkinWeightsData: The dense representation of the provided dictionary.
+        """
+        if influences is None:
+            influences = get_influences_from_skin_data(skin_data)
+        skin_data = {int(key): value for key, value in skin_data.items()}
+        vertex_count = max(skin_data.keys()) + 1 if skin_data else 0
+        influence_count = len(influences)
+        columns = {name: index for index, name in enumerate(influences)}
+        weights = array.array("d", [0.0]) * (vertex_count * influence_count)
+        for vertex_index, vertex_weights in skin_data.items():
+            start = vertex_index * influence_count
+            for name, weight in vertex_weights.items():
+                weights[start + columns[name]] = weight
+        return cls(weights=weights, influences=influences)
+
+
+def get_mesh_vertex_component(skinned_mesh):
+    """
+    Gets a component describing all vertices of the provided mesh. (Used to read and write skin weights)
+
+    Args:
+        skinned_mesh (str): The name of the mesh.
+
+    Returns:
+        tuple: A tuple with the mesh dag path (MDagPath) and a vertex component (MObject) including all vertices.
+    """
+    sel_list = apiOpenMaya.MSelectionList()
+    sel_list.add(skinned_mesh)
+    mesh_dag = sel_list.getDagPath(0)
+    vertices_num = cmds.polyEvaluate(skinned_mesh, v=True)
+    mfn_single_component = apiOpenMaya.MFnSingleIndexedComponent()
+    mesh_vert_component = mfn_single_component.create(apiOpenMaya.MFn.kMeshVertComponent)
+    mfn_single_component.setCompleteData(vertices_num)
+    return mesh_dag, mesh_vert_component
+
+
+def get_skin_weights_data(skinned_mesh):
+    """
+    Retrieve skin weights data from a given skinned mesh as a dense representation (one row per vertex).
+    The weights are read in a single "MFnSkinCluster.getWeights" call, without any per-vertex queries.
+
+    Args:
+        skinned_mesh (str): The name of the skinned mesh
+
+    Raises:
+        ValueError: If the provided mesh does not exist or doesn't have a skin cluster.
+
+    Returns:
+        SkinWeightsData: Dense skin weights. Use "to_dict" for the sparse representation used by "get_skin_weights".
+
+    Example:
+        # Assuming a valid 'pCube1' exists in the scene.
+        weights_data = get_skin_weights_data('pCube1')
+        weights_data.get_influences()  # ['joint1', 'joint2']
+        weights_data.get_vertex_weights(0)  # [0.75, 0.25]
+    """
+    if not cmds.objExists(skinned_mesh):
+        raise ValueError("Mesh '{}' does not exist.".format(skinned_mesh))
+
+    mfn_skin_cluster, skin_cluster_name = get_mfn_skin_from_geometry(skinned_mesh)
+    if not skin_cluster_name:
+        raise ValueError("Mesh '{}' does not have a skin cluster.".format(skinned_mesh))
+
+    mesh_dag, mesh_vert_component = get_mesh_vertex_component(skinned_mesh)
+    weights, inf_num = mfn_skin_cluster.getWeights(mesh_dag, mesh_vert_component)
+    inf_names = [inf_dag.partialPathName() for inf_dag in mfn_skin_cluster.influenceObjects()]
+    return SkinWeightsData(weights=weights, influences=inf_names)
+
+
 def get_skin_weights(skinned_mesh):
     """
     Retrieve skin weights data from a given skinned mesh.
     This function returns skin weight information for each vertex analysing the skin cluster
     related to the supplied skinned mesh.
     The skin weights represent the influence of each bone (influence object) on the vertices of the mesh.
+    Influences with a weight of zero are not included. For large meshes, consider using "get_skin_weights_data".
 
     Args:
         skinned_mesh (str): The name of the skinned mesh
@@ -188,55 +456,7 @@ def get_skin_weights(skinned_mesh):
         weights_data = get_skin_weights('pCube1')
         # Resulting output will be a dictionary containing skin weight data for each vertex in the cluster.
     """
-    if not cmds.objExists(skinned_mesh):
-        raise ValueError("Mesh '{}' does not exist.".format(skinned_mesh))
-
-    vertices_num = cmds.polyEvaluate(skinned_mesh, v=True)
-
-    # get om2 mfn_skin_cluster
-    sel_list = apiOpenMaya.MSelectionList()
-    sel_list.add(skinned_mesh)
-    mesh_dag = sel_list.getDagPath(0)
-    mfn_skin_cluster, skin_cluster_name = get_mfn_skin_from_geometry(skinned_mesh)
-
-    if not skin_cluster_name:
-        raise ValueError("Mesh '{}' does not have a skin cluster.".format(skinned_mesh))
-
-    # get om2 mfn mesh components
-    components_ids = [c for c in range(vertices_num)]
-    mfn_single_component = apiOpenMaya.MFnSingleIndexedComponent()
-    mesh_vert_component = mfn_single_component.create(apiOpenMaya.MFn.kMeshVertComponent)
-    mfn_single_component.addElements(components_ids)
-
-    # get weights from the skin cluster
-    weights, inf_num = mfn_skin_cluster.getWeights(mesh_dag, mesh_vert_component)
-
-    # get the plugs for the influences
-    weight_plug = mfn_skin_cluster.findPlug("weights", False)
-    list_plug = mfn_skin_cluster.findPlug("weightList", False).attribute()
-    inf_dags = mfn_skin_cluster.influenceObjects()
-    inf_num = len(inf_dags)
-    inf_names = [inf_dag.partialPathName() for inf_dag in inf_dags]
-    sparse_map = {mfn_skin_cluster.indexForInfluenceObject(inf_dag): i for i, inf_dag in enumerate(inf_dags)}
-
-    # create the dictionary for the skin data
-    skin_data = {}
-    for comp_id, vertex_num in enumerate(components_ids):
-        weight_plug.selectAncestorLogicalIndex(vertex_num, list_plug)
-        valid_ids = weight_plug.getExistingArrayAttributeIndices()
-
-        # bitwise operation to ignore false positives if any
-        valid_ids = set(valid_ids) & sparse_map.keys()
-
-        comp_weights = {}
-        flat_index = int(comp_id) * inf_num
-        for valid_id in valid_ids:
-            inf_index = sparse_map[valid_id]
-            comp_weights[inf_names[inf_index]] = weights[flat_index + inf_index]
-
-        skin_data[vertex_num] = comp_weights
-
-    return skin_data
+    return get_skin_weights_data(skinned_mesh).to_dict()
 
 
 def set_skin_weights(skinned_mesh, skin_data, remove_unused_inf=True):
@@ -329,6 +549,60 @@ def set_skin_weights(skinned_mesh, skin_data, remove_unused_inf=True):
         logger.info(f"Successfully removed unused influences within {skin_cluster_name}.")
 
 
+def set_skin_weights_data(skinned_mesh, skin_weights_data, remove_unused_inf=True):
+    """
+    Sets the skin weights using a dense representation. (See "get_skin_weights_data")
+    The weights are written in a single "MFnSkinCluster.setWeights" call.
+
+    Args:
+        skinned_mesh (str): name of the skinned mesh to apply weights to.
+        skin_weights_data (SkinWeightsData): Dense skin weights. Must describe every vertex of the mesh.
+        remove_unused_inf (boolean): removes unused influences at the end of the process
+
+    Raises:
+        ValueError: If an influence with non-zero weights is missing from the skin cluster of the mesh,
+                    or if the number of vertices is different.
+    """
+    if not cmds.objExists(skinned_mesh):
+        raise ValueError(f"Mesh '{skinned_mesh}' does not exist.")
+
+    mfn_skin_cluster, skin_cluster_name = get_mfn_skin_from_geometry(skinned_mesh)
+    if not skin_cluster_name:
+        raise ValueError(f"Mesh '{skinned_mesh}' does not have a skin cluster.")
+
+    inf_dags = mfn_skin_cluster.influenceObjects()
+    inf_dict = {i_dag.partialPathName(): i_dag for i_dag in inf_dags}
+    data_influences = skin_weights_data.get_influences()
+    # Influences with only zero weights are dropped by the remap below, they don't need to exist in the cluster
+    used_influences = skin_weights_data.get_used_influences()
+    inf_missing = [inf_name for inf_name in used_influences if inf_name not in inf_dict]
+    if inf_missing:
+        raise ValueError(
+            f"The skinCluster '{skin_cluster_name}' does not have the following influences:\n {str(inf_missing)}"
+        )
+
+    mesh_dag, mesh_vert_component = get_mesh_vertex_component(skinned_mesh)
+    vertices_num = cmds.polyEvaluate(skinned_mesh, v=True)
+    if skin_weights_data.get_vertex_count() != vertices_num:
+        raise ValueError(
+            f"Unable to set weights. Data describes {skin_weights_data.get_vertex_count()} vertices, "
+            f"but '{skinned_mesh}' has {vertices_num} vertices."
+        )
+
+    # Every influence is written (influences missing from the data receive zero)
+    inf_names = [i_dag.partialPathName() for i_dag in inf_dags]
+    inf_indices = apiOpenMaya.MIntArray([int(mfn_skin_cluster.indexForInfluenceObject(i_dag)) for i_dag in inf_dags])
+    if data_influences != inf_names:
+        skin_weights_data = skin_weights_data.get_remapped(influences=inf_names)
+    weights = apiOpenMaya.MDoubleArray(skin_weights_data.get_weights())
+    mfn_skin_cluster.setWeights(mesh_dag, mesh_vert_component, inf_indices, weights, False, False)
+    logger.info(f"Successfully set weights for supplied mesh {skinned_mesh}.")
+
+    if remove_unused_inf:
+        remove_unused_influences(skin_cluster_name)
+        logger.info(f"Successfully removed unused influences within {skin_cluster_name}.")
+
+
 def get_influences_from_skin_data(skin_data):
     """
     Gets the influences (joint names) inside the supplied skin data.
@@ -368,6 +642,151 @@ def import_skin_weights_from_json(target_object, import_file_path):
     set_skin_weights(target_object, skin_data)
 
 
+def write_skin_weights_file(file_path, skin_weights_data, mesh_name=None, compress=True):
+    """
+    Writes skin weights to a binary file. (Compact alternative to JSON, see "read_skin_weights_file")
+    The header describes the mesh, the influence table and where each array is stored. The data section stores the
+    weights in a compressed sparse row (CSR) layout. (See "SkinWeightsData.to_sparse_arrays")
+
+    Args:
+        file_path (str): Path to the file. Existing files are overwritten.
+        skin_weights_data (SkinWeightsData): Dense skin weights to write.
+        mesh_name (str, optional): Name of the mesh described by the weights. Stored in the header.
+        compress (bool, optional): If active, the arrays are compressed using zlib.
+
+    Returns:
+        str or None: Path to the written file. None if it failed.
+    """
+    sparse_arrays = zip(["offsets", "influence_indices", "weights"], skin_weights_data.to_sparse_arrays())
+    data = bytearray()
+    arrays_header = {}
+    for array_name, values in sparse_arrays:
+        array_bytes = core_io.array_to_bytes(values)
+        if compress:
+            array_bytes = zlib.compress(array_bytes)
+        arrays_header[array_name] = {"typecode": values.typecode, "offset": len(data), "length": len(array_bytes)}
+        data.extend(array_bytes)
+    header = {
+        "format": SKIN_WEIGHTS_BINARY_FORMAT,
+        "version": SKIN_WEIGHTS_BINARY_VERSION,
+        "mesh": mesh_name,
+        "vertex_count": skin_weights_data.get_vertex_count(),
+        "influences": skin_weights_data.get_influences(),
+        "compression": "zlib" if compress else None,
+        "arrays": arrays_header,
+    }
+    return core_io.write_packed_file(path=file_path, header=header, data=bytes(data))
+
+
+def read_skin_weights_file_header(file_path):
+    """
+    Reads only the header of a binary skin weights file. (See "write_skin_weights_file")
+
+    Args:
+        file_path (str): Path to a binary skin weights file.
+
+    Returns:
+        dict: The header dictionary. e.g. {"mesh": "body", "vertex_count": 10, "influences": [...], ...}
+              Empty dictionary if the file is not a binary skin weights file.
+    """
+    header, _ = core_io.read_packed_file_header(file_path)
+    if header.get("format") != SKIN_WEIGHTS_BINARY_FORMAT:
+        return {}
+    return header
+
+
+def read_skin_weights_file(file_path):
+    """
+    Reads skin weights from a file. The format is automatically detected.
+    Binary files are created by "write_skin_weights_file", JSON files follow the pattern of "get_skin_weights".
+
+    Args:
+        file_path (str): Path to a binary or JSON skin weights file.
+
+    Returns:
+        SkinWeightsData or None: Dense skin weights. None if the file could not be read.
+    """
+    if not core_io.is_packed_file(file_path):
+        skin_data = core_io.read_json_dict(path=file_path)
+        if not skin_data:
+            return
+        return SkinWeightsData.from_dict(skin_data)
+
+    header, data_start = core_io.read_packed_file_header(file_path)
+    if header.get("format") != SKIN_WEIGHTS_BINARY_FORMAT or data_start is None:
+        logger.warning(f'Unable to read skin weights. Unexpected file format: "{file_path}".')
+        return
+    data = core_io.read_packed_file_data(file_path, data_start)
+    sparse_arrays = []
+    for array_name in ["offsets", "influence_indices", "weights"]:
+        array_header = header.get("arrays").get(array_name)
+        start = array_header.get("offset")
+        array_bytes = data[start : start + array_header.get("length")]
+        if header.get("compression") == "zlib":
+            array_bytes = zlib.decompress(array_bytes)
+        sparse_arrays.append(core_io.bytes_to_array(array_bytes, typecode=array_header.get("typecode")))
+    return SkinWeightsData.from_sparse_arrays(*sparse_arrays, influences=header.get("influences"))
+
+
+def write_skin_weights_data_to_file(file_path, skin_weights_data, mesh_name=None):
+    """
+    Writes skin weights using the format defined by the file extension.
+    Binary for ".skw" (see "write_skin_weights_file"), JSON for anything else (see "get_skin_weights").
+    This function doesn't use Maya, so it can be called from a worker thread.
+
+    Args:
+        file_path (str): Path to the file. Existing files are overwritten.
+        skin_weights_data (SkinWeightsData): Dense skin weights to write.
+        mesh_name (str, optional): Name of the mesh described by the weights. (Only stored in binary files)
+
+    Returns:
+        str or None: Path to the written file. None if it failed.
+    """
+    if file_path.endswith(f".{SKIN_WEIGHTS_BINARY_EXTENSION}"):
+        return write_skin_weights_file(file_path, skin_weights_data=skin_weights_data, mesh_name=mesh_name)
+    return core_io.write_json(path=file_path, data=skin_weights_data.to_dict())
+
+
+def get_skin_weights_file_path(target_folder, mesh_name, file_format=SKIN_WEIGHTS_JSON_EXTENSION):
+    """
+    Gets the path of a skin weights file for a mesh. e.g. "<target_folder>/weights_<mesh_name>.json"
+
+    Args:
+        target_folder (str): Folder where the file is stored.
+        mesh_name (str): Name of the mesh. Only the short name is used.
+        file_format (str, optional): File extension. "json" or "skw" (binary). A leading "." is ignored.
+
+    Returns:
+        str: Path to the skin weights file.
+    """
+    import gt.core.naming as core_naming
+
+    file_format = file_format.lstrip(".")
+    file_name = f"{SKIN_WEIGHTS_FILE_PREFIX}{core_naming.get_short_name(mesh_name)}.{file_format}"
+    return os.path.join(target_folder, file_name)
+
+
+def get_skin_weights_files_from_folder(target_folder):
+    """
+    Gets the skin weights files found in a folder, without reading them.
+    When a mesh has both binary and JSON files, the binary file is used.
+
+    Args:
+        target_folder (str): Folder with exported skin weights files.
+
+    Returns:
+        dict: Mesh names (keys) and the path to their skin weights files (values). e.g. {"body": ".../weights_body.skw"}
+    """
+    extensions = [f".{SKIN_WEIGHTS_JSON_EXTENSION}", f".{SKIN_WEIGHTS_BINARY_EXTENSION}"]  # Lowest priority first
+    weights_files = {}
+    for extension in extensions:
+        for file_name in os.listdir(target_folder):
+            if file_name.startswith(SKIN_WEIGHTS_FILE_PREFIX) and file_name.endswith(extension):
+                mesh_name = file_name[len(SKIN_WEIGHTS_FILE_PREFIX) : -len(extension)]
+                weights_files[mesh_name] = os.path.join(target_folder, file_name)
+    return weights_files
+
+
 def bind_skin(joints, objects, bind_method=1, smooth_weights=0.5, maximum_influences=4):
     """
     Binds the specified joints to the given objects using the skinCluster command in Maya.
@@ -610,11 +1029,26 @@ def import_influences_from_target_folder(source_folder, verbose=False):
         )
 
 
-def export_weights_to_target_folder(obj_list, target_folder, verbose=False, file_format=".json"):
+def export_weights_to_target_folder(
+    obj_list, target_folder, verbose=False, file_format=".json", max_workers=None, callback=None
+):
     """
-    WIP
-    TODO:
-        Check if exists, add existing checks, check pattern before using it Add suffix?
+    Exports the skin weights of the provided meshes to a target folder. One file per mesh: "weights_<mesh>.<format>"
+    Weights are read from Maya in the main thread, while encoding, compression and writing happen in a thread pool,
+    so reading the next mesh overlaps with writing the previous ones.
+
+    Args:
+        obj_list (list, str): A list of skinned meshes. (A single mesh can be provided as a string)
+        target_folder (str): Path to an existing folder where the files are written.
+        verbose (bool, optional): If active, a message is printed for every exported file.
+        file_format (str, optional): ".json" (interchange, see "get_skin_weights") or ".skw" (compact binary file,
+                                     see "write_skin_weights_file").
+        max_workers (int, optional): Maximum number of threads used to write files. Default is None (automatic)
+        callback (callable, optional): A callback function to track the export progress. (Called in the main thread)
+                                       It should accept two arguments: the number of exported files and the total.
+
+    Returns:
+        list: A list of exported file paths.
     """
     if isinstance(obj_list, str):  # If a string is provided, convert it to list
         obj_list = [obj_list]
@@ -624,57 +1058,54 @@ def export_weights_to_target_folder(obj_list, target_folder, verbose=False, file
         return
 
     exported_files = set()
-    for obj in obj_list:
-        import gt.core.naming as core_naming
-
-        file_name = f"weights_{core_naming.get_short_name(obj)}.{file_format}"
-        file_path = os.path.join(target_folder, file_name)
-        skin_weights_data = get_skin_weights(obj)
-        json_file = core_io.write_json(path=file_path, data=skin_weights_data)
-        if json_file:
-            exported_files.add(json_file)
-            core_fback.print_when_true(input_string=f'Weights for "{obj}" exported to "{json_file}".', do_print=verbose)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for obj in obj_list:
+            file_path = get_skin_weights_file_path(target_folder=target_folder, mesh_name=obj, file_format=file_format)
+            skin_weights_data = get_skin_weights_data(obj)  # Maya API - Main thread
+            future = executor.submit(write_skin_weights_data_to_file, file_path, skin_weights_data, obj)
+            futures[future] = obj
+        for index, future in enumerate(as_completed(futures), start=1):
+            weights_file = future.result()
+            if weights_file:
+                exported_files.add(weights_file)
+                core_fback.print_when_true(
+                    input_string=f'Weights for "{futures[future]}" exported to "{weights_file}".', do_print=verbose
+                )
+            if callback is not None:
+                callback(index, len(futures))
     return list(exported_files)
 
 
-def import_weights_from_target_folder(obj_list, target_folder, remove_unused_inf=True):
+def import_weights_from_target_folder(obj_list, target_folder, remove_unused_inf=True, max_workers=None, callback=None):
     """
     Imports the skin weights from a target folder.
+    Only the files of the provided meshes are read. Binary (".skw") and JSON (".json") files are supported.
+    Files are read and decoded in a thread pool, while weights are applied in the main thread as soon as each
+    file is ready.
 
     Args:
         obj_list (list): list of skinned meshes
         target_folder (string): folder path with exported skin data files
         remove_unused_inf (bool): remove unused influences after the process
+        max_workers (int, optional): Maximum number of threads used to read files. Default is None (automatic)
+        callback (callable, optional): A callback function to track the import progress. (Called in the main thread)
+                                       It should accept two arguments: the number of processed meshes and the total.
 
     Returns:
 
     """
     import gt.core.joint as core_joint
     import gt.core.scene as core_scene
+    import gt.core.naming as core_naming
 
     if not os.path.exists(target_folder) or not os.path.isdir(target_folder):
         logger.warning(f"Unable to export skin weights. Missing target folder: {str(target_folder)}")
         return
 
-    data_file_prefix = "weights_"
-    data_file_ext = ".json"
-    available_meshes_in_data = []
-    weights_data = {}
-
-    for weights_file_name in os.listdir(target_folder):
-        if weights_file_name.startswith(data_file_prefix) and weights_file_name.endswith(data_file_ext):
-            file_path = os.path.join(target_folder, weights_file_name)
-            json_weights_dict = core_io.read_json_dict(file_path)
-
-            # fix json string dictionary keys back to int
-            weights_dict = {}
-            for k, v in json_weights_dict.items():
-                weights_dict[int(k)] = v
-
-            data_mesh_name = weights_file_name.replace(data_file_prefix, "").replace(data_file_ext, "")
-            available_meshes_in_data.append(data_mesh_name)
-            weights_data[data_mesh_name] = weights_dict
+    available_files = get_skin_weights_files_from_folder(target_folder)
 
+    skin_clusters = {}
     for obj in obj_list:
         if not cmds.objExists(obj):
             logger.warning(f"Skipped set weights for supplied mesh {obj}")
@@ -685,32 +1116,43 @@ def import_weights_from_target_folder(obj_list, target_folder, remove_unused_inf
             logger.warning(f"Skipped set weights for supplied mesh {obj}. The SkinCluster is missing.")
             continue
 
-        # set skin weights
-        if obj in available_meshes_in_data:
-
-            try:
-                set_skin_weights(obj, weights_data[obj], remove_unused_inf=remove_unused_inf)
-
-            except Exception as e:
-                print(e)
-                if "kInvalidParameter" not in str(e):
-                    logger.error(e)
-                    logger.warning(f"Skipped set weights for supplied mesh {obj}. Errors occur.")
-
-                else:
-                    # root joint from current influences
-                    first_key = list(weights_data[obj].keys())[0]
-                    first_joint = list(weights_data[obj][first_key].keys())[0]
+        if core_naming.get_short_name(obj) not in available_files:
+            logger.warning(f"Skipped set weights for supplied mesh {obj}. Data not found.")
+            continue
+        skin_clusters[obj] = skin_cluster_name
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for obj in skin_clusters:
+            weights_file = available_files.get(core_naming.get_short_name(obj))
+            futures[executor.submit(read_skin_weights_file, weights_file)] = obj
+
+        for index, future in enumerate(as_completed(futures), start=1):
+            obj = futures[future]
+            weights_data = future.result()
+            if not weights_data:
+                logger.warning(f"Skipped set weights for supplied mesh {obj}. Data not found.")
+            else:
+                # re-bind if influences were removed (e.g. unused influences removed after a previous import)
+                current_influences = cmds.skinCluster(skin_clusters.get(obj), query=True, influence=True) or []
+                # all-zero influences (e.g. kept after pruning) don't need to be in the skin cluster
+                used_influences = weights_data.get_used_influences()
+                if any(inf not in current_influences for inf in used_influences):
+                    # root joint from the data influences
+                    first_joint = used_influences[0]
                     root_joint = core_joint.get_root_from_joint(first_joint)
                     joint_hierarchy = core_scene.get_hierarchy(root_joint, maya_type=OpenMaya.MFn.kJoint)
-                    # re-bind
                     cmds.delete(obj, constructionHistory=True)
                     bind_skin(joint_hierarchy, [obj])
                     logger.info(f"Unused influences were removed. Successfully re-bound {obj} to the skeleton.")
-                    set_skin_weights(obj, weights_data[obj], remove_unused_inf=remove_unused_inf)
-
-        else:
-            logger.warning(f"Skipped set weights for supplied mesh {obj}. Data not found.")
+                # set skin weights - Maya API - Main thread
+                try:
+                    set_skin_weights_data(obj, weights_data, remove_unused_inf=remove_unused_inf)
+                except Exception as e:
+                    logger.error(e)
+                    logger.warning(f"Skipped set weights for supplied mesh {obj}. Errors occur.")
+            if callback is not None:
+                callback(index, len(futures))
 
 
 def get_mfn_skin_from_skin_cluster(skin_cluster):
@@ -550,6 +550,84 @@ def replace_keys_with_values(input_string, replacements_dict, case_sensitive=Tru
     return input_string
 
 
+class StringSearchIndex:
+    """
+    Substring search index for a list of strings. Strings are split into n-grams (1 to 3 characters) so a query only
+    checks the strings that share all of its n-grams, instead of every string in the list.
+    Results keep the order in which the strings were added.
+    """
+
+    NGRAM_SIZE = 3
+
+    def __init__(self, strings=None, case_sensitive=False):
+        """
+        Initializes a StringSearchIndex object.
+        Args:
+            strings (list, optional): Strings to add to the index.
+            case_sensitive (bool, optional): If inactive, strings and queries are compared in lowercase.
+        """
+        self.case_sensitive = case_sensitive
+        self.strings = []
+        self._keys = []
+        self._positions = {}
+        self._ngrams = {}
+        for string in strings or []:
+            self.add(string)
+
+    def __len__(self):
+        return len(self.strings)
+
+    def __contains__(self, string):
+        return string in self._positions
+
+    def _get_key(self, string):
+        return string if self.case_sensitive else string.lower()
+
+    def _get_ngrams(self, key, size):
+        return {key[index : index + size] for index in range(len(key) - size + 1)}
+
+    def add(self, string):
+        """
+        Adds a string to the index. Duplicates are ignored.
+        Args:
+            string (str): String to add.
+        """
+        if string in self._positions:
+            return
+        position = len(self.strings)
+        key = self._get_key(string)
+        self._positions[string] = position
+        self.strings.append(string)
+        self._keys.append(key)
+        for size in range(1, self.NGRAM_SIZE + 1):
+            for ngram in self._get_ngrams(key, size):
+                self._ngrams.setdefault(ngram, set()).add(position)
+
+    def search(self, query):
+        """
+        Gets all strings containing the query.
+        Args:
+            query (str): Substring to search for. If empty, all strings are returned.
+        Returns:
+            list: Strings containing the query, in the order they were added to the index.
+        """
+        if not query:
+            return list(self.strings)
+        query_key = self._get_key(query)
+        size = min(len(query_key), self.NGRAM_SIZE)
+        candidate_sets = []
+        for ngram in self._get_ngrams(query_key, size):
+            positions = self._ngrams.get(ngram)
+            if not positions:
+                return []
+            candidate_sets.append(positions)
+        candidate_sets.sort(key=len)
+        candidates = set.intersection(*candidate_sets)
+        if len(query_key) > self.NGRAM_SIZE:  # n-grams match, but not necessarily in sequence
+            candidates = [position for position in candidates if query_key in self._keys[position]]
+        return [self.strings[position] for position in sorted(candidates)]
+
+
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
     an_input_string = "Hello, World! This is a test."
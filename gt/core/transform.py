@@ -5,8 +5,8 @@ Code Namespace:
     core_trans  # import gt.core.transform as core_trans
 """
 
+import gt.core.transform_math as core_trans_math
 import gt.core.attr as core_attr
-import gt.core.math as core_math
 import gt.core.feedback as core_fback
 import gt.core.constraint as core_cnstr
 import maya.cmds as cmds
@@ -479,27 +479,41 @@ class Transform:
                 return
         logger.warning(f"Unable to set scale. Invalid input.")
 
-    def to_matrix(self):
+    def to_matrix(self, rotation_order=core_trans_math.RotationOrder.XYZ):
         """
         Convert the Transform object to a transformation matrix.
+        Uses the same layout as Maya (row vectors), so the translation is stored in the last row.
+
+        Args:
+            rotation_order (int, str, optional): Rotation order used to interpret the rotation (degrees).
+                                                 Same values as the "rotateOrder" attribute. Defaults to "XYZ" (0)
 
         Returns:
             list of lists: A 4x4 transformation matrix representing the combined transformations.
         """
-        translation_matrix = [
-            [1, 0, 0, self.position.x],
-            [0, 1, 0, self.position.y],
-            [0, 0, 1, self.position.z],
-            [0, 0, 0, 1],
-        ]
-
-        rotation_matrix = self.rotation.to_rotation_matrix()  # You'll need to implement this method in Vector3
+        matrix = core_trans_math.compose_matrix(
+            translation=self.position.get_as_tuple(),
+            rotation=self.rotation.get_as_tuple(),
+            scale=self.scale.get_as_tuple(),
+            rotation_order=rotation_order,
+        )
+        return [list(matrix[index : index + 4]) for index in range(0, 16, 4)]
 
-        scale_matrix = [[self.scale.x, 0, 0, 0], [0, self.scale.y, 0, 0], [0, 0, self.scale.z, 0], [0, 0, 0, 1]]
+    def set_from_matrix(self, matrix, rotation_order=core_trans_math.RotationOrder.XYZ):
+        """
+        Set the Transform attributes from a transformation matrix. Shear is ignored.
 
-        transformation_matrix = core_math.matrix_mult(translation_matrix, rotation_matrix)
-        transformation_matrix = core_math.matrix_mult(transformation_matrix, scale_matrix)
-        return transformation_matrix
+        Args:
+            matrix (list): A 4x4 matrix (list of lists) or a flat list with 16 values. e.g. "cmds.xform(q=True, m=True)"
+            rotation_order (int, str, optional): Rotation order used to extract the rotation (degrees).
+                                                 Same values as the "rotateOrder" attribute. Defaults to "XYZ" (0)
+        """
+        if len(matrix) == 4:
+            matrix = [value for row in matrix for value in row]
+        translation, rotation, scale = core_trans_math.decompose_matrix(matrix, rotation_order=rotation_order)
+        self.position = Vector3(*translation)
+        self.rotation = Vector3(*rotation)
+        self.scale = Vector3(*scale)
 
     def set_from_tuple(self, position_tuple, rotation_tuple, scale_tuple):
         """
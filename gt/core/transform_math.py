@@ -0,0 +1,964 @@
+"""
+Transform Math Module - Maya independent (no "maya" imports), so it can be used and tested with any Python interpreter.
+Uses the same conventions as Maya: row vectors (point * matrix), matrices as 16 floats in row-major order
+(translation in elements 12, 13 and 14) and the same rotation orders as the "rotateOrder" attribute.
+Quaternions are described as (x, y, z, w).
+
+Batch functions use NumPy when available and fall back to pure Python otherwise.
+
+Code Namespace:
+    core_trans_math  # import gt.core.transform_math as core_trans_math
+"""
+
+import logging
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+NUMPY_AVAILABLE = numpy is not None
+IDENTITY_MATRIX = (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+TOLERANCE = 1e-10
+
+
+class RotationOrder:
+    """
+    Rotation orders. Same values as the "rotateOrder" attribute.
+    e.g. "XYZ" rotates around X first, then Y and then Z.
+    """
+
+    XYZ = 0
+    YZX = 1
+    ZXY = 2
+    XZY = 3
+    YXZ = 4
+    ZYX = 5
+
+
+# Axis indices in the order they are applied. Key: rotation order (RotationOrder)
+ROTATION_ORDER_AXES = {
+    RotationOrder.XYZ: (0, 1, 2),
+    RotationOrder.YZX: (1, 2, 0),
+    RotationOrder.ZXY: (2, 0, 1),
+    RotationOrder.XZY: (0, 2, 1),
+    RotationOrder.YXZ: (1, 0, 2),
+    RotationOrder.ZYX: (2, 1, 0),
+}
+
+
+def _use_numpy(use_numpy):
+    """
+    Determines if NumPy should be used.
+
+    Args:
+        use_numpy (bool, None): If None, NumPy is used when available. If True and NumPy is not available,
+                                pure Python is used instead.
+
+    Returns:
+        bool: True if NumPy should be used.
+    """
+    if use_numpy is None or use_numpy:
+        return NUMPY_AVAILABLE
+    return False
+
+
+def _get_rotation_order_axes(rotation_order):
+    """
+    Gets the axis indices of a rotation order.
+
+    Args:
+        rotation_order (int, str): Rotation order (RotationOrder) or its name. e.g. 0 or "xyz"
+
+    Returns:
+        tuple: Axis indices in the order they are applied. e.g. (0, 1, 2) for "XYZ"
+    """
+    if isinstance(rotation_order, str):
+        rotation_order = getattr(RotationOrder, rotation_order.upper(), None)
+    axes = ROTATION_ORDER_AXES.get(rotation_order)
+    if axes is None:
+        raise ValueError(f'Invalid rotation order: "{rotation_order}".')
+    return axes
+
+
+# -------------------------------------------------- Vectors --------------------------------------------------
+def dot_product(vector_a, vector_b):
+    """
+    Gets the dot product of two 3D vectors.
+
+    Args:
+        vector_a (tuple, list): First vector (x, y, z)
+        vector_b (tuple, list): Second vector (x, y, z)
+
+    Returns:
+        float: The dot product of the two vectors.
+    """
+    return vector_a[0] * vector_b[0] + vector_a[1] * vector_b[1] + vector_a[2] * vector_b[2]
+
+
+def cross_product(vector_a, vector_b):
+    """
+    Gets the cross product of two 3D vectors.
+
+    Args:
+        vector_a (tuple, list): First vector (x, y, z)
+        vector_b (tuple, list): Second vector (x, y, z)
+
+    Returns:
+        tuple: The cross product (x, y, z)
+    """
+    return (
+        vector_a[1] * vector_b[2] - vector_a[2] * vector_b[1],
+        vector_a[2] * vector_b[0] - vector_a[0] * vector_b[2],
+        vector_a[0] * vector_b[1] - vector_a[1] * vector_b[0],
+    )
+
+
+def get_vector_length(vector):
+    """
+    Gets the length (magnitude) of a 3D vector.
+
+    Args:
+        vector (tuple, list): Vector (x, y, z)
+
+    Returns:
+        float: Length of the vector.
+    """
+    return math.sqrt(vector[0] * vector[0] + vector[1] * vector[1] + vector[2] * vector[2])
+
+
+def normalize_vector(vector):
+    """
+    Gets a vector with the same direction and a length of one.
+
+    Args:
+        vector (tuple, list): Vector (x, y, z)
+
+    Returns:
+        tuple: Normalized vector (x, y, z). Zero vectors are returned as (0, 0, 0).
+    """
+    length = get_vector_length(vector)
+    if length < TOLERANCE:
+        return 0.0, 0.0, 0.0
+    return vector[0] / length, vector[1] / length, vector[2] / length
+
+
+def get_distance(position_a, position_b):
+    """
+    Gets the distance between two positions.
+
+    Args:
+        position_a (tuple, list): First position (x, y, z)
+        position_b (tuple, list): Second position (x, y, z)
+
+    Returns:
+        float: Distance between the positions.
+    """
+    delta_x = position_a[0] - position_b[0]
+    delta_y = position_a[1] - position_b[1]
+    delta_z = position_a[2] - position_b[2]
+    return math.sqrt(delta_x * delta_x + delta_y * delta_y + delta_z * delta_z)
+
+
+def get_path_length(positions, use_numpy=None):
+    """
+    Gets the sum of the distances between consecutive positions.
+
+    Args:
+        positions (list): A list of positions (x, y, z)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        float: Length of the path. Zero if fewer than two positions are provided.
+    """
+    if len(positions) < 2:
+        return 0.0
+    if _use_numpy(use_numpy):
+        positions = numpy.asarray(positions, dtype=numpy.float64)
+        return float(numpy.linalg.norm(numpy.diff(positions, axis=0), axis=1).sum())
+    return sum(get_distance(position_a, position_b) for position_a, position_b in zip(positions, positions[1:]))
+
+
+def get_average_position(positions, use_numpy=None):
+    """
+    Gets the average (center) of a list of positions.
+
+    Args:
+        positions (list): A list of positions (x, y, z)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        tuple: Average position (x, y, z). Origin (0, 0, 0) if no positions are provided.
+    """
+    if not len(positions):
+        return 0.0, 0.0, 0.0
+    if _use_numpy(use_numpy):
+        return tuple(float(value) for value in numpy.asarray(positions, dtype=numpy.float64).mean(axis=0))
+    count = len(positions)
+    return tuple(sum(position[index] for position in positions) / count for index in range(3))
+
+
+# -------------------------------------------------- Matrices --------------------------------------------------
+def multiply_matrices(matrix_a, matrix_b):
+    """
+    Multiplies two 4x4 matrices. (Same as "matrix_a * matrix_b" in Maya, "matrix_a" is applied first)
+
+    Args:
+        matrix_a (tuple, list): First matrix (16 floats)
+        matrix_b (tuple, list): Second matrix (16 floats)
+
+    Returns:
+        tuple: Resulting matrix (16 floats)
+    """
+    a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = matrix_a
+    b00, b01, b02, b03, b10, b11, b12, b13, b20, b21, b22, b23, b30, b31, b32, b33 = matrix_b
+    return (
+        a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+        a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+        a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+        a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+        a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+        a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+        a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+        a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+        a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+        a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+        a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+        a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+        a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+        a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+        a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+        a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33,
+    )
+
+
+def invert_matrix(matrix):
+    """
+    Inverts an affine 4x4 matrix (translation, rotation, scale and shear).
+
+    Args:
+        matrix (tuple, list): Matrix to invert (16 floats)
+
+    Returns:
+        tuple: Inverted matrix (16 floats)
+
+    Raises:
+        ValueError: If the matrix can't be inverted (e.g. zero scale).
+    """
+    m00, m01, m02, _, m10, m11, m12, _, m20, m21, m22, _, m30, m31, m32, _ = matrix
+    c00 = m11 * m22 - m12 * m21
+    c01 = m12 * m20 - m10 * m22
+    c02 = m10 * m21 - m11 * m20
+    determinant = m00 * c00 + m01 * c01 + m02 * c02
+    if abs(determinant) < TOLERANCE:
+        raise ValueError("Unable to invert matrix. Determinant is zero.")
+    inv = 1.0 / determinant
+    i00 = c00 * inv
+    i01 = (m02 * m21 - m01 * m22) * inv
+    i02 = (m01 * m12 - m02 * m11) * inv
+    i10 = c01 * inv
+    i11 = (m00 * m22 - m02 * m20) * inv
+    i12 = (m02 * m10 - m00 * m12) * inv
+    i20 = c02 * inv
+    i21 = (m01 * m20 - m00 * m21) * inv
+    i22 = (m00 * m11 - m01 * m10) * inv
+    return (
+        i00,
+        i01,
+        i02,
+        0.0,
+        i10,
+        i11,
+        i12,
+        0.0,
+        i20,
+        i21,
+        i22,
+        0.0,
+        -(m30 * i00 + m31 * i10 + m32 * i20),
+        -(m30 * i01 + m31 * i11 + m32 * i21),
+        -(m30 * i02 + m31 * i12 + m32 * i22),
+        1.0,
+    )
+
+
+def transform_point(point, matrix):
+    """
+    Transforms a point by a matrix. (Same as "MPoint * MMatrix")
+
+    Args:
+        point (tuple, list): Position (x, y, z)
+        matrix (tuple, list): Matrix (16 floats)
+
+    Returns:
+        tuple: Transformed position (x, y, z)
+    """
+    x, y, z = point[0], point[1], point[2]
+    return (
+        x * matrix[0] + y * matrix[4] + z * matrix[8] + matrix[12],
+        x * matrix[1] + y * matrix[5] + z * matrix[9] + matrix[13],
+        x * matrix[2] + y * matrix[6] + z * matrix[10] + matrix[14],
+    )
+
+
+# -------------------------------------------------- Rotations --------------------------------------------------
+def _get_axis_rotation(axis, angle):
+    """
+    Gets a 3x3 rotation around a single axis (row vectors).
+
+    Args:
+        axis (int): Axis index. 0: X, 1: Y, 2: Z
+        angle (float): Angle in radians.
+
+    Returns:
+        tuple: 3x3 rotation matrix (9 floats)
+    """
+    cos_angle = math.cos(angle)
+    sin_angle = math.sin(angle)
+    if axis == 0:
+        return 1.0, 0.0, 0.0, 0.0, cos_angle, sin_angle, 0.0, -sin_angle, cos_angle
+    if axis == 1:
+        return cos_angle, 0.0, -sin_angle, 0.0, 1.0, 0.0, sin_angle, 0.0, cos_angle
+    return cos_angle, sin_angle, 0.0, -sin_angle, cos_angle, 0.0, 0.0, 0.0, 1.0
+
+
+def _multiply_rotations(rotation_a, rotation_b):
+    """
+    Multiplies two 3x3 matrices. ("rotation_a" is applied first)
+
+    Args:
+        rotation_a (tuple): First 3x3 matrix (9 floats)
+        rotation_b (tuple): Second 3x3 matrix (9 floats)
+
+    Returns:
+        tuple: Resulting 3x3 matrix (9 floats)
+    """
+    a00, a01, a02, a10, a11, a12, a20, a21, a22 = rotation_a
+    b00, b01, b02, b10, b11, b12, b20, b21, b22 = rotation_b
+    return (
+        a00 * b00 + a01 * b10 + a02 * b20,
+        a00 * b01 + a01 * b11 + a02 * b21,
+        a00 * b02 + a01 * b12 + a02 * b22,
+        a10 * b00 + a11 * b10 + a12 * b20,
+        a10 * b01 + a11 * b11 + a12 * b21,
+        a10 * b02 + a11 * b12 + a12 * b22,
+        a20 * b00 + a21 * b10 + a22 * b20,
+        a20 * b01 + a21 * b11 + a22 * b21,
+        a20 * b02 + a21 * b12 + a22 * b22,
+    )
+
+
+def _get_euler_rotation(rotation, rotation_order, degrees):
+    """
+    Gets the 3x3 rotation matrix of an Euler rotation.
+
+    Args:
+        rotation (tuple, list): Rotation (x, y, z)
+        rotation_order (int, str): Rotation order (RotationOrder)
+        degrees (bool): If the rotation is in degrees (True) or radians (False)
+
+    Returns:
+        tuple: 3x3 rotation matrix (9 floats)
+    """
+    first_axis, second_axis, third_axis = _get_rotation_order_axes(rotation_order)
+    if degrees:
+        rotation = [math.radians(value) for value in rotation]
+    result = _get_axis_rotation(first_axis, rotation[first_axis])
+    result = _multiply_rotations(result, _get_axis_rotation(second_axis, rotation[second_axis]))
+    return _multiply_rotations(result, _get_axis_rotation(third_axis, rotation[third_axis]))
+
+
+def _get_euler_from_rotation(rotation, rotation_order, degrees):
+    """
+    Gets the Euler rotation of an orthonormal 3x3 rotation matrix.
+
+    Args:
+        rotation (tuple): 3x3 rotation matrix (9 floats)
+        rotation_order (int, str): Rotation order (RotationOrder)
+        degrees (bool): If the result should use degrees (True) or radians (False)
+
+    Returns:
+        tuple: Rotation (x, y, z)
+    """
+    first_axis, second_axis, third_axis = _get_rotation_order_axes(rotation_order)
+    # Odd permutations (e.g. "XZY") flip the sign of the angles
+    parity = 1.0 if (second_axis - first_axis) % 3 == 1 else -1.0
+
+    def element(row, column):
+        return rotation[row * 3 + column]
+
+    cos_second = math.sqrt(element(first_axis, first_axis) ** 2 + element(first_axis, second_axis) ** 2)
+    second_angle = math.atan2(-parity * element(first_axis, third_axis), cos_second)
+    if cos_second > 1e-8:
+        first_angle = math.atan2(parity * element(second_axis, third_axis), element(third_axis, third_axis))
+        third_angle = math.atan2(parity * element(first_axis, second_axis), element(first_axis, first_axis))
+    else:  # Gimbal lock
+        first_angle = math.atan2(-parity * element(third_axis, second_axis), element(second_axis, second_axis))
+        third_angle = 0.0
+    result = [0.0, 0.0, 0.0]
+    result[first_axis] = first_angle
+    result[second_axis] = second_angle
+    result[third_axis] = third_angle
+    if degrees:
+        return tuple(math.degrees(value) for value in result)
+    return tuple(result)
+
+
+def _get_rotation_from_matrix(matrix):
+    """
+    Gets the 3x3 rotation of a 4x4 matrix (scale removed). Negative scale is removed from the X axis.
+
+    Args:
+        matrix (tuple, list): Matrix (16 floats)
+
+    Returns:
+        tuple: A tuple with the 3x3 rotation (9 floats) and scale (x, y, z).
+    """
+    rows = [matrix[0:3], matrix[4:7], matrix[8:11]]
+    scale = [get_vector_length(row) for row in rows]
+    if dot_product(cross_product(rows[0], rows[1]), rows[2]) < 0:
+        scale[0] = -scale[0]
+    rotation = []
+    for row, row_scale in zip(rows, scale):
+        if abs(row_scale) < TOLERANCE:
+            raise ValueError("Unable to extract rotation. Matrix has zero scale.")
+        rotation.extend(value / row_scale for value in row)
+    return tuple(rotation), tuple(scale)
+
+
+def euler_to_matrix(rotation, rotation_order=RotationOrder.XYZ, degrees=True):
+    """
+    Converts an Euler rotation into a matrix.
+
+    Args:
+        rotation (tuple, list): Rotation (x, y, z)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the rotation is in degrees (True) or radians (False)
+
+    Returns:
+        tuple: Rotation matrix (16 floats)
+    """
+    r00, r01, r02, r10, r11, r12, r20, r21, r22 = _get_euler_rotation(rotation, rotation_order, degrees)
+    return r00, r01, r02, 0.0, r10, r11, r12, 0.0, r20, r21, r22, 0.0, 0.0, 0.0, 0.0, 1.0
+
+
+def matrix_to_euler(matrix, rotation_order=RotationOrder.XYZ, degrees=True):
+    """
+    Extracts the Euler rotation of a matrix. Scale is ignored.
+
+    Args:
+        matrix (tuple, list): Matrix (16 floats)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the result should use degrees (True) or radians (False)
+
+    Returns:
+        tuple: Rotation (x, y, z)
+    """
+    rotation, _ = _get_rotation_from_matrix(matrix)
+    return _get_euler_from_rotation(rotation, rotation_order, degrees)
+
+
+def quaternion_to_matrix(quaternion):
+    """
+    Converts a quaternion into a rotation matrix.
+
+    Args:
+        quaternion (tuple, list): Quaternion (x, y, z, w). It doesn't need to be normalized.
+
+    Returns:
+        tuple: Rotation matrix (16 floats)
+    """
+    x, y, z, w = normalize_quaternion(quaternion)
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    return (
+        1.0 - 2.0 * (yy + zz),
+        2.0 * (xy + wz),
+        2.0 * (xz - wy),
+        0.0,
+        2.0 * (xy - wz),
+        1.0 - 2.0 * (xx + zz),
+        2.0 * (yz + wx),
+        0.0,
+        2.0 * (xz + wy),
+        2.0 * (yz - wx),
+        1.0 - 2.0 * (xx + yy),
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        1.0,
+    )
+
+
+def matrix_to_quaternion(matrix):
+    """
+    Extracts the rotation of a matrix as a quaternion. Scale is ignored.
+
+    Args:
+        matrix (tuple, list): Matrix (16 floats)
+
+    Returns:
+        tuple: Normalized quaternion (x, y, z, w)
+    """
+    (m00, m01, m02, m10, m11, m12, m20, m21, m22), _ = _get_rotation_from_matrix(matrix)
+    trace = m00 + m11 + m22
+    if trace > 0:
+        factor = 0.5 / math.sqrt(trace + 1.0)
+        quaternion = ((m12 - m21) * factor, (m20 - m02) * factor, (m01 - m10) * factor, 0.25 / factor)
+    elif m00 > m11 and m00 > m22:
+        factor = 2.0 * math.sqrt(1.0 + m00 - m11 - m22)
+        quaternion = (0.25 * factor, (m01 + m10) / factor, (m20 + m02) / factor, (m12 - m21) / factor)
+    elif m11 > m22:
+        factor = 2.0 * math.sqrt(1.0 + m11 - m00 - m22)
+        quaternion = ((m01 + m10) / factor, 0.25 * factor, (m12 + m21) / factor, (m20 - m02) / factor)
+    else:
+        factor = 2.0 * math.sqrt(1.0 + m22 - m00 - m11)
+        quaternion = ((m20 + m02) / factor, (m12 + m21) / factor, 0.25 * factor, (m01 - m10) / factor)
+    return normalize_quaternion(quaternion)
+
+
+def normalize_quaternion(quaternion):
+    """
+    Gets a quaternion with a length of one.
+
+    Args:
+        quaternion (tuple, list): Quaternion (x, y, z, w)
+
+    Returns:
+        tuple: Normalized quaternion (x, y, z, w). Zero quaternions return the identity (0, 0, 0, 1).
+    """
+    length = math.sqrt(sum(value * value for value in quaternion))
+    if length < TOLERANCE:
+        return 0.0, 0.0, 0.0, 1.0
+    return tuple(value / length for value in quaternion)
+
+
+def multiply_quaternions(quaternion_a, quaternion_b):
+    """
+    Combines two rotations. (Same as "quaternion_a * quaternion_b" in Maya, "quaternion_a" is applied first)
+
+    Args:
+        quaternion_a (tuple, list): First quaternion (x, y, z, w)
+        quaternion_b (tuple, list): Second quaternion (x, y, z, w)
+
+    Returns:
+        tuple: Resulting quaternion (x, y, z, w)
+    """
+    ax, ay, az, aw = quaternion_a
+    bx, by, bz, bw = quaternion_b
+    return (
+        bw * ax + bx * aw + by * az - bz * ay,
+        bw * ay - bx * az + by * aw + bz * ax,
+        bw * az + bx * ay - by * ax + bz * aw,
+        bw * aw - bx * ax - by * ay - bz * az,
+    )
+
+
+def euler_to_quaternion(rotation, rotation_order=RotationOrder.XYZ, degrees=True):
+    """
+    Converts an Euler rotation into a quaternion.
+
+    Args:
+        rotation (tuple, list): Rotation (x, y, z)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the rotation is in degrees (True) or radians (False)
+
+    Returns:
+        tuple: Quaternion (x, y, z, w)
+    """
+    if degrees:
+        rotation = [math.radians(value) for value in rotation]
+    result = (0.0, 0.0, 0.0, 1.0)
+    for axis in _get_rotation_order_axes(rotation_order):
+        axis_quaternion = [0.0, 0.0, 0.0, math.cos(rotation[axis] * 0.5)]
+        axis_quaternion[axis] = math.sin(rotation[axis] * 0.5)
+        result = multiply_quaternions(result, axis_quaternion)
+    return result
+
+
+def quaternion_to_euler(quaternion, rotation_order=RotationOrder.XYZ, degrees=True):
+    """
+    Converts a quaternion into an Euler rotation.
+
+    Args:
+        quaternion (tuple, list): Quaternion (x, y, z, w)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the result should use degrees (True) or radians (False)
+
+    Returns:
+        tuple: Rotation (x, y, z)
+    """
+    return matrix_to_euler(quaternion_to_matrix(quaternion), rotation_order=rotation_order, degrees=degrees)
+
+
+# -------------------------------------------------- Transforms --------------------------------------------------
+def compose_matrix(
+    translation=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1), rotation_order=RotationOrder.XYZ, degrees=True
+):
+    """
+    Composes a matrix using translation, rotation and scale. (Scale, then rotation, then translation)
+
+    Args:
+        translation (tuple, list, optional): Translation (x, y, z)
+        rotation (tuple, list, optional): Euler rotation (x, y, z)
+        scale (tuple, list, optional): Scale (x, y, z)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the rotation is in degrees (True) or radians (False)
+
+    Returns:
+        tuple: Matrix (16 floats)
+    """
+    r00, r01, r02, r10, r11, r12, r20, r21, r22 = _get_euler_rotation(rotation, rotation_order, degrees)
+    scale_x, scale_y, scale_z = scale[0], scale[1], scale[2]
+    return (
+        r00 * scale_x,
+        r01 * scale_x,
+        r02 * scale_x,
+        0.0,
+        r10 * scale_y,
+        r11 * scale_y,
+        r12 * scale_y,
+        0.0,
+        r20 * scale_z,
+        r21 * scale_z,
+        r22 * scale_z,
+        0.0,
+        float(translation[0]),
+        float(translation[1]),
+        float(translation[2]),
+        1.0,
+    )
+
+
+def decompose_matrix(matrix, rotation_order=RotationOrder.XYZ, degrees=True):
+    """
+    Decomposes a matrix into translation, rotation and scale. Shear is ignored.
+
+    Args:
+        matrix (tuple, list): Matrix (16 floats)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the rotation should use degrees (True) or radians (False)
+
+    Returns:
+        tuple: A tuple with translation (x, y, z), rotation (x, y, z) and scale (x, y, z).
+    """
+    rotation, scale = _get_rotation_from_matrix(matrix)
+    translation = (matrix[12], matrix[13], matrix[14])
+    return translation, _get_euler_from_rotation(rotation, rotation_order, degrees), scale
+
+
+# -------------------------------------------------- Batches --------------------------------------------------
+def _get_axis_rotations_numpy(axis, angles):
+    """
+    Gets 3x3 rotations around a single axis (row vectors) for an array of angles.
+
+    Args:
+        axis (int): Axis index. 0: X, 1: Y, 2: Z
+        angles (numpy.ndarray): Angles in radians. Shape: (N,)
+
+    Returns:
+        numpy.ndarray: Rotation matrices. Shape: (N, 3, 3)
+    """
+    cos_angles = numpy.cos(angles)
+    sin_angles = numpy.sin(angles)
+    rotations = numpy.zeros((len(angles), 3, 3))
+    first, second = [index for index in range(3) if index != axis]
+    sign = 1.0 if axis != 1 else -1.0  # Y is the only one that is not in cyclic order
+    rotations[:, axis, axis] = 1.0
+    rotations[:, first, first] = cos_angles
+    rotations[:, second, second] = cos_angles
+    rotations[:, first, second] = sign * sin_angles
+    rotations[:, second, first] = -sign * sin_angles
+    return rotations
+
+
+def _get_euler_rotations_numpy(rotations, rotation_order, degrees):
+    """
+    Gets the 3x3 rotation matrices of an array of Euler rotations.
+
+    Returns:
+        numpy.ndarray: Rotation matrices. Shape: (N, 3, 3)
+    """
+    rotations = numpy.asarray(rotations, dtype=numpy.float64).reshape(-1, 3)
+    if degrees:
+        rotations = numpy.radians(rotations)
+    first_axis, second_axis, third_axis = _get_rotation_order_axes(rotation_order)
+    result = _get_axis_rotations_numpy(first_axis, rotations[:, first_axis])
+    result = numpy.matmul(result, _get_axis_rotations_numpy(second_axis, rotations[:, second_axis]))
+    return numpy.matmul(result, _get_axis_rotations_numpy(third_axis, rotations[:, third_axis]))
+
+
+def _get_euler_from_rotations_numpy(rotations, rotation_order, degrees):
+    """
+    Gets the Euler rotations of an array of 3x3 rotation matrices. (See "_get_euler_from_rotation")
+
+    Returns:
+        numpy.ndarray: Rotations (x, y, z). Shape: (N, 3)
+    """
+    first_axis, second_axis, third_axis = _get_rotation_order_axes(rotation_order)
+    parity = 1.0 if (second_axis - first_axis) % 3 == 1 else -1.0
+    cos_second = numpy.sqrt(rotations[:, first_axis, first_axis] ** 2 + rotations[:, first_axis, second_axis] ** 2)
+    is_locked = cos_second <= 1e-8
+    result = numpy.zeros((len(rotations), 3))
+    result[:, second_axis] = numpy.arctan2(-parity * rotations[:, first_axis, third_axis], cos_second)
+    result[:, first_axis] = numpy.where(
+        is_locked,
+        numpy.arctan2(-parity * rotations[:, third_axis, second_axis], rotations[:, second_axis, second_axis]),
+        numpy.arctan2(parity * rotations[:, second_axis, third_axis], rotations[:, third_axis, third_axis]),
+    )
+    result[:, third_axis] = numpy.where(
+        is_locked,
+        0.0,
+        numpy.arctan2(parity * rotations[:, first_axis, second_axis], rotations[:, first_axis, first_axis]),
+    )
+    if degrees:
+        return numpy.degrees(result)
+    return result
+
+
+def _get_rotations_from_matrices_numpy(matrices):
+    """
+    Gets the 3x3 rotations and scales of an array of matrices. (See "_get_rotation_from_matrix")
+
+    Returns:
+        tuple: Rotations as "numpy.ndarray" (N, 3, 3) and scales as "numpy.ndarray" (N, 3)
+    """
+    rows = matrices[:, :3, :3]
+    scales = numpy.linalg.norm(rows, axis=2)
+    is_negative = numpy.linalg.det(rows) < 0
+    scales[:, 0] = numpy.where(is_negative, -scales[:, 0], scales[:, 0])
+    if numpy.any(numpy.abs(scales) < TOLERANCE):
+        raise ValueError("Unable to extract rotation. Matrix has zero scale.")
+    return rows / scales[:, :, numpy.newaxis], scales
+
+
+def _as_matrices_numpy(matrices):
+    """
+    Converts matrices (16 floats each) into an array with the shape (N, 4, 4).
+    """
+    return numpy.asarray(matrices, dtype=numpy.float64).reshape(-1, 4, 4)
+
+
+def euler_to_matrices(rotations, rotation_order=RotationOrder.XYZ, degrees=True, use_numpy=None):
+    """
+    Converts multiple Euler rotations into matrices. (See "euler_to_matrix")
+
+    Args:
+        rotations (list, numpy.ndarray): Rotations (x, y, z)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the rotations are in degrees (True) or radians (False)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        list or numpy.ndarray: A list of matrices (16 floats). A "numpy.ndarray" (N, 16) when using NumPy.
+    """
+    if _use_numpy(use_numpy):
+        return compose_matrices(rotations=rotations, rotation_order=rotation_order, degrees=degrees, use_numpy=True)
+    return [euler_to_matrix(rotation, rotation_order, degrees) for rotation in rotations]
+
+
+def matrices_to_euler(matrices, rotation_order=RotationOrder.XYZ, degrees=True, use_numpy=None):
+    """
+    Extracts the Euler rotation of multiple matrices. (See "matrix_to_euler")
+
+    Args:
+        matrices (list, numpy.ndarray): Matrices (16 floats each)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the result should use degrees (True) or radians (False)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        list or numpy.ndarray: A list of rotations (x, y, z). A "numpy.ndarray" (N, 3) when using NumPy.
+    """
+    if _use_numpy(use_numpy):
+        return decompose_matrices(matrices, rotation_order=rotation_order, degrees=degrees, use_numpy=True)[1]
+    return [matrix_to_euler(matrix, rotation_order, degrees) for matrix in matrices]
+
+
+def multiply_matrices_batch(matrices_a, matrices_b, use_numpy=None):
+    """
+    Multiplies pairs of matrices. (See "multiply_matrices")
+
+    Args:
+        matrices_a (list, numpy.ndarray): First matrices (16 floats each)
+        matrices_b (list, numpy.ndarray): Second matrices (16 floats each). A single matrix is also accepted, in which
+                                          case it's used for all "matrices_a" elements. (e.g. parent matrix)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        list or numpy.ndarray: A list of matrices (16 floats). A "numpy.ndarray" (N, 16) when using NumPy.
+    """
+    if _use_numpy(use_numpy):
+        result = numpy.matmul(_as_matrices_numpy(matrices_a), _as_matrices_numpy(matrices_b))
+        return result.reshape(-1, 16)
+    if len(matrices_b) == 16 and not hasattr(matrices_b[0], "__len__"):
+        return [multiply_matrices(matrix_a, matrices_b) for matrix_a in matrices_a]
+    return [multiply_matrices(matrix_a, matrix_b) for matrix_a, matrix_b in zip(matrices_a, matrices_b)]
+
+
+def transform_points(points, matrix, use_numpy=None):
+    """
+    Transforms multiple points by a matrix. (See "transform_point")
+
+    Args:
+        points (list, numpy.ndarray): Positions (x, y, z)
+        matrix (tuple, list): Matrix (16 floats)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        list or numpy.ndarray: A list of positions (x, y, z). A "numpy.ndarray" (N, 3) when using NumPy.
+    """
+    if _use_numpy(use_numpy):
+        points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        matrix = numpy.asarray(matrix, dtype=numpy.float64).reshape(4, 4)
+        return numpy.matmul(points, matrix[:3, :3]) + matrix[3, :3]
+    return [transform_point(point, matrix) for point in points]
+
+
+def compose_matrices(
+    translations=None, rotations=None, scales=None, rotation_order=RotationOrder.XYZ, degrees=True, use_numpy=None
+):
+    """
+    Composes multiple matrices using translation, rotation and scale. (See "compose_matrix")
+    At least one of the lists must be provided. Missing lists use their default values.
+
+    Args:
+        translations (list, numpy.ndarray, optional): Translations (x, y, z)
+        rotations (list, numpy.ndarray, optional): Euler rotations (x, y, z)
+        scales (list, numpy.ndarray, optional): Scales (x, y, z)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the rotations are in degrees (True) or radians (False)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        list or numpy.ndarray: A list of matrices (16 floats). A "numpy.ndarray" (N, 16) when using NumPy.
+    """
+    count = max(len(values) for values in (translations, rotations, scales) if values is not None)
+    if _use_numpy(use_numpy):
+        result = numpy.zeros((count, 4, 4))
+        if rotations is None:
+            result[:, :3, :3] = numpy.identity(3)
+        else:
+            result[:, :3, :3] = _get_euler_rotations_numpy(rotations, rotation_order, degrees)
+        if scales is not None:
+            result[:, :3, :3] *= numpy.asarray(scales, dtype=numpy.float64).reshape(-1, 3, 1)
+        if translations is not None:
+            result[:, 3, :3] = numpy.asarray(translations, dtype=numpy.float64).reshape(-1, 3)
+        result[:, 3, 3] = 1.0
+        return result.reshape(-1, 16)
+    translations = translations if translations is not None else [(0, 0, 0)] * count
+    rotations = rotations if rotations is not None else [(0, 0, 0)] * count
+    scales = scales if scales is not None else [(1, 1, 1)] * count
+    return [
+        compose_matrix(translation, rotation, scale, rotation_order, degrees)
+        for translation, rotation, scale in zip(translations, rotations, scales)
+    ]
+
+
+def decompose_matrices(matrices, rotation_order=RotationOrder.XYZ, degrees=True, use_numpy=None):
+    """
+    Decomposes multiple matrices into translation, rotation and scale. (See "decompose_matrix")
+
+    Args:
+        matrices (list, numpy.ndarray): Matrices (16 floats each)
+        rotation_order (int, str, optional): Rotation order (RotationOrder). Defaults to "XYZ".
+        degrees (bool, optional): If the rotations should use degrees (True) or radians (False)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        tuple: Lists of translations, rotations and scales (x, y, z). "numpy.ndarray" (N, 3) when using NumPy.
+    """
+    if _use_numpy(use_numpy):
+        matrices = _as_matrices_numpy(matrices)
+        rotations, scales = _get_rotations_from_matrices_numpy(matrices)
+        eulers = _get_euler_from_rotations_numpy(rotations, rotation_order, degrees)
+        return matrices[:, 3, :3].copy(), eulers, scales
+    translations, rotations, scales = [], [], []
+    for matrix in matrices:
+        translation, rotation, scale = decompose_matrix(matrix, rotation_order, degrees)
+        translations.append(translation)
+        rotations.append(rotation)
+        scales.append(scale)
+    return translations, rotations, scales
+
+
+def matrices_to_quaternions(matrices, use_numpy=None):
+    """
+    Extracts the rotation of multiple matrices as quaternions. (See "matrix_to_quaternion")
+
+    Args:
+        matrices (list, numpy.ndarray): Matrices (16 floats each)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        list or numpy.ndarray: A list of quaternions (x, y, z, w). A "numpy.ndarray" (N, 4) when using NumPy.
+    """
+    if not _use_numpy(use_numpy):
+        return [matrix_to_quaternion(matrix) for matrix in matrices]
+    rotations, _ = _get_rotations_from_matrices_numpy(_as_matrices_numpy(matrices))
+    m00, m01, m02 = rotations[:, 0, 0], rotations[:, 0, 1], rotations[:, 0, 2]
+    m10, m11, m12 = rotations[:, 1, 0], rotations[:, 1, 1], rotations[:, 1, 2]
+    m20, m21, m22 = rotations[:, 2, 0], rotations[:, 2, 1], rotations[:, 2, 2]
+    # Largest component first (most stable), then the others are derived from it
+    candidates = numpy.stack(
+        [1.0 + m00 - m11 - m22, 1.0 - m00 + m11 - m22, 1.0 - m00 - m11 + m22, 1.0 + m00 + m11 + m22], axis=1
+    )
+    largest = numpy.argmax(candidates, axis=1)
+    factor = 0.5 / numpy.sqrt(numpy.maximum(candidates[numpy.arange(len(largest)), largest], TOLERANCE))
+    quaternions = numpy.empty((len(rotations), 4))
+    options = [
+        (candidates[:, 0] * factor, (m01 + m10) * factor, (m20 + m02) * factor, (m12 - m21) * factor),
+        ((m01 + m10) * factor, candidates[:, 1] * factor, (m12 + m21) * factor, (m20 - m02) * factor),
+        ((m20 + m02) * factor, (m12 + m21) * factor, candidates[:, 2] * factor, (m01 - m10) * factor),
+        ((m12 - m21) * factor, (m20 - m02) * factor, (m01 - m10) * factor, candidates[:, 3] * factor),
+    ]
+    for index, option in enumerate(options):
+        mask = largest == index
+        quaternions[mask] = numpy.stack(option, axis=1)[mask]
+    return quaternions / numpy.linalg.norm(quaternions, axis=1)[:, numpy.newaxis]
+
+
+def quaternions_to_matrices(quaternions, use_numpy=None):
+    """
+    Converts multiple quaternions into rotation matrices. (See "quaternion_to_matrix")
+
+    Args:
+        quaternions (list, numpy.ndarray): Quaternions (x, y, z, w)
+        use_numpy (bool, optional): If None, NumPy is used when available.
+
+    Returns:
+        list or numpy.ndarray: A list of matrices (16 floats). A "numpy.ndarray" (N, 16) when using NumPy.
+    """
+    if not _use_numpy(use_numpy):
+        return [quaternion_to_matrix(quaternion) for quaternion in quaternions]
+    quaternions = numpy.asarray(quaternions, dtype=numpy.float64).reshape(-1, 4)
+    lengths = numpy.linalg.norm(quaternions, axis=1)[:, numpy.newaxis]
+    normalized = quaternions / numpy.maximum(lengths, TOLERANCE)
+    quaternions = numpy.where(lengths < TOLERANCE, (0.0, 0.0, 0.0, 1.0), normalized)
+    x, y, z, w = quaternions[:, 0], quaternions[:, 1], quaternions[:, 2], quaternions[:, 3]
+    result = numpy.zeros((len(quaternions), 4, 4))
+    result[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    result[:, 0, 1] = 2.0 * (x * y + w * z)
+    result[:, 0, 2] = 2.0 * (x * z - w * y)
+    result[:, 1, 0] = 2.0 * (x * y - w * z)
+    result[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    result[:, 1, 2] = 2.0 * (y * z + w * x)
+    result[:, 2, 0] = 2.0 * (x * z + w * y)
+    result[:, 2, 1] = 2.0 * (y * z - w * x)
+    result[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    result[:, 3, 3] = 1.0
+    return result.reshape(-1, 16)
+
+
+if __name__ == "__main__":
+    logger.setLevel(logging.DEBUG)
+    out = compose_matrix(translation=(1, 2, 3), rotation=(0, 90, 0))
+    print(decompose_matrix(out))
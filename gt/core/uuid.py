@@ -6,6 +6,7 @@ Code Namespace:
 """
 
 from gt.core.attr import add_attr, set_attr
+import maya.api.OpenMaya as apiOpenMaya
 import maya.cmds as cmds
 import logging
 import random
@@ -18,6 +19,8 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_active_uuid_index = None  # UUIDAttrIndex currently scoping lookups (see "UUIDAttrIndex.__enter__")
+
 
 def generate_uuid(short=False, short_length=8, remove_dashes=False):
     """
@@ -105,6 +108,7 @@ def is_short_uuid_valid(uuid_string, length=None):
 def get_object_from_uuid_attr(uuid_string, attr_name, obj_type="transform"):
     """
     Return object if provided UUID is present in it
+    If a "UUIDAttrIndex" is active, the lookup is answered by the index instead of querying the scene.
     Args:
         uuid_string (string): UUID to look for (if it matches, then the object is found)
         attr_name (string): Name of the attribute where the UUID is stored.
@@ -112,12 +116,284 @@ def get_object_from_uuid_attr(uuid_string, attr_name, obj_type="transform"):
     Returns:
         str, None: If found, the object with a matching UUID, otherwise None
     """
-    obj_list = cmds.ls(typ=obj_type, long=True) or []
+    if _active_uuid_index is not None:
+        candidates = _active_uuid_index.get_objects(uuid_string=uuid_string, attr_name=attr_name)
+    else:
+        candidates = query_uuid_attr_map(attr_name=attr_name).get(uuid_string) or []
+    if candidates and obj_type:
+        candidates = cmds.ls(candidates, typ=obj_type, long=True) or []
+    if candidates:
+        return candidates[0]
+
+
+def query_uuid_attr_map(attr_name):
+    """
+    Queries the scene for all objects carrying the provided UUID attribute.
+    A single wildcard "ls" call is used to find the objects, so only nodes that have the attribute are visited.
+    Args:
+        attr_name (str): Name of the attribute where the UUID is stored.
+    Returns:
+        dict: A dictionary where the key is the UUID value and the value is a list of objects (long names)
+              e.g. {"a1b2c3": ["|proxy_grp|root_proxy"]}
+    """
+    uuid_map = {}
+    obj_list = cmds.ls(f"*.{attr_name}", recursive=True, objectsOnly=True, long=True) or []
     for obj in obj_list:
-        if cmds.objExists(f"{obj}.{attr_name}"):
-            existing_uuid = cmds.getAttr(f"{obj}.{attr_name}")
-            if existing_uuid == uuid_string:
-                return obj
+        try:
+            uuid_value = cmds.getAttr(f"{obj}.{attr_name}")
+        except Exception as e:
+            logger.debug(f'Unable to read UUID attribute from "{obj}". Issue: {e}')
+            continue
+        if not uuid_value:
+            continue
+        uuid_map.setdefault(uuid_value, []).append(obj)
+    return uuid_map
+
+
+def get_uuid_attr_map(attr_name, obj_type=None):
+    """
+    Gets a map of UUID values to objects for the provided attribute.
+    Uses the active "UUIDAttrIndex" when available, otherwise the scene is queried directly.
+    Args:
+        attr_name (str): Name of the attribute where the UUID is stored.
+        obj_type (str, optional): If provided, only objects of this type are kept. e.g. "transform" or "joint"
+    Returns:
+        dict: A dictionary where the key is the UUID value and the value is a list of objects (long names)
+    """
+    if _active_uuid_index is not None:
+        uuid_map = _active_uuid_index.get_uuid_map(attr_name=attr_name)
+    else:
+        uuid_map = query_uuid_attr_map(attr_name=attr_name)
+    if not obj_type or not uuid_map:
+        return dict(uuid_map)
+    all_objects = [obj for objects in uuid_map.values() for obj in objects]
+    valid_objects = set(cmds.ls(all_objects, typ=obj_type, long=True) or [])
+    filtered_map = {}
+    for uuid_value, objects in uuid_map.items():
+        objects = [obj for obj in objects if obj in valid_objects]
+        if objects:
+            filtered_map[uuid_value] = objects
+    return filtered_map
+
+
+def get_active_uuid_index():
+    """
+    Gets the UUID attribute index currently in use. (Entered through a "with" statement)
+    Returns:
+        UUIDAttrIndex or None: The active index, None if lookups are querying the scene directly.
+    """
+    return _active_uuid_index
+
+
+def invalidate_active_uuid_index():
+    """
+    Marks the active UUID attribute index (if any) as outdated, so it's rebuilt on the next lookup.
+    Used after UUID attributes are added or their values are changed.
+    """
+    if _active_uuid_index is not None:
+        _active_uuid_index.invalidate()
+
+
+class UUIDAttrIndex:
+    def __init__(self, track_scene_changes=True):
+        """
+        Initializes a UUID attribute index.
+        Maps UUID values stored in attributes (e.g. "proxyUUID") to the objects carrying them.
+        Each attribute map is built from a single scene query the first time it's requested and reused until the
+        index is invalidated. While active, creating or deleting nodes carrying an indexed attribute invalidates the
+        map of that attribute automatically. Other scene changes keep the cached maps.
+        Objects are stored as MObjectHandles and their paths are resolved during the lookup, so renaming or
+        reparenting indexed objects doesn't invalidate the index.
+
+        Usage:
+            with UUIDAttrIndex():
+                get_object_from_uuid_attr(uuid_string="a1b2c3", attr_name="proxyUUID")  # Uses index
+
+        Args:
+            track_scene_changes (bool, optional): If True, node added/removed callbacks are registered while the
+                                                  index is active, invalidating maps affected by scene changes.
+        """
+        self.track_scene_changes = track_scene_changes
+        self._uuid_maps = {}
+        self._added_handles = []
+        self._callback_ids = []
+        self._previous_index = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(attrs={sorted(self._uuid_maps.keys())})"
+
+    def __enter__(self):
+        global _active_uuid_index
+        self._previous_index = _active_uuid_index
+        _active_uuid_index = self
+        self.invalidate()
+        if self.track_scene_changes:
+            self._add_callbacks()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active_uuid_index
+        self._remove_callbacks()
+        _active_uuid_index = self._previous_index
+        self._previous_index = None
+        self.invalidate()
+        if _active_uuid_index is not None:
+            _active_uuid_index.invalidate()  # Scene might have changed while the outer index was inactive
+
+    def _add_callbacks(self):
+        """
+        Registers Maya callbacks that invalidate the index when nodes are created or deleted.
+        """
+        self._remove_callbacks()
+        try:
+            self._callback_ids.append(apiOpenMaya.MDGMessage.addNodeAddedCallback(self._on_node_added, "dependNode"))
+            self._callback_ids.append(
+                apiOpenMaya.MDGMessage.addNodeRemovedCallback(self._on_node_removed, "dependNode")
+            )
+        except Exception as e:
+            logger.debug(f"Unable to register UUID index callbacks. Index will only be invalidated manually: {e}")
+
+    def _remove_callbacks(self):
+        """
+        Removes callbacks registered by "_add_callbacks".
+        """
+        for callback_id in self._callback_ids:
+            try:
+                apiOpenMaya.MMessage.removeCallback(callback_id)
+            except Exception as e:
+                logger.debug(f"Unable to remove UUID index callback. Issue: {e}")
+        self._callback_ids = []
+
+    def _invalidate_from_node(self, mobject):
+        """
+        Clears the cached maps of the attributes found in the provided node.
+        Args:
+            mobject (MObject): The node to check.
+        """
+        dependency_node = apiOpenMaya.MFnDependencyNode(mobject)
+        for attr_name in list(self._uuid_maps):
+            if dependency_node.hasAttribute(attr_name):
+                self._uuid_maps.pop(attr_name, None)
+
+    def _on_node_added(self, mobject, *args):
+        """
+        Maya callback function. Node created, checked during the next lookup.
+        Attributes are usually added after the node is created, so they can't be checked yet.
+        """
+        if self._uuid_maps:
+            self._added_handles.append(apiOpenMaya.MObjectHandle(mobject))
+
+    def _on_node_removed(self, mobject, *args):
+        """
+        Maya callback function. Node deleted, maps of the attributes it carries are no longer reliable.
+        """
+        self._invalidate_from_node(mobject)
+
+    def _check_added_nodes(self):
+        """
+        Checks the nodes created since the last lookup, clearing the cached maps of the attributes they carry.
+        """
+        added_handles, self._added_handles = self._added_handles, []
+        for handle in added_handles:
+            if self._uuid_maps and handle.isValid():
+                self._invalidate_from_node(handle.object())
+
+    def invalidate(self, attr_name=None):
+        """
+        Clears cached maps, causing them to be rebuilt on the next lookup.
+        Args:
+            attr_name (str, optional): If provided, only the map of this attribute is cleared.
+        """
+        if attr_name:
+            self._uuid_maps.pop(attr_name, None)
+        else:
+            self._uuid_maps.clear()
+            self._added_handles = []
+
+    def is_cached(self, attr_name):
+        """
+        Checks if the map for the provided attribute is currently cached (no query needed)
+        Args:
+            attr_name (str): Name of the attribute where the UUID is stored.
+        Returns:
+            bool: True if cached, False if it will be built on the next lookup.
+        """
+        self._check_added_nodes()
+        return attr_name in self._uuid_maps
+
+    def _get_handle_map(self, attr_name):
+        """
+        Gets the map of UUID values to object handles for the provided attribute. Builds it if not yet cached.
+        Args:
+            attr_name (str): Name of the attribute where the UUID is stored.
+        Returns:
+            dict: A dictionary where the key is the UUID value and the value is a list of MObjectHandles.
+        """
+        self._check_added_nodes()
+        handle_map = self._uuid_maps.get(attr_name)
+        if handle_map is None:
+            handle_map = {}
+            for uuid_value, objects in query_uuid_attr_map(attr_name=attr_name).items():
+                handles = []
+                for obj in objects:
+                    selection = apiOpenMaya.MSelectionList()
+                    try:
+                        selection.add(obj)
+                    except Exception as e:
+                        logger.debug(f'Unable to index object "{obj}". Issue: {e}')
+                        continue
+                    handles.append(apiOpenMaya.MObjectHandle(selection.getDependNode(0)))
+                if handles:
+                    handle_map[uuid_value] = handles
+            self._uuid_maps[attr_name] = handle_map
+        return handle_map
+
+    @staticmethod
+    def _get_paths_from_handles(handles):
+        """
+        Resolves the current path of the provided object handles. Handles of deleted objects are ignored.
+        Args:
+            handles (list): A list of MObjectHandles.
+        Returns:
+            list: A list of objects (long names)
+        """
+        paths = []
+        for handle in handles:
+            if not handle.isValid():
+                continue
+            mobject = handle.object()
+            if mobject.hasFn(apiOpenMaya.MFn.kDagNode):
+                paths.append(apiOpenMaya.MFnDagNode(mobject).fullPathName())
+            else:
+                paths.append(apiOpenMaya.MFnDependencyNode(mobject).name())
+        return paths
+
+    def get_uuid_map(self, attr_name):
+        """
+        Gets the map of UUID values to objects for the provided attribute. Builds it if not yet cached.
+        Args:
+            attr_name (str): Name of the attribute where the UUID is stored.
+        Returns:
+            dict: A dictionary where the key is the UUID value and the value is a list of objects (long names)
+        """
+        uuid_map = {}
+        for uuid_value, handles in self._get_handle_map(attr_name=attr_name).items():
+            objects = self._get_paths_from_handles(handles)
+            if objects:
+                uuid_map[uuid_value] = objects
+        return uuid_map
+
+    def get_objects(self, uuid_string, attr_name):
+        """
+        Gets all objects with the provided UUID value.
+        Args:
+            uuid_string (str): UUID to look for.
+            attr_name (str): Name of the attribute where the UUID is stored.
+        Returns:
+            list: A list of objects (long names) carrying the UUID. Empty list if nothing was found.
+        """
+        handles = self._get_handle_map(attr_name=attr_name).get(uuid_string) or []
+        return self._get_paths_from_handles(handles)
 
 
 def get_uuid(obj_name):
@@ -193,6 +469,7 @@ def add_uuid_attr(obj_list, attr_name, set_initial_uuid_value=True):
     if set_initial_uuid_value:
         for attr in created_attrs:
             set_attr(attribute_path=attr, value=generate_uuid(remove_dashes=True))
+    invalidate_active_uuid_index()
     return created_attrs
 
 
@@ -10,6 +10,7 @@ import re
 
 # Import Tests
 import gt.tests.test_auto_rigger as test_auto_rigger
+import gt.tests.test_biped_rigger_legacy as test_biped_rigger_legacy
 import gt.tests.test_core as test_core
 import gt.tests.test_curve_library as test_curve_library
 import gt.tests.test_sample_tool as test_sample_tool
@@ -39,6 +40,7 @@ modules_to_test = [
     test_ui.test_python_output_view,
     test_ui.test_qt_utils,
     test_ui.test_resource_library,
+    test_ui.test_thumbnail_cache,
     # Tools
     test_auto_rigger.test_rig_utils,
     test_auto_rigger.test_rig_framework,
@@ -51,6 +53,7 @@ modules_to_test = [
     test_auto_rigger.test_module_head,
     test_auto_rigger.test_module_utils,
     test_auto_rigger.test_template_biped,
+    test_biped_rigger_legacy.test_biped_rig_interface,
     test_curve_library.test_curve_library_model,
     test_sample_tool.test_sample_tool_model,
     # Core
@@ -71,6 +74,7 @@ modules_to_test = [
     test_core.test_joint,
     test_core.test_math,
     test_core.test_mesh,
+    test_core.test_morphing,
     test_core.test_namespace,
     test_core.test_naming,
     test_core.test_node,
@@ -85,6 +89,7 @@ modules_to_test = [
     test_core.test_str,
     test_core.test_surface,
     test_core.test_transform,
+    test_core.test_transform_math,
     test_core.test_uuid,
     test_core.test_version,
     # Utils
@@ -0,0 +1,4 @@
+"""
+Benchmarks - Timing scripts used to track the performance of the package.
+These are not unittests (not part of "modules_to_test"). Run them directly, preferably using "mayapy".
+"""
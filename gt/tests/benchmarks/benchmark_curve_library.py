@@ -0,0 +1,146 @@
+"""
+Curve Library Benchmark - Compares reading the whole curve library (previous eager import behaviour)
+against reading the curve manifest (lazy curves) and the curve pack.
+
+Run it with "mayapy" (or any Python interpreter for the parts that don't require Maya):
+    mayapy benchmark_curve_library.py
+"""
+
+import subprocess
+import logging
+import time
+import zlib
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Paths to Append
+benchmarks_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(benchmarks_dir)
+package_root_dir = os.path.dirname(os.path.dirname(tests_dir))
+if package_root_dir not in sys.path:
+    sys.path.append(package_root_dir)
+
+from gt.core.io import DataDirConstants, read_json_dict, read_packed_file_header, read_packed_file_data
+from gt.core.io import bytes_to_array
+
+CURVE_MANIFEST_FILE_NAME = "curves_manifest.json"  # Same as "gt.core.curve.CURVE_MANIFEST_FILE_NAME"
+CURVE_PACK_FILE_NAME = "curves.pack"  # Same as "gt.core.curve.CURVE_PACK_FILE_NAME"
+
+
+def get_best_time(func, repeat=5):
+    """
+    Runs the provided function multiple times and returns the fastest execution time.
+    Args:
+        func (callable): Function to time.
+        repeat (int, optional): Number of times the function is executed.
+    Returns:
+        float: The fastest execution time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+def read_all_public_curve_files(curve_dir=None):
+    """
+    Reads every public ".crv" file. This is what the "Curves" class used to do when "gt.core.curve" was imported.
+    Args:
+        curve_dir (str, optional): Curves directory. Default is the package "curves" directory.
+    Returns:
+        list: A list of curve dictionaries.
+    """
+    curve_dir = curve_dir or DataDirConstants.DIR_CURVES
+    curves_data = []
+    for file in os.listdir(curve_dir):
+        if file.endswith(".crv") and not file.startswith("_"):
+            curves_data.append(read_json_dict(os.path.join(curve_dir, file)))
+    return curves_data
+
+
+def read_curve_manifest(curve_dir=None):
+    """
+    Reads the curve manifest. This is what the "Curves" class does now when "gt.core.curve" is imported.
+    Args:
+        curve_dir (str, optional): Curves directory. Default is the package "curves" directory.
+    Returns:
+        dict: The manifest dictionary.
+    """
+    curve_dir = curve_dir or DataDirConstants.DIR_CURVES
+    return read_json_dict(os.path.join(curve_dir, CURVE_MANIFEST_FILE_NAME))
+
+
+def read_curve_pack_values(curve_dir=None):
+    """
+    Reads the points and knots of every curve from the curve pack. (Header, then one read per curve)
+    Includes the first-read validation of every source ".crv" file. (Same as "gt.core.curve.is_curve_pack_source_valid")
+    Args:
+        curve_dir (str, optional): Curves directory. Default is the package "curves" directory.
+    Returns:
+        list: A list of arrays, one per curve.
+    """
+    curve_dir = curve_dir or DataDirConstants.DIR_CURVES
+    pack_path = os.path.join(curve_dir, CURVE_PACK_FILE_NAME)
+    header, data_start = read_packed_file_header(pack_path)
+    curves_values = []
+    for file_name, entry in header.get("curves", {}).items():
+        with open(os.path.join(curve_dir, f"{file_name}.crv"), "rb") as curve_file:
+            content = curve_file.read().replace(b"\r\n", b"\n")
+        if {"size": len(content), "crc": zlib.crc32(content)} != entry.get("source"):
+            continue
+        data = read_packed_file_data(pack_path, data_start, offset=entry.get("offset"), length=entry.get("length"))
+        curves_values.append(bytes_to_array(data, typecode="d"))
+    return curves_values
+
+
+def get_module_import_time(module_name="gt.core.curve"):
+    """
+    Imports a module in a new interpreter (same executable) and returns how long the import took.
+    Args:
+        module_name (str, optional): Module to import.
+    Returns:
+        float or None: Import time in seconds. None if the module could not be imported. (e.g. Maya not available)
+    """
+    code = (
+        f"import sys, time\n"
+        f"sys.path.insert(0, {package_root_dir!r})\n"
+        f"start_time = time.perf_counter()\n"
+        f"import {module_name}\n"
+        f"print(time.perf_counter() - start_time)\n"
+    )
+    try:
+        output = subprocess.check_output([sys.executable, "-c", code], stderr=subprocess.DEVNULL)
+        return float(output.decode().strip().splitlines()[-1])
+    except Exception as e:
+        logger.debug(f'Unable to import "{module_name}". Issue: {e}')
+
+
+def run_benchmark(repeat=5):
+    """
+    Runs the curve library benchmark and prints the results.
+    Args:
+        repeat (int, optional): Number of times each operation is executed. (Fastest time is reported)
+    Returns:
+        dict: Benchmark results. Key: operation description, Value: time in seconds (or None if unavailable)
+    """
+    results = {
+        "Eager: read all public curve files": get_best_time(read_all_public_curve_files, repeat=repeat),
+        "Lazy: read curve manifest": get_best_time(read_curve_manifest, repeat=repeat),
+        "Pack: read all curves (points and knots)": get_best_time(read_curve_pack_values, repeat=repeat),
+        'Import "gt.core.curve" (new interpreter)': get_module_import_time("gt.core.curve"),
+    }
+    for description, seconds in results.items():
+        seconds_str = f"{seconds:.4f}s" if seconds is not None else "unavailable (requires Maya)"
+        print(f"{description.ljust(45)}: {seconds_str}")
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
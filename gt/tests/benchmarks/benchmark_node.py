@@ -0,0 +1,120 @@
+"""
+Node Benchmark - Compares the path resolution of "Node" objects (cached path from an MObjectHandle) against
+the previous implementation (one "cmds.ls" UUID query every time the node is used as a string).
+
+Requires Maya. Run it with "mayapy":
+    mayapy benchmark_node.py
+"""
+
+import logging
+import time
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Paths to Append
+benchmarks_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(benchmarks_dir)
+package_root_dir = os.path.dirname(os.path.dirname(tests_dir))
+if package_root_dir not in sys.path:
+    sys.path.append(package_root_dir)
+
+NODE_COUNTS = [1000, 10000]
+RESOLVE_REPEATS = 3  # How many times each node is resolved (nodes are used as strings many times during a build)
+
+
+def get_long_name_from_uuid(uuid_string):
+    """
+    Previous implementation of "Node.get_long_name". Queries the UUID every time.
+    Args:
+        uuid_string (str): The UUID of the Maya node.
+    Returns:
+        str: The long name of the Maya node. Empty string if not found.
+    """
+    import maya.cmds as cmds
+
+    found = cmds.ls(uuid_string, long=True)
+    if found:
+        return found[0]
+    return ""
+
+
+def resolve_previous(uuid_list, repeats=RESOLVE_REPEATS):
+    """
+    Resolves all paths using the previous implementation.
+    Args:
+        uuid_list (list): A list of UUIDs.
+        repeats (int, optional): How many times each UUID is resolved.
+    """
+    for _ in range(repeats):
+        for uuid_string in uuid_list:
+            get_long_name_from_uuid(uuid_string)
+
+
+def resolve_nodes(node_list, repeats=RESOLVE_REPEATS):
+    """
+    Resolves all paths using "Node" objects.
+    Args:
+        node_list (list): A list of Node objects.
+        repeats (int, optional): How many times each node is resolved.
+    """
+    for _ in range(repeats):
+        for node in node_list:
+            str(node)
+
+
+def get_time(func, *args, **kwargs):
+    """
+    Runs the provided function once and returns how long it took.
+    Args:
+        func (callable): Function to time.
+        *args: Arguments passed to the function.
+        **kwargs: Keyword arguments passed to the function.
+    Returns:
+        float: Execution time in seconds.
+    """
+    start_time = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start_time
+
+
+def run_benchmark(node_counts=None):
+    """
+    Runs the node path resolution benchmark and prints the results.
+    Args:
+        node_counts (list, optional): A list with the number of nodes to create for each run.
+    Returns:
+        list: A list of dictionaries, one per run, with the node count and the time of each operation.
+    """
+    import maya.standalone
+
+    maya.standalone.initialize()
+    from gt.core.node import Node
+    import maya.cmds as cmds
+
+    results = []
+    for node_count in node_counts or NODE_COUNTS:
+        cmds.file(new=True, force=True)
+        group = cmds.group(empty=True, world=True, name="benchmark_grp")
+        transforms = [cmds.createNode("transform", parent=group, skipSelect=True) for _ in range(node_count)]
+        uuid_list = cmds.ls(transforms, uuid=True)
+        node_list = [Node(transform) for transform in cmds.ls(transforms, long=True)]
+        result = {
+            "nodes": node_count,
+            "previous_uuid_query": get_time(resolve_previous, uuid_list),
+            "node_cached": get_time(resolve_nodes, node_list),
+        }
+        cmds.rename(group, "benchmark_renamed_grp")  # Invalidates all cached paths
+        result["node_after_rename"] = get_time(resolve_nodes, node_list)
+        results.append(result)
+        timings = [f"{key}: {value:.4f}s" for key, value in result.items() if key != "nodes"]
+        print(f'Nodes: {result.get("nodes")} (x{RESOLVE_REPEATS}) | ' + " | ".join(timings))
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
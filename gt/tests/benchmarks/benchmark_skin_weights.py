@@ -0,0 +1,135 @@
+"""
+Skin Weights Benchmark - Compares the per-vertex plug queries (previous "get_skin_weights" implementation)
+against the dense "get_skin_weights_data" on generated meshes of increasing vertex counts.
+
+Requires Maya. Run it with "mayapy":
+    mayapy benchmark_skin_weights.py
+"""
+
+import logging
+import time
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Paths to Append
+benchmarks_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(benchmarks_dir)
+package_root_dir = os.path.dirname(os.path.dirname(tests_dir))
+if package_root_dir not in sys.path:
+    sys.path.append(package_root_dir)
+
+# Plane subdivisions (width, height) - Vertex count is (width + 1) * (height + 1)
+MESH_SUBDIVISIONS = [(31, 31), (99, 99), (199, 199), (315, 315)]
+JOINT_COUNT = 8
+
+
+def create_skinned_plane(subdivisions_width, subdivisions_height, joint_count=JOINT_COUNT):
+    """
+    Creates a plane bound to a joint chain.
+    Args:
+        subdivisions_width (int): Number of subdivisions along the width.
+        subdivisions_height (int): Number of subdivisions along the height.
+        joint_count (int, optional): Number of joints in the chain.
+    Returns:
+        str: Name of the skinned plane.
+    """
+    import maya.cmds as cmds
+
+    plane = cmds.polyPlane(w=10, h=10, sx=subdivisions_width, sy=subdivisions_height, ch=False)[0]
+    cmds.select(clear=True)
+    joints = [cmds.joint(position=(0, 0, -5 + (10.0 / (joint_count - 1)) * index)) for index in range(joint_count)]
+    cmds.skinCluster(joints, plane, toSelectedBones=True, maximumInfluences=4)
+    return plane
+
+
+def get_skin_weights_per_vertex(skinned_mesh):
+    """
+    Previous implementation of "get_skin_weights". Queries the existing weight plugs once per vertex.
+    Args:
+        skinned_mesh (str): The name of the skinned mesh
+    Returns:
+        dict: Sparse weights dictionary. e.g. {0: {'joint1': 0.75, 'joint2': 0.25}, 1: {'joint2': 1.0}}
+    """
+    import maya.api.OpenMaya as apiOpenMaya
+    import gt.core.skin as core_skin
+    import maya.cmds as cmds
+
+    vertices_num = cmds.polyEvaluate(skinned_mesh, v=True)
+    sel_list = apiOpenMaya.MSelectionList()
+    sel_list.add(skinned_mesh)
+    mesh_dag = sel_list.getDagPath(0)
+    mfn_skin_cluster, skin_cluster_name = core_skin.get_mfn_skin_from_geometry(skinned_mesh)
+    components_ids = [c for c in range(vertices_num)]
+    mfn_single_component = apiOpenMaya.MFnSingleIndexedComponent()
+    mesh_vert_component = mfn_single_component.create(apiOpenMaya.MFn.kMeshVertComponent)
+    mfn_single_component.addElements(components_ids)
+    weights, inf_num = mfn_skin_cluster.getWeights(mesh_dag, mesh_vert_component)
+    weight_plug = mfn_skin_cluster.findPlug("weights", False)
+    list_plug = mfn_skin_cluster.findPlug("weightList", False).attribute()
+    inf_dags = mfn_skin_cluster.influenceObjects()
+    inf_num = len(inf_dags)
+    inf_names = [inf_dag.partialPathName() for inf_dag in inf_dags]
+    sparse_map = {mfn_skin_cluster.indexForInfluenceObject(inf_dag): i for i, inf_dag in enumerate(inf_dags)}
+    skin_data = {}
+    for comp_id, vertex_num in enumerate(components_ids):
+        weight_plug.selectAncestorLogicalIndex(vertex_num, list_plug)
+        valid_ids = set(weight_plug.getExistingArrayAttributeIndices()) & sparse_map.keys()
+        flat_index = int(comp_id) * inf_num
+        skin_data[vertex_num] = {inf_names[sparse_map[i]]: weights[flat_index + sparse_map[i]] for i in valid_ids}
+    return skin_data
+
+
+def get_time(func, *args, **kwargs):
+    """
+    Runs the provided function once and returns how long it took.
+    Args:
+        func (callable): Function to time.
+        *args: Arguments passed to the function.
+        **kwargs: Keyword arguments passed to the function.
+    Returns:
+        float: Execution time in seconds.
+    """
+    start_time = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start_time
+
+
+def run_benchmark(subdivisions=None):
+    """
+    Runs the skin weights benchmark and prints the results.
+    Args:
+        subdivisions (list, optional): A list of tuples (width, height) used to generate the meshes.
+    Returns:
+        list: A list of dictionaries, one per mesh, with the vertex count and the time of each operation.
+    """
+    import maya.standalone
+
+    maya.standalone.initialize()
+    import gt.core.skin as core_skin
+    import maya.cmds as cmds
+
+    results = []
+    for subdivisions_width, subdivisions_height in subdivisions or MESH_SUBDIVISIONS:
+        cmds.file(new=True, force=True)
+        plane = create_skinned_plane(subdivisions_width, subdivisions_height)
+        weights_data = core_skin.get_skin_weights_data(plane)
+        result = {
+            "vertices": cmds.polyEvaluate(plane, v=True),
+            "per_vertex_dict": get_time(get_skin_weights_per_vertex, plane),
+            "dense_data": get_time(core_skin.get_skin_weights_data, plane),
+            "dense_to_dict": get_time(weights_data.to_dict),
+            "set_dense_data": get_time(core_skin.set_skin_weights_data, plane, weights_data, False),
+        }
+        results.append(result)
+        timings = [f"{key}: {value:.4f}s" for key, value in result.items() if key != "vertices"]
+        print(f'Vertices: {result.get("vertices")} | ' + " | ".join(timings))
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
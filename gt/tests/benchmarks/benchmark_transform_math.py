@@ -0,0 +1,245 @@
+"""
+Transform Math Benchmark - Compares the previous implementations of the public math helpers ("core_math.matrix_mult",
+"core_math.cross_product", "core_math.dist_xyz_to_xyz" and the "Vector3" helpers) against the current ones,
+followed by "gt.core.transform_math" using pure Python and NumPy (when available) for single and batched operations.
+
+Run it with "mayapy" or any Python interpreter. The public helpers import Maya, so they're only timed with "mayapy":
+    mayapy benchmark_transform_math.py
+"""
+
+import logging
+import random
+import time
+import math
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Paths to Append
+benchmarks_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(benchmarks_dir)
+package_root_dir = os.path.dirname(os.path.dirname(tests_dir))
+if package_root_dir not in sys.path:
+    sys.path.append(package_root_dir)
+
+import gt.core.transform_math as core_trans_math
+
+try:
+    import gt.core.transform as core_trans
+    import gt.core.math as core_math
+except ImportError:  # Maya is not available
+    core_trans = None
+    core_math = None
+
+
+def get_best_time(func, repeat=5):
+    """
+    Runs the provided function multiple times and returns the fastest execution time.
+    Args:
+        func (callable): Function to time.
+        repeat (int, optional): Number of times the function is executed.
+    Returns:
+        float: The fastest execution time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+def matrix_mult_nested_loops(mat1, mat2):
+    """
+    Previous "gt.core.math.matrix_mult" implementation (nested loops over lists of lists).
+    Args:
+        mat1 (list of lists): The first matrix.
+        mat2 (list of lists): The second matrix.
+    Returns:
+        list of lists: The result of matrix multiplication.
+    """
+    result = []
+    for i in range(len(mat1)):
+        row = []
+        for j in range(len(mat2[0])):
+            value = 0
+            for k in range(len(mat1[0])):
+                value += mat1[i][k] * mat2[k][j]
+            row.append(value)
+        result.append(row)
+    return result
+
+
+def cross_product_previous(vector_a, vector_b):
+    """
+    Previous "gt.core.math.cross_product" implementation.
+    Args:
+        vector_a (list): The first vector.
+        vector_b (list): The second vector.
+    Returns:
+        list: Cross product
+    """
+    result = [
+        vector_a[1] * vector_b[2] - vector_a[2] * vector_b[1],
+        vector_a[2] * vector_b[0] - vector_a[0] * vector_b[2],
+        vector_a[0] * vector_b[1] - vector_a[1] * vector_b[0],
+    ]
+    return result
+
+
+def dist_xyz_to_xyz_previous(pos_a_x, pos_a_y, pos_a_z, pos_b_x, pos_b_y, pos_b_z):
+    """
+    Previous "gt.core.math.dist_xyz_to_xyz" implementation.
+    Args:
+        pos_a_x (float): X value for position A
+        pos_a_y (float): Y value for position A
+        pos_a_z (float): Z value for position A
+        pos_b_x (float): X value for position B
+        pos_b_y (float): Y value for position B
+        pos_b_z (float): Z value for position B
+    Returns:
+        float: A distance value between position A and B.
+    """
+    dx = pos_a_x - pos_b_x
+    dy = pos_a_y - pos_b_y
+    dz = pos_a_z - pos_b_z
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+class Vector3Previous:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        """
+        Previous "gt.core.transform.Vector3" (initialization, magnitude, dot and cross).
+        Args:
+            x (float, optional): X coordinate.
+            y (float, optional): Y coordinate.
+            z (float, optional): Z coordinate.
+        """
+        for num in [x, y, z]:
+            if not isinstance(num, (int, float)):
+                raise ValueError("Input values must be numbers")
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def magnitude(self):
+        return (self.x**2 + self.y**2 + self.z**2) ** 0.5
+
+    def dot(self, other):
+        if isinstance(other, self.__class__):
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        raise TypeError("Unsupported operand type for dot product")
+
+    def cross(self, other):
+        if isinstance(other, self.__class__):
+            return Vector3Previous(
+                self.y * other.z - self.z * other.y,
+                self.z * other.x - self.x * other.z,
+                self.x * other.y - self.y * other.x,
+            )
+        raise TypeError("Unsupported operand type for cross product")
+
+
+def get_random_transforms(count):
+    """
+    Creates random translation, rotation and scale values.
+    Args:
+        count (int): Number of transforms.
+    Returns:
+        tuple: Lists of translations, rotations (degrees) and scales.
+    """
+    random.seed(0)
+    translations = [tuple(random.uniform(-10, 10) for _ in range(3)) for _ in range(count)]
+    rotations = [tuple(random.uniform(-180, 180) for _ in range(3)) for _ in range(count)]
+    scales = [tuple(random.uniform(0.1, 3) for _ in range(3)) for _ in range(count)]
+    return translations, rotations, scales
+
+
+def run_benchmark(count=10000, repeat=5):
+    """
+    Runs the transform math benchmark and prints the results.
+    Args:
+        count (int, optional): Number of transforms used by each operation.
+        repeat (int, optional): Number of times each operation is executed. (Fastest time is reported)
+    Returns:
+        dict: Benchmark results. Key: operation description, Value: time in seconds (or None if unavailable)
+    """
+    translations, rotations, scales = get_random_transforms(count)
+    matrices = core_trans_math.compose_matrices(translations, rotations, scales, use_numpy=False)
+    parent = matrices[0]
+    nested_matrices = [[list(matrix[index : index + 4]) for index in range(0, 16, 4)] for matrix in matrices]
+    nested_parent = nested_matrices[0]
+
+    def multiply_nested():
+        return [matrix_mult_nested_loops(matrix, nested_parent) for matrix in nested_matrices]
+
+    def multiply_flat():
+        return [core_trans_math.multiply_matrices(matrix, parent) for matrix in matrices]
+
+    def get_numpy_func(func, *args, **kwargs):
+        if not core_trans_math.NUMPY_AVAILABLE:
+            return None
+        return lambda: func(*args, use_numpy=True, **kwargs)
+
+    def get_maya_func(func):
+        if core_math is None:
+            return None
+        return func
+
+    def use_vectors(vector_class):
+        vectors = [vector_class(*translation) for translation in translations]
+        other = vectors[0]
+        for vector in vectors:
+            vector.magnitude()
+            vector.dot(other)
+            vector.cross(other)
+
+    def get_distances(dist_func):
+        other = translations[0]
+        for translation in translations:
+            dist_func(translation[0], translation[1], translation[2], other[0], other[1], other[2])
+
+    operations = {
+        "matrix_mult (previous)": multiply_nested,
+        "matrix_mult (current)": get_maya_func(
+            lambda: [core_math.matrix_mult(matrix, nested_parent) for matrix in nested_matrices]
+        ),
+        "cross_product (previous)": lambda: [cross_product_previous(pos, translations[0]) for pos in translations],
+        "cross_product (current)": get_maya_func(
+            lambda: [core_math.cross_product(pos, translations[0]) for pos in translations]
+        ),
+        "dist_xyz_to_xyz (previous)": lambda: get_distances(dist_xyz_to_xyz_previous),
+        "dist_xyz_to_xyz (current)": get_maya_func(lambda: get_distances(core_math.dist_xyz_to_xyz)),
+        "Vector3 magnitude, dot and cross (previous)": lambda: use_vectors(Vector3Previous),
+        "Vector3 magnitude, dot and cross (current)": get_maya_func(lambda: use_vectors(core_trans.Vector3)),
+        "Multiply: flat (Python)": multiply_flat,
+        "Multiply: batch (NumPy)": get_numpy_func(core_trans_math.multiply_matrices_batch, matrices, parent),
+        "Compose: batch (Python)": lambda: core_trans_math.compose_matrices(
+            translations, rotations, scales, use_numpy=False
+        ),
+        "Compose: batch (NumPy)": get_numpy_func(core_trans_math.compose_matrices, translations, rotations, scales),
+        "Decompose: batch (Python)": lambda: core_trans_math.decompose_matrices(matrices, use_numpy=False),
+        "Decompose: batch (NumPy)": get_numpy_func(core_trans_math.decompose_matrices, matrices),
+        "Quaternions: batch (Python)": lambda: core_trans_math.matrices_to_quaternions(matrices, use_numpy=False),
+        "Quaternions: batch (NumPy)": get_numpy_func(core_trans_math.matrices_to_quaternions, matrices),
+        "Transform points: batch (Python)": lambda: core_trans_math.transform_points(
+            translations, parent, use_numpy=False
+        ),
+        "Transform points: batch (NumPy)": get_numpy_func(core_trans_math.transform_points, translations, parent),
+    }
+    print(f"Transforms: {count}")
+    results = {}
+    for description, func in operations.items():
+        seconds = get_best_time(func, repeat=repeat) if func else None
+        results[description] = seconds
+        seconds_str = f"{seconds:.4f}s" if seconds is not None else "unavailable (requires NumPy or Maya)"
+        print(f"{description.ljust(45)}: {seconds_str}")
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
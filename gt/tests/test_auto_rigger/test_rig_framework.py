@@ -864,3 +864,65 @@ class TestRigFramework(unittest.TestCase):
         result_transform = cmds.getAttr("mocked_second_proxy_JNT.translate")
         expected_transform = [(0.0, 0.0, 0.0)]
         self.assertEqual(expected_transform, result_transform)
+
+    def test_project_get_module_from_proxy_uuid(self):
+        a_1st_proxy = tools_rig_frm.Proxy(name="a_1st_proxy")
+        a_2nd_proxy = tools_rig_frm.Proxy(name="a_2nd_proxy")
+        a_1st_module = tools_rig_frm.ModuleGeneric()
+        a_2nd_module = tools_rig_frm.ModuleGeneric()
+        a_1st_module.add_to_proxies(a_1st_proxy)
+        a_project = tools_rig_frm.RigProject()
+        a_project.add_to_modules([a_1st_module, a_2nd_module])
+        result = a_project.get_module_from_proxy_uuid(a_1st_proxy.get_uuid())
+        self.assertEqual(a_1st_module, result)
+        a_2nd_module.add_to_proxies(a_2nd_proxy)  # Added after map was cached
+        result = a_project.get_module_from_proxy_uuid(a_2nd_proxy.get_uuid())
+        self.assertEqual(a_2nd_module, result)
+        result = a_project.get_module_from_proxy_uuid("mocked_missing_uuid")
+        self.assertIsNone(result)
+
+    def test_project_update_modules_order(self):
+        modules = []
+        for index in range(4):
+            a_module = tools_rig_frm.ModuleGeneric(name=f"module_{index}")
+            a_module.add_to_proxies(tools_rig_frm.Proxy(name=f"proxy_{index}"))
+            modules.append(a_module)
+        module_0, module_1, module_2, module_3 = modules
+        # Chain: module_0 -> module_2 -> module_3 -> module_1 (listed in the opposite order)
+        module_1.set_parent_uuid(module_3.get_proxies()[0].get_uuid())
+        module_3.set_parent_uuid(module_2.get_proxies()[0].get_uuid())
+        module_2.set_parent_uuid(module_0.get_proxies()[0].get_uuid())
+        a_project = tools_rig_frm.RigProject()
+        a_project.add_to_modules([module_1, module_3, module_2, module_0])
+        a_project.update_modules_order()
+        result = [module.get_name() for module in a_project.get_modules()]
+        expected = ["module_0", "module_2", "module_3", "module_1"]
+        self.assertEqual(expected, result)
+
+    def test_project_update_modules_order_keeps_siblings_order(self):
+        root_module = tools_rig_frm.ModuleGeneric(name="root")
+        root_module.add_to_proxies(tools_rig_frm.Proxy(name="root_proxy"))
+        root_uuid = root_module.get_proxies()[0].get_uuid()
+        child_a = tools_rig_frm.ModuleGeneric(name="child_a")
+        child_b = tools_rig_frm.ModuleGeneric(name="child_b")
+        child_a.set_parent_uuid(root_uuid)
+        child_b.set_parent_uuid(root_uuid)
+        independent_module = tools_rig_frm.ModuleGeneric(name="independent")
+        a_project = tools_rig_frm.RigProject()
+        a_project.add_to_modules([child_a, independent_module, root_module, child_b])
+        a_project.update_modules_order()
+        result = [module.get_name() for module in a_project.get_modules()]
+        expected = ["independent", "root", "child_a", "child_b"]
+        self.assertEqual(expected, result)
+
+    def test_project_update_modules_order_cycle(self):
+        a_1st_module = tools_rig_frm.ModuleGeneric(name="module_a")
+        a_2nd_module = tools_rig_frm.ModuleGeneric(name="module_b")
+        a_1st_module.add_to_proxies(tools_rig_frm.Proxy(name="proxy_a"))
+        a_2nd_module.add_to_proxies(tools_rig_frm.Proxy(name="proxy_b"))
+        a_1st_module.set_parent_uuid(a_2nd_module.get_proxies()[0].get_uuid())
+        a_2nd_module.set_parent_uuid(a_1st_module.get_proxies()[0].get_uuid())
+        a_project = tools_rig_frm.RigProject()
+        a_project.add_to_modules([a_1st_module, a_2nd_module])
+        with self.assertRaises(ValueError):
+            a_project.update_modules_order()
@@ -1,3 +1,4 @@
+from unittest.mock import patch
 import unittest
 import logging
 import sys
@@ -17,6 +18,7 @@ for to_append in [package_root_dir, tests_dir]:
         sys.path.append(to_append)
 import gt.tools.auto_rigger.template_biped as template_biped
 import gt.tools.auto_rigger.rig_framework as tools_rig_frm
+import gt.core.joint as core_joint
 from gt.tests import maya_test_tools
 
 cmds = maya_test_tools.cmds
@@ -41,3 +43,28 @@ class TestTemplateBiped(unittest.TestCase):
         result = isinstance(biped_template, tools_rig_frm.RigProject)
         expected = True
         self.assertEqual(expected, result)
+
+    def test_template_skeleton_orientation_matches_constraints(self):
+        def build_skeleton():
+            maya_test_tools.force_new_scene()
+            biped_template = template_biped.create_template_biped()
+            biped_template.build_proxy()
+            biped_template.build_skeleton()
+            results = {}
+            for jnt in cmds.ls(type="joint"):
+                world_matrix = cmds.xform(jnt, query=True, matrix=True, worldSpace=True)
+                results[jnt] = list(world_matrix) + list(cmds.getAttr(f"{jnt}.rotate")[0])
+            return results
+
+        orient_joint = core_joint.orient_joint
+
+        def orient_joint_with_constraints(*args, **kwargs):
+            return orient_joint(*args, use_constraints=True, **kwargs)
+
+        with patch.object(core_joint, "orient_joint", orient_joint_with_constraints):
+            expected = build_skeleton()
+        result = build_skeleton()
+        self.assertEqual(sorted(expected.keys()), sorted(result.keys()))
+        for jnt, expected_values in expected.items():
+            for expected_value, value in zip(expected_values, result.get(jnt)):
+                self.assertAlmostEqual(expected_value, value, places=3, msg=f'Unexpected orientation for "{jnt}".')
@@ -0,0 +1 @@
+from . import test_biped_rig_interface
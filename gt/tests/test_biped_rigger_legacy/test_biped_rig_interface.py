@@ -0,0 +1,68 @@
+import unittest
+import logging
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Tested Script
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from gt.tests import maya_test_tools
+from gt.core import anim as core_anim
+
+cmds = maya_test_tools.cmds
+
+
+def create_test_limb():
+    """
+    Creates a minimal limb (IK control, its match reference and a switch control) that can be baked.
+    The reference moves from 0 to 9 in X between frames 1 and 10. The IK control already has keys.
+    Returns:
+        dict: A limb dictionary, same format as "left_arm_seamless_dict"
+    """
+    reference = cmds.spaceLocator(name="wristSwitch_loc")[0]
+    cmds.setKeyframe(reference, attribute="tx", time=1, value=0, inTangentType="linear", outTangentType="linear")
+    cmds.setKeyframe(reference, attribute="tx", time=10, value=9, inTangentType="linear", outTangentType="linear")
+    ik_ctrl = cmds.group(name="wrist_ik_ctrl", empty=True, world=True)
+    for time in [1, 5, 20]:
+        cmds.setKeyframe(ik_ctrl, attribute="tx", time=time, value=99)
+    switch_ctrl = cmds.group(name="arm_switch_ctrl", empty=True, world=True)
+    cmds.addAttr(switch_ctrl, longName="influenceSwitch", attributeType="double", min=0, max=1, keyable=True)
+    return {
+        "switch_ctrl": switch_ctrl,
+        "end_ik_ctrl": ik_ctrl,
+        "end_ik_reference": reference,
+        "incompatible_attr_holder": "",
+    }
+
+
+class TestBipedRigInterface(unittest.TestCase):
+    def setUp(self):
+        maya_test_tools.force_new_scene()
+
+    @classmethod
+    def setUpClass(cls):
+        maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+
+    def test_fk_ik_bake_existing_keys(self):
+        from gt.tools.biped_rigger_legacy import biped_rig_interface
+
+        limb = create_test_limb()
+        ik_ctrl = limb.get("end_ik_ctrl")
+        anim_curve = core_anim.get_attr_anim_curve(f"{ik_ctrl}.tx")
+        result = biped_rig_interface.fk_ik_bake([(limb, "fk_to_ik")], start_time=1, end_time=10)
+        self.assertEqual(anim_curve, result.get(f"{ik_ctrl}.tx"))  # Existing curve edited in place
+        expected_times = [float(time) for time in range(1, 11)] + [20.0]  # Keys outside the range are kept
+        self.assertEqual(expected_times, cmds.keyframe(anim_curve, query=True))
+        values = cmds.keyframe(anim_curve, query=True, valueChange=True)
+        expected_values = [float(time - 1) for time in range(1, 11)] + [99.0]
+        self.assertEqual(expected_values, [round(value, 4) for value in values])
+        self.assertEqual(1, cmds.getAttr(f"{limb.get('switch_ctrl')}.influenceSwitch", time=10))
@@ -15,6 +15,7 @@ from . import test_iterable
 from . import test_joint
 from . import test_math
 from . import test_mesh
+from . import test_morphing
 from . import test_namespace
 from . import test_naming
 from . import test_node
@@ -29,5 +30,6 @@ from . import test_skin
 from . import test_str
 from . import test_surface
 from . import test_transform
+from . import test_transform_math
 from . import test_uuid
 from . import test_version
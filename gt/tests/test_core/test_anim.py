@@ -58,3 +58,242 @@ class TestAnimCore(unittest.TestCase):
         result = core_anim.delete_double_keyframes()
         expected = 3
         self.assertEqual(expected, result)
+
+    def test_anim_curve_data_add_key(self):
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=1, value=5, in_tangent_type="linear", out_tangent_type="step")
+        curve_data.add_key(time=10, value=-2)
+        self.assertEqual(2, len(curve_data))
+        self.assertEqual([1.0, 10.0], list(curve_data.times))
+        self.assertEqual([5.0, -2.0], list(curve_data.values))
+        self.assertEqual("linear", core_anim.get_tangent_type_name(curve_data.in_tangent_types[0]))
+        self.assertEqual("step", core_anim.get_tangent_type_name(curve_data.out_tangent_types[0]))
+        self.assertEqual("auto", core_anim.get_tangent_type_name(curve_data.in_tangent_types[1]))
+
+    def test_anim_curve_data_invert_values(self):
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=1, value=5, in_angle=30, out_angle=-15, in_weight=2, out_weight=3)
+        curve_data.invert_values()
+        self.assertEqual([-5.0], list(curve_data.values))
+        self.assertEqual([-30.0], list(curve_data.in_angles))
+        self.assertEqual([15.0], list(curve_data.out_angles))
+        self.assertEqual([2.0], list(curve_data.in_weights))
+        self.assertEqual([3.0], list(curve_data.out_weights))
+
+    def test_anim_curve_data_merge(self):
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=1, value=1)
+        curve_data.add_key(time=10, value=10)
+        other_data = core_anim.AnimCurveData()
+        other_data.add_key(time=5, value=50)
+        other_data.add_key(time=10, value=100)
+        curve_data.merge(other_data)
+        self.assertEqual([1.0, 5.0, 10.0], list(curve_data.times))
+        self.assertEqual([1.0, 50.0, 100.0], list(curve_data.values))
+
+    def test_anim_curve_data_remove_keys(self):
+        curve_data = core_anim.AnimCurveData()
+        for time in [1, 4.5, 5, 10, 20]:
+            curve_data.add_key(time=time, value=time * 2)
+        curve_data.remove_keys(4, 10)
+        self.assertEqual([1.0, 20.0], list(curve_data.times))
+        self.assertEqual([2.0, 40.0], list(curve_data.values))
+        self.assertEqual(2, len(curve_data.in_tangent_types))
+
+    def test_anim_curve_data_key_rows(self):
+        rows = [
+            (10.0, 2.0, 0.0, 0.0, False, 1.0, 1.0, "linear", "linear"),
+            (1.0, 5.0, 15.0, 15.0, True, 1.0, 1.0, "spline", "step"),
+        ]
+        curve_data = core_anim.AnimCurveData.from_key_rows(rows)
+        result = curve_data.to_key_rows()
+        expected = [rows[1], rows[0]]  # Sorted by time
+        self.assertEqual(expected, result)
+
+    def test_anim_curve_data_dict(self):
+        curve_data = core_anim.AnimCurveData(curve_type="animCurveTL", is_weighted=True)
+        curve_data.add_key(time=1, value=5, in_tangent_type="flat", out_tangent_type="clamped")
+        result = core_anim.AnimCurveData.from_dict(curve_data.to_dict())
+        self.assertEqual(curve_data, result)
+        self.assertEqual(["flat"], curve_data.to_dict().get("in_tangent_types"))
+
+    def test_get_anim_curve_data(self):
+        cube = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=1, value=0)
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=10, value=5)
+        maya_test_tools.cmds.keyTangent(cube, attribute="tx", time=(10, 10), outTangentType="step")
+        anim_curve = core_anim.get_attr_anim_curve(f"{cube}.tx")
+        result = core_anim.get_anim_curve_data(anim_curve)
+        self.assertEqual("animCurveTL", result.curve_type)
+        self.assertEqual([1.0, 10.0], list(result.times))
+        self.assertEqual([0.0, 5.0], list(result.values))
+        self.assertEqual("step", core_anim.get_tangent_type_name(result.out_tangent_types[1]))
+        expected_in_angles = maya_test_tools.cmds.keyTangent(cube, attribute="tx", inAngle=True, query=True)
+        for angle, expected_angle in zip(result.in_angles, expected_in_angles):
+            self.assertAlmostEqual(expected_angle, angle, places=5)
+
+    def test_get_anim_curve_data_rotation_ui_units(self):
+        cube = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="ry", time=1, value=90)
+        result = core_anim.get_attr_anim_curve_data(f"{cube}.ry")
+        self.assertEqual("animCurveTA", result.curve_type)
+        self.assertAlmostEqual(90, result.values[0], places=5)
+
+    def test_get_anim_curve_data_missing(self):
+        cube = maya_test_tools.create_poly_cube()
+        self.assertIsNone(core_anim.get_attr_anim_curve_data(f"{cube}.tx"))
+        self.assertIsNone(core_anim.get_anim_curve_data("mocked_missing_curve"))
+
+    def test_get_anim_curves_data(self):
+        import_anim_test_file()
+        result = core_anim.get_anim_curves_data("pCube1")
+        self.assertEqual(3, len(result))
+        result = core_anim.get_anim_curves_data("pCube2")
+        self.assertEqual(0, len(result))  # Driven keys are not included by default
+        result = core_anim.get_anim_curves_data("pCube2", include_driven=True)
+        self.assertEqual(3, len(result))
+
+    def test_set_anim_curve_data(self):
+        cube_source = maya_test_tools.create_poly_cube()
+        cube_target = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube_source, attribute="ry", time=1, value=0)
+        maya_test_tools.cmds.setKeyframe(cube_source, attribute="ry", time=12, value=45)
+        maya_test_tools.cmds.keyTangent(cube_source, attribute="ry", inTangentType="linear", outTangentType="linear")
+        curve_data = core_anim.get_attr_anim_curve_data(f"{cube_source}.ry")
+        anim_curve = core_anim.set_anim_curve_data(f"{cube_target}.ry", curve_data)
+        self.assertTrue(maya_test_tools.cmds.objExists(anim_curve))
+        result = maya_test_tools.cmds.keyframe(cube_target, attribute="ry", query=True, valueChange=True)
+        self.assertEqual([0.0, 45.0], [round(value, 5) for value in result])
+        result = maya_test_tools.cmds.keyTangent(cube_target, attribute="ry", outTangentType=True, query=True)
+        self.assertEqual(["linear", "linear"], result)
+
+    def test_set_anim_curve_data_merge(self):
+        cube = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=1, value=1)
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=10, value=10)
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=10, value=20)
+        curve_data.add_key(time=20, value=30)
+        core_anim.set_anim_curve_data(f"{cube}.tx", curve_data, replace=False)
+        result = maya_test_tools.cmds.keyframe(cube, attribute="tx", query=True)
+        self.assertEqual([1.0, 10.0, 20.0], result)
+        result = maya_test_tools.cmds.keyframe(cube, attribute="tx", query=True, valueChange=True)
+        self.assertEqual([1.0, 20.0, 30.0], result)
+
+    def test_set_anim_curve_data_replace(self):
+        cube = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=1, value=1)
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=5, value=2)
+        core_anim.set_anim_curve_data(f"{cube}.tx", curve_data, replace=True)
+        result = maya_test_tools.cmds.keyframe(cube, attribute="tx", query=True)
+        self.assertEqual([5.0], result)
+        anim_curves = maya_test_tools.cmds.ls(type="animCurve")
+        self.assertEqual(1, len(anim_curves))
+
+    def test_set_anim_curve_data_undo(self):
+        cube = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=1, value=1)
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=5, value=2)
+        maya_test_tools.cmds.undoInfo(state=True)
+        core_anim.set_anim_curve_data(f"{cube}.tx", curve_data, replace=True)
+        maya_test_tools.cmds.undo()
+        result = maya_test_tools.cmds.keyframe(cube, attribute="tx", query=True)
+        self.assertEqual([1.0], result)
+
+    def test_set_anim_curve_data_replace_in_place(self):
+        cube = maya_test_tools.create_poly_cube()
+        cube_two = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=1, value=1)
+        anim_curve = core_anim.get_attr_anim_curve(f"{cube}.tx")
+        maya_test_tools.cmds.connectAttr(f"{anim_curve}.output", f"{cube_two}.ty")  # Curve driving two plugs
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=5, value=2)
+        result = core_anim.set_anim_curve_data(f"{cube}.tx", curve_data, replace=True)
+        self.assertEqual(anim_curve, result)
+        self.assertEqual([anim_curve], maya_test_tools.cmds.listConnections(f"{cube_two}.ty", source=True))
+        result = maya_test_tools.cmds.keyframe(anim_curve, query=True)
+        self.assertEqual([5.0], result)
+
+    def test_set_anim_curve_data_existing_curve(self):
+        cube = maya_test_tools.create_poly_cube()
+        for time in [1, 4, 8, 12]:
+            maya_test_tools.cmds.setKeyframe(cube, attribute="ry", time=time, value=time)
+        anim_curve = core_anim.get_attr_anim_curve(f"{cube}.ry")
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=2, value=10, in_tangent_type="linear", out_tangent_type="linear")
+        curve_data.add_key(
+            time=6, value=-20, in_angle=15, out_angle=15, in_tangent_type="fixed", out_tangent_type="fixed"
+        )
+        result = core_anim.set_anim_curve_data(f"{cube}.ry", curve_data, replace=True)  # Fewer keys
+        self.assertEqual(anim_curve, result)
+        self.assertEqual([2.0, 6.0], maya_test_tools.cmds.keyframe(anim_curve, query=True))
+        result = maya_test_tools.cmds.keyframe(anim_curve, query=True, valueChange=True)
+        self.assertEqual([10.0, -20.0], [round(value, 5) for value in result])
+        result = maya_test_tools.cmds.keyTangent(anim_curve, query=True, outTangentType=True)
+        self.assertEqual(["linear", "fixed"], result)
+        result = maya_test_tools.cmds.keyTangent(anim_curve, query=True, index=(1, 1), outAngle=True)
+        self.assertAlmostEqual(15, result[0], places=3)
+
+        curve_data = core_anim.get_anim_curve_data(anim_curve)
+        curve_data.add_key(time=20, value=5, in_tangent_type="step", out_tangent_type="step")
+        core_anim.set_anim_curve_data(f"{cube}.ry", curve_data, replace=True)  # More keys
+        self.assertEqual([2.0, 6.0, 20.0], maya_test_tools.cmds.keyframe(anim_curve, query=True))
+        result = maya_test_tools.cmds.keyTangent(anim_curve, query=True, outTangentType=True)
+        self.assertEqual(["linear", "fixed", "step"], result)
+        self.assertEqual(1, len(maya_test_tools.cmds.ls(type="animCurve")))
+
+    def test_set_anim_curve_data_keeps_clipboard(self):
+        cube = maya_test_tools.create_poly_cube()
+        cube_two = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=1, value=1)
+        maya_test_tools.cmds.setKeyframe(cube_two, attribute="ty", time=3, value=7)
+        maya_test_tools.cmds.copyKey(cube_two, attribute="ty")  # User clipboard
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=5, value=2, in_tangent_type="linear", out_tangent_type="linear")
+        core_anim.set_anim_curve_data(f"{cube}.tx", curve_data, replace=True)
+        result = maya_test_tools.cmds.keyTangent(cube, attribute="tx", outTangentType=True, query=True)
+        self.assertEqual(["linear"], result)
+        maya_test_tools.cmds.pasteKey(cube, attribute="tz", option="replaceCompletely")
+        result = maya_test_tools.cmds.keyframe(cube, attribute="tz", query=True, valueChange=True)
+        self.assertEqual([7.0], result)
+
+    def test_set_anim_curve_data_driven_attr(self):
+        cube = maya_test_tools.create_poly_cube()
+        driver = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.connectAttr(f"{driver}.ty", f"{cube}.tx")
+        curve_data = core_anim.AnimCurveData()
+        curve_data.add_key(time=5, value=2)
+        logging.disable(logging.WARNING)
+        result = core_anim.set_anim_curve_data(f"{cube}.tx", curve_data)
+        logging.disable(logging.NOTSET)
+        self.assertIsNone(result)
+        self.assertEqual([driver], maya_test_tools.cmds.listConnections(f"{cube}.tx", source=True))
+        self.assertEqual(0, len(maya_test_tools.cmds.ls(type="animCurve")))
+
+    def test_get_matrices_at_times(self):
+        cube = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=1, value=0)
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=10, value=10)
+        maya_test_tools.cmds.currentTime(5)
+        attr_path = f"{cube}.worldMatrix[0]"
+        result = core_anim.get_matrices_at_times([attr_path], [1, 10])
+        self.assertEqual([attr_path], list(result.keys()))
+        self.assertEqual(2, len(result.get(attr_path)))
+        self.assertAlmostEqual(0, result.get(attr_path)[0][12])
+        self.assertAlmostEqual(10, result.get(attr_path)[1][12])
+        self.assertEqual(5, maya_test_tools.cmds.currentTime(query=True))
+
+    def test_evaluate_plug_at_time(self):
+        import maya.api.OpenMaya as apiOpenMaya
+
+        cube = maya_test_tools.create_poly_cube()
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=1, value=0)
+        maya_test_tools.cmds.setKeyframe(cube, attribute="tx", time=10, value=10)
+        maya_test_tools.cmds.currentTime(5)
+        selection = apiOpenMaya.MSelectionList()
+        selection.add(f"{cube}.worldMatrix[0]")
+        data = core_anim.evaluate_plug_at_time(selection.getPlug(0), 10)
+        self.assertAlmostEqual(10, apiOpenMaya.MFnMatrixData(data).matrix()[12])
+        self.assertEqual(5, maya_test_tools.cmds.currentTime(query=True))
@@ -1514,3 +1514,104 @@ class TestAttributeCore(unittest.TestCase):
         result = cmds.getAttr(f"{cube_one}.stringAttr")
         expected = "mocked_content_two"
         self.assertEqual(expected, result)
+
+    def test_get_plugs(self):
+        cube = maya_test_tools.create_poly_cube()
+        result = core_attr.get_plugs([f"{cube}.tx", f"{cube}.mocked_missing_attr"], verbose=False)
+        self.assertEqual([f"{cube}.tx"], list(result))
+        self.assertEqual("pCube1.translateX", result.get(f"{cube}.tx").name())
+
+    def test_get_attr_values(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f"{cube}.translate", 1, 2, 3)
+        cmds.setAttr(f"{cube}.rx", 45)
+        cmds.setAttr(f"{cube}.v", False)
+        cmds.addAttr(cube, longName="enumAttr", at="enum", en="zero:one:two", keyable=True)
+        cmds.setAttr(f"{cube}.enumAttr", 2)
+        cmds.addAttr(cube, ln="stringAttr", k=True, dataType="string")
+        cmds.setAttr(f"{cube}.stringAttr", "mocked_content", typ="string")
+        attr_paths = [
+            f"{cube}.translate",
+            f"{cube}.rx",
+            f"{cube}.v",
+            f"{cube}.enumAttr",
+            f"{cube}.stringAttr",
+            f"{cube}.mocked_missing_attr",
+        ]
+        result = core_attr.get_attr_values(attr_paths, verbose=False)
+        expected = {
+            "pCube1.translate": (1.0, 2.0, 3.0),
+            "pCube1.rx": 45.0,
+            "pCube1.v": False,
+            "pCube1.enumAttr": 2,
+            "pCube1.stringAttr": "mocked_content",
+            "pCube1.mocked_missing_attr": None,
+        }
+        for attr_path, expected_value in expected.items():
+            if isinstance(expected_value, float):
+                self.assertAlmostEqual(expected_value, result.get(attr_path), places=5)
+            else:
+                self.assertEqual(expected_value, result.get(attr_path))
+        result = core_attr.get_attr_values([f"{cube}.enumAttr"], enum_as_string=True)
+        self.assertEqual({"pCube1.enumAttr": "two"}, result)
+
+    def test_get_attr_values_matches_get_attr(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f"{cube}.translate", 1, 2, 3)
+        cmds.setAttr(f"{cube}.rotate", 10, 20, 30)
+        attr_paths = [f"{cube}.{attr}" for attr in core_attr.DEFAULT_ATTRS] + [f"{cube}.translate"]
+        result = core_attr.get_attr_values(attr_paths)
+        for attr_path in attr_paths:
+            self.assertEqual(core_attr.get_attr(attr_path), result.get(attr_path))
+
+    def test_get_multiple_attr_many_objects(self):
+        cubes = [maya_test_tools.create_poly_cube() for _ in range(4)]
+        for index, cube in enumerate(cubes):
+            cmds.setAttr(f"{cube}.tx", index)
+        attrs = ["tx", "ty", "tz"]
+        result = core_attr.get_multiple_attr(obj_list=cubes, attr_list=attrs)  # More than "BULK_ATTR_MIN_COUNT"
+        expected = {
+            f"{cube}.{attr}": float(index if attr == "tx" else 0) for attr in attrs for index, cube in enumerate(cubes)
+        }
+        self.assertEqual(expected, result)
+
+    def test_set_attr_values(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.addAttr(cube, longName="enumAttr", at="enum", en="zero:one:two", keyable=True)
+        cmds.addAttr(cube, ln="stringAttr", k=True, dataType="string")
+        attr_values = {
+            f"{cube}.translate": (1, 2, 3),
+            f"{cube}.rx": 90,
+            f"{cube}.v": False,
+            f"{cube}.enumAttr": "two",
+            f"{cube}.stringAttr": "mocked_content",
+        }
+        result = core_attr.set_attr_values(attr_values)
+        self.assertEqual(list(attr_values), result)
+        self.assertEqual([(1.0, 2.0, 3.0)], cmds.getAttr(f"{cube}.translate"))
+        self.assertAlmostEqual(90, cmds.getAttr(f"{cube}.rx"), places=5)
+        self.assertEqual(False, cmds.getAttr(f"{cube}.v"))
+        self.assertEqual(2, cmds.getAttr(f"{cube}.enumAttr"))
+        self.assertEqual("mocked_content", cmds.getAttr(f"{cube}.stringAttr"))
+
+    def test_set_attr_values_locked(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f"{cube}.tx", lock=True)
+        result = core_attr.set_attr_values({f"{cube}.tx": 5})
+        self.assertEqual([], result)
+        self.assertEqual(0, cmds.getAttr(f"{cube}.tx"))
+        result = core_attr.set_attr_values({f"{cube}.tx": 5}, force_unlock=True)
+        self.assertEqual([f"{cube}.tx"], result)
+        self.assertEqual(5, cmds.getAttr(f"{cube}.tx"))
+
+    def test_set_attr_values_modifier(self):
+        import maya.api.OpenMaya as apiOpenMaya
+
+        cube = maya_test_tools.create_poly_cube()
+        modifier = apiOpenMaya.MDGModifier()
+        core_attr.set_attr_values({f"{cube}.tx": 5, f"{cube}.sy": 2}, modifier=modifier)
+        self.assertEqual(5, cmds.getAttr(f"{cube}.tx"))
+        self.assertEqual(2, cmds.getAttr(f"{cube}.sy"))
+        modifier.undoIt()
+        self.assertEqual(0, cmds.getAttr(f"{cube}.tx"))
+        self.assertEqual(1, cmds.getAttr(f"{cube}.sy"))
@@ -709,11 +709,92 @@ class TestCurveCore(unittest.TestCase):
         curve = core_curve.get_curve(file_name="mocked_missing_file", curve_dir=maya_test_tools.get_data_dir_path())
         self.assertFalse(curve)
 
+    def test_lazy_curve(self):
+        curve = core_curve.LazyCurve(file_name="circle")
+        self.assertFalse(curve.is_loaded())
+        self.assertEqual("circle", curve.get_name())
+        self.assertTrue(curve.is_curve_valid())
+        self.assertFalse(curve.is_loaded())
+        self.assertEqual(1, len(curve.shapes))
+        self.assertTrue(curve.is_loaded())
+
+    def test_lazy_curve_missing_from_manifest(self):
+        curve = core_curve.LazyCurve(file_name="two_lines", curve_dir=maya_test_tools.get_data_dir_path())
+        self.assertTrue(curve.is_loaded())
+        self.assertTrue(curve.is_curve_valid())
+
+    def test_lazy_curve_build(self):
+        curve = core_curve.LazyCurve(file_name="circle")
+        result = curve.build()
+        self.assertTrue(cmds.objExists(result))
+
+    def test_curve_manifest_in_sync(self):
+        manifest = core_curve.get_curve_manifest(use_cache=False)
+        curve_dir = core_curve.DataDirConstants.DIR_CURVES
+        file_names = [file[:-4] for file in os.listdir(curve_dir) if file.endswith(".crv")]
+        self.assertEqual(sorted(file_names), sorted(manifest.keys()))
+        for file_name in file_names:
+            data = core_curve.read_json_dict(os.path.join(curve_dir, f"{file_name}.crv"))
+            expected = core_curve.get_curve_manifest_entry_from_data(data)
+            self.assertEqual(expected, manifest.get(file_name), f'Outdated manifest entry: "{file_name}"')
+
+    def test_write_curve_manifest(self):
+        temp_dir = maya_test_tools.generate_test_temp_dir()
+        curve = core_curve.get_curve(file_name="two_lines", curve_dir=maya_test_tools.get_data_dir_path())
+        curve.write_curve_to_file(os.path.join(temp_dir, "two_lines.crv"))
+        result = core_curve.write_curve_manifest(target_dir=temp_dir)
+        self.assertTrue(os.path.exists(result))
+        manifest = core_curve.get_curve_manifest(curve_dir=temp_dir)
+        self.assertEqual(["two_lines"], list(manifest.keys()))
+        self.assertEqual(2, manifest.get("two_lines").get("shapes"))
+
+    def test_curve_pack_in_sync(self):
+        curve_dir = core_curve.DataDirConstants.DIR_CURVES
+        header, _ = core_curve.get_curve_pack_header(use_cache=False)
+        file_names = [file[:-4] for file in os.listdir(curve_dir) if file.endswith(".crv")]
+        self.assertEqual(sorted(file_names), sorted(header.get("curves").keys()))
+        for file_name in file_names:
+            file_path = os.path.join(curve_dir, f"{file_name}.crv")
+            source_entry = header.get("curves").get(file_name).get("source")
+            self.assertEqual(core_curve.get_curve_pack_source_entry(file_path), source_entry)
+            expected = core_curve.read_json_dict(file_path)
+            result = core_curve.read_curve_data_from_pack(file_name)
+            self.assertEqual(expected, result, f'Outdated curve pack data: "{file_name}"')
+
+    def test_write_curve_pack(self):
+        temp_dir = maya_test_tools.generate_test_temp_dir()
+        curve = core_curve.get_curve(file_name="two_lines", curve_dir=maya_test_tools.get_data_dir_path())
+        curve.write_curve_to_file(os.path.join(temp_dir, "two_lines.crv"))
+        result = core_curve.write_curve_pack(target_dir=temp_dir)
+        self.assertTrue(os.path.exists(result))
+        expected = core_curve.read_json_dict(os.path.join(temp_dir, "two_lines.crv"))
+        result = core_curve.read_curve_data_from_pack("two_lines", curve_dir=temp_dir)
+        self.assertEqual(expected, result)
+
+    def test_read_curve_data_from_pack_modified_file(self):
+        temp_dir = maya_test_tools.generate_test_temp_dir()
+        file_path = os.path.join(temp_dir, "two_lines.crv")
+        curve = core_curve.get_curve(file_name="two_lines", curve_dir=maya_test_tools.get_data_dir_path())
+        curve.write_curve_to_file(file_path)
+        core_curve.write_curve_pack(target_dir=temp_dir)
+        self.assertIsNotNone(core_curve.read_curve_data_from_pack("two_lines", curve_dir=temp_dir))
+        curve_data = core_curve.read_json_dict(file_path)
+        curve_data["shapes"][0]["points"][0] = [1.0, 2.0, 3.0]
+        core_curve.write_json(path=file_path, data=curve_data)
+        self.assertIsNone(core_curve.read_curve_data_from_pack("two_lines", curve_dir=temp_dir))
+        lazy_curve = core_curve.LazyCurve(file_name="two_lines", curve_dir=temp_dir)
+        lazy_curve.load()
+        self.assertEqual([1.0, 2.0, 3.0], lazy_curve.shapes[0].points[0])
+
+    def test_read_curve_data_from_pack_missing(self):
+        result = core_curve.read_curve_data_from_pack("mocked_missing_file")
+        self.assertIsNone(result)
+
     @patch("sys.stdout", new_callable=StringIO)
     def test_print_code_for_crv_files(self, mocked_stdout):
         data_dir = maya_test_tools.get_data_dir_path()
         result = core_curve.print_code_for_crv_files(target_dir=data_dir, use_output_window=False)
-        expected = 'two_lines = get_curve(file_name="two_lines")'
+        expected = 'two_lines = LazyCurve(file_name="two_lines")'
         self.assertEqual(expected, result)
 
     @patch("sys.stdout", new_callable=StringIO)
@@ -725,7 +806,7 @@ class TestCurveCore(unittest.TestCase):
             with open(file_path, "w"):
                 pass
         result = core_curve.print_code_for_crv_files(target_dir=temp_dir, ignore_private=True, use_output_window=False)
-        expected = 'public = get_curve(file_name="public")'
+        expected = 'public = LazyCurve(file_name="public")'
         self.assertEqual(expected, result)
 
     @patch("sys.stdout", new_callable=StringIO)
@@ -737,7 +818,7 @@ class TestCurveCore(unittest.TestCase):
             with open(file_path, "w"):
                 pass
         result = core_curve.print_code_for_crv_files(target_dir=temp_dir, ignore_private=False, use_output_window=False)
-        expected = 'public = get_curve(file_name="public")\n_private = get_curve(file_name="_private")'
+        expected = 'public = LazyCurve(file_name="public")\n_private = LazyCurve(file_name="_private")'
         self.assertEqual(expected, result)
 
     def test_create_text(self):
@@ -373,3 +373,32 @@ class TestDataIOCore(unittest.TestCase):
         expected = True
         result = core_io.is_json_serializable(["list", {"key": "value"}])
         self.assertEqual(expected, result)
+
+    def test_array_to_bytes_and_back(self):
+        values = [0.5, -1.25, 3.0]
+        data = core_io.array_to_bytes(values, typecode="d")
+        self.assertEqual(24, len(data))
+        result = core_io.bytes_to_array(data, typecode="d").tolist()
+        self.assertEqual(values, result)
+
+    def test_write_and_read_packed_file(self):
+        packed_path = os.path.join(self.temp_dir, "test_file.pack")
+        header = {"items": {"a": {"offset": 0, "length": 16}, "b": {"offset": 16, "length": 8}}}
+        data = core_io.array_to_bytes([1.0, 2.0, 3.0], typecode="d")
+        result = core_io.write_packed_file(packed_path, header=header, data=data)
+        self.assertEqual(packed_path, result)
+        self.assertTrue(core_io.is_packed_file(packed_path))
+        read_header, data_start = core_io.read_packed_file_header(packed_path)
+        self.assertEqual(header, read_header)
+        item_b = core_io.read_packed_file_data(packed_path, data_start, offset=16, length=8)
+        self.assertEqual([3.0], core_io.bytes_to_array(item_b).tolist())
+        everything = core_io.read_packed_file_data(packed_path, data_start)
+        self.assertEqual(data, everything)
+
+    def test_read_packed_file_header_invalid_file(self):
+        core_io.write_json(path=self.file_path, data=self.mocked_dict)
+        self.assertFalse(core_io.is_packed_file(self.file_path))
+        logging.disable(logging.WARNING)
+        result = core_io.read_packed_file_header(self.file_path)
+        logging.disable(logging.NOTSET)
+        self.assertEqual(({}, None), result)
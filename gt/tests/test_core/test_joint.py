@@ -183,6 +183,67 @@ class TestJointCore(unittest.TestCase):
             self.assertAlmostEqualSigFig(0, jnt_y, tolerance=3)
             self.assertAlmostEqualSigFig(0, jnt_z, tolerance=3)
 
+    def create_orient_test_chain(self):
+        """
+        Creates a zig-zag chain (so the up direction flips when detected) with an extra locator under a joint.
+        Returns:
+            list: Joints in the chain. (The locator is not included)
+        """
+        cmds.select(clear=True)
+        joints = []
+        for index, position in enumerate([(0, 0, 0), (3, 1, -3), (6, -1, -5), (8, 2, -9), (9, 0, -12)]):
+            joints.append(cmds.joint(name=f"chain_{index}_jnt", position=position))
+        cmds.parent(joints[0], cmds.group(name="chain_grp", empty=True, world=True))
+        locator = cmds.spaceLocator(name="chain_loc")[0]
+        cmds.parent(locator, joints[2])
+        cmds.setAttr(f"{locator}.t", 1, 2, 3)
+        cmds.setAttr(f"{locator}.r", 10, 20, 30)
+        return joints
+
+    def get_orient_results(self, joints):
+        """
+        Gets the world matrices and rotation of the provided joints and the test locator.
+        (Orientation is compared through the world matrix, as the same joint orient can be described in more than
+        one way. e.g. (180, -45, 180) and (0, 225, 0))
+        """
+        results = {}
+        for obj in joints + ["chain_loc"]:
+            world_matrix = cmds.xform(obj, query=True, matrix=True, worldSpace=True)
+            results[obj] = list(world_matrix)
+            if cmds.nodeType(obj) == "joint":
+                results[obj] += list(cmds.getAttr(f"{obj}.rotate")[0])
+        return results
+
+    def assert_orient_solver_matches_constraints(self, **kwargs):
+        joints = self.create_orient_test_chain()
+        core_joint.orient_joint(joint_list=joints, use_constraints=True, **kwargs)
+        expected = self.get_orient_results(joints)
+        maya_test_tools.force_new_scene()
+        joints = self.create_orient_test_chain()
+        core_joint.orient_joint(joint_list=joints, use_constraints=False, **kwargs)
+        result = self.get_orient_results(joints)
+        for obj, expected_values in expected.items():
+            for expected_value, value in zip(expected_values, result.get(obj)):
+                self.assertAlmostEqual(expected_value, value, places=3)
+
+    def test_orient_joint_solver_matches_constraints(self):
+        self.assert_orient_solver_matches_constraints(aim_axis=(1, 0, 0), up_axis=(0, 1, 0), up_dir=(0, 1, 0))
+
+    def test_orient_joint_solver_matches_constraints_aim_z_up_x(self):
+        self.assert_orient_solver_matches_constraints(aim_axis=(0, 0, -1), up_axis=(1, 0, 0), up_dir=(0, 0, 1))
+
+    def test_orient_joint_solver_matches_constraints_detect_up_dir(self):
+        self.assert_orient_solver_matches_constraints(detect_up_dir=True)
+
+    def test_orient_joint_solver_matches_constraints_world_aligned(self):
+        self.assert_orient_solver_matches_constraints(aim_axis=(-1, 0, 0), world_aligned=True)
+
+    def test_orient_joint_solver_no_temporary_nodes(self):
+        joints = self.create_orient_test_chain()
+        nodes_before = cmds.ls()
+        core_joint.orient_joint(joint_list=joints)
+        self.assertEqual(nodes_before, cmds.ls())
+
     def test_copy_parent_orients(self):
         joint_one = cmds.joint(name="one_jnt")
         cmds.select(clear=True)
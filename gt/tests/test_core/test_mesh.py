@@ -17,6 +17,7 @@ for to_append in [package_root_dir, tests_dir]:
         sys.path.append(to_append)
 from gt.tests import maya_test_tools
 from gt.core import mesh as core_mesh
+cmds = maya_test_tools.cmds
 
 
 class TestMeshCore(unittest.TestCase):
@@ -281,3 +282,93 @@ class TestMeshCore(unittest.TestCase):
         expected = ("FaceComponents(vertices=['pCube1.vtx[0]', 'pCube1.vtx[1]', 'pCube1.vtx[2]', "
                     "'pCube1.vtx[3]'], edges=['pCube1.e[0]', 'pCube1.e[1]', 'pCube1.e[4]', 'pCube1.e[5]'])")
         self.assertEqual(expected, str(result))
+
+    def test_get_symmetry_indices(self):
+        points = [(1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, -1, 0)]
+        result = core_mesh.get_symmetry_indices(points, axis="x")
+        expected = ([2, 1, 0, 3], [])
+        self.assertEqual(expected, result)
+
+    def test_get_symmetry_indices_axis_y(self):
+        points = [(1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, -1, 0)]
+        result = core_mesh.get_symmetry_indices(points, axis="y")
+        expected = ([0, 3, 2, 1], [])
+        self.assertEqual(expected, result)
+
+    def test_get_symmetry_indices_unmatched(self):
+        points = [(1, 0, 0), (-1.5, 0, 0)]
+        result = core_mesh.get_symmetry_indices(points, axis="x", tolerance=0.01)
+        expected = ([1, 0], [0, 1])
+        self.assertEqual(expected, result)
+
+    def test_get_symmetry_indices_offset(self):
+        points = [(4, 0, 0), (6, 0, 0), (5, 1, 0), (5, -1, 0)]  # Mirrored positions are far from every point
+        result = core_mesh.get_symmetry_indices(points, axis="x")
+        expected = ([0, 0, 0, 0], [0, 1, 2, 3])
+        self.assertEqual(expected, result)
+
+    def test_get_symmetry_indices_half(self):
+        points = [(0, 1, 0), (0.5, 0.5, 0), (1, 0.2, 0), (0.5, -0.5, 0), (0, -1, 0)]  # Only the positive side
+        result = core_mesh.get_symmetry_indices(points, axis="x")
+        expected = ([0, 0, 0, 4, 4], [1, 2, 3])
+        self.assertEqual(expected, result)
+
+    def test_get_symmetry_indices_invalid_axis(self):
+        with self.assertRaises(ValueError):
+            core_mesh.get_symmetry_indices([(1, 0, 0)], axis="w")
+
+    def test_get_symmetry_sides(self):
+        points = [(1, 0, 0), (0.0001, 1, 0), (-1, 0, 0)]
+        result = core_mesh.get_symmetry_sides(points, axis="x", tolerance=0.001)
+        expected = [1, 0, -1]
+        self.assertEqual(expected, result)
+
+    def test_get_symmetry_map(self):
+        sphere = maya_test_tools.create_poly_sphere()
+        symmetry_map = core_mesh.get_symmetry_map(sphere, axis="x", use_cache=False)
+        self.assertEqual(len(cmds.ls(f"{sphere}.vtx[*]", flatten=True)), len(symmetry_map))
+        self.assertEqual([], symmetry_map.unmatched_indices)
+        self.assertEqual(len(symmetry_map), len(symmetry_map.sides))
+        for index in [0, 5, 25, 100]:
+            position = cmds.pointPosition(f"{sphere}.vtx[{index}]", local=True)
+            mirrored_position = cmds.pointPosition(f"{sphere}.vtx[{symmetry_map.get_mirrored_index(index)}]",
+                                                   local=True)
+            self.assertAlmostEqual(-position[0], mirrored_position[0], places=3)
+            self.assertAlmostEqual(position[1], mirrored_position[1], places=3)
+            self.assertAlmostEqual(position[2], mirrored_position[2], places=3)
+
+    def test_get_symmetry_map_cached(self):
+        sphere = maya_test_tools.create_poly_sphere()
+        core_mesh.clear_symmetry_map_cache()
+        symmetry_map = core_mesh.get_symmetry_map(sphere)
+        result = core_mesh.get_symmetry_map(sphere)
+        self.assertIs(symmetry_map, result)
+        cmds.polySmooth(sphere)  # Topology changed, map is rebuilt
+        result = core_mesh.get_symmetry_map(sphere)
+        self.assertIsNot(symmetry_map, result)
+
+    def test_get_symmetry_map_cached_points_changed(self):
+        sphere = maya_test_tools.create_poly_sphere()
+        core_mesh.clear_symmetry_map_cache()
+        symmetry_map = core_mesh.get_symmetry_map(sphere)
+        cmds.move(0.5, 0, 0, f"{sphere}.vtx[*]", relative=True)  # Same topology, but points moved
+        result = core_mesh.get_symmetry_map(sphere)
+        self.assertIsNot(symmetry_map, result)
+        self.assertTrue(result.unmatched_indices)
+
+    def test_symmetry_map_mirror_values(self):
+        symmetry_map = core_mesh.SymmetryMap(mesh="mocked_mesh", mirror_indices=[2, 1, 0])
+        self.assertEqual({2: 0.5, 1: 1.0}, symmetry_map.mirror_index_values({0: 0.5, 1: 1.0}))
+        self.assertEqual([3, 2, 1], symmetry_map.flip_values([1, 2, 3]))
+        self.assertEqual("mocked_mesh.vtx[2]", symmetry_map.get_mirrored_component("mocked_mesh.vtx[0]"))
+        with self.assertRaises(ValueError):
+            symmetry_map.flip_values([1, 2])
+
+    def test_symmetry_map_sides(self):
+        symmetry_map = core_mesh.SymmetryMap(mesh="mocked_mesh", mirror_indices=[2, 1, 0], sides=[-1, 0, 1])
+        self.assertEqual(0, symmetry_map.get_axis_index())
+        self.assertEqual([2], symmetry_map.get_side_indices(1))
+        self.assertEqual({2: 1.0, 1: 0.5}, symmetry_map.get_side_weights(1))
+        self.assertEqual({0: 1.0}, symmetry_map.get_side_weights(-1, center_weight=0))
+        with self.assertRaises(ValueError):
+            core_mesh.SymmetryMap(mesh="mocked_mesh", mirror_indices=[0]).get_side_indices(1)
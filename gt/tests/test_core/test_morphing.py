@@ -0,0 +1,259 @@
+import unittest
+import logging
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Utility and Maya Test Tools
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from gt.tests import maya_test_tools
+from gt.core import morphing as core_morph
+from gt.core import mesh as core_mesh
+
+cmds = maya_test_tools.cmds
+
+
+def create_test_blend_shape():
+    """
+    Creates a plane (symmetric in X) with a blend shape node and a target ("raise_vtx") moving one vertex up.
+    The target mesh is deleted, so the deltas are only stored in the blend shape node.
+    Returns:
+        tuple: Name of the base mesh, name of the blend shape node and index of the moved vertex.
+    """
+    base = cmds.polyPlane(width=2, height=2, subdivisionsX=4, subdivisionsY=4, constructionHistory=False, name="base")
+    base = base[0]
+    target = cmds.duplicate(base, name="raise_vtx")[0]
+    moved_vertex = 9  # Positive X
+    cmds.move(0, 1, 0, f"{target}.vtx[{moved_vertex}]", relative=True, objectSpace=True)
+    blend_node = cmds.blendShape(target, base, name="blend")[0]
+    cmds.delete(target)
+    return base, blend_node, moved_vertex
+
+
+class TestMorphingCore(unittest.TestCase):
+    def setUp(self):
+        maya_test_tools.force_new_scene()
+        core_mesh.clear_symmetry_map_cache()
+
+    def tearDown(self):
+        maya_test_tools.delete_test_temp_dir()
+
+    @classmethod
+    def setUpClass(cls):
+        maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+
+    def assertDeltaAlmostEqual(self, expected, result):
+        for expected_value, value in zip(expected, result):
+            self.assertAlmostEqual(expected_value, value, places=5)
+
+    def test_get_blend_target_names(self):
+        _, blend_node, _ = create_test_blend_shape()
+        result = core_morph.get_blend_target_names(blend_node)
+        expected = {"raise_vtx": 0}
+        self.assertEqual(expected, result)
+
+    def test_get_blend_target_data(self):
+        _, blend_node, moved_vertex = create_test_blend_shape()
+        result = core_morph.get_blend_target_data(blend_node, "raise_vtx")
+        self.assertEqual("raise_vtx", result.get_name())
+        self.assertEqual([moved_vertex], list(result.get_indices()))
+        self.assertDeltaAlmostEqual((0, 1, 0), result.get_delta(moved_vertex))
+        result_by_index = core_morph.get_blend_target_data(blend_node, 0)
+        self.assertEqual("raise_vtx", result_by_index.get_name())
+
+    def test_get_blend_target_data_missing(self):
+        _, blend_node, _ = create_test_blend_shape()
+        with self.assertRaises(ValueError):
+            core_morph.get_blend_target_data(blend_node, "missing_target")
+
+    def test_get_blend_shape_data(self):
+        _, blend_node, _ = create_test_blend_shape()
+        result = core_morph.get_blend_shape_data(blend_node)
+        self.assertEqual(["raise_vtx"], result.get_target_names())
+        self.assertEqual(25, result.vertex_count)
+
+    def test_set_blend_target_data_new_target(self):
+        base, blend_node, _ = create_test_blend_shape()
+        meshes = cmds.ls(type="mesh")
+        original_position = cmds.pointPosition(f"{base}.vtx[1]", local=True)
+        target_data = core_morph.BlendTargetData(name="push_vtx", indices=[0, 1], deltas=[0, 0, 1, 0, 0, 2], weight=1)
+        result = core_morph.set_blend_target_data(blend_node, target_data, set_weight=True)
+        self.assertEqual(f"{blend_node}.push_vtx", result)
+        self.assertEqual(meshes, cmds.ls(type="mesh"))  # No meshes were created
+        self.assertEqual({"raise_vtx": 0, "push_vtx": 1}, core_morph.get_blend_target_names(blend_node))
+        target_groups = cmds.getAttr(f"{blend_node}.inputTarget[0].inputTargetGroup", multiIndices=True)
+        self.assertEqual([0, 1], target_groups)  # Registered as a target, not only as a weight alias
+        self.assertEqual([], cmds.listConnections(f"{blend_node}.inputTarget", source=True) or [])
+        read_data = core_morph.get_blend_target_data(blend_node, "push_vtx")
+        self.assertEqual([0, 1], list(read_data.get_indices()))
+        position = cmds.pointPosition(f"{base}.vtx[1]", local=True)
+        self.assertAlmostEqual(original_position[2] + 2, position[2], places=5)
+
+    def test_set_blend_target_data_replace(self):
+        _, blend_node, _ = create_test_blend_shape()
+        target_data = core_morph.BlendTargetData(name="raise_vtx", indices=[3], deltas=[0, 2, 0])
+        core_morph.set_blend_target_data(blend_node, target_data)
+        self.assertEqual({"raise_vtx": 0}, core_morph.get_blend_target_names(blend_node))
+        result = core_morph.get_blend_target_data(blend_node, "raise_vtx")
+        self.assertEqual([3], list(result.get_indices()))
+        self.assertDeltaAlmostEqual((0, 2, 0), result.get_delta(3))
+
+    def test_get_blend_shape_base_mesh(self):
+        base, blend_node, _ = create_test_blend_shape()
+        result = core_morph.get_blend_shape_base_mesh(blend_node)
+        self.assertTrue(cmds.getAttr(f"{result}.intermediateObject"))
+        self.assertEqual([base], cmds.listRelatives(result, parent=True))
+        with self.assertRaises(ValueError):
+            core_morph.get_blend_shape_base_mesh(blend_node, base_index=1)
+
+    def test_get_blend_shape_symmetry_map(self):
+        base, blend_node, moved_vertex = create_test_blend_shape()
+        cmds.setAttr(f"{blend_node}.raise_vtx", 1)  # Target weights don't affect the symmetry
+        result = core_morph.get_blend_shape_symmetry_map(blend_node, axis="x")
+        self.assertEqual(25, len(result))
+        self.assertEqual([], result.unmatched_indices)
+        mirror_vertex = result.get_mirrored_index(moved_vertex)
+        position = cmds.pointPosition(f"{base}.vtx[{moved_vertex}]", local=True)
+        mirror_position = cmds.pointPosition(f"{base}.vtx[{mirror_vertex}]", local=True)
+        self.assertAlmostEqual(position[0], -mirror_position[0], places=5)
+        self.assertAlmostEqual(position[2], mirror_position[2], places=5)
+        self.assertEqual(1, result.sides[moved_vertex])
+        self.assertEqual(-1, result.sides[mirror_vertex])
+        self.assertIs(result, core_morph.get_blend_shape_symmetry_map(blend_node, axis="x"))  # Cached
+
+    def test_get_blend_shape_symmetry_map_points_changed(self):
+        _, blend_node, _ = create_test_blend_shape()
+        result = core_morph.get_blend_shape_symmetry_map(blend_node, axis="x")
+        base_mesh = core_morph.get_blend_shape_base_mesh(blend_node)
+        cmds.move(0.5, 0, 0, f"{base_mesh}.vtx[*]", relative=True)  # Same topology, but the original points moved
+        rebuilt = core_morph.get_blend_shape_symmetry_map(blend_node, axis="x")
+        self.assertIsNot(result, rebuilt)
+        self.assertTrue(rebuilt.unmatched_indices)
+
+    def test_blend_target_data_flip_mirror_unmatched(self):
+        symmetry_map = core_mesh.SymmetryMap(
+            mesh="mocked_mesh", mirror_indices=[2, 1, 0, 0], unmatched_indices=[3], sides=[-1, 0, 1, -1]
+        )
+        target = core_morph.BlendTargetData(name="a", indices=[0, 3], deltas=[1, 0, 0, 0, 1, 0])
+        logging.disable(logging.WARNING)
+        try:
+            flipped = target.get_flipped(symmetry_map)
+            mirrored = target.get_mirrored(symmetry_map, direction="-")
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual({2: (-1, 0, 0)}, flipped.to_dict())  # Unmatched vertex is not flipped
+        self.assertEqual({0: (1, 0, 0), 2: (-1, 0, 0), 3: (0, 1, 0)}, mirrored.to_dict())  # Kept, not copied
+        self.assertEqual({0: (1, 0, 0), 3: (0, 1, 0)}, target.to_dict())  # Source is not modified
+
+    def test_flip_blend_target(self):
+        base, blend_node, moved_vertex = create_test_blend_shape()
+        mirror_vertex = core_morph.get_blend_shape_symmetry_map(blend_node).get_mirrored_index(moved_vertex)
+        result = core_morph.flip_blend_target(blend_node, "raise_vtx", new_name="raise_vtx_flipped")
+        self.assertEqual(f"{blend_node}.raise_vtx_flipped", result)
+        flipped = core_morph.get_blend_target_data(blend_node, "raise_vtx_flipped")
+        self.assertEqual([mirror_vertex], list(flipped.get_indices()))
+        cmds.setAttr(result, 1)
+        self.assertAlmostEqual(1, cmds.pointPosition(f"{base}.vtx[{mirror_vertex}]", local=True)[1], places=5)
+        item_path = f"{blend_node}.inputTarget[0].inputTargetGroup[1].inputTargetItem[6000]"
+        self.assertIsNone(cmds.listConnections(f"{item_path}.inputGeomTarget"))  # No temporary geometry
+
+    def test_flip_blend_target_one_sided(self):
+        _, blend_node, _ = create_test_blend_shape()
+        base_mesh = core_morph.get_blend_shape_base_mesh(blend_node)
+        cmds.move(5, 0, 0, f"{base_mesh}.vtx[*]", relative=True)  # Every vertex on the positive side (e.g. L_eye)
+        logging.disable(logging.WARNING)
+        try:
+            result = core_morph.flip_blend_target(blend_node, "raise_vtx", new_name="raise_vtx_flipped")
+        finally:
+            logging.disable(logging.NOTSET)
+        flipped = core_morph.get_blend_target_data(blend_node, "raise_vtx_flipped")
+        self.assertEqual(0, flipped.get_point_count())  # No vertex has a mirrored vertex within the tolerance
+        self.assertEqual(f"{blend_node}.raise_vtx_flipped", result)
+
+    def test_mirror_blend_target(self):
+        _, blend_node, moved_vertex = create_test_blend_shape()
+        mirror_vertex = core_morph.get_blend_shape_symmetry_map(blend_node).get_mirrored_index(moved_vertex)
+        core_morph.mirror_blend_target(blend_node, "raise_vtx", new_name="both_sides", direction="+")
+        result = core_morph.get_blend_target_data(blend_node, "both_sides")
+        self.assertEqual(sorted([moved_vertex, mirror_vertex]), list(result.get_indices()))
+        core_morph.mirror_blend_target(blend_node, "raise_vtx", new_name="no_sides", direction="-")
+        result = core_morph.get_blend_target_data(blend_node, "no_sides")
+        self.assertEqual(0, result.get_point_count())
+
+    def test_blend_target_data_operations(self):
+        target = core_morph.BlendTargetData(name="a", indices=[1, 3], deltas=[1, 0, 0, 0, 2, 0])
+        scaled = target.get_scaled(0.5, name="a_half")
+        self.assertEqual("a_half", scaled.get_name())
+        self.assertEqual((0, 1, 0), scaled.get_delta(3))
+        other = core_morph.BlendTargetData(name="b", indices=[3, 4], deltas=[0, 1, 0, 0, 0, 1])
+        combined = core_morph.combine_blend_targets([target, other], name="c")
+        self.assertEqual({1: (1, 0, 0), 3: (0, 3, 0), 4: (0, 0, 1)}, combined.to_dict())
+        extracted = combined.get_extracted({3: 0.5, 4: 1.0})
+        self.assertEqual({3: (0, 1.5, 0), 4: (0, 0, 1)}, extracted.to_dict())
+        dense = target.to_dense(vertex_count=5)
+        self.assertEqual(15, len(dense))
+        self.assertEqual(target.to_dict(), core_morph.BlendTargetData.from_dense(dense).to_dict())
+
+    def test_blend_shape_data_combined_target(self):
+        target = core_morph.BlendTargetData(name="a", indices=[1], deltas=[1, 0, 0], weight=0.5)
+        other = core_morph.BlendTargetData(name="b", indices=[1], deltas=[0, 1, 0], weight=0)
+        blend_shape_data = core_morph.BlendShapeData(targets=[target, other], vertex_count=2)
+        self.assertEqual({1: (0.5, 0, 0)}, blend_shape_data.get_combined_target("state").to_dict())
+        result = blend_shape_data.get_combined_target("state", weights={"b": 2})
+        self.assertEqual({1: (0, 2, 0)}, result.to_dict())
+
+    def test_write_read_blend_shape_library(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        file_path = os.path.join(test_temp_dir, f"library.{core_morph.BLEND_SHAPE_LIBRARY_EXTENSION}")
+        target = core_morph.BlendTargetData(name="a", indices=[1, 3], deltas=[0.1, 0, 0, 0, 0.2, 0], weight=0.25)
+        other = core_morph.BlendTargetData(name="b", indices=[2], deltas=[0, 0, 1])
+        blend_shape_data = core_morph.BlendShapeData(targets=[target, other], vertex_count=5, mesh="head")
+        result = core_morph.write_blend_shape_library(file_path, blend_shape_data)
+        self.assertEqual(file_path, result)
+        header = core_morph.read_blend_shape_library_header(file_path)
+        self.assertEqual("head", header.get("mesh"))
+        self.assertEqual(["a", "b"], [target_header.get("name") for target_header in header.get("targets")])
+
+        result = core_morph.read_blend_shape_library(file_path)
+        self.assertEqual(["a", "b"], result.get_target_names())
+        self.assertEqual(5, result.vertex_count)
+        self.assertEqual(0.25, result.get_target("a").weight)
+        self.assertEqual([1, 3], list(result.get_target("a").get_indices()))
+        self.assertDeltaAlmostEqual((0, 0.2, 0), result.get_target("a").get_delta(3))
+
+        result = core_morph.read_blend_shape_library(file_path, target_names=["b"])
+        self.assertEqual(["b"], result.get_target_names())
+
+    def test_export_import_blend_shape_library(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        file_path = os.path.join(test_temp_dir, f"library.{core_morph.BLEND_SHAPE_LIBRARY_EXTENSION}")
+        _, blend_node, moved_vertex = create_test_blend_shape()
+        core_morph.export_blend_shape_library(blend_node, file_path)
+
+        other_base = cmds.polyPlane(width=2, height=2, subdivisionsX=4, subdivisionsY=4, constructionHistory=False)[0]
+        other_blend_node = cmds.blendShape(other_base, name="other_blend")[0]
+        result = core_morph.import_blend_shape_library(other_blend_node, file_path)
+        self.assertEqual([f"{other_blend_node}.raise_vtx"], result)
+        cmds.setAttr(f"{other_blend_node}.raise_vtx", 1)
+        self.assertAlmostEqual(1, cmds.pointPosition(f"{other_base}.vtx[{moved_vertex}]", local=True)[1], places=5)
+
+    def test_read_blend_shape_library_invalid_file(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        file_path = os.path.join(test_temp_dir, "invalid.bsl")
+        with open(file_path, "w") as file:
+            file.write("not a library")
+        logging.disable(logging.WARNING)
+        try:
+            self.assertIsNone(core_morph.read_blend_shape_library(file_path))
+            self.assertEqual({}, core_morph.read_blend_shape_library_header(file_path))
+        finally:
+            logging.disable(logging.NOTSET)
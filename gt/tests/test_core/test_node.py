@@ -288,3 +288,35 @@ class TestNodeCore(unittest.TestCase):
         self.assertEqual(expected, result_one)
         self.assertEqual(expected, result_two)
         self.assertFalse(cmds.objExists("mockedName1"))
+
+    def test_node_cached_path_updates(self):
+        cube_one = maya_test_tools.create_poly_cube()
+        group = cmds.group(name="group", empty=True, world=True)
+        a_node = Node(path=cube_one)
+        expected = "|pCube1"
+        self.assertEqual(expected, str(a_node))
+        cmds.parent(a_node, group)
+        expected = "|group|pCube1"
+        self.assertEqual(expected, str(a_node))
+        cmds.rename(group, "mockedGroup")
+        expected = "|mockedGroup|pCube1"
+        self.assertEqual(expected, str(a_node))
+
+    def test_node_deleted_and_undo(self):
+        cube_one = maya_test_tools.create_poly_cube()
+        a_node = Node(path=cube_one)
+        cmds.undoInfo(stateWithoutFlush=True)
+        cmds.delete(cube_one)
+        self.assertFalse(a_node.exists())
+        self.assertEqual("", str(a_node))
+        cmds.undo()
+        self.assertTrue(a_node.exists())
+        self.assertEqual("|pCube1", str(a_node))
+
+    def test_node_copy(self):
+        import copy
+        cube_one = maya_test_tools.create_poly_cube()
+        a_node = Node(path=cube_one)
+        copied_node = copy.deepcopy(a_node)
+        self.assertEqual(a_node.get_uuid(), copied_node.get_uuid())
+        self.assertEqual("|pCube1", str(copied_node))
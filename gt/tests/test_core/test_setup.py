@@ -99,6 +99,8 @@ class TestSetupCore(unittest.TestCase):
         target_result = sorted(os.listdir(target_dir))
         target_expected = sorted(["dir_one", "dir_two", "empty.py"])
         self.assertEqual(target_expected, target_result)
+        source_mtime = os.path.getmtime(requirement_py)
+        self.assertEqual(source_mtime, os.path.getmtime(os.path.join(target_dir, "empty.py")))
 
     def test_remove_previous_install(self):
         test_temp_dir = maya_test_tools.generate_test_temp_dir()  # Create test elements
@@ -163,6 +165,66 @@ class TestSetupCore(unittest.TestCase):
         expected = True
         self.assertEqual(expected, result)
 
+    def create_mocked_package(self, root_dir, files):
+        """Creates files (relative path: content) inside the root directory"""
+        for relative_path, content in files.items():
+            file_path = os.path.join(root_dir, *relative_path.split("/"))
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "w") as file:
+                file.write(content)
+
+    def test_build_package_manifest(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        source_dir = os.path.join(test_temp_dir, "source_dir")
+        self.create_mocked_package(
+            source_dir, {"gt/__init__.py": "init", "gt/core/io.py": "io", "gt/core/io.pyc": "", "gt/tests/t.py": ""}
+        )
+        result = core_setup.build_package_manifest({"gt": os.path.join(source_dir, "gt")}, use_hash=True)
+        expected = ["gt/__init__.py", "gt/core/io.py"]
+        self.assertEqual(expected, sorted(result))
+        self.assertEqual(4, result.get("gt/__init__.py").get("size"))
+        self.assertIn("mtime", result.get("gt/__init__.py"))
+        self.assertIn("hash", result.get("gt/__init__.py"))
+
+    def test_copy_package_requirements_incremental(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        source_dir = os.path.join(test_temp_dir, "source_dir")
+        target_dir = os.path.join(test_temp_dir, "target_dir")
+        self.create_mocked_package(source_dir, {"gt/__init__.py": "init", "gt/core/io.py": "io"})
+        self.create_mocked_package(target_dir, {"gt/core/io.py": "old_io", "gt/stale/stale.py": "stale"})
+        requirements = {"gt": os.path.join(source_dir, "gt")}
+        core_setup.copy_package_requirements_incremental(target_folder=target_dir, package_requirements=requirements)
+        with open(os.path.join(target_dir, "gt", "core", "io.py"), "r") as file:
+            self.assertEqual("io", file.read())
+        self.assertTrue(os.path.exists(os.path.join(target_dir, "gt", "__init__.py")))
+        self.assertFalse(os.path.exists(os.path.join(target_dir, "gt", "stale")))
+
+    def test_copy_package_requirements_incremental_unchanged(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        source_dir = os.path.join(test_temp_dir, "source_dir")
+        target_dir = os.path.join(test_temp_dir, "target_dir")
+        os.makedirs(target_dir)
+        self.create_mocked_package(source_dir, {"gt/__init__.py": "init"})
+        requirements = {"gt": os.path.join(source_dir, "gt")}
+        core_setup.copy_package_requirements_incremental(target_folder=target_dir, package_requirements=requirements)
+        with patch("shutil.copy2") as mocked_copy:
+            core_setup.copy_package_requirements_incremental(
+                target_folder=target_dir, package_requirements=requirements
+            )
+            mocked_copy.assert_not_called()
+
+    def test_check_installation_integrity_manifest(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        files = {f"{core_setup.PACKAGE_MAIN_MODULE}/{name}/__init__.py": "" for name in core_setup.PACKAGE_DIRS}
+        self.create_mocked_package(test_temp_dir, files)
+        requirements = {core_setup.PACKAGE_MAIN_MODULE: os.path.join(test_temp_dir, core_setup.PACKAGE_MAIN_MODULE)}
+        manifest = core_setup.build_package_manifest(requirements)
+        core_setup.write_package_manifest(test_temp_dir, manifest)
+        self.assertEqual(manifest, core_setup.read_package_manifest(test_temp_dir))
+        self.assertTrue(core_setup.check_installation_integrity(package_target_folder=test_temp_dir))
+        os.remove(os.path.join(test_temp_dir, *list(files)[0].split("/")))
+        self.assertFalse(core_setup.check_installation_integrity(package_target_folder=test_temp_dir))
+
     @patch("gt.core.setup.get_available_maya_preferences_dirs")
     def test_generate_scripts_dir_list_invalid_preferences(self, mock_get_preferences):
         mock_get_preferences.return_value = {"1234": "invalid_path"}
@@ -125,6 +125,80 @@ class TestSkinCore(unittest.TestCase):
         result = core_skin.get_skin_weights("plane")
         self.assertEqual(skin_data, result)
 
+    def test_get_skin_weights_data(self):
+        import_skinned_test_file()
+        result = core_skin.get_skin_weights_data("plane")
+        self.assertEqual(["root_jnt", "mid_jnt", "end_jnt"], result.get_influences())
+        self.assertEqual(6, result.get_vertex_count())
+        self.assertEqual([1.0, 0.0, 0.0], result.get_vertex_weights(0))
+        self.assertEqual([0.0, 0.0, 1.0, 1.0, 0.0, 0.0], result.get_influence_weights("mid_jnt"))
+
+    def test_skin_weights_data_dict_conversion(self):
+        skin_data = {
+            0: {"root_jnt": 0.75, "mid_jnt": 0.25},
+            1: {"mid_jnt": 1.0},
+            2: {"end_jnt": 1.0},
+        }
+        weights_data = core_skin.SkinWeightsData.from_dict(skin_data, influences=["root_jnt", "mid_jnt", "end_jnt"])
+        expected = [0.75, 0.25, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+        self.assertEqual(expected, weights_data.get_weights().tolist())
+        self.assertEqual(skin_data, weights_data.to_dict())
+
+    def test_skin_weights_data_dict_conversion_string_keys(self):
+        skin_data = {"0": {"root_jnt": 1.0}, "1": {"mid_jnt": 1.0}}
+        weights_data = core_skin.SkinWeightsData.from_dict(skin_data)
+        self.assertEqual(["mid_jnt", "root_jnt"], weights_data.get_influences())
+        self.assertEqual({0: {"root_jnt": 1.0}, 1: {"mid_jnt": 1.0}}, weights_data.to_dict())
+
+    def test_skin_weights_data_get_remapped(self):
+        weights_data = core_skin.SkinWeightsData(weights=[0.75, 0.25, 0.0, 1.0], influences=["root_jnt", "mid_jnt"])
+        result = weights_data.get_remapped(influences=["mid_jnt", "end_jnt", "root_jnt"])
+        expected = [0.25, 0.0, 0.75, 1.0, 0.0, 0.0]
+        self.assertEqual(expected, result.get_weights().tolist())
+
+    def test_set_skin_weights_data(self):
+        import_skinned_test_file()
+        skin_data = {
+            0: {"root_jnt": 1.0},
+            1: {"root_jnt": 1.0},
+            2: {"root_jnt": 0.5, "mid_jnt": 0.5},
+            3: {"mid_jnt": 1.0},
+            4: {"end_jnt": 1.0},
+            5: {"end_jnt": 1.0},
+        }
+        weights_data = core_skin.SkinWeightsData.from_dict(skin_data)
+        core_skin.set_skin_weights_data("plane", skin_weights_data=weights_data, remove_unused_inf=False)
+        result = core_skin.get_skin_weights("plane")
+        self.assertEqual(skin_data, result)
+
+    def test_skin_weights_data_get_used_influences(self):
+        weights_data = core_skin.SkinWeightsData(
+            weights=[0.75, 0.0, 0.25, 0.0, 0.0, 1.0], influences=["root_jnt", "mid_jnt", "end_jnt"]
+        )
+        self.assertEqual(["root_jnt", "end_jnt"], weights_data.get_used_influences())
+
+    def test_set_skin_weights_data_unused_influence_missing(self):
+        import_skinned_test_file()
+        skin_data = {
+            0: {"root_jnt": 1.0},
+            1: {"root_jnt": 1.0},
+            2: {"root_jnt": 0.5, "mid_jnt": 0.5},
+            3: {"mid_jnt": 1.0},
+            4: {"mid_jnt": 1.0},
+            5: {"mid_jnt": 1.0},
+        }
+        weights_data = core_skin.SkinWeightsData.from_dict(skin_data, influences=["root_jnt", "mid_jnt", "end_jnt"])
+        cmds.skinCluster("skinCluster1", edit=True, removeInfluence="end_jnt")
+        core_skin.set_skin_weights_data("plane", skin_weights_data=weights_data, remove_unused_inf=False)
+        result = core_skin.get_skin_weights("plane")
+        self.assertEqual(skin_data, result)
+
+    def test_set_skin_weights_data_wrong_vertex_count(self):
+        import_skinned_test_file()
+        weights_data = core_skin.SkinWeightsData(weights=[1.0, 1.0], influences=["root_jnt"])
+        with self.assertRaises(ValueError):
+            core_skin.set_skin_weights_data("plane", skin_weights_data=weights_data)
+
     def test_export_skin_weights_to_json(self):
         import_skinned_test_file()
         test_temp_dir = maya_test_tools.generate_test_temp_dir()
@@ -149,6 +223,110 @@ class TestSkinCore(unittest.TestCase):
         result = core_skin.get_skin_weights("plane")
         self.assertEqual(skin_data, result)
 
+    def test_skin_weights_data_sparse_arrays(self):
+        weights_data = core_skin.SkinWeightsData(weights=[0.75, 0.25, 0.0, 1.0], influences=["root_jnt", "mid_jnt"])
+        offsets, influence_indices, weights = weights_data.to_sparse_arrays()
+        self.assertEqual([0, 2, 3], offsets.tolist())
+        self.assertEqual([0, 1, 1], influence_indices.tolist())
+        self.assertEqual([0.75, 0.25, 1.0], weights.tolist())
+        result = core_skin.SkinWeightsData.from_sparse_arrays(
+            offsets, influence_indices, weights, influences=["root_jnt", "mid_jnt"]
+        )
+        self.assertEqual(weights_data.get_weights(), result.get_weights())
+
+    def test_write_and_read_skin_weights_file(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        weights_data = core_skin.SkinWeightsData(weights=[0.75, 0.25, 0.0, 1.0], influences=["root_jnt", "mid_jnt"])
+        for compress in [True, False]:
+            file_path = os.path.join(test_temp_dir, f"weights_plane_{compress}.skw")
+            core_skin.write_skin_weights_file(file_path, weights_data, mesh_name="plane", compress=compress)
+            header = core_skin.read_skin_weights_file_header(file_path)
+            self.assertEqual("plane", header.get("mesh"))
+            self.assertEqual(2, header.get("vertex_count"))
+            result = core_skin.read_skin_weights_file(file_path)
+            self.assertEqual(["root_jnt", "mid_jnt"], result.get_influences())
+            self.assertEqual(weights_data.get_weights(), result.get_weights())
+
+    def test_read_skin_weights_file_json(self):
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        file_path = os.path.join(test_temp_dir, "weights_plane.json")
+        skin_data = {0: {"root_jnt": 1.0}, 1: {"mid_jnt": 0.5, "root_jnt": 0.5}}
+        core_skin.core_io.write_json(path=file_path, data=skin_data)
+        self.assertEqual({}, core_skin.read_skin_weights_file_header(file_path))
+        result = core_skin.read_skin_weights_file(file_path)
+        self.assertEqual(skin_data, result.to_dict())
+
+    def test_export_import_weights_binary(self):
+        import_skinned_test_file()
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        expected = core_skin.get_skin_weights("plane")
+        exported = core_skin.export_weights_to_target_folder(["plane"], test_temp_dir, file_format=".skw")
+        self.assertEqual([os.path.join(test_temp_dir, "weights_plane.skw")], exported)
+        cmds.delete("skinCluster1")
+        cmds.select(["root_jnt", "mid_jnt", "end_jnt", "plane"])
+        cmds.skinCluster(tsb=True)
+        core_skin.import_weights_from_target_folder(["plane"], test_temp_dir, remove_unused_inf=False)
+        result = core_skin.get_skin_weights("plane")
+        self.assertEqual(expected, result)
+
+    def test_import_weights_rebind_missing_influences(self):
+        import_skinned_test_file()
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        expected = core_skin.get_skin_weights("plane")
+        core_skin.export_weights_to_target_folder(["plane"], test_temp_dir, file_format=".skw")
+        cmds.delete("skinCluster1")
+        cmds.select(["root_jnt", "mid_jnt", "plane"])  # "end_jnt" is missing
+        cmds.skinCluster(tsb=True)
+        logging.disable(logging.WARNING)
+        core_skin.import_weights_from_target_folder(["plane"], test_temp_dir, remove_unused_inf=False)
+        logging.disable(logging.NOTSET)
+        self.assertEqual(["end_jnt", "mid_jnt", "root_jnt"], sorted(core_skin.get_bound_joints("plane")))
+        result = core_skin.get_skin_weights("plane")
+        self.assertEqual(expected, result)
+
+    def test_import_weights_pruned_influences_no_rebind(self):
+        import_skinned_test_file()
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        skin_data = {
+            0: {"root_jnt": 1.0},
+            1: {"root_jnt": 1.0},
+            2: {"root_jnt": 0.5, "mid_jnt": 0.5},
+            3: {"mid_jnt": 1.0},
+            4: {"mid_jnt": 1.0},
+            5: {"mid_jnt": 1.0},
+        }
+        core_skin.set_skin_weights("plane", skin_data=skin_data, remove_unused_inf=False)
+        core_skin.export_weights_to_target_folder(["plane"], test_temp_dir, file_format=".skw")
+        core_skin.remove_unused_influences("skinCluster1")
+        self.assertEqual(["mid_jnt", "root_jnt"], sorted(core_skin.get_bound_joints("plane")))
+        core_skin.import_weights_from_target_folder(["plane"], test_temp_dir, remove_unused_inf=True)
+        self.assertTrue(cmds.objExists("skinCluster1"))  # Not re-bound
+        result = core_skin.get_skin_weights("plane")
+        self.assertEqual(skin_data, result)
+
+    def test_export_import_weights_callback(self):
+        import_skinned_test_file()
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        export_progress = []
+        import_progress = []
+        core_skin.export_weights_to_target_folder(
+            ["plane"], test_temp_dir, callback=lambda current, total: export_progress.append((current, total))
+        )
+        core_skin.import_weights_from_target_folder(
+            ["plane", "mocked_missing_mesh"],
+            test_temp_dir,
+            remove_unused_inf=False,
+            callback=lambda current, total: import_progress.append((current, total)),
+        )
+        self.assertEqual([(1, 1)], export_progress)
+        self.assertEqual([(1, 1)], import_progress)
+
+    def test_export_weights_json_file_name(self):
+        import_skinned_test_file()
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        exported = core_skin.export_weights_to_target_folder(["plane"], test_temp_dir, file_format=".json")
+        self.assertEqual([os.path.join(test_temp_dir, "weights_plane.json")], exported)
+
     def test_bind_skin(self):
         import_skinned_test_file()
         cmds.delete("skinCluster1")
@@ -672,3 +672,26 @@ class TestStringCore(unittest.TestCase):
         expected_output = "Special Characters !@#"
         result = core_str.snake_to_title(input_string)
         self.assertEqual(expected_output, result)
+
+    def test_string_search_index_search(self):
+        search_index = core_str.StringSearchIndex(["circle_arrow", "square", "arrow_flat", "Circle"])
+        self.assertEqual(["circle_arrow", "arrow_flat"], search_index.search("arrow"))
+        self.assertEqual(["circle_arrow", "Circle"], search_index.search("circ"))
+        self.assertEqual(["square"], search_index.search("q"))  # Single character
+        self.assertEqual(["arrow_flat"], search_index.search("w_"))  # Two characters
+        self.assertEqual([], search_index.search("triangle"))
+
+    def test_string_search_index_empty_query(self):
+        search_index = core_str.StringSearchIndex(["b", "a"])
+        self.assertEqual(["b", "a"], search_index.search(""))
+
+    def test_string_search_index_long_query_order(self):
+        # Every trigram of "abcabd" exists in "abdabc", but the query is not a substring
+        search_index = core_str.StringSearchIndex(["abdabcab", "abcabd"])
+        self.assertEqual(["abcabd"], search_index.search("abcabd"))
+
+    def test_string_search_index_case_sensitive(self):
+        search_index = core_str.StringSearchIndex(["Circle", "circle_arrow"], case_sensitive=True)
+        self.assertEqual(["Circle"], search_index.search("Circ"))
+        self.assertIn("Circle", search_index)
+        self.assertEqual(2, len(search_index))
@@ -483,6 +483,34 @@ class TestTransformCore(unittest.TestCase):
         transform.set_scale(xyz=new_scale)
         self.assertEqual(new_scale_vector3, transform.scale)
 
+    def test_transform_to_matrix(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f'{cube}.translate', 1, 2, 3)
+        cmds.setAttr(f'{cube}.rotate', 15, 35, 60)
+        cmds.setAttr(f'{cube}.scale', 1, 2, 3)
+        cmds.setAttr(f'{cube}.rotateOrder', 4)  # yxz
+        transform = core_transform.Transform()
+        transform.set_from_tuple((1, 2, 3), (15, 35, 60), (1, 2, 3))
+        expected = cmds.xform(cube, query=True, matrix=True)
+        result = transform.to_matrix(rotation_order=4)
+        self.assertEqual(4, len(result))
+        for expected_value, value in zip(expected, [value for row in result for value in row]):
+            self.assertAlmostEqual(expected_value, value, places=5)
+
+    def test_transform_set_from_matrix(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f'{cube}.translate', 1, 2, 3)
+        cmds.setAttr(f'{cube}.rotate', 15, 35, 60)
+        cmds.setAttr(f'{cube}.scale', 1, 2, 3)
+        transform = core_transform.Transform()
+        transform.set_from_matrix(cmds.xform(cube, query=True, matrix=True))
+        expected = ((1, 2, 3), (15, 35, 60), (1, 2, 3))
+        result = (transform.get_position(as_tuple=True), transform.get_rotation(as_tuple=True))
+        result += (transform.get_scale(as_tuple=True),)
+        for expected_values, values in zip(expected, result):
+            for expected_value, value in zip(expected_values, values):
+                self.assertAlmostEqual(expected_value, value, places=5)
+
     def test_set_transform_from_object(self):
         cube = maya_test_tools.create_poly_cube()
         cmds.setAttr(f'{cube}.ty', 5)
@@ -0,0 +1,271 @@
+import unittest
+import logging
+import random
+import math
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Tested Script - Maya independent, so "maya_test_tools" is not imported (runs with any Python interpreter)
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [os.path.dirname(package_root_dir), package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+from gt.core import transform_math as core_trans_math
+
+
+def rotate_x(angle):
+    """Rotation matrix around X (row vectors), as documented by Maya"""
+    cos_angle, sin_angle = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    return 1, 0, 0, 0, 0, cos_angle, sin_angle, 0, 0, -sin_angle, cos_angle, 0, 0, 0, 0, 1
+
+
+def rotate_y(angle):
+    """Rotation matrix around Y (row vectors), as documented by Maya"""
+    cos_angle, sin_angle = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    return cos_angle, 0, -sin_angle, 0, 0, 1, 0, 0, sin_angle, 0, cos_angle, 0, 0, 0, 0, 1
+
+
+def rotate_z(angle):
+    """Rotation matrix around Z (row vectors), as documented by Maya"""
+    cos_angle, sin_angle = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    return cos_angle, sin_angle, 0, 0, -sin_angle, cos_angle, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1
+
+
+def flatten_values(values):
+    """Flattens nested sequences (lists, tuples or NumPy arrays) into a list"""
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    if not isinstance(values, (list, tuple)):
+        return [values]
+    flat = []
+    for value in values:
+        flat.extend(flatten_values(value))
+    return flat
+
+
+class TestTransformMathCore(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.backends = [False, True] if core_trans_math.NUMPY_AVAILABLE else [False]
+
+    def assertValuesAlmostEqual(self, expected, result, places=7):
+        """Compares two flat or nested sequences of numbers"""
+        expected = [float(value) for value in flatten_values(expected)]
+        result = [float(value) for value in flatten_values(result)]
+        self.assertEqual(len(expected), len(result))
+        for expected_value, result_value in zip(expected, result):
+            self.assertAlmostEqual(expected_value, result_value, places=places)
+
+    def get_random_transforms(self, count=50, negative_scale=True):
+        translations, rotations, scales = [], [], []
+        for _ in range(count):
+            translations.append(tuple(random.uniform(-10, 10) for _ in range(3)))
+            rotations.append(tuple(random.uniform(-180, 180) for _ in range(3)))
+            scale = [random.uniform(0.1, 3) for _ in range(3)]
+            if negative_scale and random.random() > 0.5:
+                scale[0] = -scale[0]
+            scales.append(tuple(scale))
+        return translations, rotations, scales
+
+    def test_vectors(self):
+        self.assertEqual(32, core_trans_math.dot_product((1, 2, 3), (4, 5, 6)))
+        self.assertEqual((-3, 6, -3), core_trans_math.cross_product((1, 2, 3), (4, 5, 6)))
+        self.assertEqual(5.0, core_trans_math.get_vector_length((3, 4, 0)))
+        self.assertEqual((0.6, 0.8, 0.0), core_trans_math.normalize_vector((3, 4, 0)))
+        self.assertEqual((0.0, 0.0, 0.0), core_trans_math.normalize_vector((0, 0, 0)))
+        self.assertEqual(5.0, core_trans_math.get_distance((1, 1, 1), (4, 5, 1)))
+
+    def test_get_path_length(self):
+        positions = [(0, 0, 0), (0, 0, 2), (2, 0, 2), (2, 0, 0), (6, 0, 0)]
+        for use_numpy in self.backends:
+            self.assertEqual(10, core_trans_math.get_path_length(positions, use_numpy=use_numpy))
+            self.assertEqual(0, core_trans_math.get_path_length(positions[:1], use_numpy=use_numpy))
+
+    def test_get_average_position(self):
+        positions = [(0, -2, 0), (0, 6, 0), (3, 2, 3)]
+        for use_numpy in self.backends:
+            self.assertEqual((1, 2, 1), core_trans_math.get_average_position(positions, use_numpy=use_numpy))
+            self.assertEqual((0, 0, 0), core_trans_math.get_average_position([], use_numpy=use_numpy))
+
+    def test_euler_to_matrix_rotation_orders(self):
+        rotation_x, rotation_y, rotation_z = rotate_x(30), rotate_y(40), rotate_z(50)
+        multiply = core_trans_math.multiply_matrices
+        expected_matrices = {
+            core_trans_math.RotationOrder.XYZ: multiply(multiply(rotation_x, rotation_y), rotation_z),
+            core_trans_math.RotationOrder.YZX: multiply(multiply(rotation_y, rotation_z), rotation_x),
+            core_trans_math.RotationOrder.ZXY: multiply(multiply(rotation_z, rotation_x), rotation_y),
+            core_trans_math.RotationOrder.XZY: multiply(multiply(rotation_x, rotation_z), rotation_y),
+            core_trans_math.RotationOrder.YXZ: multiply(multiply(rotation_y, rotation_x), rotation_z),
+            core_trans_math.RotationOrder.ZYX: multiply(multiply(rotation_z, rotation_y), rotation_x),
+        }
+        for rotation_order, expected in expected_matrices.items():
+            result = core_trans_math.euler_to_matrix((30, 40, 50), rotation_order=rotation_order)
+            self.assertValuesAlmostEqual(expected, result)
+        result = core_trans_math.euler_to_matrix((30, 40, 50), rotation_order="zyx")
+        self.assertValuesAlmostEqual(expected_matrices.get(core_trans_math.RotationOrder.ZYX), result)
+
+    def test_euler_to_matrix_radians(self):
+        expected = core_trans_math.euler_to_matrix((0, 45, 0))
+        result = core_trans_math.euler_to_matrix((0, math.pi / 4, 0), degrees=False)
+        self.assertValuesAlmostEqual(expected, result)
+        self.assertValuesAlmostEqual((math.sqrt(0.5), 0, -math.sqrt(0.5)), result[:3])
+
+    def test_euler_to_matrix_invalid_rotation_order(self):
+        with self.assertRaises(ValueError):
+            core_trans_math.euler_to_matrix((0, 0, 0), rotation_order=6)
+
+    def test_matrix_to_euler_round_trip(self):
+        _, rotations, _ = self.get_random_transforms()
+        for rotation_order in range(6):
+            for rotation in rotations:
+                matrix = core_trans_math.euler_to_matrix(rotation, rotation_order=rotation_order)
+                result = core_trans_math.matrix_to_euler(matrix, rotation_order=rotation_order)
+                self.assertValuesAlmostEqual(matrix, core_trans_math.euler_to_matrix(result, rotation_order))
+
+    def test_matrix_to_euler_simple(self):
+        matrix = core_trans_math.euler_to_matrix((10, 20, 30), rotation_order=core_trans_math.RotationOrder.YXZ)
+        result = core_trans_math.matrix_to_euler(matrix, rotation_order=core_trans_math.RotationOrder.YXZ)
+        self.assertValuesAlmostEqual((10, 20, 30), result)
+
+    def test_matrix_to_euler_gimbal_lock(self):
+        for rotation_order, axes in core_trans_math.ROTATION_ORDER_AXES.items():
+            rotation = [10, 20, 30]
+            rotation[axes[1]] = 90
+            matrix = core_trans_math.euler_to_matrix(rotation, rotation_order=rotation_order)
+            result = core_trans_math.matrix_to_euler(matrix, rotation_order=rotation_order)
+            self.assertAlmostEqual(0, result[axes[2]])
+            self.assertValuesAlmostEqual(matrix, core_trans_math.euler_to_matrix(result, rotation_order))
+
+    def test_quaternion_conversions(self):
+        _, rotations, _ = self.get_random_transforms()
+        for rotation_order in range(6):
+            for rotation in rotations:
+                matrix = core_trans_math.euler_to_matrix(rotation, rotation_order=rotation_order)
+                quaternion = core_trans_math.euler_to_quaternion(rotation, rotation_order=rotation_order)
+                self.assertValuesAlmostEqual(matrix, core_trans_math.quaternion_to_matrix(quaternion))
+                from_matrix = core_trans_math.matrix_to_quaternion(matrix)
+                similarity = sum(value_a * value_b for value_a, value_b in zip(quaternion, from_matrix))
+                self.assertAlmostEqual(1, abs(similarity))  # Same rotation (q and -q are equivalent)
+                euler = core_trans_math.quaternion_to_euler(quaternion, rotation_order=rotation_order)
+                self.assertValuesAlmostEqual(matrix, core_trans_math.euler_to_matrix(euler, rotation_order))
+
+    def test_quaternion_axis(self):
+        result = core_trans_math.euler_to_quaternion((90, 0, 0))
+        self.assertValuesAlmostEqual((math.sqrt(0.5), 0, 0, math.sqrt(0.5)), result)
+        self.assertValuesAlmostEqual((0, 0, 0, 1), core_trans_math.normalize_quaternion((0, 0, 0, 0)))
+
+    def test_multiply_quaternions(self):
+        quaternion_a = core_trans_math.euler_to_quaternion((30, 0, 0))
+        quaternion_b = core_trans_math.euler_to_quaternion((0, 40, 0))
+        result = core_trans_math.quaternion_to_matrix(core_trans_math.multiply_quaternions(quaternion_a, quaternion_b))
+        self.assertValuesAlmostEqual(core_trans_math.multiply_matrices(rotate_x(30), rotate_y(40)), result)
+
+    def test_compose_matrix(self):
+        result = core_trans_math.compose_matrix(translation=(1, 2, 3), rotation=(0, 0, 90), scale=(2, 1, 1))
+        expected = (0, 2, 0, 0, -1, 0, 0, 0, 0, 0, 1, 0, 1, 2, 3, 1)
+        self.assertValuesAlmostEqual(expected, result)
+        self.assertValuesAlmostEqual((1, 4, 3), core_trans_math.transform_point((1, 0, 0), result))
+
+    def test_decompose_matrix_round_trip(self):
+        translations, rotations, scales = self.get_random_transforms()
+        for rotation_order in range(6):
+            for translation, rotation, scale in zip(translations, rotations, scales):
+                matrix = core_trans_math.compose_matrix(translation, rotation, scale, rotation_order)
+                result = core_trans_math.decompose_matrix(matrix, rotation_order=rotation_order)
+                self.assertValuesAlmostEqual(translation, result[0])
+                self.assertValuesAlmostEqual(scale, result[2])
+                self.assertValuesAlmostEqual(matrix, core_trans_math.compose_matrix(*result, rotation_order))
+
+    def test_decompose_matrix_zero_scale(self):
+        matrix = core_trans_math.compose_matrix(scale=(0, 1, 1))
+        with self.assertRaises(ValueError):
+            core_trans_math.decompose_matrix(matrix)
+
+    def test_invert_matrix(self):
+        translations, rotations, scales = self.get_random_transforms(count=10)
+        for translation, rotation, scale in zip(translations, rotations, scales):
+            matrix = core_trans_math.compose_matrix(translation, rotation, scale)
+            result = core_trans_math.multiply_matrices(matrix, core_trans_math.invert_matrix(matrix))
+            self.assertValuesAlmostEqual(core_trans_math.IDENTITY_MATRIX, result)
+        with self.assertRaises(ValueError):
+            core_trans_math.invert_matrix((0,) * 16)
+
+    def test_multiply_matrices_parent(self):
+        child = core_trans_math.compose_matrix(translation=(1, 0, 0))
+        parent = core_trans_math.compose_matrix(translation=(0, 5, 0), rotation=(0, 0, 90))
+        result = core_trans_math.multiply_matrices(child, parent)
+        self.assertValuesAlmostEqual((0, 6, 0), result[12:15])
+
+    def test_batch_compose_decompose(self):
+        translations, rotations, scales = self.get_random_transforms()
+        for use_numpy in self.backends:
+            for rotation_order in range(6):
+                expected = [
+                    core_trans_math.compose_matrix(translation, rotation, scale, rotation_order)
+                    for translation, rotation, scale in zip(translations, rotations, scales)
+                ]
+                matrices = core_trans_math.compose_matrices(
+                    translations, rotations, scales, rotation_order=rotation_order, use_numpy=use_numpy
+                )
+                self.assertValuesAlmostEqual(expected, matrices)
+                result = core_trans_math.decompose_matrices(matrices, rotation_order, use_numpy=use_numpy)
+                self.assertValuesAlmostEqual(translations, result[0])
+                self.assertValuesAlmostEqual(scales, result[2])
+                eulers = core_trans_math.matrices_to_euler(matrices, rotation_order, use_numpy=use_numpy)
+                self.assertValuesAlmostEqual(result[1], eulers)
+                rebuilt = core_trans_math.compose_matrices(*result, rotation_order=rotation_order, use_numpy=use_numpy)
+                self.assertValuesAlmostEqual(expected, rebuilt)
+
+    def test_batch_compose_partial(self):
+        for use_numpy in self.backends:
+            result = core_trans_math.compose_matrices(translations=[(1, 2, 3)], use_numpy=use_numpy)
+            self.assertValuesAlmostEqual((1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 2, 3, 1), result)
+            result = core_trans_math.euler_to_matrices([(0, 0, 90)], use_numpy=use_numpy)
+            self.assertValuesAlmostEqual(rotate_z(90), result)
+
+    def test_batch_multiply_and_transform(self):
+        translations, rotations, scales = self.get_random_transforms(count=20)
+        matrices = core_trans_math.compose_matrices(translations, rotations, scales, use_numpy=False)
+        parent = matrices[0]
+        for use_numpy in self.backends:
+            result = core_trans_math.multiply_matrices_batch(matrices, matrices[::-1], use_numpy=use_numpy)
+            expected = [core_trans_math.multiply_matrices(a, b) for a, b in zip(matrices, matrices[::-1])]
+            self.assertValuesAlmostEqual(expected, result)
+            result = core_trans_math.multiply_matrices_batch(matrices, parent, use_numpy=use_numpy)
+            expected = [core_trans_math.multiply_matrices(matrix, parent) for matrix in matrices]
+            self.assertValuesAlmostEqual(expected, result)
+            result = core_trans_math.transform_points(translations, parent, use_numpy=use_numpy)
+            expected = [core_trans_math.transform_point(point, parent) for point in translations]
+            self.assertValuesAlmostEqual(expected, result)
+
+    def test_batch_quaternions(self):
+        translations, rotations, scales = self.get_random_transforms(count=20)
+        matrices = core_trans_math.compose_matrices(translations, rotations, scales, use_numpy=False)
+        expected_rotations = core_trans_math.euler_to_matrices(rotations, use_numpy=False)
+        for use_numpy in self.backends:
+            quaternions = core_trans_math.matrices_to_quaternions(matrices, use_numpy=use_numpy)
+            result = core_trans_math.quaternions_to_matrices(quaternions, use_numpy=use_numpy)
+            self.assertValuesAlmostEqual(expected_rotations, result)
+
+    def test_use_numpy_unavailable(self):
+        original_numpy = core_trans_math.numpy
+        original_available = core_trans_math.NUMPY_AVAILABLE
+        try:
+            core_trans_math.numpy = None
+            core_trans_math.NUMPY_AVAILABLE = False
+            result = core_trans_math.compose_matrices(translations=[(1, 2, 3)], use_numpy=True)
+            self.assertIsInstance(result, list)
+        finally:
+            core_trans_math.numpy = original_numpy
+            core_trans_math.NUMPY_AVAILABLE = original_available
+
+
+if __name__ == "__main__":
+    unittest.main()
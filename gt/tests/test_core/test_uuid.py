@@ -193,3 +193,94 @@ class TestUUIDCore(unittest.TestCase):
         result = core_uuid.get_object_from_uuid(_uuid)
         expected = cmds.ls(cube, long=True)[0]
         self.assertEqual(expected, result)
+
+    def test_get_object_from_uuid_attr_obj_type(self):
+        cube = maya_test_tools.create_poly_cube()
+        joint = cmds.joint(name="mocked_joint")
+        cmds.select(clear=True)
+        created_uuid_attr = core_uuid.add_uuid_attr([cube, joint], "mockedAttrName", set_initial_uuid_value=False)
+        cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value", typ="string")
+        cmds.setAttr(created_uuid_attr[1], "mocked_uuid_value", typ="string")
+        result = core_uuid.get_object_from_uuid_attr(
+            uuid_string="mocked_uuid_value", attr_name="mockedAttrName", obj_type="joint"
+        )
+        expected = "|mocked_joint"
+        self.assertEqual(expected, result)
+
+    def test_get_uuid_attr_map(self):
+        cube_one = maya_test_tools.create_poly_cube()
+        cube_two = maya_test_tools.create_poly_cube()
+        maya_test_tools.create_poly_cube()
+        created_uuid_attr = core_uuid.add_uuid_attr([cube_one, cube_two], "mockedAttrName")
+        cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value", typ="string")
+        cmds.setAttr(created_uuid_attr[1], "", typ="string")  # Empty values are ignored
+        result = core_uuid.get_uuid_attr_map(attr_name="mockedAttrName")
+        expected = {"mocked_uuid_value": ["|pCube1"]}
+        self.assertEqual(expected, result)
+
+    def test_uuid_attr_index_context(self):
+        self.assertIsNone(core_uuid.get_active_uuid_index())
+        with core_uuid.UUIDAttrIndex() as uuid_index:
+            self.assertEqual(uuid_index, core_uuid.get_active_uuid_index())
+            with core_uuid.UUIDAttrIndex() as nested_index:
+                self.assertEqual(nested_index, core_uuid.get_active_uuid_index())
+            self.assertEqual(uuid_index, core_uuid.get_active_uuid_index())
+        self.assertIsNone(core_uuid.get_active_uuid_index())
+
+    def test_uuid_attr_index_lookup(self):
+        cube = maya_test_tools.create_poly_cube()
+        created_uuid_attr = core_uuid.add_uuid_attr(cube, "mockedAttrName", set_initial_uuid_value=False)
+        cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value", typ="string")
+        with core_uuid.UUIDAttrIndex() as uuid_index:
+            self.assertFalse(uuid_index.is_cached("mockedAttrName"))
+            result = core_uuid.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name="mockedAttrName")
+            self.assertEqual("|pCube1", result)
+            self.assertTrue(uuid_index.is_cached("mockedAttrName"))
+            self.assertEqual(["|pCube1"], uuid_index.get_objects("mocked_uuid_value", "mockedAttrName"))
+
+    def test_uuid_attr_index_invalidated_by_scene_changes(self):
+        cube = maya_test_tools.create_poly_cube()
+        core_uuid.add_uuid_attr(cube, "mockedAttrName")
+        with core_uuid.UUIDAttrIndex() as uuid_index:
+            uuid_index.get_uuid_map(attr_name="mockedAttrName")
+            self.assertTrue(uuid_index.is_cached("mockedAttrName"))
+            cmds.delete(cube)
+            self.assertFalse(uuid_index.is_cached("mockedAttrName"))
+            self.assertEqual({}, uuid_index.get_uuid_map(attr_name="mockedAttrName"))
+            new_cube = maya_test_tools.create_poly_cube()
+            created_uuid_attr = core_uuid.add_uuid_attr(new_cube, "mockedAttrName", set_initial_uuid_value=False)
+            cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value", typ="string")
+            self.assertFalse(uuid_index.is_cached("mockedAttrName"))
+            result = core_uuid.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name="mockedAttrName")
+            self.assertEqual(f"|{new_cube}", result)
+
+    def test_uuid_attr_index_ignores_unrelated_scene_changes(self):
+        cube = maya_test_tools.create_poly_cube()
+        created_uuid_attr = core_uuid.add_uuid_attr(cube, "mockedAttrName", set_initial_uuid_value=False)
+        cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value", typ="string")
+        with core_uuid.UUIDAttrIndex() as uuid_index:
+            uuid_index.get_uuid_map(attr_name="mockedAttrName")
+            other_cube = maya_test_tools.create_poly_cube()
+            cmds.delete(other_cube)
+            cmds.group(empty=True, name="mocked_grp")
+            self.assertTrue(uuid_index.is_cached("mockedAttrName"))
+            duplicated_cube = cmds.duplicate(cube, name="mocked_duplicated_cube")[0]
+            self.assertFalse(uuid_index.is_cached("mockedAttrName"))
+            result = uuid_index.get_objects(uuid_string="mocked_uuid_value", attr_name="mockedAttrName")
+            self.assertEqual(sorted(["|pCube1", f"|{duplicated_cube}"]), sorted(result))
+
+    def test_uuid_attr_index_rename_reparent(self):
+        cube = maya_test_tools.create_poly_cube()
+        group = cmds.group(empty=True, name="mocked_grp")
+        created_uuid_attr = core_uuid.add_uuid_attr(cube, "mockedAttrName", set_initial_uuid_value=False)
+        cmds.setAttr(created_uuid_attr[0], "mocked_uuid_value", typ="string")
+        with core_uuid.UUIDAttrIndex() as uuid_index:
+            result = core_uuid.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name="mockedAttrName")
+            self.assertEqual("|pCube1", result)
+            cmds.parent(cube, group)
+            cmds.rename("|mocked_grp|pCube1", "mocked_renamed_cube")
+            self.assertTrue(uuid_index.is_cached("mockedAttrName"))
+            result = core_uuid.get_object_from_uuid_attr(uuid_string="mocked_uuid_value", attr_name="mockedAttrName")
+            self.assertEqual("|mocked_grp|mocked_renamed_cube", result)
+            expected = {"mocked_uuid_value": ["|mocked_grp|mocked_renamed_cube"]}
+            self.assertEqual(expected, uuid_index.get_uuid_map(attr_name="mockedAttrName"))
@@ -221,3 +221,30 @@ class TestCurveLibraryModel(unittest.TestCase):
     def test_get_preview_image(self):
         result = self.model.get_preview_image("circle")
         self.assertTrue(os.path.exists(result))
+
+    def test_search_curves(self):
+        self.model.base_curves = []
+        self.model.user_curves = []
+        self.model.controls = []
+        self.model.add_base_curve(Curves.circle_arrow)
+        self.model.add_control(Curves.circle)
+        self.model.add_user_curve(Curves.square)
+        result = self.model.search_curves(filter_str="CIRC")
+        expected = ([Curves.circle_arrow], [Curves.circle], [])
+        self.assertEqual(expected, result)
+
+    def test_search_curves_no_filter(self):
+        self.model.base_curves = [Curves.circle_arrow]
+        self.model.user_curves = [Curves.square]
+        self.model.controls = []
+        result = self.model.search_curves()
+        expected = ([Curves.circle_arrow], [], [Curves.square])
+        self.assertEqual(expected, result)
+
+    def test_get_curve_from_name_list_replaced(self):
+        curve = Curve(name="two_lines")
+        curve.shapes = "mocked_shapes"
+        self.model.get_curve_from_name(curve_name="circle")  # Build indexes
+        self.model.user_curves = [curve]
+        result = self.model.get_curve_from_name(curve_name="two_lines")
+        self.assertEqual(curve, result)
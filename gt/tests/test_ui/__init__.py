@@ -5,3 +5,4 @@ from . import test_progress_bar
 from . import test_python_output_view
 from . import test_qt_utils
 from . import test_resource_library
+from . import test_thumbnail_cache
@@ -89,3 +89,52 @@ class TestMayaMenu(unittest.TestCase):
         self.assertEqual(params.get("tearOff"), None)
         self.assertEqual(params["enableCommandRepeat"], False)
         self.assertEqual(params.get("optionBox"), None)
+
+    def test_get_item_parameters_callable_label_and_icon(self):
+        item = MenuItem(
+            label=lambda: "resolved_label",
+            command="command",
+            tooltip="tooltip",
+            icon=lambda: "resolved_icon",
+            enable=True,
+            parent=None,
+            divider=False,
+            divider_label="",
+            sub_menu=False,
+            tear_off=False,
+            enable_command_repeat=False,
+            option_box=False,
+            option_box_icon="",
+        )
+        params = self.menu.get_item_parameters(item)
+        self.assertEqual(params["label"], "resolved_label")
+        self.assertEqual(params["image"], "resolved_icon")
+
+    def test_group_items_by_sub_menu(self):
+        self.menu.add_sub_menu("SubMenuOne")
+        self.menu.add_menu_item("ItemOne")
+        self.menu.add_divider(divider_label="Divider")
+        self.menu.add_sub_menu("SubMenuTwo")
+        self.menu.add_menu_item("ItemTwo")
+        self.menu._group_items_by_sub_menu()
+        root_labels = [item.label for item in self.menu._root_items]
+        self.assertEqual(root_labels, ["SubMenuOne", "SubMenuTwo"])
+        sub_menu_one = [item.label or item.divider_label for item in self.menu._sub_menu_items.get("SubMenuOne")]
+        sub_menu_two = [item.label for item in self.menu._sub_menu_items.get("SubMenuTwo")]
+        self.assertEqual(sub_menu_one, ["ItemOne", "Divider"])
+        self.assertEqual(sub_menu_two, ["ItemTwo"])
+
+    def test_create_menu_lazy(self):
+        lazy_menu = MayaMenu(name="TestLazyMenu", lazy=True)
+        resolved_icons = []
+
+        def get_icon():
+            resolved_icons.append("icon")
+            return ""
+
+        lazy_menu.add_sub_menu("SubMenu", icon=get_icon)
+        lazy_menu.add_menu_item("Item", icon=get_icon)
+        lazy_menu.create_menu()
+        self.assertTrue(lazy_menu.initialized)
+        self.assertEqual(resolved_icons, [])  # Nothing populated or resolved until the menu is opened
+        lazy_menu.delete_menu()
@@ -71,3 +71,15 @@ class TestProgressBar(unittest.TestCase):
         output_text = window.get_output_box_plain_text()
         self.assertIn(text_to_add1, output_text)
         self.assertIn(text_to_add2, output_text)
+
+    def test_set_last_line_text(self):
+        window = ProgressBarWindow()
+
+        # Test replacing only the last line
+        window.add_text_to_output_box("This is line 1.")
+        window.add_text_to_output_box("Progress: 0%")
+        window.set_last_line_text("Progress: 50%")
+        window.set_last_line_text("Progress: 100%")
+
+        output_text = window.get_output_box_plain_text()
+        self.assertEqual("This is line 1.\nProgress: 100%", output_text)
@@ -234,3 +234,50 @@ class TestResourceLibrary(unittest.TestCase):
                 raise Exception(f"Missing file path for font: {font_key}")
             if not os.path.exists(font_path):
                 raise Exception(f"Missing file for a font path: {font_path}")
+
+    def test_process_stylesheet_variables_single_pass(self):
+        mocked_variables = {"@color;": "@other;", "@other;": "red", "@color_dark;": "blue"}
+        result = ui_res_lib.process_stylesheet_variables(
+            stylesheet_content="a: @color; b: @other; c: @color_dark;", stylesheet_variables=mocked_variables
+        )
+        expected = "a: @other;; b: red; c: blue;"  # Replaced values are not processed again
+        self.assertEqual(expected, result)
+
+    def test_process_stylesheet_variables_empty_dict(self):
+        result = ui_res_lib.process_stylesheet_variables(stylesheet_content="@original", stylesheet_variables={})
+        expected = "@original"
+        self.assertEqual(expected, result)
+
+    def test_lazy_resource_memoized(self):
+        calls = []
+
+        def get_mocked_resource(name):
+            calls.append(name)
+            return f"resolved_{name}"
+
+        class MockedLibrary:
+            resource = ui_res_lib.LazyResource(get_mocked_resource, "mocked")
+
+        self.assertEqual([], calls)  # Nothing resolved on class definition
+        self.assertEqual("resolved_mocked", MockedLibrary.resource)
+        self.assertEqual("resolved_mocked", MockedLibrary.resource)
+        self.assertEqual(["mocked"], calls)
+        self.assertEqual("resolved_mocked", vars(MockedLibrary).get("resource"))
+
+    def test_is_resource_available(self):
+        icons_dir = ui_res_lib.ResourceDirConstants.DIR_ICONS
+        existing_icon = os.path.join(icons_dir, "package_logo.svg")
+        missing_icon = os.path.join(icons_dir, "mocked_missing_icon.svg")
+        self.assertTrue(ui_res_lib.is_resource_available(existing_icon, resource_folder=icons_dir))
+        self.assertFalse(ui_res_lib.is_resource_available(missing_icon, resource_folder=icons_dir))
+
+    def test_stylesheet_variables_used(self):
+        all_attributes = vars(ui_res_lib.Stylesheet)
+        stylesheet_keys = [attr for attr in all_attributes if not (attr.startswith("__") and attr.endswith("__"))]
+        for stylesheet_key in stylesheet_keys:
+            stylesheet_content = getattr(ui_res_lib.Stylesheet, stylesheet_key)
+            unresolved_variables = re.findall(r"@\w+;", stylesheet_content)
+            if unresolved_variables:
+                raise Exception(
+                    f'Stylesheet "{stylesheet_key}" has unresolved variables: {", ".join(unresolved_variables)}'
+                )
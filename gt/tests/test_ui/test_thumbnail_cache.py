@@ -0,0 +1,142 @@
+import unittest
+import logging
+import shutil
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Import Tested Script
+test_utils_dir = os.path.dirname(__file__)
+tests_dir = os.path.dirname(test_utils_dir)
+package_root_dir = os.path.dirname(tests_dir)
+for to_append in [package_root_dir, tests_dir]:
+    if to_append not in sys.path:
+        sys.path.append(to_append)
+import gt.ui.thumbnail_cache as ui_thumb_cache
+from gt.tests import maya_test_tools
+import gt.ui.qt_import as ui_qt
+
+
+class TestThumbnailCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        app = ui_qt.QtWidgets.QApplication.instance()
+        if not app:
+            cls.app = ui_qt.QtWidgets.QApplication(sys.argv)
+
+    def setUp(self):
+        self.test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        self.cache_dir = os.path.join(self.test_temp_dir, "thumbnails")
+        source_image = os.path.join(package_root_dir, "core", "data", "curves", "symbol_bell.jpg")  # 512x512
+        self.image_path = os.path.join(self.test_temp_dir, "preview.jpg")
+        shutil.copy(source_image, self.image_path)
+
+    def tearDown(self):
+        maya_test_tools.delete_test_temp_dir()
+
+    def wait_for_thumbnails(self, cache):
+        cache.thread_pool.waitForDone()
+        ui_qt.QtWidgets.QApplication.processEvents()
+
+    def test_get_thumbnail_key(self):
+        key = ui_thumb_cache.get_thumbnail_key(self.image_path, size=128)
+        self.assertIsInstance(key, str)
+        self.assertEqual(key, ui_thumb_cache.get_thumbnail_key(self.image_path, size=128))
+        self.assertNotEqual(key, ui_thumb_cache.get_thumbnail_key(self.image_path, size=256))
+
+    def test_get_thumbnail_key_changes_with_file(self):
+        key = ui_thumb_cache.get_thumbnail_key(self.image_path)
+        stat = os.stat(self.image_path)
+        os.utime(self.image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        self.assertNotEqual(key, ui_thumb_cache.get_thumbnail_key(self.image_path))
+
+    def test_get_thumbnail_key_missing_file(self):
+        missing_path = os.path.join(self.test_temp_dir, "missing.jpg")
+        self.assertIsNone(ui_thumb_cache.get_thumbnail_key(missing_path))
+        self.assertIsNone(ui_thumb_cache.get_thumbnail_key(None))
+
+    def test_is_qt_resource_path(self):
+        self.assertTrue(ui_thumb_cache.is_qt_resource_path(":polyCube.png"))
+        self.assertFalse(ui_thumb_cache.is_qt_resource_path(self.image_path))
+        self.assertFalse(ui_thumb_cache.is_qt_resource_path(None))
+
+    def test_scale_thumbnail_image(self):
+        image = ui_qt.QtGui.QImage(self.image_path)
+        result = ui_thumb_cache.scale_thumbnail_image(image, size=64)
+        self.assertEqual(result.width(), 64)
+        self.assertEqual(result.height(), 64)
+        result = ui_thumb_cache.scale_thumbnail_image(result, size=256)
+        self.assertEqual(result.width(), 256)
+
+    def test_load_thumbnail_image_writes_disk_cache(self):
+        image = ui_thumb_cache.load_thumbnail_image(self.image_path, size=64, cache_dir=self.cache_dir)
+        self.assertFalse(image.isNull())
+        self.assertEqual(image.width(), 64)
+        key = ui_thumb_cache.get_thumbnail_key(self.image_path, size=64)
+        expected_file = os.path.join(self.cache_dir, f"{key}.{ui_thumb_cache.THUMBNAIL_FORMAT}")
+        self.assertTrue(os.path.isfile(expected_file))
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(expected_file)])
+
+    def test_load_thumbnail_image_reads_disk_cache(self):
+        ui_thumb_cache.load_thumbnail_image(self.image_path, size=64, cache_dir=self.cache_dir)
+        stat = os.stat(self.image_path)
+        with open(self.image_path, "wb") as file:  # Same size and time, but only the cached thumbnail is valid
+            file.write(bytes(stat.st_size))
+        os.utime(self.image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        image = ui_thumb_cache.load_thumbnail_image(self.image_path, size=64, cache_dir=self.cache_dir)
+        self.assertFalse(image.isNull())
+        self.assertEqual(image.width(), 64)
+
+    def test_load_thumbnail_image_invalid(self):
+        invalid_path = os.path.join(self.test_temp_dir, "invalid.jpg")
+        with open(invalid_path, "w") as file:
+            file.write("not an image")
+        image = ui_thumb_cache.load_thumbnail_image(invalid_path, size=64, cache_dir=self.cache_dir)
+        self.assertTrue(image.isNull())
+
+    def test_request_thumbnail_async(self):
+        cache = ui_thumb_cache.ThumbnailCache(size=64, cache_dir=self.cache_dir)
+        results = []
+        from_memory = cache.request_thumbnail(self.image_path, lambda path, pixmap: results.append((path, pixmap)))
+        self.assertFalse(from_memory)
+        self.wait_for_thumbnails(cache)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0], self.image_path)
+        self.assertEqual(results[0][1].width(), 64)
+        self.assertEqual(cache.get_memory_count(), 1)
+
+        from_memory = cache.request_thumbnail(self.image_path, lambda path, pixmap: results.append((path, pixmap)))
+        self.assertTrue(from_memory)
+        self.assertEqual(len(results), 2)
+
+    def test_request_thumbnail_shared_task(self):
+        cache = ui_thumb_cache.ThumbnailCache(size=64)
+        results = []
+        cache.request_thumbnail(self.image_path, lambda path, pixmap: results.append(1))
+        cache.request_thumbnail(self.image_path, lambda path, pixmap: results.append(2))
+        self.wait_for_thumbnails(cache)
+        self.assertEqual(sorted(results), [1, 2])
+
+    def test_request_thumbnail_missing_file(self):
+        cache = ui_thumb_cache.ThumbnailCache(size=64)
+        results = []
+        missing_path = os.path.join(self.test_temp_dir, "missing.jpg")
+        cache.request_thumbnail(missing_path, lambda path, pixmap: results.append(pixmap))
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].isNull())
+
+    def test_memory_limit(self):
+        cache = ui_thumb_cache.ThumbnailCache(size=64, memory_limit=2)
+        pixmap = ui_qt.QtGui.QPixmap(self.image_path)
+        cache.add_to_memory("one", pixmap)
+        cache.add_to_memory("two", pixmap)
+        cache.add_to_memory("one", pixmap)  # "one" becomes the most recently used
+        cache.add_to_memory("three", pixmap)
+        self.assertEqual(cache.get_memory_count(), 2)
+        self.assertEqual(list(cache._memory_cache.keys()), ["one", "three"])
+        cache.clear_memory()
+        self.assertEqual(cache.get_memory_count(), 0)
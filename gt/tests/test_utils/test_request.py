@@ -1,9 +1,15 @@
 from unittest.mock import patch, Mock, MagicMock, mock_open
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import tempfile
 import unittest
+import hashlib
 import urllib
 import logging
+import shutil
 import sys
 import os
+import re
 
 # Logging Setup
 logging.basicConfig()
@@ -17,6 +23,36 @@ if tools_root_dir not in sys.path:
 import gt.utils.request as utils_request
 
 
+class MockedFileRequestHandler(BaseHTTPRequestHandler):
+    """
+    Local HTTP server stand-in. Serves "server.file_data" and supports "Range" requests (unless disabled).
+    """
+
+    def do_GET(self):
+        data = self.server.file_data
+        self.server.request_headers.append(dict(self.headers))
+        range_header = self.headers.get("Range")
+        match = re.match(r"bytes=(\d+)-", range_header or "")
+        if match and self.server.supports_range:
+            start = int(match.group(1))
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+            data = data[start:]
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass  # Silence server output
+
+
 class TestRequestUtils(unittest.TestCase):
     def test_parse_http_request_url(self):
         url = "https://api.github.com/repos/etc"
@@ -151,3 +187,102 @@ class TestRequestUtils(unittest.TestCase):
     def test_open_package_docs_url_in_browser(self, mocked_open_url):
         utils_request.open_package_docs_url_in_browser()
         mocked_open_url.assert_called_once()
+
+
+class TestResumableDownload(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), MockedFileRequestHandler)
+        cls.server.file_data = bytes(range(256)) * 1024  # 256 KB
+        cls.server.supports_range = True
+        cls.server.request_headers = []
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/package.zip"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.destination = os.path.join(self.temp_dir, "package.zip")
+        self.server.supports_range = True
+        self.server.request_headers = []
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_partial_file(self, size):
+        with open(f"{self.destination}.part", "wb") as partial_file:
+            partial_file.write(self.server.file_data[:size])
+
+    def test_download_file_resumable(self):
+        checksum = hashlib.sha256(self.server.file_data).hexdigest()
+        result = utils_request.download_file_resumable(self.url, self.destination, expected_checksum=checksum)
+        self.assertEqual(self.destination, result)
+        with open(self.destination, "rb") as file:
+            self.assertEqual(self.server.file_data, file.read())
+        self.assertFalse(os.path.exists(f"{self.destination}.part"))
+
+    def test_download_file_resumable_resume(self):
+        self.write_partial_file(size=1000)
+        checksum = hashlib.sha256(self.server.file_data).hexdigest()
+        utils_request.download_file_resumable(self.url, self.destination, expected_checksum=checksum)
+        self.assertEqual("bytes=1000-", self.server.request_headers[0].get("Range"))
+        with open(self.destination, "rb") as file:
+            self.assertEqual(self.server.file_data, file.read())
+
+    def test_download_file_resumable_range_not_supported(self):
+        self.server.supports_range = False
+        self.write_partial_file(size=1000)
+        utils_request.download_file_resumable(self.url, self.destination)
+        with open(self.destination, "rb") as file:
+            self.assertEqual(self.server.file_data, file.read())
+
+    def test_download_file_resumable_already_complete(self):
+        self.write_partial_file(size=len(self.server.file_data))
+        checksum = hashlib.sha256(self.server.file_data).hexdigest()
+        utils_request.download_file_resumable(self.url, self.destination, expected_checksum=checksum)
+        with open(self.destination, "rb") as file:
+            self.assertEqual(self.server.file_data, file.read())
+
+    def test_download_file_resumable_checksum_mismatch(self):
+        with self.assertRaises(IOError):
+            utils_request.download_file_resumable(self.url, self.destination, expected_checksum="mocked_checksum")
+        self.assertFalse(os.path.exists(self.destination))
+        self.assertFalse(os.path.exists(f"{self.destination}.part"))
+
+    def test_download_file_resumable_size_mismatch(self):
+        with self.assertRaises(IOError):
+            utils_request.download_file_resumable(self.url, self.destination, expected_size=1)
+        self.assertFalse(os.path.exists(self.destination))
+
+    def test_download_file_resumable_throttled_callback(self):
+        mocked_callback = MagicMock()
+        utils_request.download_file_resumable(
+            self.url, self.destination, chunk_size=1024, callback=mocked_callback, callback_interval=60
+        )
+        # First chunk and the forced final call. Other chunks are within the interval
+        self.assertEqual(2, mocked_callback.call_count)
+        mocked_callback.assert_called_with(100)
+
+    def test_throttled_callback_flush(self):
+        mocked_callback = MagicMock()
+        throttled_callback = utils_request.ThrottledCallback(mocked_callback, interval=60)
+        throttled_callback(1, 10)
+        throttled_callback(2, 10)
+        throttled_callback(3, 10)
+        self.assertEqual(1, mocked_callback.call_count)
+        throttled_callback.flush()
+        mocked_callback.assert_called_with(3, 10)
+        self.assertEqual(2, mocked_callback.call_count)
+
+    def test_get_file_checksum(self):
+        file_path = os.path.join(self.temp_dir, "file.txt")
+        with open(file_path, "wb") as file:
+            file.write(b"mocked_data")
+        result = utils_request.get_file_checksum(file_path)
+        expected = hashlib.sha256(b"mocked_data").hexdigest()
+        self.assertEqual(expected, result)
@@ -358,7 +358,7 @@ class TestSystemUtils(unittest.TestCase):
         utils_system.process_launch_options(["mocked_script_name", "-install"])
         mock_install_package.assert_called_once()
         result = str(mock_install_package.call_args)
-        expected = "call(clean_install=False)"
+        expected = "call(clean_install=False, incremental=True)"
         self.assertEqual(expected, result)
 
     @patch("gt.core.setup.install_package")
@@ -466,6 +466,76 @@ class TestSystemUtils(unittest.TestCase):
         result = greet_person("Barbara", message="Hi")
         self.assertEqual(result, "Hi, Barbara!")
 
+    def test_time_profiler_records_active_profiler(self):
+        @time_profiler
+        def temp_function():
+            pass
+
+        with io.StringIO() as buf, redirect_stdout(buf):
+            with utils_system.TimeProfiler() as profiler:
+                temp_function()
+        events = profiler.get_events()
+        self.assertEqual(1, len(events))
+        self.assertEqual("temp_function", events[0].get("name"))
+        self.assertEqual("function", events[0].get("category"))
+
+    def test_profile_section_inactive(self):
+        self.assertIsNone(utils_system.get_active_time_profiler())
+        with utils_system.profile_section(name="mocked_section") as event:
+            self.assertIsNone(event)
+
+    def test_time_profiler_hierarchy(self):
+        with utils_system.TimeProfiler() as profiler:
+            self.assertEqual(profiler, utils_system.get_active_time_profiler())
+            with utils_system.profile_section(name="phase", category="phase"):
+                with utils_system.profile_section(name="module_a.build", module="module_a"):
+                    pass
+                with utils_system.profile_section(name="module_b.build", module="module_b"):
+                    pass
+        self.assertIsNone(utils_system.get_active_time_profiler())
+        events = profiler.get_events()
+        self.assertEqual(["phase", "module_a.build", "module_b.build"], [event.get("name") for event in events])
+        self.assertEqual([0, 1, 1], [event.get("depth") for event in events])
+        self.assertEqual([None, "phase", "phase"], [event.get("parent") for event in events])
+        phase_event = events[0]
+        children_time = events[1].get("duration") + events[2].get("duration")
+        self.assertAlmostEqual(phase_event.get("duration") - children_time, phase_event.get("self_time"))
+
+    def test_time_profiler_counters_and_summary(self):
+        counter = {"value": 0}
+        with utils_system.TimeProfiler(counters={"nodes": lambda: counter.get("value")}) as profiler:
+            for module_name in ["module_a", "module_b"]:
+                with utils_system.profile_section(name=f"{module_name}.build", module=module_name, phase="build"):
+                    counter["value"] += 2
+        summary = profiler.get_summary(group_by="phase")
+        self.assertEqual(1, len(summary))
+        self.assertEqual("build", summary[0].get("name"))
+        self.assertEqual(2, summary[0].get("calls"))
+        self.assertEqual(4, summary[0].get("nodes"))
+        summary = profiler.get_summary(group_by="module", sort_by="nodes")
+        self.assertEqual(["module_a", "module_b"], sorted([entry.get("name") for entry in summary]))
+        report = profiler.get_report(group_by="module")
+        self.assertIn("module_a", report)
+        self.assertIn("nodes", report)
+
+    def test_time_profiler_chrome_trace(self):
+        with utils_system.TimeProfiler(name="mocked_profiler") as profiler:
+            with utils_system.profile_section(name="phase", category="phase", module="module_a"):
+                pass
+        test_temp_dir = maya_test_tools.generate_test_temp_dir()
+        trace_path = os.path.join(test_temp_dir, "trace.json")
+        profiler.write_chrome_trace(trace_path)
+        import json
+
+        with open(trace_path, "r") as trace_file:
+            trace = json.load(trace_file)
+        trace_events = trace.get("traceEvents")
+        self.assertEqual("mocked_profiler", trace_events[0].get("args").get("name"))
+        self.assertEqual("X", trace_events[1].get("ph"))
+        self.assertEqual("phase", trace_events[1].get("cat"))
+        self.assertEqual({"module": "module_a"}, trace_events[1].get("args"))
+        self.assertIn("dur", trace_events[1])
+
     def test_single_valid_callback(self):
         # Test with a single valid callback function
         mock_callback = MagicMock()
@@ -652,6 +652,7 @@ class Proxy:
             loc_scale_cluster = core_curve.add_shape_scale_cluster(proxy_crv, scale_driver_attr=scale_attr)
         for attr in uuid_attrs:
             core_attr.set_attr(attribute_path=attr, value=self.uuid)
+        core_uuid.invalidate_active_uuid_index()
         # Set Transforms
         if self.offset_transform and apply_transforms:
             self.offset_transform.apply_transform(target_object=proxy_offset, world_space=True)
@@ -1972,14 +1973,14 @@ class ModuleGeneric:
         Returns:
             list: A list of transforms used as drivers/controls for this module.
         """
-        obj_list = cmds.ls(typ="transform", long=True) or []
+        driver_map = core_uuid.get_uuid_attr_map(
+            attr_name=tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID, obj_type="transform"
+        )
         matches = []
         module_uuid = self.uuid
-        for obj in obj_list:
-            if cmds.objExists(f"{obj}.{tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID}"):
-                uuid_value = cmds.getAttr(f"{obj}.{tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID}")
-                if uuid_value.startswith(module_uuid):
-                    matches.append(obj)
+        for uuid_value, objects in driver_map.items():
+            if uuid_value.startswith(module_uuid):
+                matches.extend(objects)
         return matches
 
     def find_proxy_drivers(self, proxy, as_dict=True):
@@ -2004,14 +2005,14 @@ class ModuleGeneric:
         driver_uuids = []
         for proxy_type in proxy_driver_types:
             driver_uuids.append(f"{self.uuid}-{proxy_type}-{proxy_purpose}")
-        obj_list = cmds.ls(typ="transform", long=True) or []
+        driver_map = core_uuid.get_uuid_attr_map(
+            attr_name=tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID, obj_type="transform"
+        )
         module_matches = {}
-        module_uuid = self.uuid
-        for obj in obj_list:
-            if cmds.objExists(f"{obj}.{tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID}"):
-                uuid_value = cmds.getAttr(f"{obj}.{tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID}")
-                if uuid_value.startswith(module_uuid):
-                    module_matches[uuid_value] = core_node.Node(obj)
+        for driver_uuid in driver_uuids:
+            objects = driver_map.get(driver_uuid)
+            if objects:
+                module_matches[driver_uuid] = core_node.Node(objects[-1])
         matches = []
         matches_dict = {}
         for driver_uuid in driver_uuids:
@@ -2587,6 +2588,7 @@ class ModuleGeneric:
             core_attr.set_attr(
                 obj_list=joint, attr_list=tools_rig_const.RiggerConstants.ATTR_JOINT_UUID, value=proxy.get_uuid()
             )
+            core_uuid.invalidate_active_uuid_index()
             # Add module reference - Module UUID
             core_attr.add_attr(
                 obj_list=joint, attributes=tools_rig_const.RiggerConstants.ATTR_MODULE_UUID, attr_type="string"
@@ -2694,6 +2696,7 @@ class RigProject:
         self.prefix = None
         self.modules = []
         self.preferences = RigPreferencesData()  # Initialize Preferences
+        self._proxy_uuid_module_map = None  # Cached map, see "get_proxy_uuid_module_map"
 
         if name:
             self.set_name(name=name)
@@ -2735,6 +2738,7 @@ class RigProject:
             logger.warning(f'Unable to set modules list. Expected a list but got "{str(type(modules))}"')
             return
         self.modules = modules
+        self.invalidate_proxy_uuid_module_map()
         self.refresh_modules_project_reference()
 
     def add_to_modules(self, module, set_parent_project=True):
@@ -2754,6 +2758,7 @@ class RigProject:
             for mod in module:
                 if str(mod.__class__.__name__) in all_modules:
                     self.modules.append(mod)
+                    self.invalidate_proxy_uuid_module_map()
                     if set_parent_project:
                         mod.set_parent_project(rig_project=self)
                 else:
@@ -2775,6 +2780,7 @@ class RigProject:
         for _module in self.modules:
             if module == _module:
                 self.modules.remove(module)
+                self.invalidate_proxy_uuid_module_map()
                 module.set_parent_project(rig_project=None)
                 return module
         logger.debug(f"Unable to remove module from project. Not found.")
@@ -2855,6 +2861,7 @@ class RigProject:
 
             _module.read_data_from_dict(module_dict=module_description)
             self.modules.append(_module)
+        self.invalidate_proxy_uuid_module_map()
         self.refresh_modules_project_reference()
 
     def read_data_from_dict(self, module_dict, clear_modules=True):
@@ -2868,6 +2875,7 @@ class RigProject:
         """
         if clear_modules:
             self.modules = []
+            self.invalidate_proxy_uuid_module_map()
         self.preferences = None
 
         if module_dict and not isinstance(module_dict, dict):
@@ -2929,14 +2937,45 @@ class RigProject:
         """
         return self.modules
 
+    def get_proxy_uuid_module_map(self, use_cache=True):
+        """
+        Gets a map of proxy UUIDs to the modules containing them.
+        The map is cached and reused until the modules list changes. (See "invalidate_proxy_uuid_module_map")
+        Args:
+            use_cache (bool, optional): If False, the map is rebuilt even when a cached version is available.
+        Returns:
+            dict: A dictionary where the key is the proxy UUID and the value is the module (ModuleGeneric)
+                  If the same UUID is found in multiple modules, the first module is used.
+        """
+        if use_cache and self._proxy_uuid_module_map is not None:
+            return self._proxy_uuid_module_map
+        proxy_uuid_module_map = {}
+        for module in self.modules:
+            for proxy_uuid in module.get_proxies_uuids():
+                proxy_uuid_module_map.setdefault(proxy_uuid, module)
+        self._proxy_uuid_module_map = proxy_uuid_module_map
+        return proxy_uuid_module_map
+
+    def invalidate_proxy_uuid_module_map(self):
+        """
+        Clears the cached proxy UUID to module map, causing it to be rebuilt on its next use.
+        """
+        self._proxy_uuid_module_map = None
+
     def get_module_from_proxy_uuid(self, uuid):
         """
         Returns a module in case a proxy with the provided UUID is found within this project.
+        Uses the cached proxy UUID map. Proxies added or removed after the map was built cause it to be rebuilt.
         Returns:
             ModuleGeneric or None: The module that contains the provided UUID, None otherwise.
         """
-        for module in self.modules:
-            if module.get_proxy_uuid_existence(uuid):
+        is_cached = self._proxy_uuid_module_map is not None
+        module = self.get_proxy_uuid_module_map().get(uuid)
+        if module and module.get_proxy_uuid_existence(uuid):
+            return module
+        if is_cached:  # Outdated or missing entry, rebuild once and try again
+            module = self.get_proxy_uuid_module_map(use_cache=False).get(uuid)
+            if module and module.get_proxy_uuid_existence(uuid):
                 return module
 
     def get_preferences(self):
@@ -3015,10 +3054,33 @@ class RigProject:
             required_order (str, None) If provided, the code will only run when matching the provided order
             according to the CodeData object.
         """
-        for module in self.modules:
-            if not module.is_active():  # If not active, skip
-                continue
-            module.execute_module_python_code(required_order=required_order)
+        with system_utils.profile_section(name=str(required_order), category="code"):
+            for module in self.modules:
+                if not module.is_active():  # If not active, skip
+                    continue
+                with self._profile_module_section(module=module, phase=str(required_order)):
+                    module.execute_module_python_code(required_order=required_order)
+
+    @staticmethod
+    def _profile_module_section(module, phase):
+        """
+        Gets a profiler section for a module build step. Only recorded when a TimeProfiler is active.
+        Section names use the pattern "<module name>.<phase>", the module and phase are also stored as arguments,
+        so reports can be aggregated per module or per phase. e.g. get_report(group_by="phase")
+        Args:
+            module (ModuleGeneric): Module running the step.
+            phase (str): Name of the build step. e.g. "build_rig"
+        Returns:
+            contextmanager: A "system_utils.profile_section" context manager.
+        """
+        module_name = module.get_name() or module.get_module_class_name()
+        return system_utils.profile_section(
+            name=f"{module_name}.{phase}",
+            category="module",
+            module=module_name,
+            module_uuid=module.get_uuid(),
+            phase=phase,
+        )
 
     def refresh_modules_project_reference(self):
         """
@@ -3028,24 +3090,48 @@ class RigProject:
         for module in self.modules:
             module.set_parent_project(rig_project=self)
 
-    def update_modules_order(self):
+    def get_modules_graph(self):
         """
-        Refreshes the order of the modules topologically to make sure children modules come after their parents
+        Gets the dependency graph of the modules. A module depends on the module containing its parent proxy.
+        Returns:
+            tuple: A tuple with two dictionaries (parents, children). Keys are the modules in the project.
+                   "parents": module as key, parent module (or None) as value.
+                   "children": module as key, list of child modules (in project order) as value.
         """
-        # Create Topological Hierarchy
-        updated_modules = self.get_modules()
-        for module in self.get_modules():
+        proxy_uuid_module_map = self.get_proxy_uuid_module_map(use_cache=False)
+        parents = {}
+        children = {module: [] for module in self.modules}
+        for module in self.modules:
+            parent_module = None
             parent_proxy_uuid = module.get_parent_uuid()
-            if not parent_proxy_uuid or not isinstance(parent_proxy_uuid, str):
-                continue
-            parent_module = self.get_module_from_proxy_uuid(parent_proxy_uuid)
-            if module == parent_module:
-                continue
-            if parent_module:
-                moving_module_index = updated_modules.index(module)
-                moving_module_popped = updated_modules.pop(moving_module_index)
-                parent_index = updated_modules.index(parent_module)
-                updated_modules.insert(parent_index + 1, moving_module_popped)
+            if parent_proxy_uuid and isinstance(parent_proxy_uuid, str):
+                parent_module = proxy_uuid_module_map.get(parent_proxy_uuid)
+            if parent_module is module or parent_module not in children:
+                parent_module = None  # Parented to itself or to a module that is not part of the project
+            parents[module] = parent_module
+            if parent_module is not None:
+                children[parent_module].append(module)
+        return parents, children
+
+    def update_modules_order(self):
+        """
+        Refreshes the order of the modules topologically to make sure children modules come after their parents
+        Children are placed right after their parents, otherwise the current order is kept.
+        Raises:
+            ValueError: If the modules are parented in a cycle. e.g. module A is the parent of B, B the parent of A.
+        """
+        parents, children = self.get_modules_graph()
+        # Kahn's algorithm - Each module has at most one parent, so it's ready as soon as its parent is placed
+        ready_modules = [module for module in reversed(self.modules) if parents.get(module) is None]
+        updated_modules = []
+        while ready_modules:
+            module = ready_modules.pop()  # Last in, first out keeps children next to their parents
+            updated_modules.append(module)
+            ready_modules.extend(reversed(children.get(module)))
+        if len(updated_modules) != len(self.modules):
+            placed_modules = set(updated_modules)
+            cycle_names = [str(module.get_name()) for module in self.modules if module not in placed_modules]
+            raise ValueError(f"Unable to update modules order. Cyclic parenting found between: {cycle_names}")
         self.set_modules(updated_modules)
 
     def print_modules_order(self, get_name=True):
@@ -3072,134 +3158,147 @@ class RigProject:
         """
         Builds Proxy/Guide Armature. This later becomes the skeleton that is driven by the rig controls.
         """
-        cmds.refresh(suspend=True)
-        try:
-            self.execute_modules_code(CodeData.Order.pre_proxy)  # Try to run any pre-proxy code.
-            root_group = tools_rig_utils.create_root_group(is_proxy=True)
-            root_transform = tools_rig_utils.create_ctrl_proxy_global()
-            core_hrchy.parent(source_objects=root_transform, target_parent=root_group)
-            category_groups = tools_rig_utils.create_utility_groups(line=True, target_parent=root_group)
-            line_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_LINES)
-            attr_to_activate = ["overrideEnabled", "overrideDisplayType", "hiddenInOutliner"]
-            core_attr.set_attr(obj_list=line_grp, attr_list=attr_to_activate, value=1)
-            core_attr.add_attr(
-                obj_list=str(root_transform), attributes="linesVisibility", attr_type="bool", default=True
-            )
-            cmds.connectAttr(f"{root_transform}.linesVisibility", f"{line_grp}.visibility")
-
-            # Build Proxy
-            proxy_data_list = []
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
-                proxy_data_list += module.build_proxy(optimized=optimized)
+        phase_section = system_utils.profile_section(name="build_proxy", category="phase")
+        with phase_section, core_uuid.UUIDAttrIndex():  # UUID lookups during the build are served by an index
+            cmds.refresh(suspend=True)
+            try:
+                self.execute_modules_code(CodeData.Order.pre_proxy)  # Try to run any pre-proxy code.
+                root_group = tools_rig_utils.create_root_group(is_proxy=True)
+                root_transform = tools_rig_utils.create_ctrl_proxy_global()
+                core_hrchy.parent(source_objects=root_transform, target_parent=root_group)
+                category_groups = tools_rig_utils.create_utility_groups(line=True, target_parent=root_group)
+                line_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_LINES)
+                attr_to_activate = ["overrideEnabled", "overrideDisplayType", "hiddenInOutliner"]
+                core_attr.set_attr(obj_list=line_grp, attr_list=attr_to_activate, value=1)
+                core_attr.add_attr(
+                    obj_list=str(root_transform), attributes="linesVisibility", attr_type="bool", default=True
+                )
+                cmds.connectAttr(f"{root_transform}.linesVisibility", f"{line_grp}.visibility")
+
+                # Build Proxy
+                proxy_data_list = []
+                for module in self.modules:
+                    if not module.is_active():  # If not active, skip
+                        continue
+                    with self._profile_module_section(module=module, phase="build_proxy"):
+                        proxy_data_list += module.build_proxy(optimized=optimized)
 
-            for proxy_data in proxy_data_list:
-                core_color.add_side_color_setup(obj=proxy_data.get_long_name())
-                core_hrchy.parent(source_objects=proxy_data.get_setup(), target_parent=line_grp)
-                core_hrchy.parent(source_objects=proxy_data.get_offset(), target_parent=root_transform)
+                for proxy_data in proxy_data_list:
+                    core_color.add_side_color_setup(obj=proxy_data.get_long_name())
+                    core_hrchy.parent(source_objects=proxy_data.get_setup(), target_parent=line_grp)
+                    core_hrchy.parent(source_objects=proxy_data.get_offset(), target_parent=root_transform)
 
-            # Parent Proxy
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
-                tools_rig_utils.parent_proxies(proxy_list=module.get_proxies())
-                if not optimized:
-                    tools_rig_utils.create_proxy_visualization_lines(
-                        proxy_list=module.get_proxies(), lines_parent=line_grp
-                    )
-                for proxy in module.get_proxies():
-                    proxy.apply_attr_dict()
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
-                module.build_proxy_setup()
+                # Parent Proxy
+                for module in self.modules:
+                    if not module.is_active():  # If not active, skip
+                        continue
+                    with self._profile_module_section(module=module, phase="parent_proxies"):
+                        tools_rig_utils.parent_proxies(proxy_list=module.get_proxies())
+                        if not optimized:
+                            tools_rig_utils.create_proxy_visualization_lines(
+                                proxy_list=module.get_proxies(), lines_parent=line_grp
+                            )
+                        for proxy in module.get_proxies():
+                            proxy.apply_attr_dict()
+                for module in self.modules:
+                    if not module.is_active():  # If not active, skip
+                        continue
+                    with self._profile_module_section(module=module, phase="build_proxy_setup"):
+                        module.build_proxy_setup()
 
-            cmds.select(clear=True)
-            self.execute_modules_code(CodeData.Order.post_proxy)  # Try to run any post-proxy code.
-        except Exception as e:
-            raise e
-        finally:
-            cmds.refresh(suspend=False)
-            cmds.refresh()
+                cmds.select(clear=True)
+                self.execute_modules_code(CodeData.Order.post_proxy)  # Try to run any post-proxy code.
+            except Exception as e:
+                raise e
+            finally:
+                cmds.refresh(suspend=False)
+                cmds.refresh()
 
     def build_skeleton(self):
         """
         Builds project skeleton.
         """
-        self.execute_modules_code(CodeData.Order.pre_skeleton)  # Try to run any pre-skeleton code.
+        with system_utils.profile_section(name="build_skeleton", category="phase"):
+            self.execute_modules_code(CodeData.Order.pre_skeleton)  # Try to run any pre-skeleton code.
 
-        # builds module joints
-        for module in self.modules:
-            if not module.is_active():  # If not active, skip
-                continue
-            module.build_skeleton_joints()
+            # builds module joints
+            for module in self.modules:
+                if not module.is_active():  # If not active, skip
+                    continue
+                with self._profile_module_section(module=module, phase="build_skeleton_joints"):
+                    module.build_skeleton_joints()
 
-        # builds module skeleton hierarchy
-        for module in self.modules:
-            if not module.is_active():  # If not active, skip
-                continue
-            module.build_skeleton_hierarchy()
+            # builds module skeleton hierarchy
+            for module in self.modules:
+                if not module.is_active():  # If not active, skip
+                    continue
+                with self._profile_module_section(module=module, phase="build_skeleton_hierarchy"):
+                    module.build_skeleton_hierarchy()
 
-        self.execute_modules_code(CodeData.Order.post_skeleton)  # Try to run any post-skeleton code.
+            self.execute_modules_code(CodeData.Order.post_skeleton)  # Try to run any post-skeleton code.
 
     def build_rig(self):
         """
         Builds Rig using Proxy/Guide Armature/Skeleton (from previous step (build_proxy)
         """
-        cmds.refresh(suspend=True)
-        try:
-            root_group = tools_rig_utils.create_root_group()
-            global_ctrl = tools_rig_utils.create_ctrl_global()
-            global_offset_ctrl = tools_rig_utils.create_ctrl_global_offset()
-            category_groups = tools_rig_utils.create_utility_groups(
-                geometry=True, skeleton=True, control=True, setup=True, target_parent=root_group
-            )
-            control_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_CONTROL)
-            skeleton_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_SKELETON)
-            setup_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_SETUP)
-            core_hrchy.parent(source_objects=list(category_groups.values()), target_parent=root_group)
-            core_hrchy.parent(source_objects=global_ctrl, target_parent=control_grp)
-            core_hrchy.parent(source_objects=global_offset_ctrl, target_parent=global_ctrl)
-
-            # connect Scale
-            cmds.connectAttr(f"{global_ctrl}.scale", f"{skeleton_grp}.scale")
-            cmds.connectAttr(f"{global_ctrl}.scale", f"{setup_grp}.scale")
-
-            # build skeleton
-            self.build_skeleton()
-
-            # build rig
-            if self.get_preferences_dict_value(key="build_control_rig", default=True):  # Key from RigPreferencesData
-                self.execute_modules_code(CodeData.Order.pre_control_rig)  # Try to run any pre-control-rig code.
-
-                for module in self.modules:
-                    if not module.is_active():  # If not active, skip
-                        continue
-                    module.build_rig()
-
-                # build rig post
-                for module in self.modules:
-                    if not module.is_active():  # If not active, skip
-                        continue
-                    module.build_rig_post()
-
-                self.execute_modules_code(CodeData.Order.post_control_rig)  # Try to run any pre-control-rig code.
-
-            # delete proxy
-            if self.get_preferences_dict_value(key="delete_proxy_after_build", default=True):
-                proxy_root = tools_rig_utils.find_root_group_proxy()
-                if proxy_root:
-                    cmds.delete(proxy_root)
-
-            self.execute_modules_code(CodeData.Order.post_build)  # Try to run any post_build code.
+        phase_section = system_utils.profile_section(name="build_rig", category="phase")
+        with phase_section, core_uuid.UUIDAttrIndex():  # UUID lookups during the build are served by an index
+            cmds.refresh(suspend=True)
+            try:
+                root_group = tools_rig_utils.create_root_group()
+                global_ctrl = tools_rig_utils.create_ctrl_global()
+                global_offset_ctrl = tools_rig_utils.create_ctrl_global_offset()
+                category_groups = tools_rig_utils.create_utility_groups(
+                    geometry=True, skeleton=True, control=True, setup=True, target_parent=root_group
+                )
+                control_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_CONTROL)
+                skeleton_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_SKELETON)
+                setup_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_SETUP)
+                core_hrchy.parent(source_objects=list(category_groups.values()), target_parent=root_group)
+                core_hrchy.parent(source_objects=global_ctrl, target_parent=control_grp)
+                core_hrchy.parent(source_objects=global_offset_ctrl, target_parent=global_ctrl)
+
+                # connect Scale
+                cmds.connectAttr(f"{global_ctrl}.scale", f"{skeleton_grp}.scale")
+                cmds.connectAttr(f"{global_ctrl}.scale", f"{setup_grp}.scale")
+
+                # build skeleton
+                self.build_skeleton()
+
+                # build rig
+                # Key from RigPreferencesData
+                if self.get_preferences_dict_value(key="build_control_rig", default=True):
+                    self.execute_modules_code(CodeData.Order.pre_control_rig)  # Try to run any pre-control-rig code.
+
+                    for module in self.modules:
+                        if not module.is_active():  # If not active, skip
+                            continue
+                        with self._profile_module_section(module=module, phase="build_rig"):
+                            module.build_rig()
+
+                    # build rig post
+                    for module in self.modules:
+                        if not module.is_active():  # If not active, skip
+                            continue
+                        with self._profile_module_section(module=module, phase="build_rig_post"):
+                            module.build_rig_post()
+
+                    self.execute_modules_code(CodeData.Order.post_control_rig)  # Try to run any pre-control-rig code.
+
+                # delete proxy
+                if self.get_preferences_dict_value(key="delete_proxy_after_build", default=True):
+                    proxy_root = tools_rig_utils.find_root_group_proxy()
+                    if proxy_root:
+                        cmds.delete(proxy_root)
+
+                self.execute_modules_code(CodeData.Order.post_build)  # Try to run any post_build code.
 
-        except Exception as e:
-            raise e
-        finally:
-            cmds.refresh(suspend=False)
-            cmds.refresh()
-            cmds.select(clear=True)
+            except Exception as e:
+                raise e
+            finally:
+                cmds.refresh(suspend=False)
+                cmds.refresh()
+                cmds.select(clear=True)
 
 
 def get_environment_variables(rig_project=None):
@@ -18,6 +18,7 @@ import gt.core.str as core_str
 import gt.core.attr as core_attr
 import gt.core.node as core_node
 import gt.core.uuid as core_uuid
+import gt.utils.system as system_utils
 import maya.cmds as cmds
 import logging
 import json
@@ -308,23 +309,22 @@ def find_drivers_from_module(module_uuid, filter_driver_type=None, filter_driver
     if module_uuid and isinstance(module_uuid, ModuleGeneric):
         module_uuid = module_uuid.get_uuid()
     module_drivers = []
-    transforms = cmds.ls(typ="transform", long=True) or []
-    for obj in transforms:
-        attr_path = f"{obj}.{tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID}"
-        if cmds.objExists(attr_path):
-            attr_value = core_attr.get_attr(attribute_path=attr_path)
-            if not attr_value:
-                continue  # Missing UUID driver data, skip it
-            if filter_driver_type and isinstance(filter_driver_type, str):
-                # Check if it has valid content
-                if len(str(attr_value).split("-")) == 3 and str(attr_value).split("-")[1] != filter_driver_type:
-                    continue  # Not of the desired type, skip it
-            if filter_driver_purpose and isinstance(filter_driver_purpose, str):
-                # Check if it has valid content
-                if len(str(attr_value).split("-")) == 3 and str(attr_value).split("-")[2] != filter_driver_purpose:
-                    continue  # Not of the desired purpose, skip it
-            if attr_value.startswith(module_uuid):
-                module_drivers.append(core_node.Node(obj))
+    driver_map = core_uuid.get_uuid_attr_map(
+        attr_name=tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID, obj_type="transform"
+    )
+    for attr_value, objects in driver_map.items():
+        if not attr_value.startswith(module_uuid):
+            continue  # Different module, skip it
+        if filter_driver_type and isinstance(filter_driver_type, str):
+            # Check if it has valid content
+            if len(str(attr_value).split("-")) == 3 and str(attr_value).split("-")[1] != filter_driver_type:
+                continue  # Not of the desired type, skip it
+        if filter_driver_purpose and isinstance(filter_driver_purpose, str):
+            # Check if it has valid content
+            if len(str(attr_value).split("-")) == 3 and str(attr_value).split("-")[2] != filter_driver_purpose:
+                continue  # Not of the desired purpose, skip it
+        for obj in objects:
+            module_drivers.append(core_node.Node(obj))
     # Find Supporting Drivers
     for driver in module_drivers:
         if not cmds.objExists(f"{driver}.{tools_rig_const.RiggerConstants.ATTR_DRIVER_UUID}"):
@@ -897,6 +897,7 @@ def add_driver_uuid_attr(target_driver, module_uuid, driver_type=None, proxy_pur
         verbose=True,
     )[0]
     core_attr.set_attr(attribute_path=uuid_attr, value=str(uuid))
+    core_uuid.invalidate_active_uuid_index()
     return uuid
 
 
@@ -1281,6 +1282,30 @@ def create_control_visualization_line(control, end_obj):
     return line_curve
 
 
+def create_build_profiler(name="rig_build", count_nodes=True):
+    """
+    Creates a profiler used to time rig project builds. Profiling only happens while the profiler is active.
+
+    Usage:
+        with create_build_profiler() as profiler:
+            rig_project.build_proxy()
+            rig_project.build_rig()
+        print(profiler.get_report(group_by="phase"))  # or group_by="module"
+        profiler.write_chrome_trace(r"C:/temp/rig_build_trace.json")  # Open in "chrome://tracing" or Perfetto
+
+    Args:
+        name (str, optional): Name of the profiler. Shown in reports and in the Chrome trace.
+        count_nodes (bool, optional): If True, the number of nodes created by each section is also recorded.
+                                      (Lists all scene nodes when a section starts/ends, adding some overhead)
+    Returns:
+        TimeProfiler: A profiler to be entered using a "with" statement.
+    """
+    counters = {}
+    if count_nodes:
+        counters["nodes"] = lambda: len(cmds.ls() or [])
+    return system_utils.TimeProfiler(name=name, counters=counters)
+
+
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
     # cmds.file(new=True, force=True)
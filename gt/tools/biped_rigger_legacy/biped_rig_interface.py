@@ -161,6 +161,14 @@
  1.5.11 - 2022-10-27
  Fixed an issue where locators would be left in the scene if the pose mirror functioned failed
 
+ 1.5.12 - 2026-10-18
+ Animation export, import and mirror now read and write whole anim curves in bulk (gt.core.anim)
+ Animation import and mirror are undone as a single step
+
+ 1.5.13 - 2026-10-18
+ FK/IK bake no longer scrubs the timeline. Poses are sampled and solved in memory and keyed in bulk (fk_ik_bake)
+ FK/IK bake can process multiple limbs in one pass and also keys the end frame
+
  TODO:
     Overwrite keys for animation functions
     Option to save pose thumbnail when exporting it
@@ -168,7 +176,9 @@
 """
 
 from maya import OpenMayaUI as OpenMayaUI
+import maya.api.OpenMaya as apiOpenMaya
 import gt.ui.qt_import as ui_qt
+import gt.core.anim as core_anim
 import maya.cmds as cmds
 import maya.mel as mel
 import traceback
@@ -191,7 +201,7 @@ script_name = "Custom Rig Interface"
 unique_rig = ""  # If provided, it will be used in the window title
 
 # Version:
-script_version = "1.5.11"
+script_version = "1.5.13"
 
 # Script General Settings:
 gt_custom_rig_interface_settings = {
@@ -1463,6 +1473,203 @@ def _open_gt_tools_documentation():
     cmds.showHelp("https://github.com/TrevisanGMW/gt-tools/tree/release/docs#-gt-biped-auto-rigger-", absolute=True)
 
 
+def _get_clavicle_influence_attr(ik_fk_dict, namespace=""):
+    """
+    Gets the clavicle influence attribute of a limb. (Auto clavicle is not compatible with the FK/IK match)
+
+    Args:
+        ik_fk_dict (dict): A dictionary containing the elements that are part of the system you want to switch
+        namespace (optional, string): In case the rig has a namespace, it will be used to find the attribute.
+
+    Returns:
+        str or None: Path to the clavicle influence attribute or None if the limb doesn't have one.
+    """
+    if not ik_fk_dict.get("incompatible_attr_holder"):
+        return None
+    ns_incompatible_attr_holder = namespace + ik_fk_dict.get("incompatible_attr_holder")
+    available_attributes = cmds.listAttr(ns_incompatible_attr_holder, userDefined=True) or []
+    if "autoClavicleInfluence" in available_attributes:  # Before V1.7
+        return ns_incompatible_attr_holder + ".autoClavicleInfluence"
+    return ns_incompatible_attr_holder + ".clavicleInfluence"
+
+
+def _reset_auxiliary_ik_controls(ik_fk_ns_dict):
+    """
+    Resets the auxiliary feet controls (roll and IK ball) so the IK foot can be matched to the FK foot.
+
+    Args:
+        ik_fk_ns_dict (dict): A limb dictionary where the values already include the namespace
+    """
+    for key in ["auxiliary_roll_ankle", "auxiliary_roll_ball", "auxiliary_roll_toe"]:
+        if ik_fk_ns_dict.get(key):
+            for xyz in ["x", "y", "z"]:
+                cmds.setAttr(ik_fk_ns_dict.get(key) + ".r" + xyz, 0)
+    if ik_fk_ns_dict.get("auxiliary_roll_up_down_toe"):
+        for xyz in ["x", "y", "z"]:
+            cmds.setAttr(ik_fk_ns_dict.get("auxiliary_roll_up_down_toe") + ".t" + xyz, 0)
+    if ik_fk_ns_dict.get("auxiliary_ik_ball"):
+        for xyz in ["x", "y", "z"]:
+            cmds.setAttr(ik_fk_ns_dict.get("auxiliary_ik_ball") + ".t" + xyz, 0)
+            cmds.setAttr(ik_fk_ns_dict.get("auxiliary_ik_ball") + ".r" + xyz, 0)
+
+
+def _get_fk_ik_match_pairs(ik_fk_dict, direction="fk_to_ik", namespace=""):
+    """
+    Gets the controls that receive a new pose during a FK/IK switch and the references they are matched to.
+
+    Args:
+        ik_fk_dict (dict): A dictionary containing the elements that are part of the system you want to switch
+        direction (optional, string): Either "fk_to_ik" or "ik_to_fk".
+        namespace (optional, string): In case the rig has a namespace, it will be added to the returned objects.
+
+    Returns:
+        list: A list of pairs [target_ctrl, reference] (with namespace). Missing auxiliary controls are ignored.
+    """
+    if direction == "fk_to_ik":
+        end_reference = "end_ik_reference" if ik_fk_dict.get("end_ik_reference") != "" else "end_fk_jnt"
+        key_pairs = [
+            ["end_ik_ctrl", end_reference],
+            ["pvec_ik_ctrl", "mid_ik_reference"],
+            ["auxiliary_ik_ball", "auxiliary_fk_ball_ref"],
+        ]
+    else:
+        key_pairs = [
+            ["base_fk_ctrl", "base_ik_ref"],
+            ["mid_fk_ctrl", "mid_ik_ref"],
+            ["end_fk_ctrl", "end_ik_ref"],
+            ["auxiliary_fk_ball", "auxiliary_roll_ball_ref"],
+        ]
+    match_pairs = []
+    for target_key, reference_key in key_pairs:
+        if not ik_fk_dict.get(target_key) or not ik_fk_dict.get(reference_key):
+            continue
+        target = namespace + ik_fk_dict.get(target_key)
+        reference = namespace + ik_fk_dict.get(reference_key)
+        if cmds.objExists(target) and cmds.objExists(reference):
+            match_pairs.append([target, reference])
+    return match_pairs
+
+
+def fk_ik_bake(limbs, start_time, end_time, namespace="", key_influence=True):
+    """
+    Bakes the FK/IK match of one or multiple limbs across a frame range without scrubbing the timeline.
+    World matrices for all limbs are sampled in a single pass (one DG context evaluation per frame), the matched
+    poses are computed in memory and all keys are written at once (one anim curve per channel).
+    Controls are expected to use their default pivots and rotate axis (same as the rig controls).
+
+    Args:
+        limbs (list): A list of pairs (ik_fk_dict, direction). Direction is either "fk_to_ik" or "ik_to_fk".
+                      e.g. [(left_arm_seamless_dict, "fk_to_ik"), (left_leg_seamless_dict, "fk_to_ik")]
+        start_time (int): First baked frame. The influence switch receives its current value here.
+        end_time (int): Last baked frame. The influence switch receives its new value here.
+        namespace (optional, string): In case the rig has a namespace, it will be used to find the controls.
+        key_influence (optional, bool): If active, the "influenceSwitch" attribute is keyed on the start and end
+                                        frames. Otherwise, it's only set to its new value.
+
+    Returns:
+        dict: Attribute paths as keys and the name of their anim curves as values.
+    """
+    time_list = list(range(int(start_time), int(end_time) + 1))
+    function_name = "FK/IK Bake"
+    cmds.undoInfo(openChunk=True, chunkName=function_name)
+    clavicle_values = {}
+    try:
+        # Auto clavicle is not compatible with the match
+        for ik_fk_dict, direction in limbs:
+            clavicle_attr = _get_clavicle_influence_attr(ik_fk_dict, namespace)
+            if clavicle_attr and clavicle_attr not in clavicle_values:
+                clavicle_values[clavicle_attr] = cmds.getAttr(clavicle_attr)
+                cmds.setAttr(clavicle_attr, 0)
+
+        # Collect Targets (Sorted by depth, so parents are solved before their children)
+        match_pairs = []
+        switch_values = {}
+        for ik_fk_dict, direction in limbs:
+            if direction == "fk_to_ik":
+                _reset_auxiliary_ik_controls({key: namespace + value for key, value in ik_fk_dict.items() if value})
+            match_pairs.extend(_get_fk_ik_match_pairs(ik_fk_dict, direction=direction, namespace=namespace))
+            switch_values[namespace + ik_fk_dict.get("switch_ctrl") + ".influenceSwitch"] = (
+                1 if direction == "fk_to_ik" else 0
+            )
+        long_names = {target: cmds.ls(target, long=True)[0] for target, _ in match_pairs}
+        match_pairs.sort(key=lambda pair: long_names.get(pair[0]).count("|"))
+        target_parents = {}
+        for target, _ in match_pairs:
+            ancestors = [
+                other
+                for other, _ in match_pairs
+                if other != target and long_names.get(target).startswith(long_names.get(other) + "|")
+            ]
+            if ancestors:  # Closest target ancestor
+                target_parents[target] = max(ancestors, key=lambda other: len(long_names.get(other)))
+
+        # Sample all frames in one pass
+        attr_paths = []
+        for target, reference in match_pairs:
+            attr_paths.extend([reference + ".worldMatrix[0]", target + ".worldMatrix[0]", target + ".parentMatrix[0]"])
+        matrices = core_anim.get_matrices_at_times(attr_paths, time_list)
+
+        # Solve Poses
+        curves_data = {}
+        target_channels = {}
+        for target, _ in match_pairs:
+            channels = []
+            for channel, curve_type in [("t", "animCurveTL"), ("r", "animCurveTA")]:
+                for dimension in ["x", "y", "z"]:
+                    attr_path = target + "." + channel + dimension
+                    if cmds.getAttr(attr_path, lock=True):
+                        channels.append(None)
+                        continue
+                    curves_data[attr_path] = core_anim.AnimCurveData(curve_type=curve_type)
+                    channels.append(attr_path)
+            target_channels[target] = channels
+        previous_rotations = {}
+        for index, time_value in enumerate(time_list):
+            matched_matrices = {}
+            for target, reference in match_pairs:
+                reference_matrix = matrices.get(reference + ".worldMatrix[0]")[index]
+                world_matrix = matrices.get(target + ".worldMatrix[0]")[index]
+                parent_matrix = matrices.get(target + ".parentMatrix[0]")[index]
+                target_parent = target_parents.get(target)
+                if target_parent:  # Parent moves with the new pose of its matched ancestor
+                    old_ancestor_matrix = matrices.get(target_parent + ".worldMatrix[0]")[index]
+                    parent_matrix = parent_matrix * old_ancestor_matrix.inverse() * matched_matrices.get(target_parent)
+
+                # Position and rotation from reference, scale is kept (same as "matchTransform")
+                matched_transform = apiOpenMaya.MTransformationMatrix(reference_matrix)
+                world_scale = apiOpenMaya.MTransformationMatrix(world_matrix).scale(apiOpenMaya.MSpace.kWorld)
+                matched_transform.setScale(world_scale, apiOpenMaya.MSpace.kWorld)
+                matched_matrices[target] = matched_transform.asMatrix()
+
+                local_transform = apiOpenMaya.MTransformationMatrix(matched_matrices[target] * parent_matrix.inverse())
+                translation = local_transform.translation(apiOpenMaya.MSpace.kTransform)
+                rotation = local_transform.rotation().reorder(cmds.getAttr(target + ".rotateOrder"))
+                if target in previous_rotations:
+                    rotation = rotation.closestSolution(previous_rotations.get(target))
+                previous_rotations[target] = rotation
+                values = [apiOpenMaya.MDistance.internalToUI(value) for value in translation]
+                values += [apiOpenMaya.MAngle.internalToUI(value) for value in (rotation.x, rotation.y, rotation.z)]
+                for attr_path, value in zip(target_channels.get(target), values):
+                    if attr_path:
+                        curves_data[attr_path].add_key(time_value, value)
+
+        # Influence Switch
+        for switch_attr, switch_value in switch_values.items():
+            if key_influence:
+                curve_data = core_anim.AnimCurveData(curve_type="animCurveTU")
+                curve_data.add_key(time_list[0], cmds.getAttr(switch_attr, time=time_list[0]))
+                curve_data.add_key(time_list[-1], switch_value)
+                curves_data[switch_attr] = curve_data
+            else:
+                cmds.setAttr(switch_attr, switch_value)
+
+        return core_anim.set_anim_curves_data(curves_data, replace=False)
+    finally:
+        for clavicle_attr, clavicle_value in clavicle_values.items():
+            cmds.setAttr(clavicle_attr, clavicle_value)
+        cmds.undoInfo(closeChunk=True, chunkName=function_name)
+
+
 def fk_ik_switch(
     ik_fk_dict, direction="fk_to_ik", namespace="", keyframe=False, start_time=0, end_time=0, method="sparse"
 ):
@@ -1485,8 +1692,7 @@ def fk_ik_switch(
 
     def switch(match_only=False):
         """
-        Performs the switch operation.
-        Commands were wrapped into a function to be used during the bake operation.
+        Performs the switch operation. (The bake operation uses "fk_ik_bake" instead)
 
         Args:
             match_only (optional, bool) If active (True) it will only match the pose, but not switch
@@ -1521,22 +1727,7 @@ def fk_ik_switch(
                     cmds.setAttr(ik_fk_ns_dict.get("switch_ctrl") + ".influenceSwitch", 1)
 
                 # Special Cases (Auxiliary Feet Controls)
-                if ik_fk_ns_dict.get("auxiliary_roll_ankle"):
-                    for xyz in ["x", "y", "z"]:
-                        cmds.setAttr(ik_fk_ns_dict.get("auxiliary_roll_ankle") + ".r" + xyz, 0)
-                if ik_fk_ns_dict.get("auxiliary_roll_ball"):
-                    for xyz in ["x", "y", "z"]:
-                        cmds.setAttr(ik_fk_ns_dict.get("auxiliary_roll_ball") + ".r" + xyz, 0)
-                if ik_fk_ns_dict.get("auxiliary_roll_toe"):
-                    for xyz in ["x", "y", "z"]:
-                        cmds.setAttr(ik_fk_ns_dict.get("auxiliary_roll_toe") + ".r" + xyz, 0)
-                if ik_fk_ns_dict.get("auxiliary_roll_up_down_toe"):
-                    for xyz in ["x", "y", "z"]:
-                        cmds.setAttr(ik_fk_ns_dict.get("auxiliary_roll_up_down_toe") + ".t" + xyz, 0)
-                if ik_fk_ns_dict.get("auxiliary_ik_ball"):
-                    for xyz in ["x", "y", "z"]:
-                        cmds.setAttr(ik_fk_ns_dict.get("auxiliary_ik_ball") + ".t" + xyz, 0)
-                        cmds.setAttr(ik_fk_ns_dict.get("auxiliary_ik_ball") + ".r" + xyz, 0)
+                _reset_auxiliary_ik_controls(ik_fk_ns_dict)
 
                 # Transfer from FK to IK Ball
                 if cmds.objExists(ik_fk_ns_dict.get("auxiliary_fk_ball_ref") or ""):
@@ -1630,15 +1821,10 @@ def fk_ik_switch(
         cmds.warning("No controls were found. Make sure you are using the correct namespace.")
     else:
         auto_clavicle_value = None
-        if ik_fk_dict.get("incompatible_attr_holder"):
-            ns_incompatible_attr_holder = namespace + ik_fk_dict.get("incompatible_attr_holder")
-            available_attributes = cmds.listAttr(ns_incompatible_attr_holder, userDefined=True)
-            if "autoClavicleInfluence" in available_attributes:  # Before V1.7
-                auto_clavicle_value = cmds.getAttr(ns_incompatible_attr_holder + ".autoClavicleInfluence")
-                cmds.setAttr(ns_incompatible_attr_holder + ".autoClavicleInfluence", 0)
-            else:
-                auto_clavicle_value = cmds.getAttr(ns_incompatible_attr_holder + ".clavicleInfluence")
-                cmds.setAttr(ns_incompatible_attr_holder + ".clavicleInfluence", 0)
+        clavicle_attr = _get_clavicle_influence_attr(ik_fk_dict, namespace)
+        if clavicle_attr:
+            auto_clavicle_value = cmds.getAttr(clavicle_attr)
+            cmds.setAttr(clavicle_attr, 0)
         if keyframe:
             if method.lower() == "sparse":  # Only Influence Switch
                 original_time = cmds.currentTime(q=True)
@@ -1659,81 +1845,29 @@ def fk_ik_switch(
                 if start_time >= end_time:
                     cmds.warning("Invalid range. Please review the start and end frames and try again.")
                 else:
-                    original_time = cmds.currentTime(q=True)
-                    cmds.currentTime(start_time)
-                    current_time = cmds.currentTime(q=True)
-                    if gt_custom_rig_interface_settings.get("key_influence"):
-                        cmds.setKeyframe(
-                            namespace + ik_fk_dict.get("switch_ctrl"), time=current_time, attribute="influenceSwitch"
-                        )  # Start Switch
-                    for index in range(end_time - start_time):
-                        cmds.currentTime(current_time)
-                        switch(match_only=True)
-                        if direction == "fk_to_ik":
-                            for channel in ["t", "r"]:
-                                for dimension in ["x", "y", "z"]:
-                                    cmds.setKeyframe(
-                                        namespace + ik_fk_dict.get("end_ik_ctrl"),
-                                        time=current_time,
-                                        attribute=channel + dimension,
-                                    )  # Wrist IK Ctrl
-                                    cmds.setKeyframe(
-                                        namespace + ik_fk_dict.get("pvec_ik_ctrl"),
-                                        time=current_time,
-                                        attribute=channel + dimension,
-                                    )  # PVec Elbow IK Ctrl
-                                    if ik_fk_dict.get("auxiliary_ik_ball"):
-                                        cmds.setKeyframe(
-                                            namespace + ik_fk_dict.get("auxiliary_ik_ball"),
-                                            time=current_time,
-                                            attribute=channel + dimension,
-                                        )  # Toe Full IK Control
-
-                        if direction == "ik_to_fk":
-                            for channel in ["t", "r"]:
-                                for dimension in ["x", "y", "z"]:
-                                    cmds.setKeyframe(
-                                        namespace + ik_fk_dict.get("base_fk_ctrl"),
-                                        time=current_time,
-                                        attribute=channel + dimension,
-                                    )  # Shoulder FK Ctrl
-                                    cmds.setKeyframe(
-                                        namespace + ik_fk_dict.get("end_fk_ctrl"),
-                                        time=current_time,
-                                        attribute=channel + dimension,
-                                    )  # Wrist FK Ctrl
-                                    cmds.setKeyframe(
-                                        namespace + ik_fk_dict.get("mid_fk_ctrl"),
-                                        time=current_time,
-                                        attribute=channel + dimension,
-                                    )  # Elbow FK Ctrl
-                                    if ik_fk_dict.get("auxiliary_fk_ball"):
-                                        cmds.setKeyframe(
-                                            namespace + ik_fk_dict.get("auxiliary_fk_ball"),
-                                            time=current_time,
-                                            attribute=channel + dimension,
-                                        )  # Ball FK Ctrl
-                        current_time += 1
-                    switch()
-                    if gt_custom_rig_interface_settings.get("key_influence"):
-                        cmds.setKeyframe(
-                            namespace + ik_fk_dict.get("switch_ctrl"), time=current_time, attribute="influenceSwitch"
-                        )  # End Switch
-                    cmds.currentTime(original_time)
-                    print_inview_feedback()
+                    try:
+                        fk_ik_bake(
+                            [(ik_fk_dict, direction)],
+                            start_time=start_time,
+                            end_time=end_time,
+                            namespace=namespace,
+                            key_influence=gt_custom_rig_interface_settings.get("key_influence"),
+                        )
+                        print_inview_feedback()
+                    except Exception as e:
+                        logger.debug(str(traceback.format_exc()))
+                        cmds.warning(
+                            "An error occurred. Please check if a namespace is necessary or if a "
+                            "control was deleted.     Error: " + str(e)
+                        )
             else:
                 cmds.warning('Invalid method was provided. Must be either "sparse" or "bake", but got ' + method)
         else:
             switch()
             print_inview_feedback()
 
-        if ik_fk_dict.get("incompatible_attr_holder"):
-            ns_incompatible_attr_holder = namespace + ik_fk_dict.get("incompatible_attr_holder")
-            available_attributes = cmds.listAttr(ns_incompatible_attr_holder, userDefined=True)
-            if "autoClavicleInfluence" in available_attributes:  # Before V1.7
-                cmds.setAttr(ns_incompatible_attr_holder + ".autoClavicleInfluence", auto_clavicle_value)
-            else:
-                cmds.setAttr(ns_incompatible_attr_holder + ".clavicleInfluence", auto_clavicle_value)
+        if clavicle_attr:
+            cmds.setAttr(clavicle_attr, auto_clavicle_value)
             if auto_clavicle_value != 0:
                 # Print Feedback
                 cmds.inViewMessage(
@@ -2631,23 +2765,6 @@ def anim_mirror(biped_ctrls, source_side, namespace=""):
 
     """
 
-    def invert_float_list_values(float_list):
-        """
-        Returns a list where all the float values are inverted. For example, if the value is 5, it will then become -5.
-
-        Args:
-            float_list (list) : A list of floats.
-
-        Returns:
-            inverted_float_list (list): A list of floats with their values inverted
-
-        """
-
-        inverted_values = []
-        for val in float_list:
-            inverted_values.append(val * -1)
-        return inverted_values
-
     # Merge Dictionaries
     biped_ctrls_dict = {}
     for ctrl_dict in biped_ctrls:
@@ -2665,6 +2782,7 @@ def anim_mirror(biped_ctrls, source_side, namespace=""):
     if len(available_ctrls) != 0:
 
         errors = []
+        mirrored_curves = {}
 
         right_side_objects = []
         left_side_objects = []
@@ -2687,262 +2805,48 @@ def anim_mirror(biped_ctrls, source_side, namespace=""):
                     # TR = [(inverted?,inverted?,inverted?),(inverted?,inverted?,inverted?)]
                     key = biped_ctrls_dict.get(remove_side_tag_right)
 
-                    # Mirroring Transform?, Inverting it? (X,Y,Z), Transform name.
+                    # Mirroring Transform?, Inverting it? (X,Y,Z), Transform name. (Long names)
                     transforms = [
-                        [True, key[0][0], "tx"],
-                        [True, key[0][1], "ty"],
-                        [True, key[0][2], "tz"],
-                        [True, key[1][0], "rx"],
-                        [True, key[1][1], "ry"],
-                        [True, key[1][2], "rz"],
+                        [True, key[0][0], "translateX"],
+                        [True, key[0][1], "translateY"],
+                        [True, key[0][2], "translateZ"],
+                        [True, key[1][0], "rotateX"],
+                        [True, key[1][1], "rotateY"],
+                        [True, key[1][2], "rotateZ"],
                     ]
 
                     if len(key) > 2:  # Mirroring Scale?
-                        transforms.append([True, False, "sx"])
-                        transforms.append([True, False, "sy"])
-                        transforms.append([True, False, "sz"])
-
-                    # Transfer Right to Left
-                    if source_side == "right":
-                        for transform in transforms:
-                            if transform[0]:  # Using Transform? Inverted? Name of the Attr
-                                try:
-                                    attr = transform[2]
-
-                                    # Get Values
-                                    frames = cmds.keyframe(namespace + right_obj, q=1, at=attr)
-                                    values = cmds.keyframe(namespace + right_obj, q=1, at=attr, valueChange=True)
-
-                                    in_angle_tangent = cmds.keyTangent(
-                                        namespace + right_obj, at=attr, inAngle=True, query=True
-                                    )
-                                    out_angle_tangent = cmds.keyTangent(
-                                        namespace + right_obj, at=attr, outAngle=True, query=True
-                                    )
-                                    is_locked = cmds.keyTangent(
-                                        namespace + right_obj, at=attr, weightLock=True, query=True
-                                    )
-                                    in_weight = cmds.keyTangent(
-                                        namespace + right_obj, at=attr, inWeight=True, query=True
-                                    )
-                                    out_weight = cmds.keyTangent(
-                                        namespace + right_obj, at=attr, outWeight=True, query=True
-                                    )
-                                    in_tangent_type = cmds.keyTangent(
-                                        namespace + right_obj, at=attr, inTangentType=True, query=True
-                                    )
-                                    out_tangent_type = cmds.keyTangent(
-                                        namespace + right_obj, at=attr, outTangentType=True, query=True
-                                    )
-
-                                    if transform[1]:  # Inverted?
-                                        values = invert_float_list_values(values)
-                                        in_angle_tangent = invert_float_list_values(in_angle_tangent)
-                                        out_angle_tangent = invert_float_list_values(out_angle_tangent)
-                                        in_weight = invert_float_list_values(in_weight)
-                                        out_weight = invert_float_list_values(out_weight)
-
-                                    # Set Keys/Values
-                                    for index in range(len(values)):
-                                        time = frames[index]
-                                        cmds.setKeyframe(
-                                            namespace + left_obj, time=time, attribute=attr, value=values[index]
-                                        )
-                                        # Set Tangents
-                                        cmds.keyTangent(
-                                            namespace + left_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            lock=is_locked[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + left_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            inAngle=in_angle_tangent[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + left_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            outAngle=out_angle_tangent[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + left_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            inWeight=in_weight[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + left_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            outWeight=out_weight[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + left_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            inTangentType=in_tangent_type[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + left_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            outTangentType=out_tangent_type[index],
-                                            e=True,
-                                        )
-                                except Exception as e:
-                                    logger.debug(str(e))  # 0 keyframes
-
-                        # Other Attributes
-                        attributes = cmds.listAnimatable(namespace + right_obj)
-                        default_channels = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ"]
-                        for attr in attributes:
-                            try:
-                                short_attr = attr.split(".")[-1]
-                                if short_attr not in default_channels:
-                                    # Get Keys/Values
-                                    frames = cmds.keyframe(namespace + right_obj, q=1, at=short_attr)
-                                    values = cmds.keyframe(namespace + right_obj, q=1, at=short_attr, valueChange=True)
-
-                                    # Set Keys/Values
-                                    for index in range(len(values)):
-                                        cmds.setKeyframe(
-                                            namespace + left_obj,
-                                            time=frames[index],
-                                            attribute=short_attr,
-                                            value=values[index],
-                                        )
-                            except Exception as e:
-                                logger.debug(str(e))  # 0 keyframes
+                        transforms.append([True, False, "scaleX"])
+                        transforms.append([True, False, "scaleY"])
+                        transforms.append([True, False, "scaleZ"])
 
-                    # Transfer Left to Right
+                    # Transfer Right to Left (or Left to Right)
+                    source_obj, target_obj = right_obj, left_obj
                     if source_side == "left":
-                        for transform in transforms:
-                            if transform[0]:  # Using Transform? Inverted? Name of the Attr
-                                try:
-                                    attr = transform[2]
-
-                                    # Get Values
-                                    frames = cmds.keyframe(namespace + left_obj, q=1, at=attr)
-                                    values = cmds.keyframe(namespace + left_obj, q=1, at=attr, valueChange=True)
-
-                                    in_angle_tangent = cmds.keyTangent(
-                                        namespace + left_obj, at=attr, inAngle=True, query=True
-                                    )
-                                    out_angle_tangent = cmds.keyTangent(
-                                        namespace + left_obj, at=attr, outAngle=True, query=True
-                                    )
-                                    is_locked = cmds.keyTangent(
-                                        namespace + left_obj, at=attr, weightLock=True, query=True
-                                    )
-                                    in_weight = cmds.keyTangent(
-                                        namespace + left_obj, at=attr, inWeight=True, query=True
-                                    )
-                                    out_weight = cmds.keyTangent(
-                                        namespace + left_obj, at=attr, outWeight=True, query=True
-                                    )
-                                    in_tangent_type = cmds.keyTangent(
-                                        namespace + left_obj, at=attr, inTangentType=True, query=True
-                                    )
-                                    out_tangent_type = cmds.keyTangent(
-                                        namespace + left_obj, at=attr, outTangentType=True, query=True
-                                    )
-
-                                    if transform[1]:  # Inverted?
-                                        values = invert_float_list_values(values)
-                                        in_angle_tangent = invert_float_list_values(in_angle_tangent)
-                                        out_angle_tangent = invert_float_list_values(out_angle_tangent)
-                                        in_weight = invert_float_list_values(in_weight)
-                                        out_weight = invert_float_list_values(out_weight)
-
-                                    # Set Keys/Values
-                                    for index in range(len(values)):
-                                        time = frames[index]
-                                        cmds.setKeyframe(
-                                            namespace + right_obj, time=time, attribute=attr, value=values[index]
-                                        )
-                                        # Set Tangents
-                                        cmds.keyTangent(
-                                            namespace + right_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            lock=is_locked[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + right_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            inAngle=in_angle_tangent[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + right_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            outAngle=out_angle_tangent[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + right_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            inWeight=in_weight[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + right_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            outWeight=out_weight[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + right_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            inTangentType=in_tangent_type[index],
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + right_obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            outTangentType=out_tangent_type[index],
-                                            e=True,
-                                        )
-                                except Exception as e:
-                                    logger.debug(str(e))  # 0 keyframes
-
-                        # Other Attributes
-                        attributes = cmds.listAnimatable(namespace + left_obj)
-                        default_channels = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ"]
-                        for attr in attributes:
-                            try:
-                                short_attr = attr.split(".")[-1]
-                                if short_attr not in default_channels:
-                                    # Get Keys/Values
-                                    frames = cmds.keyframe(namespace + left_obj, q=1, at=short_attr)
-                                    values = cmds.keyframe(namespace + left_obj, q=1, at=short_attr, valueChange=True)
-
-                                    # Set Keys/Values
-                                    for index in range(len(values)):
-                                        cmds.setKeyframe(
-                                            namespace + right_obj,
-                                            time=frames[index],
-                                            attribute=short_attr,
-                                            value=values[index],
-                                        )
-                            except Exception as e:
-                                logger.debug(str(e))  # 0 keyframes
+                        source_obj, target_obj = left_obj, right_obj
+                    for transform in transforms:
+                        if transform[0]:  # Using Transform? Inverted? Name of the Attr
+                            attr = transform[2]
+                            curve_data = core_anim.get_attr_anim_curve_data(namespace + source_obj + "." + attr)
+                            if curve_data is None:
+                                continue  # 0 keyframes
+                            if transform[1]:  # Inverted?
+                                curve_data.invert_values()
+                            mirrored_curves[namespace + target_obj + "." + attr] = curve_data
+
+                    # Other Attributes
+                    default_channels = [transform[2] for transform in transforms]
+                    for attr_path, curve_data in core_anim.get_anim_curves_data(namespace + source_obj).items():
+                        attr = attr_path.split(".")[-1]
+                        try:
+                            attr = cmds.attributeQuery(attr, node=namespace + source_obj, longName=True)
+                        except Exception as e:
+                            logger.debug(str(e))
+                        if attr not in default_channels:
+                            mirrored_curves[namespace + target_obj + "." + attr] = curve_data
+
+        # Set Keys/Values (Single undo chunk)
+        core_anim.set_anim_curves_data(mirrored_curves, replace=False)
 
         # Print Feedback
         unique_message = "<" + str(random.random()) + ">"
@@ -3027,35 +2931,9 @@ def anim_export(namespace=""):
 
         # Extract Keyframes:
         for obj in available_ctrls:
-            attributes = cmds.listAnimatable(namespace + obj)
-            for attr in attributes:
-                try:
-                    short_attr = attr.split(".")[-1]
-                    frames = cmds.keyframe(namespace + obj, q=1, at=short_attr)
-                    values = cmds.keyframe(namespace + obj, q=1, at=short_attr, valueChange=True)
-                    in_angle_tangent = cmds.keyTangent(namespace + obj, at=short_attr, inAngle=True, query=True)
-                    out_angle_tangent = cmds.keyTangent(namespace + obj, at=short_attr, outAngle=True, query=True)
-                    is_locked = cmds.keyTangent(namespace + obj, at=short_attr, weightLock=True, query=True)
-                    in_weight = cmds.keyTangent(namespace + obj, at=short_attr, inWeight=True, query=True)
-                    out_weight = cmds.keyTangent(namespace + obj, at=short_attr, outWeight=True, query=True)
-                    in_tangent_type = cmds.keyTangent(namespace + obj, at=short_attr, inTangentType=True, query=True)
-                    out_tangent_type = cmds.keyTangent(namespace + obj, at=short_attr, outTangentType=True, query=True)
-                    export_dict["{}.{}".format(obj, short_attr)] = list(
-                        zip(
-                            frames,
-                            values,
-                            in_angle_tangent,
-                            out_angle_tangent,
-                            is_locked,
-                            in_weight,
-                            out_weight,
-                            in_tangent_type,
-                            out_tangent_type,
-                        )
-                    )
-                except Exception as e:
-                    logger.debug(str(e))
-                    pass  # 0 keyframes
+            for attr_path, curve_data in core_anim.get_anim_curves_data(namespace + obj).items():
+                short_attr = attr_path.split(".")[-1]
+                export_dict["{}.{}".format(obj, short_attr)] = curve_data.to_key_rows()
 
         try:
             with open(pose_file, "w") as outfile:
@@ -3153,62 +3031,18 @@ def anim_import(debugging=False, debugging_path="", namespace=""):
 
                     if is_operation_valid:
                         # Object-Space
+                        imported_curves = {}
                         for key, dict_value in data.items():
                             if key != "gt_interface_version" and key != "gt_export_method":
-                                for key_data in dict_value:
-                                    # Unpack Data
-                                    time = key_data[0]
-                                    value = key_data[1]
-                                    in_angle_tangent = key_data[2]
-                                    out_angle_tangent = key_data[3]
-                                    is_locked = key_data[4]
-                                    in_weight = key_data[5]
-                                    out_weight = key_data[6]
-                                    in_tangent_type = key_data[7]
-                                    out_tangent_type = key_data[8]
-
-                                    try:
-                                        obj, attr = key.split(".")
-                                        cmds.setKeyframe(namespace + obj, time=time, attribute=attr, value=value)
-                                        cmds.keyTangent(
-                                            namespace + obj, at=attr, time=(time, time), lock=is_locked, e=True
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            inAngle=in_angle_tangent,
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            outAngle=out_angle_tangent,
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + obj, at=attr, time=(time, time), inWeight=in_weight, e=True
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + obj, at=attr, time=(time, time), outWeight=out_weight, e=True
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            inTangentType=in_tangent_type,
-                                            e=True,
-                                        )
-                                        cmds.keyTangent(
-                                            namespace + obj,
-                                            at=attr,
-                                            time=(time, time),
-                                            outTangentType=out_tangent_type,
-                                            e=True,
-                                        )
-                                    except Exception as e:
-                                        logger.debug(str(e))
+                                try:
+                                    obj, attr = key.split(".")
+                                    if not cmds.objExists(namespace + obj + "." + attr):
+                                        continue
+                                    curve_data = core_anim.AnimCurveData.from_key_rows(dict_value)
+                                    imported_curves[namespace + obj + "." + attr] = curve_data
+                                except Exception as e:
+                                    logger.debug(str(e))
+                        core_anim.set_anim_curves_data(imported_curves, replace=False)
 
                         unique_message = "<" + str(random.random()) + ">"
                         unique_message += '<span style="color:#FFFFFF;">Animation imported from </span>'
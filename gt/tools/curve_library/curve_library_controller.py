@@ -25,6 +25,7 @@ class CurveLibraryController:
     CURVE_TYPE_BASE = "Curve"
     CURVE_TYPE_USER = "User Curve"
     CURVE_TYPE_CONTROL = "Control"
+    FILTER_DELAY_MS = 150  # Debounce - Time without typing before the list is filtered
 
     def __init__(self, model, view):
         """
@@ -45,7 +46,11 @@ class CurveLibraryController:
         # Connections
         self.view.build_button.clicked.connect(self.build_view_selected_curve)
         self.view.item_list.itemSelectionChanged.connect(self.on_item_selection_changed)
-        self.view.search_bar.textChanged.connect(self.filter_list)
+        self.filter_timer = ui_qt.QtCore.QTimer()
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.filter_list)
+        self.view.search_bar.textChanged.connect(self.schedule_filter_list)
         self.view.parameters_button.clicked.connect(self.open_parameter_editor)
         self.view.add_custom_button.clicked.connect(self.add_user_curve)
         self.view.delete_custom_button.clicked.connect(self.remove_user_curve)
@@ -95,9 +100,18 @@ class CurveLibraryController:
         self.view.set_parameters_button_enabled(True)
         self.view.set_delete_button_enabled(False)
 
+    def schedule_filter_list(self, *args):
+        """
+        Restarts the filter timer, so the list is only filtered once the user stops typing.
+        Args:
+            *args: Variable number of arguments. (Received from the "textChanged" signal)
+        """
+        self.filter_timer.start()
+
     def filter_list(self):
         """
         Filter the curve library list based on the search text entered by the user.
+        Called by the "filter_timer" once the user stops typing. (Debounced)
         """
         search_text = self.view.search_bar.text().lower()
         self.populate_curve_library(filter_str=search_text)
@@ -150,25 +164,17 @@ class CurveLibraryController:
             filter_str (str, None): If provided, it will be used to filter desired objects when populating the list.
         """
         self.view.clear_view_library()
-        base_curves = self.model.get_base_curves()
-        control_curves = self.model.get_controls()
-        user_curves = self.model.get_user_curves()
+        base_curves, control_curves, user_curves = self.model.search_curves(filter_str=filter_str)
         icon_base_crv = ui_qt.QtGui.QIcon(ui_res_lib.Icon.curve_library_base_curve)
         icon_control = ui_qt.QtGui.QIcon(ui_res_lib.Icon.curve_library_control)
         icon_user_crv = ui_qt.QtGui.QIcon(ui_res_lib.Icon.curve_library_user_curve)
         for crv in base_curves:
-            if filter_str and filter_str not in crv.get_name():
-                continue
             metadata_base_crv = {"object": crv, "item_type": self.CURVE_TYPE_BASE}
             self.view.add_item_view_library(item_name=crv.get_name(), icon=icon_base_crv, metadata=metadata_base_crv)
         for ctrl in control_curves:
-            if filter_str and filter_str not in ctrl.get_name():
-                continue
             metadata_control = {"object": ctrl, "item_type": self.CURVE_TYPE_CONTROL}
             self.view.add_item_view_library(item_name=ctrl.get_name(), icon=icon_control, metadata=metadata_control)
         for crv in user_curves:
-            if filter_str and filter_str not in crv.get_name():
-                continue
             metadata_user_crv = {"object": crv, "item_type": self.CURVE_TYPE_USER}
             self.view.add_item_view_library(item_name=crv.get_name(), icon=icon_user_crv, metadata=metadata_user_crv)
         self.view.item_list.setCurrentRow(0)  # Select index 0
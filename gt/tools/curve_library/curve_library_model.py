@@ -11,6 +11,7 @@ Classes:
 
 from gt.core.control import Controls, get_control_preview_image_path, Control
 from gt.core.curve import Curves, get_curve_preview_image_path, Curve
+from gt.core.str import StringSearchIndex
 import gt.ui.resource_library as ui_res_lib
 import logging
 import os
@@ -29,6 +30,11 @@ class CurveLibraryModel:
         self.base_curves = []
         self.user_curves = []  # User-defined curves
         self.controls = []
+        # Indexes - Rebuilt when the lists above are replaced or change size
+        self._index_signature = None
+        self._name_index = {}  # e.g. {"circle": Curve}
+        self._name_categories = {}  # e.g. {"circle": "base"}
+        self._search_index = StringSearchIndex()
         self.import_default_library()
         self.import_controls_library()
 
@@ -40,10 +46,7 @@ class CurveLibraryModel:
         Returns:
             bool: True if it's conflict (already in the list), False if not.
         """
-        current_names = self.get_all_curve_names()
-        if name in current_names:
-            return True
-        return False
+        return self._get_name_index().get(name) is not None
 
     def validate_curve(self, curve):
         """
@@ -73,7 +76,7 @@ class CurveLibraryModel:
         if not self.validate_curve(curve):
             logger.debug(f"Unable to add Curve to base curves. Curve failed validation.")
             return
-        self.base_curves.append(curve)
+        self._add_to_list(curve, curve_list=self.base_curves)
 
     def add_user_curve(self, user_curve):
         """
@@ -84,7 +87,7 @@ class CurveLibraryModel:
         if not self.validate_curve(user_curve):
             logger.debug(f"Unable to add Curve to user-defined curves. Curve failed validation.")
             return
-        self.user_curves.append(user_curve)
+        self._add_to_list(user_curve, curve_list=self.user_curves)
 
     def add_control(self, control):
         """
@@ -95,7 +98,7 @@ class CurveLibraryModel:
         if not self.validate_curve(control):
             logger.debug(f"Unable to add Control to control curves. Curve failed validation.")
             return
-        self.controls.append(control)
+        self._add_to_list(control, curve_list=self.controls)
 
     def get_base_curves(self):
         """
@@ -121,6 +124,97 @@ class CurveLibraryModel:
         """
         return self.controls
 
+    def _get_index_signature(self):
+        """
+        Gets a signature describing the current curve lists. Used to determine if the indexes are outdated.
+        Returns:
+            tuple: Identity and size of the base curves, controls and user curves lists.
+        """
+        curve_lists = (self.base_curves, self.controls, self.user_curves)
+        return tuple((id(curve_list), len(curve_list)) for curve_list in curve_lists)
+
+    def refresh_indexes(self, force=False):
+        """
+        Rebuilds the name and search indexes in case the curve lists changed.
+        Args:
+            force (bool, optional): If active, the indexes are rebuilt even if the curve lists seem unchanged.
+                                    e.g. After renaming a curve that is already in one of the lists.
+        """
+        signature = self._get_index_signature()
+        if not force and signature == self._index_signature:
+            return
+        self._name_index = {}
+        self._name_categories = {}
+        self._search_index = StringSearchIndex()
+        for curve_list in (self.base_curves, self.user_curves, self.controls):  # Same priority as "get_all_curves"
+            for crv in curve_list:
+                self._add_to_indexes(crv, curve_list=curve_list)
+        self._index_signature = signature
+
+    def _get_category(self, curve_list):
+        """
+        Gets the category of a curve list.
+        Args:
+            curve_list (list): One of the curve lists. (base_curves, user_curves or controls)
+        Returns:
+            str: "base", "user" or "control"
+        """
+        if curve_list is self.base_curves:
+            return "base"
+        if curve_list is self.controls:
+            return "control"
+        return "user"
+
+    def _add_to_indexes(self, curve, curve_list):
+        """
+        Adds a curve to the name and search indexes. (First curve with a name takes priority)
+        Args:
+            curve (Curve, Control): Curve to add.
+            curve_list (list): List the curve belongs to. Used to determine its category.
+        """
+        curve_name = curve.get_name()
+        if curve_name in self._name_index:
+            return
+        self._name_index[curve_name] = curve
+        self._name_categories[curve_name] = self._get_category(curve_list)
+        self._search_index.add(curve_name)
+
+    def _add_to_list(self, curve, curve_list):
+        """
+        Adds a curve to one of the curve lists, updating the indexes without rebuilding them (when up-to-date)
+        Args:
+            curve (Curve, Control): Curve to add.
+            curve_list (list): One of the curve lists. (base_curves, user_curves or controls)
+        """
+        is_index_current = self._index_signature == self._get_index_signature()
+        curve_list.append(curve)
+        if is_index_current:
+            self._add_to_indexes(curve, curve_list=curve_list)
+            self._index_signature = self._get_index_signature()
+
+    def _get_name_index(self):
+        """
+        Gets the name index. A dictionary with curve names as keys and curves as values.
+        Returns:
+            dict: The name index, e.g. {"circle": Curve}
+        """
+        self.refresh_indexes()
+        return self._name_index
+
+    def search_curves(self, filter_str=None):
+        """
+        Searches for curves containing the provided string in their names. (Case-insensitive)
+        Args:
+            filter_str (str, optional): String to search for. If not provided, all curves are returned.
+        Returns:
+            tuple: Three lists with the matching base curves, controls and user curves. (In that order)
+        """
+        self.refresh_indexes()
+        matches = {"base": [], "control": [], "user": []}
+        for curve_name in self._search_index.search(filter_str):
+            matches[self._name_categories.get(curve_name)].append(self._name_index.get(curve_name))
+        return matches.get("base"), matches.get("control"), matches.get("user")
+
     def get_all_curves(self):
         """
         Get all curves, controls and user-defined curves. (All elements stored in this model)
@@ -193,6 +287,7 @@ class CurveLibraryModel:
     def import_default_library(self):
         """
         Imports all curves found in "curve_utils.Curves" to the CurveLibraryModel curves list
+        Package curves are "LazyCurve" objects, so their point data is only read when built.
         """
         curve_attributes = vars(Curves)
         curve_keys = [attr for attr in curve_attributes if not (attr.startswith("__") and attr.endswith("__"))]
@@ -272,9 +367,12 @@ class CurveLibraryModel:
         Returns:
             Curve or None: Curve object with the requested name. None if not found.
         """
-        for crv in self.get_all_curves():
-            if isinstance(crv, Curve) and curve_name == crv.get_name():
-                return crv
+        crv = self._get_name_index().get(curve_name)
+        if crv is None or crv.get_name() != curve_name:  # Missing or renamed after indexing, re-index and try again
+            self.refresh_indexes(force=True)
+            crv = self._name_index.get(curve_name)
+        if isinstance(crv, Curve):
+            return crv
 
     def get_preview_image(self, object_name):
         """
@@ -4,6 +4,7 @@ Curve Library View - The main GUI window class for the Curve Library tool.
 
 import gt.ui.resource_library as ui_res_lib
 from gt.ui.squared_widget import SquaredWidget
+import gt.ui.thumbnail_cache as ui_thumb_cache
 import gt.ui.qt_utils as ui_qt_utils
 import gt.ui.qt_import as ui_qt
 
@@ -30,6 +31,7 @@ class CurveLibraryView(metaclass=ui_qt_utils.MayaWindowMeta):
         self.delete_custom_button = None
         self.build_button = None
         self.preview_image = None
+        self.preview_image_path = None
         self.description = None
         self.snapshot_button = None
         self.parameters_button = None
@@ -61,15 +63,33 @@ class CurveLibraryView(metaclass=ui_qt_utils.MayaWindowMeta):
     def update_preview_image(self, new_image_path=None):
         """
         Update the preview image displayed in the window.
+        The image is loaded through the shared thumbnail cache, so decoding happens outside the UI thread.
+        The preview is updated once the thumbnail is ready, unless another image was requested in the meantime.
 
         Args:
             new_image_path (str, optional): The path to the new image file.
                                             Defaults to None, which becomes "missing_preview_file"
         """
-        if new_image_path:
-            self.preview_image.set_pixmap(ui_qt.QtGui.QPixmap(new_image_path))
-        else:
-            self.preview_image.set_pixmap(ui_qt.QtGui.QPixmap(ui_res_lib.Icon.library_missing_file))
+        if not new_image_path:
+            new_image_path = ui_res_lib.Icon.library_missing_file
+        self.preview_image_path = new_image_path
+        ui_thumb_cache.get_thumbnail_cache().request_thumbnail(new_image_path, self.on_preview_thumbnail_loaded)
+
+    def on_preview_thumbnail_loaded(self, source_path, pixmap):
+        """
+        Receives a loaded thumbnail and displays it, if it's still the requested preview image.
+
+        Args:
+            source_path (str): Path to the image that was loaded.
+            pixmap (QPixmap): Loaded thumbnail. Null if the image couldn't be loaded.
+        """
+        if source_path != self.preview_image_path:
+            return  # Outdated request (selection changed before the image was ready)
+        if pixmap.isNull():
+            if source_path != ui_res_lib.Icon.library_missing_file:
+                self.update_preview_image()
+            return
+        self.preview_image.set_pixmap(pixmap)
 
     def create_widgets(self):
         """Create the widgets for the window."""
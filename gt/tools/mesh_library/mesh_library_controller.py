@@ -26,6 +26,7 @@ class MeshLibraryController:
     MESH_TYPE_BASE = "Mesh"
     MESH_TYPE_USER = "User Mesh"
     MESH_TYPE_PARAM = "Parametric Mesh"
+    FILTER_DELAY_MS = 150  # Debounce - Time without typing before the list is filtered
 
     def __init__(self, model, view):
         """
@@ -46,7 +47,11 @@ class MeshLibraryController:
         # Connections
         self.view.build_button.clicked.connect(self.build_view_selected_mesh)
         self.view.item_list.itemSelectionChanged.connect(self.on_item_selection_changed)
-        self.view.search_bar.textChanged.connect(self.filter_list)
+        self.filter_timer = ui_qt.QtCore.QTimer()
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.filter_list)
+        self.view.search_bar.textChanged.connect(self.schedule_filter_list)
         self.view.parameters_button.clicked.connect(self.open_parameter_editor)
         self.view.add_custom_button.clicked.connect(self.add_user_mesh)
         self.view.delete_custom_button.clicked.connect(self.remove_user_mesh)
@@ -96,9 +101,18 @@ class MeshLibraryController:
         self.view.set_parameters_button_enabled(True)
         self.view.set_delete_button_enabled(False)
 
+    def schedule_filter_list(self, *args):
+        """
+        Restarts the filter timer, so the list is only filtered once the user stops typing.
+        Args:
+            *args: Variable number of arguments. (Received from the "textChanged" signal)
+        """
+        self.filter_timer.start()
+
     def filter_list(self):
         """
         Filter the mesh library list based on the search text entered by the user.
+        Called by the "filter_timer" once the user stops typing. (Debounced)
         """
         search_text = self.view.search_bar.text().lower()
         self.populate_mesh_library(filter_str=search_text)
@@ -151,27 +165,19 @@ class MeshLibraryController:
             filter_str (str, None): If provided, it will be used to filter desired objects when populating the list.
         """
         self.view.clear_view_library()
-        meshes_base = self.model.get_base_meshes()
-        meshes_param = self.model.get_param_meshes()
-        meshes_user = self.model.get_user_meshes()
+        meshes_base, meshes_param, meshes_user = self.model.search_meshes(filter_str=filter_str)
 
         icon_base_mesh = ui_qt.QtGui.QIcon(ui_res_lib.Icon.mesh_library_base)
         icon_param_mesh = ui_qt.QtGui.QIcon(ui_res_lib.Icon.mesh_library_param)
         icon_user_mesh = ui_qt.QtGui.QIcon(ui_res_lib.Icon.mesh_library_user)
 
         for mesh_name, mesh in meshes_base.items():
-            if filter_str and filter_str not in mesh_name:
-                continue
             metadata_base_mesh = {"object": mesh, "item_type": self.MESH_TYPE_BASE}
             self.view.add_item_view_library(item_name=mesh_name, icon=icon_base_mesh, metadata=metadata_base_mesh)
         for mesh_name, param_mesh in meshes_param.items():
-            if filter_str and filter_str not in mesh_name:
-                continue
             metadata_param_mesh = {"object": param_mesh, "item_type": self.MESH_TYPE_PARAM}
             self.view.add_item_view_library(item_name=mesh_name, icon=icon_param_mesh, metadata=metadata_param_mesh)
         for mesh_name, user_mesh in meshes_user.items():
-            if filter_str and filter_str not in user_mesh.get_name():
-                continue
             metadata_user_mesh = {"object": user_mesh, "item_type": self.MESH_TYPE_USER}
             self.view.add_item_view_library(item_name=mesh_name, icon=icon_user_mesh, metadata=metadata_user_mesh)
         self.view.item_list.setCurrentRow(0)  # Select index 0
@@ -3,6 +3,7 @@ Mesh Library Model
 """
 
 from gt.core.mesh import Meshes, MeshFile, ParametricMesh, get_mesh_preview_image_path, ParametricMeshes
+from gt.core.str import StringSearchIndex
 import gt.ui.resource_library as ui_res_lib
 import logging
 import sys
@@ -23,6 +24,9 @@ class MeshLibraryModel:
         self.base_meshes = {}
         self.user_meshes = {}  # User-defined meshes
         self.param_meshes = {}
+        # Search Index - Rebuilt when the dictionaries above are replaced or change size
+        self._index_signature = None
+        self._search_index = StringSearchIndex()
         self.import_package_library()
         self.import_parametric_meshes_library()
 
@@ -34,10 +38,7 @@ class MeshLibraryModel:
         Returns:
             bool: True if it's conflict (already in the list), False if not.
         """
-        current_names = self.get_all_mesh_names()
-        if name in current_names:
-            return True
-        return False
+        return name in self.base_meshes or name in self.user_meshes or name in self.param_meshes
 
     def validate_item(self, item):
         """
@@ -115,6 +116,41 @@ class MeshLibraryModel:
         """
         return self.param_meshes
 
+    def refresh_search_index(self, force=False):
+        """
+        Rebuilds the search index in case the mesh dictionaries changed.
+        Args:
+            force (bool, optional): If active, the index is rebuilt even if the dictionaries seem unchanged.
+        """
+        mesh_dicts = (self.base_meshes, self.param_meshes, self.user_meshes)
+        signature = tuple((id(mesh_dict), len(mesh_dict)) for mesh_dict in mesh_dicts)
+        if not force and signature == self._index_signature:
+            return
+        self._search_index = StringSearchIndex()
+        for mesh_dict in mesh_dicts:
+            for mesh_name in mesh_dict:
+                self._search_index.add(mesh_name)
+        self._index_signature = signature
+
+    def search_meshes(self, filter_str=None):
+        """
+        Searches for meshes containing the provided string in their names. (Case-insensitive)
+        Args:
+            filter_str (str, optional): String to search for. If not provided, all meshes are returned.
+        Returns:
+            tuple: Three dictionaries (name: mesh) with the matching base, parametric and user meshes. (In that order)
+        """
+        self.refresh_search_index()
+        base_matches, param_matches, user_matches = {}, {}, {}
+        for mesh_name in self._search_index.search(filter_str):
+            if mesh_name in self.base_meshes:
+                base_matches[mesh_name] = self.base_meshes.get(mesh_name)
+            elif mesh_name in self.param_meshes:
+                param_matches[mesh_name] = self.param_meshes.get(mesh_name)
+            else:
+                user_matches[mesh_name] = self.user_meshes.get(mesh_name)
+        return base_matches, param_matches, user_matches
+
     def get_all_mesh_names(self):
         """
         Get the list of names from all meshes found in the model (package, user and parametric)
@@ -218,10 +254,9 @@ class MeshLibraryModel:
         Returns:
             MeshFile, ParametricMesh or None: Item object with the requested name. None if not found.
         """
-        all_meshes = self.get_all_meshes()
-        for key, value in all_meshes.items():
-            if key == item_name:
-                return value
+        for meshes in (self.param_meshes, self.user_meshes, self.base_meshes):  # Same priority as "get_all_meshes"
+            if item_name in meshes:
+                return meshes.get(item_name)
 
     def get_preview_image(self, object_name):
         """
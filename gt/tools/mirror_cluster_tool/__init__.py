@@ -15,12 +15,17 @@
  Added patch version
  PEP8 General cleanup
 
+ 1.3.0 - 2026-10-18
+ Mirrored vertices are now found through a symmetry map (vertex positions are read only once)
+ Cluster weights are now read and written with a single call (instead of one call per vertex)
+ Fixed issue where vertices would fail to be filtered in Python 3
+
  Todo:
      Add option to mirror other deformers
      Mirror multiple clusters and meshes at the same time
 """
 # Tool Version
-__version_tuple__ = (1, 2, 1)
+__version_tuple__ = (1, 3, 0)
 __version_suffix__ = ''
 __version__ = '.'.join(str(n) for n in __version_tuple__) + __version_suffix__
 
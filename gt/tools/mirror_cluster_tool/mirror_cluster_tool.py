@@ -4,7 +4,10 @@
 """
 
 from maya import OpenMayaUI as OpenMayaUI
+import maya.OpenMayaAnim as OpenMayaAnim
+import maya.OpenMaya as OpenMaya
 import gt.ui.qt_import as ui_qt
+import gt.core.mesh as core_mesh
 import maya.cmds as cmds
 import logging
 
@@ -273,54 +276,26 @@ def mirror_cluster():
         is_current_setup_valid = False
 
     if is_current_setup_valid:
-        mesh_shape = cmds.listRelatives(mesh_transform, s=1, c=1)
-        vertices_selected_mesh = get_cluster_vertices_on_mesh(mesh_transform, cluster_handle)
-        mirrored_vertices = []
-
-        for vertex in vertices_selected_mesh:
-            vertex_position = cmds.pointPosition(vertex[0], local=1)
-
-            # Utility node used to collect information about the other side of the mesh
-            closest_point_node = cmds.createNode("closestPointOnMesh")
-
-            if mirror_axis == 1:
-
-                cmds.setAttr(
-                    (closest_point_node + ".inPosition"), -vertex_position[0], vertex_position[1], vertex_position[2]
-                )
-            elif mirror_axis == 2:
-                cmds.setAttr(
-                    (closest_point_node + ".inPosition"), vertex_position[0], -vertex_position[1], vertex_position[2]
-                )
-            else:
-                cmds.setAttr(
-                    (closest_point_node + ".inPosition"), vertex_position[0], vertex_position[1], -vertex_position[2]
-                )
-
-            try:
-                cmds.connectAttr((mesh_shape[0] + ".outMesh"), (closest_point_node + ".inMesh"), force=1)
-            except Exception as e:
-                logger.debug(str(e))
-
-            mirrored_vertex = (
-                mesh_transform + ".vtx[" + str(cmds.getAttr((closest_point_node + ".closestVertexIndex"))) + "]"
-            )  # Find mirrored vertex
-            vertex[0] = mirrored_vertex  # Replace previous pair vertex with newly found one
-            mirrored_vertices.append(mirrored_vertex)
-            cmds.delete(closest_point_node)  # Delete utility node
-
+        axis = core_mesh.SYMMETRY_AXES[mirror_axis - 1]
+        symmetry_map = core_mesh.get_symmetry_map(mesh_transform, axis=axis)  # Cached per mesh topology
         cluster_deform_node = cmds.listConnections((cluster_handle + ".worldMatrix[0]"), type="cluster", destination=1)
         is_relative = cmds.getAttr((cluster_deform_node[0] + ".relative"))
 
+        # Find mirrored vertices
+        index_weights = get_cluster_weights_on_mesh(mesh_transform, cluster_handle)
+        mirrored_index_weights = symmetry_map.mirror_index_values(index_weights)
+        mirrored_indices = sorted(mirrored_index_weights)
+        mirrored_vertices = [f"{mesh_transform}.vtx[{index}]" for index in mirrored_indices]
+
         new_cluster_name = cluster_handle.replace(
             cmds.textField("search_text_field", q=True, text=True),
             cmds.textField("replace_text_field", q=True, text=True),
         )
         new_cluster = cmds.cluster(mirrored_vertices, rel=is_relative)
 
-        # Transfer weight back to new cluster
-        for num in range(len(vertices_selected_mesh)):
-            cmds.percent(new_cluster[0], vertices_selected_mesh[num][0], v=vertices_selected_mesh[num][1])
+        # Transfer weight back to new cluster (single call)
+        mirrored_weights = [mirrored_index_weights.get(index) for index in mirrored_indices]
+        set_cluster_weights_on_mesh(mesh_transform, new_cluster[0], mirrored_weights, mirrored_indices)
 
         cmds.rename(new_cluster_name)
     else:
@@ -328,15 +303,66 @@ def mirror_cluster():
     # End of Main Function ===============================================================
 
 
-def get_cluster_vertices_on_mesh(mesh_transform, cluster_handle):
+def get_mesh_dag_path(mesh_transform):
     """
-    Returns vertices influenced by a cluster
+    Gets the dag path of the mesh shape (API 1.0)
+
+    Args:
+        mesh_transform (str): A mesh transform, for example "pSphere1"
+    Returns:
+        MDagPath: Dag path of the mesh shape
+    """
+    selection = OpenMaya.MSelectionList()
+    selection.add(mesh_transform)
+    dag_path = OpenMaya.MDagPath()
+    selection.getDagPath(0, dag_path)
+    dag_path.extendToShape()
+    return dag_path
+
+
+def get_weight_geometry_filter(deformer):
+    """
+    Gets the function set used to read and write weights in bulk for the provided deformer (API 1.0)
+
+    Args:
+        deformer (str): A weight geometry filter deformer, for example "cluster1"
+    Returns:
+        MFnWeightGeometryFilter: Function set for the deformer
+    """
+    selection = OpenMaya.MSelectionList()
+    selection.add(deformer)
+    deformer_obj = OpenMaya.MObject()
+    selection.getDependNode(0, deformer_obj)
+    return OpenMayaAnim.MFnWeightGeometryFilter(deformer_obj)
+
+
+def create_vertex_component(indices):
+    """
+    Creates a vertex component containing the provided indices (API 1.0)
+
+    Args:
+        indices (list): A list of vertex indices
+    Returns:
+        MObject: Vertex component
+    """
+    component_fn = OpenMaya.MFnSingleIndexedComponent()
+    component = component_fn.create(OpenMaya.MFn.kMeshVertComponent)
+    index_array = OpenMaya.MIntArray()
+    for index in indices:
+        index_array.append(index)
+    component_fn.addElements(index_array)
+    return component
+
+
+def get_cluster_weights_on_mesh(mesh_transform, cluster_handle):
+    """
+    Returns the weights of the vertices influenced by a cluster. Weights are read with a single call.
 
     Args:
         mesh_transform: a selected mesh, for example "pSphere1"
         cluster_handle: a cluster handle that has influence over the mesh
     Returns:
-        A list of paired vertices and weights [vertex, weight]
+        A dictionary with vertex indices as keys and weights as values {index: weight}
     """
     cluster_deform_node = cmds.listConnections((cluster_handle + ".worldMatrix[0]"), type="cluster", destination=1)
     cluster_set = cmds.listConnections(cluster_deform_node[0], type="objectSet")
@@ -344,24 +370,51 @@ def get_cluster_vertices_on_mesh(mesh_transform, cluster_handle):
 
     # 28: Control Vertices (CVs)     31: Polygon Vertices
     # 36: Subdivision Mesh Points    46: Lattice Points
-    extracted_vertices = cmds.filterExpand(extracted_vertices, selectionMask=(28, 31, 36, 46))  # Filter Points Only
+    extracted_vertices = cmds.filterExpand(extracted_vertices, selectionMask=(28, 31, 36, 46)) or []
 
     # Isolate vertices on mesh
-    vertices_on_mesh = []
+    vertex_indices = []
     for vertex in extracted_vertices:
-        name = vertex.encode("utf-8")
-        if name.startswith(mesh_transform):
-            vertices_on_mesh.append(vertex)
-
-    # Pair Vertices with their weights
-    vertices_with_weights = []
-    for vertex in vertices_on_mesh:
-        vertex_weight_pair = [vertex]
-        value_w = cmds.percent(cluster_deform_node[0], vertex, q=1, v=1)
-        vertex_weight_pair.append(value_w[0])
-        vertices_with_weights.append(vertex_weight_pair)
-
-    return vertices_with_weights
+        if vertex.startswith(mesh_transform + "."):
+            vertex_indices.append(int(vertex.rsplit("[", 1)[-1].rstrip("]")))
+    if not vertex_indices:
+        return {}
+
+    weights = OpenMaya.MFloatArray()
+    weight_fn = get_weight_geometry_filter(cluster_deform_node[0])
+    weight_fn.getWeights(get_mesh_dag_path(mesh_transform), create_vertex_component(vertex_indices), weights)
+    return {index: weights[num] for num, index in enumerate(vertex_indices)}
+
+
+def set_cluster_weights_on_mesh(mesh_transform, cluster, weights, vertex_indices):
+    """
+    Sets the weights of many vertices influenced by a cluster with a single call.
+
+    Args:
+        mesh_transform: a mesh influenced by the cluster, for example "pSphere1"
+        cluster: a cluster deformer node, for example "cluster1"
+        weights: a list of weights (one for each vertex index)
+        vertex_indices: a list of vertex indices (same order as the weights)
+    """
+    weight_array = OpenMaya.MFloatArray()
+    for weight in weights:
+        weight_array.append(weight)
+    weight_fn = get_weight_geometry_filter(cluster)
+    weight_fn.setWeight(get_mesh_dag_path(mesh_transform), create_vertex_component(vertex_indices), weight_array)
+
+
+def get_cluster_vertices_on_mesh(mesh_transform, cluster_handle):
+    """
+    Returns vertices influenced by a cluster
+
+    Args:
+        mesh_transform: a selected mesh, for example "pSphere1"
+        cluster_handle: a cluster handle that has influence over the mesh
+    Returns:
+        A list of paired vertices and weights [vertex, weight]
+    """
+    index_weights = get_cluster_weights_on_mesh(mesh_transform, cluster_handle)
+    return [[f"{mesh_transform}.vtx[{index}]", weight] for index, weight in index_weights.items()]
 
 
 def loader_existence_check(obj):
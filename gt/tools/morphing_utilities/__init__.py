@@ -33,9 +33,15 @@
  Added duplicate and mirror button
  Added operation help buttons
  Added mirror direction and symmetry axis drop-down menus
+
+ 1.3.3 - 2026-10-18
+ Flip and mirror now edit the target deltas in memory ("gt.core.morphing") instead of duplicating targets through the
+ Shape Editor and running "blendShape -flipTarget/-mirrorTarget"
+ Flipped and mirrored targets without a new name now use the "_Flipped" and "_Mirrored" suffixes
+ Flipping or mirroring onto an existing target name still fails, the existing target is not overwritten
 """
 # Tool Version
-__version_tuple__ = (1, 3, 2)
+__version_tuple__ = (1, 3, 3)
 __version_suffix__ = ''
 __version__ = '.'.join(str(n) for n in __version_tuple__) + __version_suffix__
 
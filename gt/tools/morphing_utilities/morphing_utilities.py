@@ -4,6 +4,7 @@
 """
 
 from maya import OpenMayaUI as OpenMayaUI
+import gt.core.morphing as core_morph
 import gt.ui.qt_import as ui_qt
 import maya.cmds as cmds
 import maya.mel as mel
@@ -278,45 +279,24 @@ def duplicate_blend_target(blend_node, blend_index):
 def duplicate_flip_blend_target(blend_node, target_name, duplicate_name=None, symmetry_axis="x"):
     """
     Duplicates and flip targets matching the provided name
+    The flipped deltas are written directly to the blend shape node (no meshes or Shape Editor selection involved)
     Args:
         blend_node (string) Name of the blend shape node
         target_name (string) Name of the blend shape target to duplicate and flip
         duplicate_name (optional, string): New name for the duplicated target
         symmetry_axis (string, optional) Which axis to use when mirroring (default: x)
+    Raises:
+        ValueError: If a target with the duplicate name already exists (existing targets are not overwritten)
     """
-    cmds.select(d=True)  # Deselect
-    blendshape_names = cmds.listAttr(blend_node + ".w", m=True)
-
-    duplicate_target_index = get_target_index(blend_node, target_name)
-    duplicate_blend_target(blend_node, duplicate_target_index)
-
-    # Get Newly Generated Targets
-    blendshape_names_refresh = cmds.listAttr(blend_node + ".w", m=True)
-    blendshape_names_new_only = list(set(blendshape_names_refresh) - set(blendshape_names))
-
-    duplicate_target_name = ""
-    if blendshape_names_new_only:
-        duplicate_target_name = blendshape_names_new_only[0]
-    if duplicate_target_name:
-        duplicate_target_index = get_target_index(blend_node, duplicate_target_name)
-        cmds.blendShape(
-            blend_node, e=True, flipTarget=[(0, duplicate_target_index)], symmetryAxis=symmetry_axis, symmetrySpace=1
-        )  # 0=topological, 1=object, 2=UV
-        if duplicate_name:
-            rename_blend_target(blend_node, duplicate_target_name, duplicate_name)
-        else:
-            new_name = duplicate_target_name.replace("Copy", "Flipped")
-            rename_blend_target(blend_node, duplicate_target_name, new_name)
+    blendshape_names = cmds.listAttr(blend_node + ".w", m=True) or []
+    duplicate_name = duplicate_name or target_name + "_Flipped"
+    if duplicate_name in blendshape_names:
+        raise ValueError(f'Unable to flip "{target_name}". A target named "{duplicate_name}" already exists.')
+    core_morph.flip_blend_target(blend_node, target_name, new_name=duplicate_name, symmetry_axis=symmetry_axis)
 
     # Return Generated Targets
-    blendshape_names_refresh = cmds.listAttr(blend_node + ".w", m=True)
-    blendshape_names_new_only = list(set(blendshape_names_refresh) - set(blendshape_names))
-    for blend in blendshape_names_new_only:
-        try:
-            cmds.setAttr(blend_node + "." + blend, 0)
-        except Exception as e:
-            logger.debug(str(e))
-    return blendshape_names_new_only
+    blendshape_names_refresh = cmds.listAttr(blend_node + ".w", m=True) or []
+    return list(set(blendshape_names_refresh) - set(blendshape_names))
 
 
 def duplicate_mirror_blend_target(
@@ -324,55 +304,28 @@ def duplicate_mirror_blend_target(
 ):
     """
     Duplicates and mirror targets matching the provided name
+    The mirrored deltas are written directly to the blend shape node (no meshes or Shape Editor selection involved)
     Args:
         blend_node (string) Name of the blend shape node
         target_name (string) Name of the blend shape target to duplicate and flip
         duplicate_name (optional, string): New name for the duplicated target
         symmetry_axis (optional, string) Which axis to use when mirroring (default: x)
         mirror_direction (optional, string): Direction of the mirror operation (either "+" or "-") - Default "-"
+                                             "-" copies the negative side to the positive side and "+" the opposite
+    Raises:
+        ValueError: If a target with the duplicate name already exists (existing targets are not overwritten)
     """
-    cmds.select(d=True)  # Deselect
-    blendshape_names = cmds.listAttr(blend_node + ".w", m=True)
-
-    mirror_dir = 0  # 0=negative,1=positive
-    if mirror_direction == "+":
-        mirror_dir = 1
-
-    duplicate_target_index = get_target_index(blend_node, target_name)
-    duplicate_blend_target(blend_node, duplicate_target_index)
-
-    # Get Newly Generated Targets
-    blendshape_names_refresh = cmds.listAttr(blend_node + ".w", m=True)
-    blendshape_names_new_only = list(set(blendshape_names_refresh) - set(blendshape_names))
-
-    duplicate_target_name = ""
-    if blendshape_names_new_only:
-        duplicate_target_name = blendshape_names_new_only[0]
-    if duplicate_target_name:
-        duplicate_target_index = get_target_index(blend_node, duplicate_target_name)
-        cmds.blendShape(
-            blend_node,
-            e=True,
-            mirrorTarget=[(0, duplicate_target_index)],
-            mirrorDirection=mirror_dir,  # 0=negative,1=positive
-            symmetrySpace=1,  # 0=topological, 1=object, 2=UV
-            symmetryAxis=symmetry_axis,  # for object symmetrySpace
-        )
-        if duplicate_name:
-            rename_blend_target(blend_node, duplicate_target_name, duplicate_name)
-        else:
-            new_name = duplicate_target_name.replace("Copy", "Mirrored")
-            rename_blend_target(blend_node, duplicate_target_name, new_name)
+    blendshape_names = cmds.listAttr(blend_node + ".w", m=True) or []
+    duplicate_name = duplicate_name or target_name + "_Mirrored"
+    if duplicate_name in blendshape_names:
+        raise ValueError(f'Unable to mirror "{target_name}". A target named "{duplicate_name}" already exists.')
+    core_morph.mirror_blend_target(
+        blend_node, target_name, new_name=duplicate_name, symmetry_axis=symmetry_axis, direction=mirror_direction
+    )
 
     # Return Generated Targets
-    blendshape_names_refresh = cmds.listAttr(blend_node + ".w", m=True)
-    blendshape_names_new_only = list(set(blendshape_names_refresh) - set(blendshape_names))
-    for blend in blendshape_names_new_only:
-        try:
-            cmds.setAttr(blend_node + "." + blend, 0)
-        except Exception as e:
-            logger.debug(str(e))
-    return blendshape_names_new_only
+    blendshape_names_refresh = cmds.listAttr(blend_node + ".w", m=True) or []
+    return list(set(blendshape_names_refresh) - set(blendshape_names))
 
 
 def duplicate_flip_filtered_targets(blend_node, search_string, replace_string=None, symmetry_axis="x"):
@@ -409,7 +362,7 @@ def duplicate_flip_filtered_targets(blend_node, search_string, replace_string=No
             duplicate_flip_blend_target(blend_node, key, duplicate_name=value, symmetry_axis=symmetry_axis)
             number_operations += 1
         except Exception as exc:
-            logger.debug(str(exc))
+            logger.warning(str(exc))
     return number_operations
 
 
@@ -452,7 +405,7 @@ def duplicate_mirror_filtered_targets(
             )
             number_operations += 1
         except Exception as exc:
-            logger.debug(str(exc))
+            logger.warning(str(exc))
     return number_operations
 
 
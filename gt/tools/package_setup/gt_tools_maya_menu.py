@@ -3,11 +3,10 @@
  github.com/TrevisanGMW/gt-tools - 2020-03-03
 """
 
-from gt.core.version import get_package_version
-import gt.ui.resource_library as ui_res_lib
-from gt.core.prefs import PackagePrefs
 from gt.ui.maya_menu import MayaMenu
+from functools import partial
 import logging
+import time
 import sys
 
 # Setup  Logger
@@ -18,6 +17,88 @@ MENU_NAME = "GT Tools"
 IMPORT_TOOL = "from gt.utils.system import initialize_tool\n"
 IMPORT_UTIL = "from gt.utils.system import initialize_utility\n"
 
+# Startup timings (in seconds) - e.g. {"loader_import": 0.01, "menu_creation": 0.002}
+startup_timings = {}
+active_menu = None  # Last created MayaMenu, used to report the time spent populating sub-menus
+
+
+def _get_icon_path(icon_name):
+    """
+    Gets the path of a package icon. The resource library is only imported when an icon is first needed.
+    Args:
+        icon_name (str): Name of the icon attribute found in "resource_library.Icon". e.g. "root_general"
+    Returns:
+        str: Path to the icon.
+    """
+    import gt.ui.resource_library as ui_res_lib
+
+    return getattr(ui_res_lib.Icon, icon_name)
+
+
+class _MenuIcons:
+    """
+    Icon path getters, so icons are only resolved for the menu items that are shown.
+    e.g. "menu_icons.root_general" returns a callable that gets "resource_library.Icon.root_general" when called.
+    """
+
+    def __getattr__(self, icon_name):
+        if icon_name.startswith("__"):
+            raise AttributeError(icon_name)
+        return partial(_get_icon_path, icon_name)
+
+
+menu_icons = _MenuIcons()
+
+
+def _get_installed_version_label():
+    """
+    Gets the label used to display the installed version. (Only read when the "Help" sub-menu is opened)
+    Returns:
+        str: Label describing the installed version. e.g. "Installed Version: 1.2.3"
+    """
+    from gt.core.version import get_package_version
+
+    package_version = get_package_version() or "?.?.?"
+    return f"Installed Version: {str(package_version)}"
+
+
+def record_startup_timing(name, seconds):
+    """
+    Records a startup timing, so it can be reported using "get_startup_timing_report"
+    Args:
+        name (str): Name of the timed step. e.g. "loader_import"
+        seconds (float): Time in seconds the step took.
+    """
+    startup_timings[name] = seconds
+
+
+def get_startup_timing_report():
+    """
+    Gets a report describing how long the package took to load during startup.
+    Includes the import time of the loader path, the menu creation and the time spent populating the sub-menus
+    that were opened so far. (Sub-menus are only populated when opened for the first time)
+    Returns:
+        str: A report with the recorded timings in milliseconds.
+    """
+    lines = ["GT Tools Startup Timings:"]
+    for name, seconds in startup_timings.items():
+        lines.append(f"    {name}: {seconds * 1000:.3f} ms")
+    if active_menu and active_menu.populate_timings:
+        lines.append("Populated Sub-Menus:")
+        for name, seconds in active_menu.populate_timings.items():
+            lines.append(f"    {name}: {seconds * 1000:.3f} ms")
+    return "\n".join(lines)
+
+
+def print_startup_timing_report(*args):
+    """
+    Prints the startup timing report. (See "get_startup_timing_report")
+    Args:
+        *args: Variable number of arguments. Not used, only logged as debug.
+    """
+    logger.debug(f"Args: {str(args)}")
+    sys.stdout.write(get_startup_timing_report() + "\n")
+
 
 def _rebuild_menu(*args):
     """
@@ -44,91 +125,100 @@ def unload_menu(*args):
 def load_menu(*args):
     """
     Loads the package drop-down menu with various submenus and menu items.
+    Only the top-level menu is created, sub-menus are populated (and their icons resolved) when first opened.
     Args:
         *args: Variable number of arguments. Not used, only logged as debug.
     Returns:
         str: The path of the created menu.
     """
     logger.debug(f"Args: {str(args)}")
-    package_version = get_package_version() or "?.?.?"
+    global active_menu
+    from gt.core.prefs import PackagePrefs
 
-    menu = MayaMenu(MENU_NAME)
+    start_time = time.perf_counter()
+    prefs = PackagePrefs()
+    if prefs.is_skipping_menu_creation():
+        print('GT-Tools: "Skip Menu Creation" preference is active. Menu creation was skipped.')
+        unload_menu()
+        return
+
+    menu = MayaMenu(MENU_NAME, lazy=True)
     # ------------------------------------ General / Tools ------------------------------------
-    menu.add_sub_menu("General", icon=ui_res_lib.Icon.root_general, parent_to_root=True)
+    menu.add_sub_menu("General", icon=menu_icons.root_general, parent_to_root=True)
     menu.add_menu_item(
         label="Attributes to Python",
         command=IMPORT_TOOL + 'initialize_tool("attributes_to_python")',
         tooltip="Converts attributes into Python code. TRS Channels or User-defined.",
-        icon=ui_res_lib.Icon.tool_attributes_to_python,
+        icon=menu_icons.tool_attributes_to_python,
     )
     menu.add_menu_item(
         label="Color Manager",
         command=IMPORT_TOOL + 'initialize_tool("color_manager")',
         tooltip="A way to quickly change colors of objects and objects names (outliner).",
-        icon=ui_res_lib.Icon.tool_color_manager_roller,
+        icon=menu_icons.tool_color_manager_roller,
     )
     menu.add_menu_item(
         label="Outliner Sorter",
         command=IMPORT_TOOL + 'initialize_tool("outliner_sorter")',
         tooltip="Manages the order of the elements in the outliner.",
-        icon=ui_res_lib.Icon.tool_outliner_sorter,
+        icon=menu_icons.tool_outliner_sorter,
     )
     menu.add_menu_item(
         label="Path Manager",
         command=IMPORT_TOOL + 'initialize_tool("path_manager")',
         tooltip="A script for managing and repairing the path of many nodes.",
-        icon=ui_res_lib.Icon.tool_path_manager,
+        icon=menu_icons.tool_path_manager,
     )
     menu.add_menu_item(
         label="Renamer",
         command=IMPORT_TOOL + 'initialize_tool("renamer")',
         tooltip="Script for renaming multiple objects.",
-        icon=ui_res_lib.Icon.tool_renamer,
+        icon=menu_icons.tool_renamer,
     )
     menu.add_menu_item(
         label="Render Checklist",
         command=IMPORT_TOOL + 'initialize_tool("render_checklist")',
         tooltip="Performs a series of checks to detect common issues that are often accidentally " "ignored/unnoticed.",
-        icon=ui_res_lib.Icon.tool_render_checklist,
+        icon=menu_icons.tool_render_checklist,
     )
     menu.add_menu_item(
         label="Selection Manager",
         command=IMPORT_TOOL + 'initialize_tool("selection_manager")',
         tooltip="Manages or creates custom selections.",
-        icon=ui_res_lib.Icon.tool_selection_manager,
+        icon=menu_icons.tool_selection_manager,
     )
     menu.add_menu_item(
         label="Transfer Transforms",
         command=IMPORT_TOOL + 'initialize_tool("transfer_transforms")',
         tooltip="Script for quickly transferring Translate, Rotate, and Scale between objects.",
-        icon=ui_res_lib.Icon.tool_transfer_transforms,
+        icon=menu_icons.tool_transfer_transforms,
     )
     menu.add_menu_item(
         label="World Space Baker",
         command=IMPORT_TOOL + 'initialize_tool("world_space_baker")',
         tooltip="Script for getting and setting translate and rotate world space data.",
-        icon=ui_res_lib.Icon.tool_world_space_baker,
+        icon=menu_icons.tool_world_space_baker,
     )
 
     # ------------------------------------ Curves ------------------------------------
-    menu.add_sub_menu("Curves", icon=ui_res_lib.Icon.root_curves, parent_to_root=True)
+    menu.add_sub_menu("Curves", icon=menu_icons.root_curves, parent_to_root=True)
     menu.add_menu_item(
         label="Curve Library",
         command=IMPORT_TOOL + 'initialize_tool("curve_library")',
         tooltip="Open the Curve Library tool.",
-        icon=ui_res_lib.Icon.tool_crv_library,
+        icon=menu_icons.tool_crv_library,
     )
     menu.add_menu_item(
         label="Curve to Python",
         command=IMPORT_TOOL + 'initialize_tool("curve_to_python")',
         tooltip="Extracts python code to recreate or reshape curves.",
-        icon=ui_res_lib.Icon.tool_crv_python,
+        icon=menu_icons.tool_crv_python,
     )
     menu.add_menu_item(
         label="Generate Text Curve",
         command=IMPORT_TOOL + 'initialize_tool("shape_text_to_curve")',
         tooltip="Generates a single curve containing all shapes necessary to produce a word/text.",
-        icon=ui_res_lib.Icon.tool_crv_text,
+        icon=menu_icons.tool_crv_text,
     )
 
     menu.add_divider(divider_label="Utilities")  # Utility Section +++++++++++++++++++++++++++++++++
@@ -136,28 +226,28 @@ def load_menu(*args):
         label="Combine Curves",
         command=IMPORT_UTIL + 'initialize_utility("curve", "selected_curves_combine")',
         tooltip="Combine curves by moving all the shape objects inside one single transform.",
-        icon=ui_res_lib.Icon.util_crv_combine,
+        icon=menu_icons.util_crv_combine,
     )
     menu.add_menu_item(
         label="Separate Curves",
         command=IMPORT_UTIL + 'initialize_utility("curve", "selected_curves_separate")',
         tooltip="Separate curves by moving every shape object to their own separated transform.",
-        icon=ui_res_lib.Icon.util_crv_separate,
+        icon=menu_icons.util_crv_separate,
     )
 
     # ------------------------------------ Modeling ------------------------------------
-    menu.add_sub_menu("Modeling", icon=ui_res_lib.Icon.root_modeling, parent_to_root=True)
+    menu.add_sub_menu("Modeling", icon=menu_icons.root_modeling, parent_to_root=True)
     menu.add_menu_item(
         label="Mesh Library",
         command=IMPORT_TOOL + 'initialize_tool("mesh_library")',
         tooltip="Open the Mesh Library tool.",
-        icon=ui_res_lib.Icon.tool_mesh_library,
+        icon=menu_icons.tool_mesh_library,
     )
     menu.add_menu_item(
         label="Transfer UVs",
         command=IMPORT_TOOL + 'initialize_tool("transfer_uvs")',
         tooltip="A script to export/import UVs as well as transfer them between objects.",
-        icon=ui_res_lib.Icon.tool_transfer_uvs,
+        icon=menu_icons.tool_transfer_uvs,
     )
 
     menu.add_divider(divider_label="Utilities")  # Utility Section +++++++++++++++++++++++++++++++++
@@ -165,14 +255,14 @@ def load_menu(*args):
         label="Preview All UDIMs",
         command=IMPORT_UTIL + 'initialize_utility("display", "generate_udim_previews")',
         tooltip="Generates UDIM previews for all file nodes.",
-        icon=ui_res_lib.Icon.util_mod_load_udims,
+        icon=menu_icons.util_mod_load_udims,
     )
     menu.add_menu_item(
         label="Convert Bif to Mesh",
         command=IMPORT_UTIL + 'initialize_utility("mesh", "convert_bif_to_mesh")',
         tooltip="Converts Bifrost Geometry into Maya Geometry (Mesh). "
         "If used with volume or particles the output will be empty.",
-        icon=ui_res_lib.Icon.util_mod_bif_to_mesh,
+        icon=menu_icons.util_mod_bif_to_mesh,
     )
 
     menu.add_divider(divider_label="Copy/Paste Utilities")  # Material Section +++++++++++++++++++++++++++++++++
@@ -180,39 +270,39 @@ def load_menu(*args):
         label="Copy Material",
         command=IMPORT_UTIL + 'initialize_utility("misc", "material_copy")',
         tooltip="Copies material to clipboard.",
-        icon=ui_res_lib.Icon.util_mod_copy_material,
+        icon=menu_icons.util_mod_copy_material,
     )
     menu.add_menu_item(
         label="Paste Material",
         command=IMPORT_UTIL + 'initialize_utility("misc", "material_paste")',
         tooltip="Pastes material from clipboard.",
-        icon=ui_res_lib.Icon.util_mod_paste_material,
+        icon=menu_icons.util_mod_paste_material,
     )
     # ------------------------------------ Rigging ------------------------------------
-    menu.add_sub_menu("Rigging", icon=ui_res_lib.Icon.root_rigging, parent_to_root=True)
+    menu.add_sub_menu("Rigging", icon=menu_icons.root_rigging, parent_to_root=True)
     menu.add_menu_item(
         label="Biped Auto Rigger",
         command=IMPORT_TOOL + 'initialize_tool("biped_rigger_legacy")',
         tooltip="Automated solution for creating a biped rig.",
-        icon=ui_res_lib.Icon.tool_auto_rigger_legacy,
+        icon=menu_icons.tool_auto_rigger_legacy,
     )
     menu.add_menu_item(
         label="Biped Rig Interface",
         command=IMPORT_TOOL + 'initialize_tool("biped_rigger_legacy", "launch_biped_rig_interface")',
         tooltip="Custom Rig Interface for GT Biped Auto Rigger.",
-        icon=ui_res_lib.Icon.tool_rig_interface,
+        icon=menu_icons.tool_rig_interface,
     )
     menu.add_menu_item(
         label="Retarget Assistant",
         command=IMPORT_TOOL + 'initialize_tool("biped_rigger_legacy", "launch_retarget_assistant")',
         tooltip="Script with HumanIK patches.",
-        icon=ui_res_lib.Icon.tool_retarget_assistant,
+        icon=menu_icons.tool_retarget_assistant,
     )
     menu.add_menu_item(
         label="Game FBX Exporter",
         command=IMPORT_TOOL + 'initialize_tool("biped_rigger_legacy", "launch_game_exporter")',
         tooltip="Automated solution for exporting real-time FBX files.",
-        icon=ui_res_lib.Icon.tool_game_fbx_exporter,
+        icon=menu_icons.tool_game_fbx_exporter,
     )
 
     menu.add_divider()  # General Rigging Tools +++++++++++++++++++++++++++++++++
@@ -220,95 +310,95 @@ def load_menu(*args):
         label="Add Offset Transform",
         command=IMPORT_TOOL + 'initialize_tool("add_offset_transform")',
         tooltip="Generates offset transforms that can be used as transform " "layers for rigging/animation.",
-        icon=ui_res_lib.Icon.tool_add_inbetween,
+        icon=menu_icons.tool_add_inbetween,
     )
     menu.add_menu_item(
         label="Add Sine Attributes",
         command=IMPORT_TOOL + 'initialize_tool("sine_attributes")',
         tooltip="Create Sine function without using third-party plugins or expressions.",
-        icon=ui_res_lib.Icon.tool_sine_attributes,
+        icon=menu_icons.tool_sine_attributes,
     )
     menu.add_menu_item(
         label="Connect Attributes",
         command=IMPORT_TOOL + 'initialize_tool("connect_attributes")',
         tooltip="Automated solution for connecting multiple attributes.",
-        icon=ui_res_lib.Icon.tool_connect_attributes,
+        icon=menu_icons.tool_connect_attributes,
     )
     menu.add_menu_item(
         label="Create Auto FK",
         command=IMPORT_TOOL + 'initialize_tool("create_auto_fk")',
         tooltip="Automated solution for created an FK control curve.",
-        icon=ui_res_lib.Icon.tool_create_fk,
+        icon=menu_icons.tool_create_fk,
     )
     menu.add_menu_item(
         label="Create Testing Keys",
         command=IMPORT_TOOL + 'initialize_tool("create_testing_keys")',
         tooltip="Automated solution for creating testing keyframes.",
-        icon=ui_res_lib.Icon.tool_testing_keys,
+        icon=menu_icons.tool_testing_keys,
     )
     menu.add_menu_item(
         label="Influences to Python",
         command=IMPORT_TOOL + 'initialize_tool("influences_to_python")',
         tooltip="Generate Python code used to select influence (bound) joints.",
-        icon=ui_res_lib.Icon.tool_influence_joints,
+        icon=menu_icons.tool_influence_joints,
     )
     menu.add_menu_item(
         label="Make IK Stretchy",
         command=IMPORT_TOOL + 'initialize_tool("make_ik_stretchy")',
         tooltip="Automated solution for making an IK system stretchy.",
-        icon=ui_res_lib.Icon.tool_make_ik_stretchy,
+        icon=menu_icons.tool_make_ik_stretchy,
     )
     menu.add_menu_item(
         label="Mirror Cluster Tool",
         command=IMPORT_TOOL + 'initialize_tool("mirror_cluster_tool")',
         tooltip="Automated solution for mirroring clusters.",
-        icon=ui_res_lib.Icon.tool_mirror_cluster,
+        icon=menu_icons.tool_mirror_cluster,
     )
     menu.add_menu_item(
         label="Morphing Attributes",
         command=IMPORT_TOOL + 'initialize_tool("morphing_attributes")',
         tooltip="Creates attributes to drive selected blend shapes.",
-        icon=ui_res_lib.Icon.tool_morphing_attributes,
+        icon=menu_icons.tool_morphing_attributes,
     )
     menu.add_menu_item(
         label="Morphing Utilities",
         command=IMPORT_TOOL + 'initialize_tool("morphing_utilities")',
         tooltip="Morphing utilities (Blend Shapes).",
-        icon=ui_res_lib.Icon.tool_morphing_utils,
+        icon=menu_icons.tool_morphing_utils,
     )
     menu.add_menu_item(
         label="Orient Joints",
         command=IMPORT_TOOL + 'initialize_tool("orient_joints")',
         tooltip="Orients Joint in a more predictable way.",
-        icon=ui_res_lib.Icon.tool_orient_joints,
+        icon=menu_icons.tool_orient_joints,
     )
     menu.add_menu_item(
         label="Ribbon Tool",
         command=IMPORT_TOOL + 'initialize_tool("ribbon_tool")',
         tooltip="Create ribbon setups, using existing objects or by itself.",
-        icon=ui_res_lib.Icon.tool_ribbon,
+        icon=menu_icons.tool_ribbon,
     )
     menu.add_divider()  # General Rigging Tools +++++++++++++++++++++++++++++++++
     menu.add_menu_item(
         label="Rivet Locator",
         command=IMPORT_UTIL + 'initialize_utility("constraint", "create_rivet")',
         tooltip="Creates a rivet between two polygon edges or on a surface point",
-        icon=ui_res_lib.Icon.util_rivet,
+        icon=menu_icons.util_rivet,
     )
 
     # ------------------------------------ Utilities ------------------------------------
-    menu.add_sub_menu("Utilities", icon=ui_res_lib.Icon.root_utilities, parent_to_root=True)
+    menu.add_sub_menu("Utilities", icon=menu_icons.root_utilities, parent_to_root=True)
     menu.add_menu_item(
         label="Reload File",
         command=IMPORT_UTIL + 'initialize_utility("scene", "force_reload_file")',
         tooltip="Forces the re-opening of an opened file. (Changes are ignored)",
-        icon=ui_res_lib.Icon.util_reload_file,
+        icon=menu_icons.util_reload_file,
     )
     menu.add_menu_item(
         label="Open File Directory",
         command=IMPORT_UTIL + 'initialize_utility("scene", "open_file_dir")',
         tooltip="Opens the directory where the scene is located.",
-        icon=ui_res_lib.Icon.util_open_dir,
+        icon=menu_icons.util_open_dir,
     )
 
     menu.add_divider(divider_label="General Utilities")  # General +++++++++++++++++++++++++++++++++
@@ -317,47 +407,47 @@ def load_menu(*args):
         command=IMPORT_UTIL + 'initialize_utility("display", "toggle_full_hud")',
         tooltip="Toggles most of the Heads-Up Display (HUD) options according to the state of "
         "the majority of them. (Keeps default elements intact when toggling it off)",
-        icon=ui_res_lib.Icon.util_hud_toggle,
+        icon=menu_icons.util_hud_toggle,
     )
     menu.add_menu_item(
         label="Select Non-Unique Objects",
         command=IMPORT_UTIL + 'initialize_utility("selection", "select_non_unique_objects")',
         tooltip="Selects all objects with the same short name. (non-unique objects)",
-        icon=ui_res_lib.Icon.util_sel_non_unique,
+        icon=menu_icons.util_sel_non_unique,
     )
     menu.add_menu_item(
         label="Set Joint Name as Label",
         command=IMPORT_UTIL + 'initialize_utility("display", "set_joint_name_as_label")',
         tooltip="Set the label of the selected joints to be the same as their short name.",
-        icon=ui_res_lib.Icon.util_joint_to_label,
+        icon=menu_icons.util_joint_to_label,
     )
     menu.add_menu_item(
         label="Uniform LRA Toggle",
         command=IMPORT_UTIL + 'initialize_utility("display", "toggle_uniform_lra")',
         tooltip="Makes the visibility of the Local Rotation Axis uniform among the selected "
         "objects according to the current state of the majority of them.",
-        icon=ui_res_lib.Icon.util_lra_toggle,
+        icon=menu_icons.util_lra_toggle,
     )
     menu.add_menu_item(
         label="Uniform Joint Label Toggle",
         command=IMPORT_UTIL + 'initialize_utility("display", "toggle_uniform_jnt_label")',
         tooltip="Makes the visibility of the joint labels uniform according to the current "
         "state of the majority of them.",
-        icon=ui_res_lib.Icon.util_joint_label_toggle,
+        icon=menu_icons.util_joint_label_toggle,
     )
     menu.add_menu_item(
         label="Unhide Default Channels",
         command=IMPORT_UTIL + 'initialize_utility("attr", ' '"selection_unhide_default_channels")',
         tooltip="Un-hides the default channels of the selected objects. "
         "(Default channels : Translate, Rotate, Scale and Visibility)",
-        icon=ui_res_lib.Icon.util_unhide_trs,
+        icon=menu_icons.util_unhide_trs,
     )
     menu.add_menu_item(
         label="Unlock Default Channels",
         command=IMPORT_UTIL + 'initialize_utility("attr", ' '"selection_unlock_default_channels")',
         tooltip="Unlocks the default channels of the selected objects. "
         "(Default channels : Translate, Rotate, Scale and Visibility)",
-        icon=ui_res_lib.Icon.util_unlock_trs,
+        icon=menu_icons.util_unlock_trs,
     )
 
     menu.add_divider(divider_label="Convert Utilities")  # Convert Section +++++++++++++++++++++++++++++++++
@@ -365,13 +455,13 @@ def load_menu(*args):
         label="Convert Joints to Mesh",
         command=IMPORT_UTIL + 'initialize_utility("joint", "convert_joints_to_mesh")',
         tooltip="Converts joints to mesh. (Helpful when sending references to other applications)",
-        icon=ui_res_lib.Icon.util_convert_joint_mesh,
+        icon=menu_icons.util_convert_joint_mesh,
     )
     menu.add_menu_item(
         label="Convert to Locators",
         command=IMPORT_UTIL + 'initialize_utility("transform", "convert_transforms_to_locators")',
         tooltip="Converts transforms to locators. Function doesn't affect selected objects.",
-        icon=ui_res_lib.Icon.util_convert_loc,
+        icon=menu_icons.util_convert_loc,
     )
 
     menu.add_divider(divider_label="Reference Utilities")  # References Section +++++++++++++++++++++++++++++++++
@@ -379,13 +469,13 @@ def load_menu(*args):
         label="Import References",
         command=IMPORT_UTIL + 'initialize_utility("reference", "references_import")',
         tooltip="Imports all references.",
-        icon=ui_res_lib.Icon.util_ref_import,
+        icon=menu_icons.util_ref_import,
     )
     menu.add_menu_item(
         label="Remove References",
         command=IMPORT_UTIL + 'initialize_utility("reference", "references_remove")',
         tooltip="Removes all references.",
-        icon=ui_res_lib.Icon.util_ref_remove,
+        icon=menu_icons.util_ref_remove,
     )
 
     menu.add_divider(divider_label="Pivot Utilities")  # Pivot Section +++++++++++++++++++++++++++++++++
@@ -393,19 +483,19 @@ def load_menu(*args):
         label="Move Pivot to Top",
         command=IMPORT_UTIL + 'initialize_utility("transform", "move_pivot_top")',
         tooltip="Moves pivot point to the top of the bounding box of every selected object.",
-        icon=ui_res_lib.Icon.util_pivot_top,
+        icon=menu_icons.util_pivot_top,
     )
     menu.add_menu_item(
         label="Move Pivot to Base",
         command=IMPORT_UTIL + 'initialize_utility("transform", "move_pivot_base")',
         tooltip="Moves pivot point to the base of the bounding box of every selected object.",
-        icon=ui_res_lib.Icon.util_pivot_bottom,
+        icon=menu_icons.util_pivot_bottom,
     )
     menu.add_menu_item(
         label="Move Object to Origin",
         command=IMPORT_UTIL + 'initialize_utility("transform", "move_selection_to_origin")',
         tooltip="Moves selected objects to origin according to their pivot point.",
-        icon=ui_res_lib.Icon.util_move_origin,
+        icon=menu_icons.util_move_origin,
     )
 
     menu.add_divider(divider_label="Reset Utilities")  # Reset Section +++++++++++++++++++++++++++++++++
@@ -414,20 +504,20 @@ def load_menu(*args):
         command=IMPORT_UTIL + 'initialize_utility("transform", "reset_transforms")',
         tooltip="Reset transforms. It checks for incoming connections, then set the attribute to 0 "
         "if there are none. Currently affects Joints, meshes and transforms. (Only Rotation)",
-        icon=ui_res_lib.Icon.util_reset_transforms,
+        icon=menu_icons.util_reset_transforms,
     )
     menu.add_menu_item(
         label="Reset Joints Display",
         command=IMPORT_UTIL + 'initialize_utility("display", "reset_joint_display")',
         tooltip="Resets the radius attribute back to one in all joints, then changes the global "
         "multiplier (jointDisplayScale) back to one.",
-        icon=ui_res_lib.Icon.util_reset_jnt_display,
+        icon=menu_icons.util_reset_jnt_display,
     )
     menu.add_menu_item(
         label='Reset "persp" Camera',
         command=IMPORT_UTIL + 'initialize_utility("camera", "reset_persp_shape_attributes")',
         tooltip="If persp camera exists (default camera), reset its attributes.",
-        icon=ui_res_lib.Icon.util_reset_persp,
+        icon=menu_icons.util_reset_persp,
     )
 
     menu.add_divider(divider_label="Delete Utilities")  # Delete Section +++++++++++++++++++++++++++++++++
@@ -435,86 +525,86 @@ def load_menu(*args):
         label="Delete Custom Attributes",
         command=IMPORT_UTIL + 'initialize_utility("attr", ' '"selection_delete_user_defined_attrs")',
         tooltip="Deletes user-defined (custom) attributes found on the selected objects.",
-        icon=ui_res_lib.Icon.util_delete_custom_attr,
+        icon=menu_icons.util_delete_custom_attr,
     )
     menu.add_menu_item(
         label="Delete Namespaces",
         command=IMPORT_UTIL + 'initialize_utility("namespace", "delete_namespaces")',
         tooltip="Deletes all namespaces in the scene.",
-        icon=ui_res_lib.Icon.util_delete_ns,
+        icon=menu_icons.util_delete_ns,
     )
     menu.add_menu_item(
         label="Delete Display Layers",
         command=IMPORT_UTIL + 'initialize_utility("display", "delete_display_layers")',
         tooltip="Deletes all display layers.",
-        icon=ui_res_lib.Icon.util_delete_display_layers,
+        icon=menu_icons.util_delete_display_layers,
     )
     menu.add_menu_item(
         label="Delete Unused Nodes",
         command=IMPORT_UTIL + 'initialize_utility("cleanup", "delete_unused_nodes")',
         tooltip="Deletes unused nodes.",
-        icon=ui_res_lib.Icon.util_delete_unused_nodes,
+        icon=menu_icons.util_delete_unused_nodes,
     )
     menu.add_menu_item(
         label="Delete Nucleus Nodes",
         command=IMPORT_UTIL + 'initialize_utility("cleanup", "delete_nucleus_nodes")',
         tooltip="Deletes all nodes related to particles. " "(Nucleus, nHair, nCloth, nConstraints, Emitter, etc...)",
-        icon=ui_res_lib.Icon.util_delete_nucleus_nodes,
+        icon=menu_icons.util_delete_nucleus_nodes,
     )
     menu.add_menu_item(
         label="Delete Keyframes",
         command=IMPORT_UTIL + 'initialize_utility("anim", "delete_time_keyframes")',
         tooltip='Deletes all nodes of the type "animCurveTA" (keyframes).',
-        icon=ui_res_lib.Icon.util_delete_keyframes,
+        icon=menu_icons.util_delete_keyframes,
     )
 
     # ------------------------------------ Miscellaneous ------------------------------------
-    menu.add_sub_menu("Miscellaneous", icon=ui_res_lib.Icon.root_miscellaneous, parent_to_root=True)
+    menu.add_sub_menu("Miscellaneous", icon=menu_icons.root_miscellaneous, parent_to_root=True)
     menu.add_menu_item(
         label="Startup Booster",
         command=IMPORT_TOOL + 'initialize_tool("startup_booster")',
         tooltip="Improve startup times by managing which plugins get loaded when starting Maya.",
-        icon=ui_res_lib.Icon.tool_startup_booster,
+        icon=menu_icons.tool_startup_booster,
     )
     menu.add_menu_item(
         label="fSpy Importer",
         command=IMPORT_TOOL + 'initialize_tool("fspy_importer")',
         tooltip="Imports the JSON data exported out of fSpy (Camera Matching software).",
-        icon=ui_res_lib.Icon.tool_fspy_importer,
+        icon=menu_icons.tool_fspy_importer,
     )
     menu.add_menu_item(
         label="Maya to Discord",
         command=IMPORT_TOOL + 'initialize_tool("maya_to_discord")',
         tooltip="Send images and videos (playblasts) from Maya to Discord using a "
         "Discord Webhook to bridge the two programs.",
-        icon=ui_res_lib.Icon.tool_maya_to_discord,
+        icon=menu_icons.tool_maya_to_discord,
     )
     menu.add_menu_item(
         label="Render Calculator",
         command=IMPORT_TOOL + 'initialize_tool("render_calculator")',
         tooltip="Helps calculate how long it's going to take to render an image sequence.",
-        icon=ui_res_lib.Icon.tool_render_calculator,
+        icon=menu_icons.tool_render_calculator,
     )
     # ------------------------------------ Development ------------------------------------
-    if PackagePrefs().is_dev_menu_visible():
-        menu.add_sub_menu("Develop", icon=ui_res_lib.Icon.root_dev, parent_to_root=True)
+    if prefs.is_dev_menu_visible():
+        menu.add_sub_menu("Develop", icon=menu_icons.root_dev, parent_to_root=True)
         menu.add_menu_item(
             label="Resource Library",
             command=IMPORT_TOOL + 'initialize_tool("resource_library")',
             tooltip="Opens Resource Library tool." "Library with colors, package icons and Maya icons.",
-            icon=ui_res_lib.Icon.tool_resource_library,
+            icon=menu_icons.tool_resource_library,
         )
         menu.add_menu_item(
             label="Sample Tool",
             command=IMPORT_TOOL + 'initialize_tool("sample_tool")',
             tooltip="Opens sample tool.",
-            icon=ui_res_lib.Icon.dev_screwdriver,
+            icon=menu_icons.dev_screwdriver,
         )
         menu.add_menu_item(
             label="Auto Rigger",
             command=IMPORT_TOOL + 'initialize_tool("auto_rigger")',
             tooltip="Opens auto rigger.",
-            icon=ui_res_lib.Icon.tool_auto_rigger,
+            icon=menu_icons.tool_auto_rigger,
         )
         menu.add_divider(divider_label="Curves")  # Curve Thumbnails Section +++++++++++++++++++++++++++++++++
         menu.add_menu_item(
@@ -522,28 +612,36 @@ def load_menu(*args):
             command="from gt.core.curve import add_thumbnail_metadata_attr_to_selection\n"
             "add_thumbnail_metadata_attr_to_selection()\n",
             tooltip="Add thumbnail metadata attributes to selection.",
-            icon=ui_res_lib.Icon.dev_filter,
+            icon=menu_icons.dev_filter,
         )
         menu.add_menu_item(
             label="Write Curve Files from Selection",
             command="from gt.core.curve import write_curve_files_from_selection\n"
             "write_curve_files_from_selection()\n",
             tooltip="Write curve data attributes to a desktop folder.",
-            icon=ui_res_lib.Icon.dev_binary,
+            icon=menu_icons.dev_binary,
         )
         menu.add_menu_item(
             label="Get Package CRV files to Python",
             command="from gt.core.curve import print_code_for_crv_files\n"
             "print_code_for_crv_files(use_output_window=True)\n",
             tooltip='Get Python Lines used to call curves from "Curves" class.',
-            icon=ui_res_lib.Icon.dev_binary,
+            icon=menu_icons.dev_binary,
+        )
+        menu.add_menu_item(
+            label="Write Package Curves Manifest and Pack",
+            command="from gt.core.curve import write_curve_manifest, write_curve_pack\n"
+            "write_curve_manifest()\n"
+            "write_curve_pack()\n",
+            tooltip="Regenerates the curve manifest and curve pack using the package curve files.",
+            icon=menu_icons.dev_binary,
         )
         menu.add_menu_item(
             label="Render Package Curves Thumbnails",
             command="from gt.core.curve import generate_package_curves_thumbnails\n"
             "generate_package_curves_thumbnails()\n",
             tooltip="Render thumbnails for the package curves to a desktop folder.",
-            icon=ui_res_lib.Icon.dev_picker,
+            icon=menu_icons.dev_picker,
         )
         menu.add_divider(divider_label="General")  # Misc Section +++++++++++++++++++++++++++++++++
         menu.add_menu_item(
@@ -554,13 +652,13 @@ def load_menu(*args):
             '"Snapshot %Y-%m-%d %H%M%S"), get_desktop_path())\nif file_path:\n\t'
             "sys.stdout.write(f'\\nSnapshot written to: \"{file_path}\"')",
             tooltip="Saves a viewport snapshot to the desktop.",
-            icon=ui_res_lib.Icon.dev_picker,
+            icon=menu_icons.dev_picker,
         )
         menu.add_menu_item(
             label="Silently Check for Updates",
             command=IMPORT_TOOL + 'initialize_tool("package_updater", "silently_check_for_updates")',
             tooltip="Silently checks for updates.",
-            icon=ui_res_lib.Icon.dev_git_pull_request,
+            icon=menu_icons.dev_git_pull_request,
         )
         menu.add_menu_item(
             label="Get Loaded Package Location",
@@ -568,60 +666,65 @@ def load_menu(*args):
             "from gt.utils.system import open_file_dir\n"
             'open_file_dir(get_module_path(module_name="gt", verbose=True))\n',
             tooltip="Gets the loaded package path location.",
-            icon=ui_res_lib.Icon.dev_code,
+            icon=menu_icons.dev_code,
+        )
+        menu.add_menu_item(
+            label="Print Startup Timings",
+            command="from gt.tools.package_setup.gt_tools_maya_menu import print_startup_timing_report\n"
+            "print_startup_timing_report()\n",
+            tooltip="Prints how long the package loader import, menu creation and opened sub-menus took.",
+            icon=menu_icons.dev_code,
         )
         menu.add_divider(divider_label="Dangerous")  # Misc Section +++++++++++++++++++++++++++++++++
         menu.add_menu_item(
             label="Skip Menu Creation Toggle",
             command="from gt.core.prefs import toggle_skip_menu_creation\n" "toggle_skip_menu_creation()\n",
             tooltip="Opens sample tool.",
-            icon=ui_res_lib.Icon.dev_code,
+            icon=menu_icons.dev_code,
         )
         menu.add_menu_item(
             label="Purge Package Settings",
             command="from gt.core.prefs import purge_package_settings\n" "purge_package_settings()\n",
             tooltip="Opens sample tool.",
-            icon=ui_res_lib.Icon.dev_trash,
+            icon=menu_icons.dev_trash,
         )
     # ------------------------------------ About/Help ------------------------------------
     menu.add_divider(parent_to_root=True)
-    menu.add_sub_menu("Help", icon=ui_res_lib.Icon.root_help, parent_to_root=True)
+    menu.add_sub_menu("Help", icon=menu_icons.root_help, parent_to_root=True)
     menu.add_menu_item(
         label="About",
         command=IMPORT_TOOL + 'initialize_tool("package_setup", "open_about_window")',
         tooltip="Opens about menu.",
-        icon=ui_res_lib.Icon.misc_about,
+        icon=menu_icons.misc_about,
     )
     _rebuild_menu_command = "from gt.tools.package_setup.gt_tools_maya_menu import _rebuild_menu\n_rebuild_menu()"
     menu.add_menu_item(
         label="Re-Build Menu",
         command=_rebuild_menu_command,
         tooltip="Re-Creates this menu, and does a rehash to pick up any new scripts.",
-        icon=ui_res_lib.Icon.misc_rebuild_menu,
+        icon=menu_icons.misc_rebuild_menu,
     )
     menu.add_menu_item(
         label="Check for Updates",
         command=IMPORT_TOOL + 'initialize_tool("package_updater")',
         tooltip="Check for updates by comparing current version with latest release.",
-        icon=ui_res_lib.Icon.tool_package_updater,
+        icon=menu_icons.tool_package_updater,
     )
     menu.add_menu_item(
         label="Develop Menu Toggle",
         command="from gt.core.prefs import toggle_dev_sub_menu\n" "toggle_dev_sub_menu()\n" + _rebuild_menu_command,
         tooltip="Check for updates by comparing current version with latest release.",
-        icon=ui_res_lib.Icon.root_dev,
+        icon=menu_icons.root_dev,
     )
     menu.add_menu_item(
-        label=f"Installed Version: {str(package_version)}",
+        label=_get_installed_version_label,
         enable=False,
-        icon=ui_res_lib.Icon.misc_current_version,
+        icon=menu_icons.misc_current_version,
     )
     # ------------------------------------ End ------------------------------------
-    if PackagePrefs().is_skipping_menu_creation():
-        print('GT-Tools: "Skip Menu Creation" preference is active. Menu creation was skipped.')
-        unload_menu()
-        return
     menu_path = menu.create_menu()
+    active_menu = menu
+    record_startup_timing("menu_creation", time.perf_counter() - start_time)
     return menu_path
 
 
@@ -6,7 +6,7 @@ Classes:
 """
 
 from gt.core.setup import remove_package_loaded_modules, reload_package_loaded_modules
-from gt.utils.request import download_file, is_connected_to_internet
+from gt.utils.request import download_file_resumable, is_connected_to_internet, ThrottledCallback
 from gt.core.io import unzip_zip_file, delete_paths
 from gt.core.setup import PACKAGE_MAIN_MODULE
 import gt.ui.resource_library as ui_res_lib
@@ -20,6 +20,7 @@ from json import loads
 import logging
 import sys
 import os
+import re
 
 # Logging Setup
 logging.basicConfig()
@@ -31,6 +32,7 @@ PREFS_NAME = "package_updater"
 PREFS_LAST_DATE = "last_date"  # Format: '2020-01-01 17:08:00'
 PREFS_AUTO_CHECK = "auto_check"
 PREFS_INTERVAL_DAYS = "interval_days"
+PROGRESS_UPDATE_INTERVAL = 0.1  # Minimum time (seconds) between progress window updates (download/extract)
 
 
 class PackageUpdaterModel:
@@ -355,9 +357,10 @@ class PackageUpdaterModel:
             _cache = core_prefs.PackageCache()
 
         cache_dir = _cache.get_cache_dir()
-        cache_download = os.path.join(cache_dir, "package_update.zip")
+        # Named after the release, so an interrupted download (".part") is only resumed for the same release
+        release_tag = re.sub(r"[^\w.-]", "_", str(content.get("tag_name") or "latest"))
+        cache_download = os.path.join(cache_dir, f"package_update_{release_tag}.zip")
         cache_extract = os.path.join(cache_dir, "update_extract")
-        _cache.add_path_to_cache_list(cache_download)
         _cache.add_path_to_cache_list(cache_extract)
 
         if not os.path.exists(cache_dir):
@@ -367,18 +370,20 @@ class PackageUpdaterModel:
 
         # Download Update --------------------------------------------------
         self.progress_win.add_text_to_output_box("Downloading Update...")
-        output_box_content = self.progress_win.get_output_box_plain_text()
+        self.progress_win.add_text_to_output_box("Download progress: 0.00%")
 
         def print_download_progress(progress):
-            output_box = output_box_content
-            output_box += f"\nDownload progress: {progress:.2f}%"
-            self.progress_win.clear_output_box()
-            self.progress_win.add_text_to_output_box(output_box, as_new_line=True)
+            self.progress_win.set_last_line_text(f"Download progress: {progress:.2f}%")
 
         try:
-            download_file(
-                url=zip_file_url, destination=cache_download, chunk_size=65536, callback=print_download_progress
+            download_file_resumable(
+                url=zip_file_url,
+                destination=cache_download,
+                chunk_size=65536,
+                callback=print_download_progress,
+                callback_interval=PROGRESS_UPDATE_INTERVAL,
             )
+            _cache.add_path_to_cache_list(cache_download)
             self.progress_win.increase_progress_bar_value()
         except Exception as e:
             self.progress_win.add_text_to_output_box(input_string=str(e), color=ui_res_lib.Color.Hex.red_melon)
@@ -386,14 +391,15 @@ class PackageUpdaterModel:
 
         # Extract Update ----------------------------------------------------
         self.progress_win.add_text_to_output_box("Extracting zip file...", as_new_line=True)
-        output_box_content = self.progress_win.get_output_box_plain_text()
+        self.progress_win.add_text_to_output_box("Extract progress: 0.00%")
 
         def print_extract_progress(current_file, total_files):
             percent_complete = (current_file / total_files) * 100
-            output_box = output_box_content
-            output_box += f"\nExtract progress: {percent_complete:.2f}% ({current_file}/{total_files})"
-            self.progress_win.clear_output_box()
-            self.progress_win.add_text_to_output_box(output_box)
+            self.progress_win.set_last_line_text(
+                f"Extract progress: {percent_complete:.2f}% ({current_file}/{total_files})"
+            )
+
+        throttled_extract_progress = ThrottledCallback(print_extract_progress, interval=PROGRESS_UPDATE_INTERVAL)
 
         # Enforce clear extracted cache (In case it exists)
         if os.path.exists(cache_extract):
@@ -401,7 +407,10 @@ class PackageUpdaterModel:
             os.makedirs(cache_extract)
 
         try:
-            unzip_zip_file(zip_file_path=cache_download, extract_path=cache_extract, callback=print_extract_progress)
+            unzip_zip_file(
+                zip_file_path=cache_download, extract_path=cache_extract, callback=throttled_extract_progress
+            )
+            throttled_extract_progress.flush()
             self.progress_win.increase_progress_bar_value()
         except Exception as e:
             self.progress_win.add_text_to_output_box(input_string=str(e), color=ui_res_lib.Color.Hex.red_melon)
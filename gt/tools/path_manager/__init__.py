@@ -35,6 +35,11 @@
  Minor PEP8 Cleanup
  Aligned path to the left
  Added padding to table cells
+
+ 1.3.0 - 2026-10-18
+ Auto Path Repair now scans the search directory only once (file name index) instead of once per missing path
+ Search directory index is reused across repairs until one of its folders changes (modification time)
+ Fixed issue where image sequences without a UDIM pattern would not be found
 """
 import logging
 
@@ -44,7 +49,7 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 # Tool Version
-__version_tuple__ = (1, 2, 3)
+__version_tuple__ = (1, 3, 0)
 __version_suffix__ = ''
 __version__ = '.'.join(str(n) for n in __version_tuple__) + __version_suffix__
 
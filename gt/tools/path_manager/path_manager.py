@@ -3,11 +3,13 @@
  github.com/TrevisanGMW/gt-tools - 2020-08-26
 """
 
+import maya.app.general.fileTexturePathResolver
 import gt.ui.resource_library as ui_res_lib
 import maya.OpenMayaUI as OpenMayaUI
 import maya.OpenMaya as OpenMaya
 import gt.ui.qt_import as ui_qt
 import maya.cmds as cmds
+import threading
 import logging
 import os
 import re
@@ -23,6 +25,245 @@ logging.basicConfig()
 logger = logging.getLogger("gt_path_manager")
 logger.setLevel(logging.INFO)
 
+# File Name Index - Used to find missing files (Stem ending in digits, e.g. "texture.1001" -> "texture." + "1001")
+NUMBERED_STEM_PATTERN = re.compile(r"^(.*?)(\d+)$")
+UDIM_TOKEN = "<UDIM>"
+FRAME_TOKEN = "<f>"
+file_name_indexes = {}  # Search directory as key, "FileNameIndex" as value (Reused across repairs)
+
+
+def get_file_group_keys(file_name):
+    """
+    Gets the UDIM and image sequence group keys for a file name.
+    The last group of digits in the file name (before the extension) is replaced with a token.
+    e.g. "texture.1001.png" returns ("texture.<UDIM>.png", "texture.<f>.png")
+
+    Args:
+        file_name (str): A file name (not a path). e.g. "texture.1001.png"
+
+    Returns:
+        tuple: Two elements (udim_key, sequence_key). Elements are None when the file name can't be grouped.
+               UDIM keys are only returned for four digits tiles, such as "1001".
+    """
+    stem, extension = os.path.splitext(file_name)
+    match = NUMBERED_STEM_PATTERN.match(stem)
+    if not match:
+        return None, None
+    prefix, digits = match.groups()
+    udim_key = None
+    if len(digits) == 4:
+        udim_key = prefix + UDIM_TOKEN + extension
+    sequence_key = prefix + FRAME_TOKEN + extension
+    return udim_key, sequence_key
+
+
+class FileNameIndex:
+    """
+    Index of all files and folders found in a directory tree. Built by scanning the tree only once.
+    Used to resolve many missing paths through lookups (instead of walking the directory for every path)
+    Files are stored by name and also grouped by UDIM tiles and image sequences.
+    """
+
+    def __init__(self, root_dir):
+        """
+        Initializes an empty index. (Use "build" to scan the directory)
+
+        Args:
+            root_dir (str): Path to the directory to be indexed.
+        """
+        self.root_dir = os.path.normpath(root_dir)
+        self.files = {}  # File name as key, list of directories as value
+        self.dirs = {}  # Folder name as key, list of parent directories as value
+        self.udim_groups = {}  # e.g. "texture.<UDIM>.png" as key, list of file paths as value
+        self.sequence_groups = {}  # e.g. "render.<f>.exr" as key, list of file paths as value
+        self.dir_mtimes = {}  # Scanned directories as key, modification time as value
+        self.scanned_dir_count = 0
+        self.is_built = False
+
+    def build(self):
+        """
+        Scans the directory tree (using "os.scandir") and populates the index.
+        It's safe to call it from a worker thread. It doesn't call any Maya commands.
+        """
+        files = {}
+        dirs = {}
+        udim_groups = {}
+        sequence_groups = {}
+        dir_mtimes = {}
+        self.scanned_dir_count = 0
+        dirs_to_scan = [self.root_dir]
+        while dirs_to_scan:
+            current_dir = dirs_to_scan.pop()
+            try:
+                dir_mtimes[current_dir] = os.stat(current_dir).st_mtime
+                entries = list(os.scandir(current_dir))
+            except OSError as e:
+                logger.debug(f'Unable to scan "{current_dir}". Issue: {str(e)}')
+                continue
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    dirs.setdefault(entry.name, []).append(current_dir)
+                    dirs_to_scan.append(entry.path)
+                    continue
+                files.setdefault(entry.name, []).append(current_dir)
+                udim_key, sequence_key = get_file_group_keys(entry.name)
+                if udim_key:
+                    udim_groups.setdefault(udim_key, []).append(entry.path)
+                if sequence_key:
+                    sequence_groups.setdefault(sequence_key, []).append(entry.path)
+            self.scanned_dir_count += 1
+
+        for group in list(udim_groups.values()) + list(sequence_groups.values()):
+            group.sort()
+        self.files = files
+        self.dirs = dirs
+        self.udim_groups = udim_groups
+        self.sequence_groups = sequence_groups
+        self.dir_mtimes = dir_mtimes
+        self.is_built = True
+
+    def build_in_thread(self, on_progress=None, poll_interval=0.05):
+        """
+        Builds the index in a worker thread while the calling thread waits for it to finish.
+
+        Args:
+            on_progress (callable, optional): Called on the calling thread while waiting (so it can update the UI).
+                                              Receives the number of scanned directories. e.g. on_progress(10)
+            poll_interval (float, optional): How long to wait for the worker thread between progress updates.
+        """
+        worker = threading.Thread(target=self.build, name="gt_path_manager_index")
+        worker.daemon = True
+        worker.start()
+        while worker.is_alive():
+            worker.join(poll_interval)
+            if on_progress:
+                on_progress(self.scanned_dir_count)
+
+    def is_stale(self):
+        """
+        Checks if the index is outdated by comparing the modification time of every scanned directory.
+        A directory modification time changes when files or folders are added, removed or renamed inside it.
+
+        Returns:
+            bool: True if the index was never built or if a directory changed since it was built, False otherwise.
+        """
+        if not self.is_built:
+            return True
+        for dir_path, mtime in self.dir_mtimes.items():
+            try:
+                if os.stat(dir_path).st_mtime != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def find_file(self, file_name, preferred_dirs=None):
+        """
+        Finds a file by its name.
+
+        Args:
+            file_name (str): File name to find. e.g. "texture.png"
+            preferred_dirs (list, optional): Directories to prefer when many files have the same name.
+
+        Returns:
+            str or None: Path to the file. None if not found.
+        """
+        return self._find_entry(self.files, file_name, preferred_dirs)
+
+    def find_dir(self, dir_name, preferred_dirs=None):
+        """
+        Finds a folder by its name.
+
+        Args:
+            dir_name (str): Folder name to find. e.g. "cache_folder"
+            preferred_dirs (list, optional): Directories to prefer when many folders have the same name.
+
+        Returns:
+            str or None: Path to the folder. None if not found.
+        """
+        return self._find_entry(self.dirs, dir_name, preferred_dirs)
+
+    @staticmethod
+    def _find_entry(entries, name, preferred_dirs=None):
+        """
+        Finds an entry (file or folder) by its name.
+
+        Args:
+            entries (dict): Name as key, list of parent directories as value.
+            name (str): Name to find.
+            preferred_dirs (list, optional): Directories to prefer when many entries have the same name.
+
+        Returns:
+            str or None: Path to the entry. None if not found.
+        """
+        parent_dirs = entries.get(name)
+        if not parent_dirs:
+            return None
+        for preferred_dir in preferred_dirs or []:
+            if preferred_dir in parent_dirs:
+                return os.path.join(preferred_dir, name)
+        return os.path.join(parent_dirs[0], name)
+
+    def find_udim_tile(self, file_name):
+        """
+        Finds the first tile of a UDIM file.
+
+        Args:
+            file_name (str): UDIM file name. e.g. "texture.<UDIM>.png" or "texture.1001.png"
+
+        Returns:
+            str or None: Path to the first tile found. None if not found.
+        """
+        if UDIM_TOKEN in file_name:
+            udim_key = file_name
+        else:
+            udim_key = get_file_group_keys(file_name)[0]
+        tiles = self.udim_groups.get(udim_key)
+        if tiles:
+            return tiles[0]
+
+    def find_sequence_frame(self, file_name):
+        """
+        Finds the first frame of an image sequence.
+
+        Args:
+            file_name (str): Image sequence file name. e.g. "render.<f>.exr", "render.<F>.exr" or "render.0001.exr"
+
+        Returns:
+            str or None: Path to the first frame found. None if not found.
+        """
+        if FRAME_TOKEN in file_name.replace("<F>", FRAME_TOKEN):
+            sequence_key = file_name.replace("<F>", FRAME_TOKEN)
+        else:
+            sequence_key = get_file_group_keys(file_name)[1]
+        frames = self.sequence_groups.get(sequence_key)
+        if frames:
+            return frames[0]
+
+
+def get_file_name_index(search_dir, on_progress=None):
+    """
+    Gets an index for the provided directory. The index is reused across repairs until a directory changes.
+
+    Args:
+        search_dir (str): Path to the search directory.
+        on_progress (callable, optional): Called while the index is being built. (See "FileNameIndex.build_in_thread")
+
+    Returns:
+        FileNameIndex: An up-to-date index for the search directory.
+    """
+    index_key = os.path.normcase(os.path.normpath(search_dir))
+    file_name_index = file_name_indexes.get(index_key)
+    if file_name_index is None or file_name_index.is_stale():
+        file_name_index = FileNameIndex(search_dir)
+        file_name_index.build_in_thread(on_progress=on_progress)
+        file_name_indexes[index_key] = file_name_index
+    return file_name_index
+
 
 def maya_main_window():
     """
@@ -398,6 +639,7 @@ class GTPathManagerDialog(ui_qt.QtWidgets.QDialog):
         """
         common_locations = []  # Locations where files were found
         is_search_dir_valid = False
+        file_name_index = None
         if is_repair_attempt:
             search_dir = self.filepath_le.text()
             if os.path.isdir(search_dir):
@@ -453,12 +695,28 @@ class GTPathManagerDialog(ui_qt.QtWidgets.QDialog):
         refs = cmds.ls(rf=True)
         path_nodes += refs
 
+        # Index Search Directory (Scanned once, reused while the directory doesn't change)
+        if is_repair_attempt and is_search_dir_valid:
+            index_progress_name = "Indexing"
+            self.make_progress_bar(index_progress_name, 100)
+
+            def update_index_progress(scanned_dir_count):  # Total is unknown while scanning, bar cycles instead
+                cmds.progressBar(index_progress_name + "_progress", edit=True, progress=scanned_dir_count % 100)
+                cmds.refresh()
+
+            try:
+                file_name_index = get_file_name_index(search_dir, on_progress=update_index_progress)
+            except Exception as e:
+                logger.warning(f"Unable to index search directory. Issue: {str(e)}")
+                is_search_dir_valid = False
+            finally:
+                self.kill_progress_window(index_progress_name)
+
         # Populate Table
         for i in range(len(path_nodes)):
 
             # ################ Start Directory Search ################ #
             if is_repair_attempt and is_search_dir_valid:
-                progress_bar_name = "Searching"
                 try:
                     # (path, is_path_valid, node_type_string, icon, node_attr)
                     file_items = self.get_path_items(path_nodes[i])
@@ -510,77 +768,33 @@ class GTPathManagerDialog(ui_qt.QtWidgets.QDialog):
                                 self.set_attr_enhanced(path_nodes[i], file_items[4], resolved_path)
                                 is_found = True
 
-                    # Full Search/Walk
+                    # Index Search (Lookup)
                     if initial_result is not True and is_found is False:
-                        search_count = 0  # How many folders to look into (walk) for the progress bar
-                        # Generates the file names in a directory tree by walking the tree either top-b or b-top
-                        for path in os.walk(search_dir):
-                            logger.debug(str(path))
-                            search_count += 1
                         resolved_path = query_path
-                        # make_progress_bar(name, maxVal) - Max value is the number of folders
-                        self.make_progress_bar(progress_bar_name, search_count)
-                        # root_dir_path, sub_dirs, files in os.walk(my_dir)
-                        for path, dirs, files in os.walk(search_dir):
-                            self.move_progress_bar(progress_bar_name, 1)
-                            path = path.replace("/", "\\")
-
-                            # Handle Files
-                            if desired_file in files:
-                                resolved_path = (path + "\\" + desired_file).replace("/", "\\")
-                                common_locations.append(resolved_path)
-                                is_found = True
-
-                            # Handle Folders (instead of files)
-                            if accept_dir and desired_file in dirs:
-                                resolved_path = (path + "\\" + desired_file).replace("/", "\\")
-                                common_locations.append(resolved_path)
-                                is_found = True
-
-                            # Handle UDIMs
-                            if is_udim_file and is_found is False:
-                                file_name = os.path.splitext(desired_file)[0].replace("<UDIM>", "")
-                                extension = os.path.splitext(desired_file)[1]
-
-                                pattern = re.compile(file_name + "\\d\\d\\d\\d" + extension)
-
-                                first_found_file = ""
-
-                                if any(pattern.match(line) for line in files):
-                                    lines_to_log = [line for line in files if pattern.match(line)]
-                                    first_found_file = lines_to_log[0]
-
-                                if first_found_file != "":
-                                    resolved_path = (path + "\\" + first_found_file).replace("/", "\\")
-                                    if os.path.exists(resolved_path):
-                                        common_locations.append(resolved_path)
-                                        is_found = True
-
-                            # Handle Image sequences
-                            if is_image_sequence and is_found is False:
-                                file_name = os.path.splitext(desired_file)[0].replace("<f>", "").replace("<F>", "")
-                                extension = os.path.splitext(desired_file)[1]
+                        preferred_dirs = [os.path.normpath(os.path.dirname(loc)) for loc in common_locations]
+                        found_path = file_name_index.find_file(desired_file, preferred_dirs=preferred_dirs)
 
-                                pattern = re.compile(file_name + "\\d+" + extension)
+                        # Handle Folders (instead of files)
+                        if accept_dir and not found_path:
+                            found_path = file_name_index.find_dir(desired_file, preferred_dirs=preferred_dirs)
 
-                                first_found_file = ""
+                        # Handle UDIMs
+                        if is_udim_file and not found_path:
+                            found_path = file_name_index.find_udim_tile(desired_file)
 
-                                if any(pattern.match(line) for line in files):
-                                    lines_to_log = [line for line in files if pattern.match(line)]
-                                    first_found_file = lines_to_log[0]
+                        # Handle Image sequences
+                        if is_image_sequence and not found_path:
+                            found_path = file_name_index.find_sequence_frame(desired_file)
 
-                                if first_found_file != "":
-                                    resolved_path = (path + "\\" + first_found_file).replace("/", "\\")
-                                    if os.path.exists(resolved_path):
-                                        common_locations.append(resolved_path)
-                                        is_found = True
+                        if found_path:
+                            resolved_path = found_path.replace("/", "\\")
+                            common_locations.append(resolved_path)
+                            is_found = True
                         if is_found:
                             # print(path_nodes[i] + ' has a valid path.') # Debugging
                             self.set_attr_enhanced(path_nodes[i], file_items[4], resolved_path)
-                    self.kill_progress_window(progress_bar_name)  # Kill progress bar
                 except Exception as e:
                     logger.debug(str(e))
-                    self.kill_progress_window(progress_bar_name)
                     # ################ End Directory Search ################ #
 
             # Search and Replace
@@ -34,12 +34,17 @@
     Fixed settings issue where the UI would get bigger
     Simplified some expressions
 
+ 1.5.0 - 2026-10-18
+    Scene data is now collected once in a single pass and shared by all checks (scene snapshot)
+    Ngons are detected through the mesh face vertex counts instead of "polyCleanupArgList"
+    Full report now includes a timing breakdown (time taken by each check)
+
  Todo:
     Add checks for xgen
     Create a better error handling option for the total texture count function
 """
 # Tool Version
-__version_tuple__ = (1, 4, 4)
+__version_tuple__ = (1, 5, 0)
 __version_suffix__ = ''
 __version__ = '.'.join(str(n) for n in __version_tuple__) + __version_suffix__
 
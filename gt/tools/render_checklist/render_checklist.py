@@ -12,10 +12,12 @@
 from maya import OpenMayaUI as OpenMayaUI
 import gt.ui.qt_import as ui_qt
 import gt.ui.resource_library as ui_res_lib
+import maya.api.OpenMaya as apiOpenMaya
 import maya.cmds as cmds
 import maya.mel as mel
 import logging
 import copy
+import time
 
 # Logging Setup
 logging.basicConfig()
@@ -76,6 +78,179 @@ checklist_settings = {
 CHECKLIST_MAIN_COLUMN_HEIGHT = 345
 CHECKLIST_BUTTONS_COLUMN_HEIGHT = 90
 
+# Scene Snapshot - Scene data shared by all checks while the checklist runs (see "run_checklist")
+active_scene_snapshot = None
+last_scene_snapshot = None
+# Timing Breakdown - Check function name as key, execution time in seconds as value (last run)
+checklist_timings = {}
+
+
+def collect_scene_snapshot():
+    """
+    Collects the scene data used by the checks in a single pass through the scene.
+    Nodes are listed once and classified by type, then meshes, file nodes, references and shading assignments
+    are read only once, so the checks don't need to query the scene again.
+
+    Returns:
+        dict: Scene snapshot with the following keys:
+            "node_types" (set): All node types available (loaded plugins included)
+            "nodes_by_type" (dict): Node type as key, list of nodes as value. e.g. {"file": ["file1"]}
+                                    Nodes are also listed under inherited types, same as "cmds.ls(type=...)".
+                                    e.g. A "bezierCurve" is listed under "bezierCurve" and "nurbsCurve"
+            "transforms" (list): All transforms (derived types included, e.g. joints)
+            "lights" (list): All light shapes
+            "geometry" (list): All geometry shapes
+            "named_objects" (list): Lights, leaf and geometry nodes. (Used to validate names)
+            "meshes" (dict): Mesh as key, dictionary with mesh data as value. Keys: "long_name", "triangles",
+                             "edges", "smooth_level", "display_smooth", "is_intermediate", "ngons", "uv_sets"
+            "file_nodes" (dict): File node as key, dictionary with "path", "uv_tiling_mode", "use_frame_extension"
+                                 and "color_space" as value.
+            "references" (list): List of tuples with the reference node and its file path (None if missing)
+            "lambert1_members" (list): Members of the "initialShadingGroup" (objects assigned to lambert1)
+    """
+    transform_types = set(cmds.nodeType("transform", derived=True, isTypeName=True) or [])
+    light_types = set(cmds.nodeType("light", derived=True, isTypeName=True) or [])
+    geometry_types = set(cmds.nodeType("geometryShape", derived=True, isTypeName=True) or [])
+
+    snapshot = {
+        "node_types": set(cmds.ls(nodeTypes=True) or []),
+        "nodes_by_type": {},
+        "transforms": [],
+        "lights": [],
+        "geometry": [],
+        "named_objects": cmds.ls(lt=True, lf=True, g=True) or [],
+        "meshes": {},
+        "file_nodes": {},
+        "references": [],
+        "lambert1_members": cmds.sets("initialShadingGroup", q=True) or [],
+    }
+
+    # Single pass through all nodes
+    all_nodes = cmds.ls(showType=True) or []
+    nodes_by_type = snapshot.get("nodes_by_type")
+    inherited_types = {}  # Queried once per node type
+    for node, node_type in zip(all_nodes[0::2], all_nodes[1::2]):
+        if node_type not in inherited_types:
+            inherited_types[node_type] = cmds.nodeType(node_type, inherited=True, isTypeName=True) or [node_type]
+        for inherited_type in inherited_types.get(node_type):
+            nodes_by_type.setdefault(inherited_type, []).append(node)
+        if node_type in transform_types:
+            snapshot["transforms"].append(node)
+        if node_type in light_types:
+            snapshot["lights"].append(node)
+        if node_type in geometry_types:
+            snapshot["geometry"].append(node)
+
+    # Meshes
+    for mesh in nodes_by_type.get("mesh", []):
+        try:
+            selection = apiOpenMaya.MSelectionList()
+            selection.add(mesh)
+            dag_path = selection.getDagPath(0)
+            mesh_fn = apiOpenMaya.MFnMesh(dag_path)
+            polygon_vertex_counts = mesh_fn.getVertices()[0]
+            transform_name = cmds.listRelatives(mesh, parent=True, fullPath=True) or [dag_path.fullPathName()]
+            snapshot["meshes"][mesh] = {
+                "long_name": dag_path.fullPathName(),
+                "triangles": cmds.polyEvaluate(mesh, t=True),
+                "edges": mesh_fn.numEdges,
+                "smooth_level": mesh_fn.findPlug("smoothLevel", False).asInt(),
+                "display_smooth": mesh_fn.findPlug("displaySmoothMesh", False).asInt(),
+                "is_intermediate": mesh_fn.isIntermediateObject,
+                "ngons": [
+                    f"{transform_name[0]}.f[{index}]"
+                    for index, vertex_count in enumerate(polygon_vertex_counts)
+                    if vertex_count > 4
+                ],
+                "uv_sets": {uv_set: mesh_fn.numUVs(uv_set) for uv_set in mesh_fn.getUVSetNames()},
+            }
+        except Exception as e:
+            logger.debug(f'Unable to collect mesh data from "{mesh}". Issue: {str(e)}')
+
+    # File Nodes
+    for file_node in nodes_by_type.get("file", []):
+        snapshot["file_nodes"][file_node] = {
+            "path": cmds.getAttr(file_node + ".fileTextureName") or "",
+            "uv_tiling_mode": cmds.getAttr(file_node + ".uvTilingMode"),
+            "use_frame_extension": cmds.getAttr(file_node + ".useFrameExtension"),
+            "color_space": cmds.getAttr(file_node + ".colorSpace") or "",
+        }
+
+    # References
+    for ref in cmds.ls(rf=True) or []:
+        try:
+            ref_path = cmds.referenceQuery(ref, filename=True)
+        except Exception as e:
+            logger.debug(str(e))
+            ref_path = None
+        snapshot["references"].append((ref, ref_path))
+
+    return snapshot
+
+
+def get_scene_snapshot():
+    """
+    Gets the scene snapshot shared by the checks.
+    If no checklist run is active (a check function was called directly), a new snapshot is collected.
+
+    Returns:
+        dict: Scene snapshot. (See "collect_scene_snapshot" for the available keys)
+    """
+    if active_scene_snapshot is not None:
+        return active_scene_snapshot
+    return collect_scene_snapshot()
+
+
+def run_checklist(snapshot=None):
+    """
+    Runs all checks using a single scene snapshot and records how long each check took. (See "checklist_timings")
+
+    Args:
+        snapshot (dict, optional): A snapshot collected by "collect_scene_snapshot". If not provided, a new one is
+                                   collected before running the checks.
+
+    Returns:
+        list: A list of report strings, one for each check.
+    """
+    global active_scene_snapshot
+    global last_scene_snapshot
+    checklist_timings.clear()
+    start_time = time.perf_counter()
+    if snapshot is None:
+        snapshot = collect_scene_snapshot()
+    checklist_timings["collect_scene_snapshot"] = time.perf_counter() - start_time
+
+    report_strings = []
+    active_scene_snapshot = snapshot
+    try:
+        for check_function in checklist_functions:
+            check_start_time = time.perf_counter()
+            report_strings.append(check_function())
+            checklist_timings[check_function.__name__] = time.perf_counter() - check_start_time
+    finally:
+        active_scene_snapshot = None
+        last_scene_snapshot = snapshot
+    checklist_timings["total"] = time.perf_counter() - start_time
+    logger.debug(get_timings_report())
+    return report_strings
+
+
+def get_timings_report():
+    """
+    Gets a report describing how long each check took during the last checklist run. (Slowest first)
+
+    Returns:
+        str: Timing breakdown report.
+    """
+    timings = dict(checklist_timings)
+    total_time = timings.pop("total", None)
+    string_status = ""
+    for function_name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        string_status += f"{seconds:.4f}s - {function_name}\n"
+    if total_time is not None:
+        string_status += f"{total_time:.4f}s - Total"
+    return "\n*** Timing Breakdown ***\n" + string_status.rstrip("\n")
+
 
 def get_persistent_settings_render_checklist():
     """
@@ -230,7 +405,7 @@ def build_gui_gt_render_checklist():
     # Checklist Buttons ==========================================================
     checklist_buttons = cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1, 10)], p=main_column)
     cmds.separator(h=10, style="none")
-    cmds.button(l="Generate Report", h=30, c=lambda args: checklist_generate_report())
+    cmds.button(l="Generate Report", h=30, c=lambda args: checklist_generate_report(snapshot=last_scene_snapshot))
     cmds.separator(h=10, style="none")
     cmds.button(l="Refresh", h=30, c=lambda args: checklist_refresh())
     cmds.separator(h=8, style="none")
@@ -304,28 +479,7 @@ def checklist_refresh():
     # Save Current Selection For Later
     current_selection = cmds.ls(selection=True)
 
-    check_frame_rate()
-    check_scene_units()
-    check_output_resolution()
-    check_total_texture_count()
-    check_network_file_paths()
-    check_network_reference_paths()
-    check_unparented_objects()
-    check_total_triangle_count()
-    check_total_poly_object_count()
-    check_shadow_casting_light_count()
-    check_rs_shadow_casting_light_count()
-    check_ai_shadow_casting_light_count()
-    check_default_object_names()
-    check_objects_assigned_to_lambert1()
-    check_ngons()
-    check_non_manifold_geometry()
-    check_empty_uv_sets()
-    check_frozen_transforms()
-    check_animated_visibility()
-    check_non_deformer_history()
-    check_textures_color_space()
-    check_other_network_paths()
+    run_checklist()
 
     # Clear Selection
     cmds.selectMode(object=True)
@@ -335,34 +489,19 @@ def checklist_refresh():
     cmds.select(current_selection)
 
 
-def checklist_generate_report():
+def checklist_generate_report(snapshot=None):
+    """
+    Runs all checks and shows a full report, including the timing breakdown.
+
+    Args:
+        snapshot (dict, optional): A snapshot collected by "collect_scene_snapshot". e.g. "last_scene_snapshot"
+                                   If not provided, a new one is collected.
+    """
     # Save Current Selection For Later
     current_selection = cmds.ls(selection=True)
 
-    report_strings = [
-        check_frame_rate(),
-        check_scene_units(),
-        check_output_resolution(),
-        check_total_texture_count(),
-        check_network_file_paths(),
-        check_network_reference_paths(),
-        check_unparented_objects(),
-        check_total_triangle_count(),
-        check_total_poly_object_count(),
-        check_shadow_casting_light_count(),
-        check_rs_shadow_casting_light_count(),
-        check_ai_shadow_casting_light_count(),
-        check_default_object_names(),
-        check_objects_assigned_to_lambert1(),
-        check_ngons(),
-        check_non_manifold_geometry(),
-        check_empty_uv_sets(),
-        check_frozen_transforms(),
-        check_animated_visibility(),
-        check_non_deformer_history(),
-        check_textures_color_space(),
-        check_other_network_paths(),
-    ]
+    report_strings = run_checklist(snapshot=snapshot)
+    report_strings.append(get_timings_report())
 
     # Clear Selection
     cmds.selectMode(object=True)
@@ -1038,12 +1177,12 @@ def check_total_texture_count():
         custom_settings_failed = True
 
     # Count Textures
-    all_file_nodes = cmds.ls(type="file")
-    for file in all_file_nodes:
-        uv_tiling_mode = cmds.getAttr(file + ".uvTilingMode")
+    all_file_nodes = get_scene_snapshot().get("file_nodes")
+    for file, file_data in all_file_nodes.items():
+        uv_tiling_mode = file_data.get("uv_tiling_mode")
         if uv_tiling_mode != 0:
-            use_frame_extension = cmds.getAttr(file + ".useFrameExtension")
-            file_path = cmds.getAttr(file + ".fileTextureName")
+            use_frame_extension = file_data.get("use_frame_extension")
+            file_path = file_data.get("path")
 
             try:
                 import maya.app.general.fileTexturePathResolver
@@ -1161,9 +1300,9 @@ def check_network_file_paths():
     incorrect_file_nodes = []
 
     # Count Incorrect File Nodes
-    all_file_nodes = cmds.ls(type="file")
-    for file in all_file_nodes:
-        file_path = cmds.getAttr(file + ".fileTextureName")
+    all_file_nodes = get_scene_snapshot().get("file_nodes")
+    for file, file_data in all_file_nodes.items():
+        file_path = file_data.get("path")
         if file_path != "":
             file_path_no_slashes = file_path.replace("/", "").replace("\\", "")
             for valid_path in expected_value:
@@ -1231,10 +1370,11 @@ def check_network_reference_paths():
     incorrect_reference_nodes = []
 
     # Count Incorrect Reference Nodes
-    reference_list = cmds.ls(rf=True)
+    reference_list = get_scene_snapshot().get("references")
     try:
-        for ref in reference_list:
-            ref_path = cmds.referenceQuery(ref, filename=True)
+        for ref, ref_path in reference_list:
+            if ref_path is None:
+                raise RuntimeError(f'Reference node "{ref}" is not associated with a reference file.')
             if ref_path != "":
                 ref_path_no_slashes = ref_path.replace("/", "").replace("\\", "")
                 for valid_path in expected_value:
@@ -1307,7 +1447,7 @@ def check_unparented_objects():
     unparented_objects = []
 
     # Count Unparented Objects
-    geo_dag_nodes = cmds.ls(geometry=True)
+    geo_dag_nodes = get_scene_snapshot().get("geometry")
     for obj in geo_dag_nodes:
         first_parent = cmds.listRelatives(obj, p=True, f=True)  # Check if it returned something?
         children_members = cmds.listRelatives(first_parent[0], c=True, type="transform") or []
@@ -1380,16 +1520,15 @@ def check_total_triangle_count():
     if isinstance(expected_value, int) is False or isinstance(inbetween_value, int) is False:
         custom_settings_failed = True
 
-    all_poly_count = cmds.ls(type="mesh", flatten=True)
+    all_poly_count = get_scene_snapshot().get("meshes")
     scene_tri_count = 0
     # smoothed_obj_count = 0
 
-    for obj in all_poly_count:
-        smooth_level = cmds.getAttr(obj + ".smoothLevel")
-        smooth_state = cmds.getAttr(obj + ".displaySmoothMesh")
-        total_tri_count = cmds.polyEvaluate(obj, t=True)
-        total_edge_count = cmds.polyEvaluate(obj, e=True)
-        # total_face_count = cmds.polyEvaluate(obj, f=True)
+    for obj, mesh_data in all_poly_count.items():
+        smooth_level = mesh_data.get("smooth_level")
+        smooth_state = mesh_data.get("display_smooth")
+        total_tri_count = mesh_data.get("triangles")
+        total_edge_count = mesh_data.get("edges")
 
         if smooth_state > 0 and smooth_level != 0:
             one_subdiv_tri_count = total_edge_count * 4
@@ -1518,7 +1657,7 @@ def check_total_poly_object_count():
     if isinstance(expected_value, int) is False or isinstance(inbetween_value, int) is False:
         custom_settings_failed = True
 
-    all_polymesh = cmds.ls(type="mesh")
+    all_polymesh = get_scene_snapshot().get("nodes_by_type").get("mesh", [])
 
     if expected_value > len(all_polymesh) > inbetween_value:
         cmds.button(
@@ -1631,7 +1770,7 @@ def check_shadow_casting_light_count():
     if isinstance(expected_value, int) is False or isinstance(inbetween_value, int) is False:
         custom_settings_failed = True
 
-    all_lights = cmds.ls(lights=True)
+    all_lights = get_scene_snapshot().get("lights")
     shadow_casting_lights = []
 
     for light in all_lights:
@@ -1760,14 +1899,16 @@ def check_rs_shadow_casting_light_count():
 
     rs_physical_type = "RedshiftPhysicalLight"  # Used to check if Redshift is loaded
 
-    node_types = cmds.ls(nodeTypes=True)
+    snapshot = get_scene_snapshot()
+    node_types = snapshot.get("node_types")
+    nodes_by_type = snapshot.get("nodes_by_type")
 
     if rs_physical_type in node_types:  # is RS loaded?
 
-        rs_physical = cmds.ls(type=rs_physical_type)
-        rs_photometric = cmds.ls(type="RedshiftIESLight")
-        rs_portal = cmds.ls(type="RedshiftPortalLight")
-        rs_dome = cmds.ls(type="RedshiftDomeLight")
+        rs_physical = nodes_by_type.get(rs_physical_type, [])
+        rs_photometric = nodes_by_type.get("RedshiftIESLight", [])
+        rs_portal = nodes_by_type.get("RedshiftPortalLight", [])
+        rs_dome = nodes_by_type.get("RedshiftDomeLight", [])
 
         all_rs_lights = []
         all_rs_lights.extend(rs_physical)
@@ -1936,14 +2077,16 @@ def check_ai_shadow_casting_light_count():
 
     ai_physical_type = "aiAreaLight"  # Used to check if Arnold is loaded
 
-    node_types = cmds.ls(nodeTypes=True)
+    snapshot = get_scene_snapshot()
+    node_types = snapshot.get("node_types")
+    nodes_by_type = snapshot.get("nodes_by_type")
 
     if ai_physical_type in node_types:  # is Arnold loaded?
 
-        ai_sky_dome = cmds.ls(type="aiSkyDomeLight")
-        ai_mesh = cmds.ls(type="aiMeshLight")
-        ai_photometric = cmds.ls(type="aiPhotometricLight")
-        ai_area = cmds.ls(type=ai_physical_type)
+        ai_sky_dome = nodes_by_type.get("aiSkyDomeLight", [])
+        ai_mesh = nodes_by_type.get("aiMeshLight", [])
+        ai_photometric = nodes_by_type.get("aiPhotometricLight", [])
+        ai_area = nodes_by_type.get(ai_physical_type, [])
         # ai_portal = cmds.ls(type="aiLightPortal")
 
         all_ai_lights = []
@@ -2138,7 +2281,7 @@ def check_default_object_names():
         "volumeLight",
     ]
 
-    all_objects = cmds.ls(lt=True, lf=True, g=True)
+    all_objects = get_scene_snapshot().get("named_objects")
 
     for obj in all_objects:
         for def_name in default_object_names:
@@ -2251,7 +2394,7 @@ def check_objects_assigned_to_lambert1():
     item_id = item_name.lower().replace(" ", "_").replace("-", "_")
     # expected_value = checklist_items.get(13)[1]
 
-    lambert1_objects = cmds.sets("initialShadingGroup", q=True) or []
+    lambert1_objects = get_scene_snapshot().get("lambert1_members")
 
     if len(lambert1_objects) == 0:
         cmds.button(
@@ -2322,14 +2465,10 @@ def check_ngons():
     item_id = item_name.lower().replace(" ", "_").replace("-", "_")
     # expected_value = checklist_items.get(14)[1]
 
-    ngon_mel_command = (
-        'string $ngons[] = `polyCleanupArgList 3 { "1","2","1","0","1","0","0","0","0",'
-        '"1e-005","0","1e-005","0","1e-005","0","-1","0" }`;'
-    )
-    ngons_list = mel.eval(ngon_mel_command)
-    cmds.select(clear=True)
-
-    print("")  # Clear Any Warnings
+    ngons_list = []
+    for mesh_data in get_scene_snapshot().get("meshes").values():
+        if not mesh_data.get("is_intermediate"):
+            ngons_list.extend(mesh_data.get("ngons"))
 
     if len(ngons_list) == 0:
         cmds.button(
@@ -2370,8 +2509,9 @@ def check_ngons():
         )
 
         if user_input == "Select Ngons":
-            out_ngons_list = mel.eval(ngon_mel_command)
-            logger.debug(str(out_ngons_list))
+            existing_ngons = [face for face in ngons_list if cmds.objExists(face)]
+            cmds.select(existing_ngons)
+            logger.debug(str(existing_ngons))
         else:
             cmds.button("status_" + item_id, e=True, l="")
 
@@ -2398,7 +2538,7 @@ def check_non_manifold_geometry():
     nonmanifold_geo = []
     nonmanifold_verts = []
 
-    all_geo = cmds.ls(type="mesh", long=True)
+    all_geo = [mesh_data.get("long_name") for mesh_data in get_scene_snapshot().get("meshes").values()]
 
     for geo in all_geo:
         obj_non_manifold_verts = cmds.polyInfo(geo, nmv=True) or []
@@ -2474,18 +2614,16 @@ def check_empty_uv_sets():
     objects_extra_empty_uv_sets = []
     objects_single_empty_uv_sets = []
 
-    all_geo = cmds.ls(type="mesh")
+    all_geo = get_scene_snapshot().get("meshes")
 
-    for obj in all_geo:
-        all_uv_sets = cmds.polyUVSet(obj, q=True, allUVSets=True) or []
+    for obj, mesh_data in all_geo.items():
+        all_uv_sets = mesh_data.get("uv_sets")
         if len(all_uv_sets) > 1:
-            for uv_set in all_uv_sets:
-                uv_count = cmds.polyEvaluate(obj, uv=True, uvs=uv_set)
+            for uv_count in all_uv_sets.values():
                 if uv_count == 0:
                     objects_extra_empty_uv_sets.append(obj)
         else:
-            for uv_set in all_uv_sets:
-                uv_count = cmds.polyEvaluate(obj, uv=True, uvs=uv_set)
+            for uv_count in all_uv_sets.values():
                 if uv_count == 0:
                     objects_single_empty_uv_sets.append(obj)
 
@@ -2556,7 +2694,7 @@ def check_frozen_transforms():
 
     objects_no_frozen_transforms = []
 
-    all_transforms = cmds.ls(type="transform")
+    all_transforms = get_scene_snapshot().get("transforms")
 
     for transform in all_transforms:
         children = cmds.listRelatives(transform, c=True, pa=True) or []
@@ -2640,7 +2778,7 @@ def check_animated_visibility():
     objects_animated_visibility = []
     objects_hidden = []
 
-    all_transforms = cmds.ls(type="transform")
+    all_transforms = get_scene_snapshot().get("transforms")
 
     for transform in all_transforms:
         attributes = cmds.listAttr(transform)
@@ -2763,11 +2901,12 @@ def check_non_deformer_history():
     objects_non_deformer_history = []
     possible_objects_non_deformer_history = []
 
+    nodes_by_type = get_scene_snapshot().get("nodes_by_type")
     objects_to_check = []
-    objects_to_check.extend(cmds.ls(typ="nurbsSurface") or [])
-    objects_to_check.extend(cmds.ls(typ="mesh") or [])
-    objects_to_check.extend(cmds.ls(typ="subdiv") or [])
-    objects_to_check.extend(cmds.ls(typ="nurbsCurve") or [])
+    objects_to_check.extend(nodes_by_type.get("nurbsSurface", []))
+    objects_to_check.extend(nodes_by_type.get("mesh", []))
+    objects_to_check.extend(nodes_by_type.get("subdiv", []))
+    objects_to_check.extend(nodes_by_type.get("nurbsCurve", []))
 
     not_history_nodes = [
         "tweak",
@@ -2966,9 +3105,9 @@ def check_textures_color_space():
     float3_to_float_exceptions = {"RedshiftBumpMap": "input", "RedshiftDisplacement": "texMap"}
 
     # Count Textures
-    all_file_nodes = cmds.ls(type="file")
-    for file in all_file_nodes:
-        color_space = cmds.getAttr(file + ".colorSpace")
+    all_file_nodes = get_scene_snapshot().get("file_nodes")
+    for file, file_data in all_file_nodes.items():
+        color_space = file_data.get("color_space")
 
         has_suspicious_connection = False
         has_error_node_type = False
@@ -3179,12 +3318,13 @@ def check_other_network_paths():
     item_id = item_name.lower().replace(" ", "_").replace("-", "_")
     expected_value = checklist_items.get(21)[1]
     incorrect_path_nodes = []
+    snapshot = get_scene_snapshot()
 
     def check_paths(
         node_type, path_attribute_name, accepts_empty=False, checks_multiple_paths=False, multiple_paths_spliter=";"
     ):
         try:
-            all_provided_type_nodes = cmds.ls(type=node_type) or []
+            all_provided_type_nodes = snapshot.get("nodes_by_type").get(node_type, [])
             for node in all_provided_type_nodes:
                 file_path = cmds.getAttr(node + "." + path_attribute_name) or ""
 
@@ -3218,7 +3358,7 @@ def check_other_network_paths():
                 + '".'
             )
 
-    node_types = cmds.ls(nodeTypes=True)
+    node_types = snapshot.get("node_types")
 
     # Count Nodes Incorrect  with Incorrect Paths
 
@@ -3338,6 +3478,33 @@ def check_other_network_paths():
 # Checklist Functions End Here ===================================================================
 
 
+# Checks in the order they are executed (Used by "run_checklist")
+checklist_functions = [
+    check_frame_rate,
+    check_scene_units,
+    check_output_resolution,
+    check_total_texture_count,
+    check_network_file_paths,
+    check_network_reference_paths,
+    check_unparented_objects,
+    check_total_triangle_count,
+    check_total_poly_object_count,
+    check_shadow_casting_light_count,
+    check_rs_shadow_casting_light_count,
+    check_ai_shadow_casting_light_count,
+    check_default_object_names,
+    check_objects_assigned_to_lambert1,
+    check_ngons,
+    check_non_manifold_geometry,
+    check_empty_uv_sets,
+    check_frozen_transforms,
+    check_animated_visibility,
+    check_non_deformer_history,
+    check_textures_color_space,
+    check_other_network_paths,
+]
+
+
 def print_message(message, as_warning=False, as_heads_up_message=False):
     if as_warning:
         cmds.warning(message)
@@ -60,7 +60,10 @@ class ResourceLibraryController:
         metadata_obj = self.get_selected_item_object()
 
         # Preview Image
-        new_preview_image = self.model.get_preview_image(item=metadata_obj)
+        if metadata and metadata.get("item_type") == self.TYPE_MAYA_ICON:
+            new_preview_image = self.model.get_maya_icon_preview(icon_key=item_name)
+        else:
+            new_preview_image = self.model.get_preview_image(item=metadata_obj)
         if new_preview_image:
             self.view.update_preview_image(new_image=new_preview_image)
 
@@ -101,15 +101,8 @@ class ResourceLibraryModel:
             icon_str (str): Maya resource string
         """
         self.maya_icons_raw[icon_key] = icon_str
-        icon = ui_qt.QtGui.QIcon(f":{icon_str}")
-        if icon_str.endswith(".png"):
-            try:
-                pixmap = icon.pixmap(icon.actualSize(icon.availableSizes()[0]))
-                scaled_pixmap = pixmap.scaled(pixmap.width() * 10, pixmap.height() * 10)
-                icon = ui_qt.QtGui.QIcon(scaled_pixmap)
-            except Exception as e:
-                logger.debug(f"Unable to re-scale Maya icon. Issue: {str(e)}")
-        self.maya_icons[icon_key] = icon
+        # QIcon only reads the resource when painted. Large previews come from "get_maya_icon_preview"
+        self.maya_icons[icon_key] = ui_qt.QtGui.QIcon(f":{icon_str}")
 
     def import_package_colors(self):
         """
@@ -175,6 +168,25 @@ class ResourceLibraryModel:
             return item.pixmap(512)
         return ui_res_lib.Icon.library_missing_file
 
+    def get_maya_icon_preview(self, icon_key):
+        """
+        Gets the preview image for a Maya icon.
+        PNG resources return their resource path (e.g. ":polyCube.png"), so they can be decoded and scaled by the
+        thumbnail cache outside the UI thread. Other formats (e.g. SVG) are rendered by their QIcon.
+
+        Args:
+            icon_key (str): Key of the Maya icon (same as used in "add_maya_icon")
+
+        Returns:
+            str or QPixmap: Resource path or pixmap used as preview. Missing file icon path if the key is unknown.
+        """
+        icon_str = self.maya_icons_raw.get(icon_key)
+        if not icon_str:
+            return ui_res_lib.Icon.library_missing_file
+        if icon_str.lower().endswith(".png"):
+            return f":{icon_str}"
+        return self.get_preview_image(self.maya_icons.get(icon_key))
+
     def export_resource(self, key, source=None):
         """
         Saves/Exports resource
@@ -5,6 +5,7 @@ Resource Library View
 from gt.ui.syntax_highlighter import PythonSyntaxHighlighter
 from gt.ui.squared_widget import SquaredWidget
 import gt.ui.resource_library as ui_res_lib
+import gt.ui.thumbnail_cache as ui_thumb_cache
 import gt.ui.qt_utils as ui_qt_utils
 import gt.ui.qt_import as ui_qt
 
@@ -29,6 +30,7 @@ class ResourceLibraryView(metaclass=ui_qt_utils.MayaWindowMeta):
         self.item_list = None
         self.save_btn = None
         self.preview_image = None
+        self.preview_image_path = None
         self.description = None
         self.resource_path = None
         self.source_combo_box = None
@@ -61,17 +63,36 @@ class ResourceLibraryView(metaclass=ui_qt_utils.MayaWindowMeta):
     def update_preview_image(self, new_image=None):
         """
         Update the preview image displayed in the window.
+        Image paths are loaded through the shared thumbnail cache, so decoding happens outside the UI thread.
 
         Args:
-            new_image (str, QPixmap, optional): The path to the new image file.
+            new_image (str, QPixmap, optional): The path to the new image file or a pixmap to display.
                                                      Defaults to None, which becomes "missing_preview_file"
         """
-        if new_image:
-            if isinstance(new_image, str):
-                new_image = ui_qt.QtGui.QPixmap(new_image)
-            self.preview_image.set_pixmap(new_image)
-        else:
-            self.preview_image.set_pixmap(ui_qt.QtGui.QPixmap(ui_res_lib.Icon.library_missing_file))
+        if not new_image:
+            new_image = ui_res_lib.Icon.library_missing_file
+        if isinstance(new_image, str):
+            self.preview_image_path = new_image
+            ui_thumb_cache.get_thumbnail_cache().request_thumbnail(new_image, self.on_preview_thumbnail_loaded)
+            return
+        self.preview_image_path = None
+        self.preview_image.set_pixmap(new_image)
+
+    def on_preview_thumbnail_loaded(self, source_path, pixmap):
+        """
+        Receives a loaded thumbnail and displays it, if it's still the requested preview image.
+
+        Args:
+            source_path (str): Path to the image that was loaded.
+            pixmap (QPixmap): Loaded thumbnail. Null if the image couldn't be loaded.
+        """
+        if source_path != self.preview_image_path:
+            return  # Outdated request (selection changed before the image was ready)
+        if pixmap.isNull():
+            if source_path != ui_res_lib.Icon.library_missing_file:
+                self.update_preview_image()
+            return
+        self.preview_image.set_pixmap(pixmap)
 
     def create_widgets(self):
         """Create the widgets for the window."""
@@ -18,11 +18,15 @@
  Minor PEP8 Cleanup
  Dropped Python 2 support (Only Python 3+ now)
 
+ 1.1.0 - 2026-10-18
+ World space data is sampled through DG context evaluation (no timeline scrubbing)
+ Keys are written in bulk, one set of commands per attribute instead of one per frame
+
  TODO:
     Add sparse key option
 """
 # Tool Version
-__version_tuple__ = (1, 0, 2)
+__version_tuple__ = (1, 1, 0)
 __version_suffix__ = ''
 __version__ = '.'.join(str(n) for n in __version_tuple__) + __version_suffix__
 
@@ -14,6 +14,10 @@
  Minor PEP8 Cleanup
  Dropped Python 2 support (Only Python 3+ now)
 
+ 1.1.0 - 2026-10-18
+ World space data is sampled through DG context evaluation (no timeline scrubbing)
+ Keys are written in bulk, one set of commands per attribute instead of one per frame
+
  TODO:
     Add sparse key option
 
@@ -21,6 +25,8 @@
 
 from maya import OpenMayaUI as OpenMayaUI
 import gt.ui.resource_library as ui_res_lib
+import gt.core.anim as core_anim
+import maya.api.OpenMaya as apiOpenMaya
 import gt.ui.qt_import as ui_qt
 import maya.cmds as cmds
 import logging
@@ -373,6 +379,74 @@ def select_existing_objects(stored_list):
         cmds.select(found_elements)
 
 
+def get_matrix_plug(obj, attr_name="worldMatrix"):
+    """
+    Gets the matrix plug (instance element) for the provided DAG object
+
+    Args:
+        obj (str): Name of the transform
+        attr_name (str): Matrix array attribute. e.g. "worldMatrix" or "parentInverseMatrix"
+
+    Returns:
+        OpenMaya.MPlug: The element plug for the object instance. e.g. "pCube1.worldMatrix[0]"
+    """
+    selection = apiOpenMaya.MSelectionList()
+    selection.add(obj)
+    dag_path = selection.getDagPath(0)
+    array_plug = apiOpenMaya.MFnDependencyNode(dag_path.node()).findPlug(attr_name, False)
+    return array_plug.elementByLogicalIndex(dag_path.instanceNumber())
+
+
+def get_world_matrices(obj_list, time_list):
+    """
+    Samples the world matrix of all provided objects at every provided time.
+    Each frame is evaluated once for all objects using a DG context, so the current time is never changed.
+
+    Args:
+        obj_list (list): List of transforms
+        time_list (list): List of frames (UI time unit)
+
+    Returns:
+        dict: Object name as key, list of matrices (OpenMaya.MMatrix) as value, one matrix per frame.
+    """
+    world_plugs = [get_matrix_plug(obj) for obj in obj_list]
+    return dict(zip(obj_list, core_anim.get_plug_matrices_at_times(world_plugs, time_list)))
+
+
+def set_keyframes_in_bulk(obj, attr_values, time_list):
+    """
+    Sets one key per frame for each attribute using the shared anim curve writer ("core_anim.set_anim_curves_data").
+    Existing keys in the range are replaced, keys outside the range are kept.
+
+    Args:
+        obj (str): Object receiving the keys
+        attr_values (dict): Attribute name as key, list of values (one per frame, UI units) as value.
+        time_list (list): List of frames (sorted, UI time unit)
+    """
+    in_tangent = (cmds.keyTangent(query=True, g=True, inTangentType=True) or ["auto"])[0]
+    out_tangent = (cmds.keyTangent(query=True, g=True, outTangentType=True) or ["auto"])[0]
+    curves_data = {}
+    for attr, values in attr_values.items():
+        attr_path = f"{obj}.{attr}"
+        existing_curve = core_anim.get_attr_anim_curve(attr_path)
+        if not existing_curve and cmds.listConnections(attr_path, source=True, destination=False):
+            # Not directly connected to a curve (e.g. animation layers) - Key one frame at a time
+            for time_value, value in zip(time_list, values):
+                cmds.setKeyframe(obj, attribute=attr, time=time_value, value=value)
+            continue
+        baked_data = core_anim.AnimCurveData(curve_type=core_anim.get_anim_curve_type_from_attr(attr_path))
+        for time_value, value in zip(time_list, values):
+            baked_data.add_key(time_value, value, in_tangent_type=in_tangent, out_tangent_type=out_tangent)
+        curve_data = core_anim.get_anim_curve_data(existing_curve) if existing_curve else None
+        if curve_data is None:
+            curves_data[attr_path] = baked_data
+            continue
+        curve_data.remove_keys(time_list[0], time_list[-1])
+        curve_data.merge(baked_data)
+        curves_data[attr_path] = curve_data
+    core_anim.set_anim_curves_data(curves_data, replace=True)
+
+
 def extract_world_space_data():
     """
     Extracts the world space data from the objects that were loaded into selections
@@ -383,12 +457,9 @@ def extract_world_space_data():
         if cmds.objExists(obj):
             available_ctrls.append(obj)
 
-    # Store Current Time
-    original_time = cmds.currentTime(q=True)
-
     # Last Validation
     is_valid = True
-    if available_ctrls == 0:
+    if not available_ctrls:
         is_valid = False
         cmds.warning("Loaded objects couldn't be found. Please review your settings and try again")
     elif gt_world_space_baker_settings.get("start_time_range") >= gt_world_space_baker_settings.get("end_time_range"):
@@ -399,61 +470,134 @@ def extract_world_space_data():
 
     # Extract Keyframes:
     if is_valid:
+        start_time = gt_world_space_baker_settings.get("start_time_range")
+        end_time = gt_world_space_baker_settings.get("end_time_range")
+        time_list = [float(time_value) for time_value in range(start_time, end_time + 1)]
+        channels = {}
+        for obj in available_ctrls:
+            attributes = cmds.listAnimatable(obj) or []
+            attr_names = [attr.split(".")[-1] for attr in attributes]
+            channels[obj] = (
+                any(attr.startswith("translate") for attr in attr_names),
+                any(attr.startswith("rotate") for attr in attr_names),
+            )
+        sampled_objects = [obj for obj in available_ctrls if any(channels.get(obj))]
         try:
-            cmds.refresh(suspend=True)
-            for obj in available_ctrls:
-                attributes = cmds.listAnimatable(obj)
-                needs_ws_transforms = True
-                frame_translate_values = []
-                frame_rotate_values = []
-                for attr in attributes:
-
-                    try:
-                        # WS Values # Translate and Rotate for the desired frame range
-                        if "translate" in attr or "rotate" in attr:
-                            if needs_ws_transforms:
-                                cmds.currentTime(gt_world_space_baker_settings.get("start_time_range"))
-
-                                for index in range(
-                                    gt_world_space_baker_settings.get("end_time_range")
-                                    - gt_world_space_baker_settings.get("start_time_range")
-                                    + 1
-                                ):
-                                    frame_translate_values.append(
-                                        [cmds.currentTime(q=True), cmds.xform(obj, ws=True, q=True, t=True)]
-                                    )
-                                    frame_rotate_values.append(
-                                        [cmds.currentTime(q=True), cmds.xform(obj, ws=True, q=True, ro=True)]
-                                    )
-                                    cmds.currentTime(cmds.currentTime(q=True) + 1)
-                                needs_ws_transforms = False
-
-                            if attr.split(".")[-1].startswith("translate"):
-                                gt_world_space_baker_anim_storage["{}.{}".format(obj, "translate")] = (
-                                    frame_translate_values
-                                )
-
-                            if attr.split(".")[-1].startswith("rotate"):
-                                gt_world_space_baker_anim_storage["{}.{}".format(obj, "rotate")] = frame_rotate_values
-                    except Exception as e:
-                        logger.debug(str(e))  # 0 keyframes
+            world_matrices = get_world_matrices(obj_list=sampled_objects, time_list=time_list)
         except Exception as e:
-            logger.debug(str(e))  # 0 keyframes
-        finally:
-            cmds.refresh(suspend=False)
+            logger.debug(str(e))
+            world_matrices = {}
+        for obj, matrices in world_matrices.items():
+            needs_translate, needs_rotate = channels.get(obj)
+            rotate_order = cmds.getAttr(f"{obj}.rotateOrder")
+            frame_translate_values = []
+            frame_rotate_values = []
+            for time_value, matrix in zip(time_list, matrices):
+                transform_matrix = apiOpenMaya.MTransformationMatrix(matrix)
+                translation = transform_matrix.translation(apiOpenMaya.MSpace.kWorld)
+                rotation = transform_matrix.rotation().reorder(rotate_order)
+                frame_translate_values.append(
+                    [time_value, [apiOpenMaya.MDistance.internalToUI(value) for value in translation]]
+                )
+                frame_rotate_values.append(
+                    [time_value, [apiOpenMaya.MAngle.internalToUI(value) for value in rotation]]
+                )
+            if needs_translate:
+                gt_world_space_baker_anim_storage["{}.{}".format(obj, "translate")] = frame_translate_values
+            if needs_rotate:
+                gt_world_space_baker_anim_storage["{}.{}".format(obj, "rotate")] = frame_rotate_values
 
-    cmds.currentTime(original_time)
     return True
 
 
-def bake_world_space_data():
+def bake_object_world_space_data(obj, translate_data=None, rotate_data=None):
     """
-    Bakes extracted data using stored world space dictionary (only translate and rotate)
+    Bakes world space translate and rotate data into the local channels of an object.
+    The parent matrix is evaluated for each frame using a DG context (no timeline scrubbing), so parents should be
+    baked before their children.
+
+    Args:
+        obj (str): Transform receiving the keys
+        translate_data (list, optional): List of [frame, [x, y, z]] with world space positions (UI units)
+        rotate_data (list, optional): List of [frame, [x, y, z]] with world space rotations (UI units)
+                                      Values follow the rotation order of the object.
     """
+    frame_data = translate_data or rotate_data
+    if not frame_data:
+        return
+    time_list = [key_data[0] for key_data in frame_data]
+    selection = apiOpenMaya.MSelectionList()
+    selection.add(obj)
+    dag_path = selection.getDagPath(0)
+    fn_transform = apiOpenMaya.MFnTransform(dag_path)
+    current_transform = fn_transform.transformation()
+    rotate_order = cmds.getAttr(f"{obj}.rotateOrder")
+    rotate_axis = current_transform.rotationOrientation()
+    joint_orient = apiOpenMaya.MQuaternion()
+    if cmds.objectType(obj) == "joint":
+        joint_orient_values = cmds.getAttr(f"{obj}.jointOrient")[0]
+        joint_orient = apiOpenMaya.MEulerRotation(
+            [apiOpenMaya.MAngle.uiToInternal(value) for value in joint_orient_values]
+        ).asQuaternion()
+    has_pivot_offsets = any(
+        vector.length() > 1e-9
+        for vector in [
+            apiOpenMaya.MVector(current_transform.rotatePivot(apiOpenMaya.MSpace.kTransform)),
+            current_transform.rotatePivotTranslation(apiOpenMaya.MSpace.kTransform),
+            apiOpenMaya.MVector(current_transform.scalePivot(apiOpenMaya.MSpace.kTransform)),
+            current_transform.scalePivotTranslation(apiOpenMaya.MSpace.kTransform),
+        ]
+    )
+    parent_inverse_plug = get_matrix_plug(obj, attr_name="parentInverseMatrix") if dag_path.length() > 1 else None
+
+    translate_values = [[], [], []]
+    rotate_values = [[], [], []]
+    previous_rotation = fn_transform.rotation(apiOpenMaya.MSpace.kTransform, asQuaternion=False)
+    for index, time_value in enumerate(time_list):
+        parent_inverse = apiOpenMaya.MMatrix()
+        if parent_inverse_plug:
+            parent_inverse_data = core_anim.evaluate_plug_at_time(parent_inverse_plug, time_value)
+            parent_inverse = apiOpenMaya.MFnMatrixData(parent_inverse_data).matrix()
+        # Rotation: world = rotate_axis * rotate * joint_orient * parent
+        rotation = previous_rotation
+        if rotate_data:
+            world_rotation = apiOpenMaya.MEulerRotation(
+                [apiOpenMaya.MAngle.uiToInternal(value) for value in rotate_data[index][1]], rotate_order
+            ).asQuaternion()
+            parent_rotation = apiOpenMaya.MTransformationMatrix(parent_inverse.inverse()).rotation(asQuaternion=True)
+            local_rotation = world_rotation * parent_rotation.conjugate()
+            rotation = (rotate_axis.conjugate() * local_rotation * joint_orient.conjugate()).asEulerRotation()
+            rotation = rotation.reorder(rotate_order).closestSolution(previous_rotation)
+            previous_rotation = rotation
+            for axis in range(3):
+                rotate_values[axis].append(apiOpenMaya.MAngle.internalToUI(rotation[axis]))
+        # Translation: Position in parent space, minus any offset caused by pivots
+        if translate_data:
+            world_position = apiOpenMaya.MPoint(
+                [apiOpenMaya.MDistance.uiToInternal(value) for value in translate_data[index][1]]
+            )
+            translation = apiOpenMaya.MVector(world_position * parent_inverse)
+            if has_pivot_offsets:
+                pivot_transform = apiOpenMaya.MTransformationMatrix(current_transform)
+                pivot_transform.setRotation(rotation)
+                pivot_transform.setTranslation(apiOpenMaya.MVector(), apiOpenMaya.MSpace.kTransform)
+                pivot_matrix = pivot_transform.asMatrix()
+                translation -= apiOpenMaya.MVector(pivot_matrix[12], pivot_matrix[13], pivot_matrix[14])
+            for axis in range(3):
+                translate_values[axis].append(apiOpenMaya.MDistance.internalToUI(translation[axis]))
+
+    attr_values = {}
+    if translate_data:
+        attr_values.update({"tx": translate_values[0], "ty": translate_values[1], "tz": translate_values[2]})
+    if rotate_data:
+        attr_values.update({"rx": rotate_values[0], "ry": rotate_values[1], "rz": rotate_values[2]})
+    set_keyframes_in_bulk(obj=obj, attr_values=attr_values, time_list=time_list)
 
-    # Store Current Time
-    original_time = cmds.currentTime(q=True)
 
+def bake_world_space_data():
+    """
+    Bakes extracted data using stored world space dictionary (only translate and rotate)
+    """
     # Last Validation
     is_valid = True
     if len(gt_world_space_baker_anim_storage) == 0:
@@ -462,37 +606,32 @@ def bake_world_space_data():
 
     # Bake Keyframes:
     if is_valid:
+        object_data = {}
+        for key, dict_value in gt_world_space_baker_anim_storage.items():
+            obj, attr = key.rsplit(".", 1)
+            if not cmds.objExists(obj):
+                continue
+            object_data.setdefault(obj, {})[attr] = dict_value
+        # Parents first, so children are baked against their new parent motion
+        sorted_objects = sorted(object_data.keys(), key=lambda _obj: cmds.ls(_obj, long=True)[0].count("|"))
         try:
             cmds.refresh(suspend=True)
             cmds.undoInfo(openChunk=True, chunkName="World Space Bake")
-            for key, dict_value in gt_world_space_baker_anim_storage.items():
-                for key_data in dict_value:
-                    try:
-                        obj, attr = key.split(".")
-                        time = key_data[0]
-                        value = key_data[1]
-                        cmds.currentTime(time)
-                        if attr == "translate":
-                            cmds.xform(obj, ws=True, t=value)
-                            cmds.setKeyframe(obj, time=time, attribute="tx")
-                            cmds.setKeyframe(obj, time=time, attribute="ty")
-                            cmds.setKeyframe(obj, time=time, attribute="tz")
-                        if attr == "rotate":
-                            cmds.xform(obj, ws=True, ro=value)
-                            cmds.setKeyframe(obj, time=time, attribute="rx")
-                            cmds.setKeyframe(obj, time=time, attribute="ry")
-                            cmds.setKeyframe(obj, time=time, attribute="rz")
-                    except Exception as e:
-                        logger.debug(str(e))
+            for obj in sorted_objects:
+                try:
+                    bake_object_world_space_data(
+                        obj=obj,
+                        translate_data=object_data.get(obj).get("translate"),
+                        rotate_data=object_data.get(obj).get("rotate"),
+                    )
+                except Exception as e:
+                    logger.debug(str(e))
         except Exception as e:
             logger.debug(str(e))
         finally:
             cmds.undoInfo(closeChunk=True, chunkName="GT World Space Bake")
             cmds.refresh(suspend=False)
 
-    # Reset to Original Time
-    cmds.currentTime(original_time)
-
 
 # Build UI
 if __name__ == "__main__":
@@ -2,7 +2,9 @@
 Maya Menu UI - Utilities for creating a maya menu
 """
 from collections import namedtuple
+from functools import partial
 import logging
+import time
 
 
 logging.basicConfig()
@@ -33,18 +35,23 @@ class MayaMenu:
         menu_items (list): A list of menu items to be used when building the menu
         sub_menus (list): A list of sub_menus added to the menu
         menu_parent (string): Parent of the menu (e.g. Maya or a window)
+        lazy (bool): If the menu and its sub-menus are only populated when opened for the first time
+        populate_timings (dict): Time (in seconds) it took to populate the root menu and each sub-menu (lazy only)
 
     Methods:
         create_menu(): Creates the menu and populates it with objects that were previously added to it (aka initialize)
         add_menu_item():
     """
-    def __init__(self, name, parent=""):
+    def __init__(self, name, parent="", lazy=False):
         """
         Initializes Maya Menu Object
         Args:
             name (str): Name of the menu. This also become its label.
             parent (str, optional): Menu parent. It could be a maya window for example.
                                     Optional: If not provided, Maya is used instead.
+            lazy (bool, optional): If active, the menu items are only created when the menu (or its sub-menus)
+                                   is opened for the first time. (Uses "postMenuCommand")
+                                   Labels and icons can also be callables, so they are only resolved when shown.
         """
         self.initialized = False
         self.menu_path = None
@@ -53,6 +60,10 @@ class MayaMenu:
         self.menu_items = []
         self.sub_menus = []
         self.menu_parent = parent
+        self.lazy = lazy
+        self.populate_timings = {}
+        self._root_items = []
+        self._sub_menu_items = {}
 
     def create_menu(self, *args):
         """
@@ -85,13 +96,89 @@ class MayaMenu:
         # Set Status
         if not self.initialized:
             self.initialized = True
+
+        # Populate Menu (Lazy) - Items are created when the menu is opened
+        if self.lazy:
+            self.populate_timings = {}
+            self._group_items_by_sub_menu()
+            cmds.menu(self.menu_path, e=True, postMenuCommand=self._populate_root, postMenuCommandOnce=True)
+            return self.menu_path
+
         # Populate Menu
         for item in self.menu_items:
             params = self.get_item_parameters(item)
             # Populate root values
             if params.get('parent') is not None and params.get('parent') == MENU_ROOT_PLACEHOLDER:
                 params['parent'] = self.menu_path
-            cmds.menuItem(item.label, **params)
+            cmds.menuItem(params.get("label"), **params)
+        return self.menu_path
+
+    def _group_items_by_sub_menu(self):
+        """
+        Groups the menu items into root items and sub-menu items. Used to populate a lazy menu.
+        Items without a parent belong to the last sub-menu added to the root, same as when populated directly.
+        """
+        self._root_items = []
+        self._sub_menu_items = {}
+        current_sub_menu = None
+        for item in self.menu_items:
+            if item.sub_menu and item.parent == MENU_ROOT_PLACEHOLDER:
+                self._root_items.append(item)
+                self._sub_menu_items[item.label] = []
+                current_sub_menu = item.label
+            elif item.parent == MENU_ROOT_PLACEHOLDER or current_sub_menu is None:
+                self._root_items.append(item)
+            elif item.parent in self._sub_menu_items:
+                self._sub_menu_items[item.parent].append(item)
+            else:
+                self._sub_menu_items[current_sub_menu].append(item)
+
+    def _populate_root(self, *args):
+        """
+        Populates the root of a lazy menu. Sub-menus are created empty and populated when opened.
+        Args:
+            *args: Variable number of arguments. (Received from the "postMenuCommand")
+        """
+        start_time = time.perf_counter()
+        self._populate_items(self._root_items, self.menu_path)
+        self.populate_timings[self.menu_name_raw] = time.perf_counter() - start_time
+
+    def _populate_sub_menu(self, sub_menu_label, sub_menu_path, *args):
+        """
+        Populates a sub-menu of a lazy menu.
+        Args:
+            sub_menu_label (str): Label of the sub-menu (as added using "add_sub_menu")
+            sub_menu_path (str): Path of the sub-menu in Maya.
+            *args: Variable number of arguments. (Received from the "postMenuCommand")
+        """
+        start_time = time.perf_counter()
+        self._populate_items(self._sub_menu_items.get(sub_menu_label, []), sub_menu_path)
+        self.populate_timings[sub_menu_label] = time.perf_counter() - start_time
+
+    def _populate_items(self, items, parent_path):
+        """
+        Creates the provided items under the provided parent.
+        Root sub-menus are created empty and populated only when opened. (postMenuCommand)
+        Args:
+            items (list): A list of MenuItem objects.
+            parent_path (str): Path of the menu or sub-menu that will receive the items.
+        """
+        current_parent = parent_path
+        for item in items:
+            params = self.get_item_parameters(item)
+            is_root_sub_menu = item.sub_menu and item.parent == MENU_ROOT_PLACEHOLDER
+            if item.parent == MENU_ROOT_PLACEHOLDER or item.parent is None or is_root_sub_menu:
+                params["parent"] = parent_path if is_root_sub_menu else current_parent
+            item_path = cmds.menuItem(params.get("label"), **params)
+            if is_root_sub_menu:
+                cmds.menuItem(
+                    item_path,
+                    e=True,
+                    postMenuCommand=partial(self._populate_sub_menu, item.label, item_path),
+                    postMenuCommandOnce=True,
+                )
+            elif item.sub_menu:  # Nested sub-menu, following items are created inside it
+                current_parent = item_path
 
     def delete_menu(self):
         """
@@ -192,20 +279,36 @@ class MayaMenu:
                              option_box=False, option_box_icon='')
         self.menu_items.append(menu_item)
 
+    @staticmethod
+    def resolve_value(value):
+        """
+        Resolves a value that can be provided as a callable. Used for labels and icons of lazy menus.
+        Args:
+            value (any): A value or a callable that returns the value. e.g. "icon.svg" or a function returning it.
+        Returns:
+            any: The resolved value.
+        """
+        if callable(value):
+            return value()
+        return value
+
     @staticmethod
     def get_item_parameters(item):
         """
         Retrieves the parameters of a menu item in a dictionary format.
+        Labels and icons provided as callables are resolved here (only when the item is created)
         Args:
            item: The menu item to retrieve the parameters from.
         Returns:
            dict: A dictionary containing the parameters of the menu item.
         """
+        label = MayaMenu.resolve_value(item.label)
+        icon = MayaMenu.resolve_value(item.icon)
         # Build default menu item param list
         param_dict = {
-            "label": item.label,
+            "label": label,
             "annotation": item.tooltip,
-            "image": item.icon,
+            "image": icon,
             "enable": item.enable,
             "divider": item.divider,
             "dividerLabel": item.divider_label,
@@ -216,8 +319,8 @@ class MayaMenu:
         # In case it's a sub-menu, replace with simplified version
         if item.sub_menu:
             param_dict = {
-                "label": item.label,
-                "image": item.icon,
+                "label": label,
+                "image": icon,
                 "enable": item.enable,
                 "subMenu": item.sub_menu,
                 "tearOff": item.tear_off,
@@ -175,6 +175,30 @@ class ProgressBarWindow(ui_qt.QtWidgets.QMainWindow):
         # self.output_textbox.append(str(append_string))
         ui_qt.QtWidgets.QApplication.processEvents()  # Updates the GUI and keeps it responsive
 
+    def set_last_line_text(self, input_string, color=None):
+        """
+        Replaces the text of the last line of the output_textbox. The rest of the content is not changed.
+        Useful for progress lines (e.g. "Download progress: 50%") that are updated many times.
+        Args:
+           input_string (str): The text used to replace the last line.
+           color (QColor, str, optional): QColor or Hex color used to determine the color of the input text.
+                                          e.g. "#FF0000" or QColor("#FF0000")
+        """
+        text_format = ui_qt.QtGui.QTextCharFormat()
+        text_format.setFont(self.output_text_font)
+        text_format.setFontPointSize(self.output_text_size)
+        if color:
+            text_format.setForeground(ui_qt_utils.get_qt_color(color))
+
+        # Select the last line (block) and replace it
+        cursor = self.output_textbox.textCursor()
+        cursor.movePosition(ui_qt.QtLib.TextCursor.End)
+        cursor.movePosition(ui_qt.QtLib.TextCursor.StartOfBlock, ui_qt.QtLib.TextCursor.KeepAnchor)
+        cursor.insertText(str(input_string), text_format)
+
+        self.output_textbox.ensureCursorVisible()
+        ui_qt.QtWidgets.QApplication.processEvents()  # Updates the GUI and keeps it responsive
+
     def clear_output_box(self):
         """Clears the output_textbox"""
         self.output_textbox.clear()
@@ -251,10 +251,13 @@ class QtLib:
     # ------------------------------------------- TransformationMode ----------------------------------------
     class TransformationMode:
         SmoothTransformation = None
+        FastTransformation = None
         if IS_PYSIDE6:  # PySide6
             SmoothTransformation = QtCore.Qt.TransformationMode.SmoothTransformation
+            FastTransformation = QtCore.Qt.TransformationMode.FastTransformation
         else:  # PySide2
             SmoothTransformation = QtCore.Qt.SmoothTransformation
+            FastTransformation = QtCore.Qt.FastTransformation
 
     # ------------------------------------------- OpenModeFlag ----------------------------------------
     class OpenModeFlag:
@@ -299,6 +302,7 @@ class QtLib:
         StartOfLine = None
         EndOfLine = None
         NextBlock = None
+        StartOfBlock = None
         if IS_PYSIDE6:  # PySide6
             MoveAnchor = QtGui.QTextCursor.MoveMode.MoveAnchor
             KeepAnchor = QtGui.QTextCursor.MoveMode.KeepAnchor
@@ -308,6 +312,7 @@ class QtLib:
             StartOfLine = QtGui.QTextCursor.MoveOperation.StartOfLine
             EndOfLine = QtGui.QTextCursor.MoveOperation.EndOfLine
             NextBlock = QtGui.QTextCursor.MoveOperation.NextBlock
+            StartOfBlock = QtGui.QTextCursor.MoveOperation.StartOfBlock
         else:  # PySide2
             MoveAnchor = QtGui.QTextCursor.MoveAnchor
             KeepAnchor = QtGui.QTextCursor.KeepAnchor
@@ -317,6 +322,7 @@ class QtLib:
             StartOfLine = QtGui.QTextCursor.StartOfLine
             EndOfLine = QtGui.QTextCursor.EndOfLine
             NextBlock = QtGui.QTextCursor.NextBlock
+            StartOfBlock = QtGui.QTextCursor.StartOfBlock
 
     # ------------------------------------------- TextDocument ----------------------------------------
     class TextDocument:
@@ -15,6 +15,81 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Caches - Directory scans, raw stylesheet files and compiled stylesheet variable patterns
+_resource_dir_indexes = {}
+_stylesheet_file_cache = {}
+_stylesheet_pattern_cache = {}
+
+
+class LazyResource:
+    """
+    Class attribute resolved only when accessed for the first time. The resolved value then replaces the
+    LazyResource in the owner class (memoized), so the following accesses are regular attribute lookups.
+    e.g. "root_general = LazyResource(get_icon_path, "root_general.svg")" only gets the path when first used.
+    """
+
+    def __init__(self, function, *args, **kwargs):
+        """
+        Initializes a LazyResource object.
+        Args:
+            function (callable): Function used to get the resource. e.g. "get_icon_path"
+            *args: Arguments passed to the function when resolving the resource.
+            **kwargs: Keyword arguments passed to the function when resolving the resource.
+        """
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = self.resolve()
+        if self.name:
+            setattr(owner, self.name, value)  # Memoize
+        return value
+
+    def resolve(self):
+        """
+        Resolves the resource by calling its function. (Not memoized)
+        Returns:
+            any: The resolved resource. e.g. a path or the content of a stylesheet.
+        """
+        return self.function(*self.args, **self.kwargs)
+
+
+def get_resource_dir_index(resource_folder):
+    """
+    Gets a set with the paths of all files found inside a resource folder (including sub-folders).
+    The folder is scanned only once, the following calls return the cached index.
+    Args:
+        resource_folder (str): Path to the resource folder. e.g. "ResourceDirConstants.DIR_ICONS"
+    Returns:
+        frozenset: Normalized paths of all files found in the resource folder.
+    """
+    index = _resource_dir_indexes.get(resource_folder)
+    if index is None:
+        file_paths = set()
+        for root, dirs, files in os.walk(resource_folder):
+            for file_name in files:
+                file_paths.add(os.path.normcase(os.path.normpath(os.path.join(root, file_name))))
+        index = frozenset(file_paths)
+        _resource_dir_indexes[resource_folder] = index
+    return index
+
+
+def is_resource_available(resource_path, resource_folder):
+    """
+    Checks if a resource file exists using the cached index of its resource folder. (See "get_resource_dir_index")
+    Args:
+        resource_path (str): Path to the resource file.
+        resource_folder (str): Path to the resource folder the file should be in.
+    Returns:
+        bool: True if the resource file was found in the folder index, False otherwise.
+    """
+    return os.path.normcase(os.path.normpath(resource_path)) in get_resource_dir_index(resource_folder)
+
 
 def get_resource_path(resource_name, resource_folder, sub_folder=None):
     """
@@ -47,7 +122,7 @@ def get_icon_path(icon_name, sub_folder=None):
         str: Path to the icon.
     """
     icon_path = get_resource_path(icon_name, resource_folder=ResourceDirConstants.DIR_ICONS, sub_folder=sub_folder)
-    if not os.path.exists(icon_path) or icon_name == "":
+    if icon_name == "" or not is_resource_available(icon_path, resource_folder=ResourceDirConstants.DIR_ICONS):
         logger.info(f'Could not find icon: "{icon_path}"')
     return icon_path
 
@@ -64,14 +139,14 @@ def get_font_path(font_name, sub_folder=None):
         str: QT Formatted Path to the font. @@@ (Double slashes "//" are replaced with single slashes "/")
     """
     font_path = get_resource_path(font_name, resource_folder=ResourceDirConstants.DIR_FONTS, sub_folder=sub_folder)
-    if not os.path.exists(font_path) or font_name == "":
+    if font_name == "" or not is_resource_available(font_path, resource_folder=ResourceDirConstants.DIR_FONTS):
         logger.info(f'Could not find font: "{font_path}"')
     return font_path
 
 
 def process_stylesheet_variables(stylesheet_content, stylesheet_variables=None):
     """
-    Replaces any instances of the given stylesheet variables in the given stylesheet
+    Replaces any instances of the given stylesheet variables in the given stylesheet (single regex pass)
     If not stylesheet is provided, this function acts as passthrough (no changes to the content)
     If stylesheet variables are of an incorrect type, the raw content will be returned.
     Adds a ";" at the end of the variable automatically
@@ -90,9 +165,29 @@ def process_stylesheet_variables(stylesheet_content, stylesheet_variables=None):
             f'Must be a dictionary, but received a: "{str(type(stylesheet_variables))}".'
         )
         return stylesheet_content
-    for key, value in stylesheet_variables.items():
-        stylesheet_content = stylesheet_content.replace(key, f"{value};")
-    return stylesheet_content
+    if not stylesheet_variables:
+        return stylesheet_content
+    pattern = get_stylesheet_variables_pattern(stylesheet_variables.keys())
+    return pattern.sub(lambda match: f"{stylesheet_variables[match.group(0)]};", stylesheet_content)
+
+
+def get_stylesheet_variables_pattern(variable_keys):
+    """
+    Gets a compiled pattern matching any of the provided stylesheet variable keys.
+    Longer keys come first, so a key is never shadowed by a shorter key it starts with.
+    Patterns are cached, since many stylesheets share the same keys.
+    Args:
+        variable_keys (iterable): Stylesheet variable keys. e.g. ["@maya_button;", "@maya_selection;"]
+    Returns:
+        re.Pattern: Compiled pattern matching any of the keys.
+    """
+    cache_key = frozenset(variable_keys)
+    pattern = _stylesheet_pattern_cache.get(cache_key)
+    if pattern is None:
+        sorted_keys = sorted(cache_key, key=len, reverse=True)
+        pattern = re.compile("|".join(re.escape(key) for key in sorted_keys))
+        _stylesheet_pattern_cache[cache_key] = pattern
+    return pattern
 
 
 def get_stylesheet_content(stylesheet_name, sub_folder=None, file_extension="qss", stylesheet_variables=None):
@@ -114,16 +209,18 @@ def get_stylesheet_content(stylesheet_name, sub_folder=None, file_extension="qss
         resource_folder=ResourceDirConstants.DIR_STYLESHEETS,
         sub_folder=sub_folder,
     )
-    if not os.path.exists(stylesheet_path) or stylesheet_name == "":
-        logger.info(f'Could not find stylesheet: "{stylesheet_path}"')
-        return ""
-    else:
+    stylesheet_data = _stylesheet_file_cache.get(stylesheet_path)
+    if stylesheet_data is None:
+        if not os.path.exists(stylesheet_path) or stylesheet_name == "":
+            logger.info(f'Could not find stylesheet: "{stylesheet_path}"')
+            return ""
         with open(stylesheet_path, "r") as data_file:
             stylesheet_data = data_file.read()
-            stylesheet_content = process_stylesheet_variables(
-                stylesheet_content=stylesheet_data, stylesheet_variables=stylesheet_variables
-            )
-        return stylesheet_content
+        _stylesheet_file_cache[stylesheet_path] = stylesheet_data
+    stylesheet_content = process_stylesheet_variables(
+        stylesheet_content=stylesheet_data, stylesheet_variables=stylesheet_variables
+    )
+    return stylesheet_content
 
 
 def rgba_to_hex(r, g, b, a=255, include_alpha=False):
@@ -243,193 +340,193 @@ class Icon:
         """
 
     # Root Menu
-    root_general = get_icon_path(r"root_general.svg")
-    root_curves = get_icon_path(r"root_curves.svg")
-    root_modeling = get_icon_path(r"root_modeling.svg")
-    root_animation = get_icon_path(r"root_animation.svg")
-    root_rigging = get_icon_path(r"root_rigging.svg")
-    root_utilities = get_icon_path(r"root_utilities.svg")
-    root_miscellaneous = get_icon_path(r"root_miscellaneous.svg")
-    root_help = get_icon_path(r"root_help.svg")
-    root_dev = get_icon_path(r"root_dev.svg")
+    root_general = LazyResource(get_icon_path, r"root_general.svg")
+    root_curves = LazyResource(get_icon_path, r"root_curves.svg")
+    root_modeling = LazyResource(get_icon_path, r"root_modeling.svg")
+    root_animation = LazyResource(get_icon_path, r"root_animation.svg")
+    root_rigging = LazyResource(get_icon_path, r"root_rigging.svg")
+    root_utilities = LazyResource(get_icon_path, r"root_utilities.svg")
+    root_miscellaneous = LazyResource(get_icon_path, r"root_miscellaneous.svg")
+    root_help = LazyResource(get_icon_path, r"root_help.svg")
+    root_dev = LazyResource(get_icon_path, r"root_dev.svg")
     # General
-    tool_renamer = get_icon_path(r"tool_renamer.svg")
-    tool_outliner_sorter = get_icon_path(r"tool_outliner_sorter.svg")
-    tool_selection_manager = get_icon_path(r"tool_selection_manager.svg")
-    tool_path_manager = get_icon_path(r"tool_path_manager.svg")
-    tool_color_manager = get_icon_path(r"tool_color_manager.svg")
-    tool_color_manager_roller = get_icon_path(r"tool_color_manager_roller.svg")
-    tool_transfer_transforms = get_icon_path(r"tool_transfer_transforms.svg")
-    tool_world_space_baker = get_icon_path(r"tool_world_space_baker.svg")
-    tool_attributes_to_python = get_icon_path(r"tool_attributes_to_python.svg")
-    tool_render_checklist = get_icon_path(r"tool_render_checklist.svg")
+    tool_renamer = LazyResource(get_icon_path, r"tool_renamer.svg")
+    tool_outliner_sorter = LazyResource(get_icon_path, r"tool_outliner_sorter.svg")
+    tool_selection_manager = LazyResource(get_icon_path, r"tool_selection_manager.svg")
+    tool_path_manager = LazyResource(get_icon_path, r"tool_path_manager.svg")
+    tool_color_manager = LazyResource(get_icon_path, r"tool_color_manager.svg")
+    tool_color_manager_roller = LazyResource(get_icon_path, r"tool_color_manager_roller.svg")
+    tool_transfer_transforms = LazyResource(get_icon_path, r"tool_transfer_transforms.svg")
+    tool_world_space_baker = LazyResource(get_icon_path, r"tool_world_space_baker.svg")
+    tool_attributes_to_python = LazyResource(get_icon_path, r"tool_attributes_to_python.svg")
+    tool_render_checklist = LazyResource(get_icon_path, r"tool_render_checklist.svg")
     # Curves
-    tool_crv_library = get_icon_path(r"tool_crv_library.svg")
-    tool_crv_python = get_icon_path(r"tool_crv_python.svg")
-    tool_crv_text = get_icon_path(r"tool_crv_text.svg")
-    tool_crv_extract_state = get_icon_path(r"tool_crv_extract_state.svg")
-    util_crv_combine = get_icon_path(r"util_crv_combine.svg")
-    util_crv_separate = get_icon_path(r"util_crv_separate.svg")
+    tool_crv_library = LazyResource(get_icon_path, r"tool_crv_library.svg")
+    tool_crv_python = LazyResource(get_icon_path, r"tool_crv_python.svg")
+    tool_crv_text = LazyResource(get_icon_path, r"tool_crv_text.svg")
+    tool_crv_extract_state = LazyResource(get_icon_path, r"tool_crv_extract_state.svg")
+    util_crv_combine = LazyResource(get_icon_path, r"util_crv_combine.svg")
+    util_crv_separate = LazyResource(get_icon_path, r"util_crv_separate.svg")
     # Modeling
-    tool_transfer_uvs = get_icon_path(r"tool_transfer_uvs.svg")
-    tool_mesh_library = get_icon_path(r"tool_sphere_types.svg")
-    util_mod_load_udims = get_icon_path(r"util_mod_load_udims.svg")
-    util_mod_bif_to_mesh = get_icon_path(r"util_mod_bif_to_mesh.svg")
-    util_mod_copy_material = get_icon_path(r"util_mod_copy_material.svg")
-    util_mod_paste_material = get_icon_path(r"util_mod_paste_material.svg")
+    tool_transfer_uvs = LazyResource(get_icon_path, r"tool_transfer_uvs.svg")
+    tool_mesh_library = LazyResource(get_icon_path, r"tool_sphere_types.svg")
+    util_mod_load_udims = LazyResource(get_icon_path, r"util_mod_load_udims.svg")
+    util_mod_bif_to_mesh = LazyResource(get_icon_path, r"util_mod_bif_to_mesh.svg")
+    util_mod_copy_material = LazyResource(get_icon_path, r"util_mod_copy_material.svg")
+    util_mod_paste_material = LazyResource(get_icon_path, r"util_mod_paste_material.svg")
     # Rigging
-    tool_auto_rigger_legacy = get_icon_path(r"tool_auto_rigger_legacy.svg")
-    tool_auto_rigger = get_icon_path(r"tool_auto_rigger.svg")
-    tool_rig_interface = get_icon_path(r"tool_rig_interface.svg")
-    tool_retarget_assistant = get_icon_path(r"tool_retarget_assistant.svg")
-    tool_game_fbx_exporter = get_icon_path(r"tool_game_fbx_exporter.svg")
-    tool_influence_joints = get_icon_path(r"tool_influence_joints.svg")
-    tool_add_inbetween = get_icon_path(r"tool_add_inbetween.svg")
-    tool_sine_attributes = get_icon_path(r"tool_sine_attributes.svg")
-    tool_connect_attributes = get_icon_path(r"tool_connect_attributes.svg")
-    tool_create_fk = get_icon_path(r"tool_create_fk.svg")
-    tool_testing_keys = get_icon_path(r"tool_testing_keys.svg")
-    tool_make_ik_stretchy = get_icon_path(r"tool_make_ik_stretchy.svg")
-    tool_mirror_cluster = get_icon_path(r"tool_mirror_cluster.svg")
-    tool_morphing_attributes = get_icon_path(r"tool_morphing_attributes.svg")
-    tool_morphing_utils = get_icon_path(r"tool_morphing_utils.svg")
-    tool_orient_joints = get_icon_path(r"tool_orient_joints.svg")
-    tool_ribbon = get_icon_path(r"tool_ribbon.svg")
+    tool_auto_rigger_legacy = LazyResource(get_icon_path, r"tool_auto_rigger_legacy.svg")
+    tool_auto_rigger = LazyResource(get_icon_path, r"tool_auto_rigger.svg")
+    tool_rig_interface = LazyResource(get_icon_path, r"tool_rig_interface.svg")
+    tool_retarget_assistant = LazyResource(get_icon_path, r"tool_retarget_assistant.svg")
+    tool_game_fbx_exporter = LazyResource(get_icon_path, r"tool_game_fbx_exporter.svg")
+    tool_influence_joints = LazyResource(get_icon_path, r"tool_influence_joints.svg")
+    tool_add_inbetween = LazyResource(get_icon_path, r"tool_add_inbetween.svg")
+    tool_sine_attributes = LazyResource(get_icon_path, r"tool_sine_attributes.svg")
+    tool_connect_attributes = LazyResource(get_icon_path, r"tool_connect_attributes.svg")
+    tool_create_fk = LazyResource(get_icon_path, r"tool_create_fk.svg")
+    tool_testing_keys = LazyResource(get_icon_path, r"tool_testing_keys.svg")
+    tool_make_ik_stretchy = LazyResource(get_icon_path, r"tool_make_ik_stretchy.svg")
+    tool_mirror_cluster = LazyResource(get_icon_path, r"tool_mirror_cluster.svg")
+    tool_morphing_attributes = LazyResource(get_icon_path, r"tool_morphing_attributes.svg")
+    tool_morphing_utils = LazyResource(get_icon_path, r"tool_morphing_utils.svg")
+    tool_orient_joints = LazyResource(get_icon_path, r"tool_orient_joints.svg")
+    tool_ribbon = LazyResource(get_icon_path, r"tool_ribbon.svg")
     # Utils
-    util_reload_file = get_icon_path(r"util_reload_file.svg")
-    util_open_dir = get_icon_path(r"util_open_dir.svg")
-    util_hud_toggle = get_icon_path(r"util_hud_toggle.svg")
-    util_sel_non_unique = get_icon_path(r"util_sel_non_unique.svg")
-    util_joint_to_label = get_icon_path(r"util_joint_to_label.svg")
-    util_lra_toggle = get_icon_path(r"util_lra_toggle.svg")
-    util_joint_label_toggle = get_icon_path(r"util_joint_label_toggle.svg")
-    util_unhide_trs = get_icon_path(r"util_unhide_trs.svg")
-    util_unlock_trs = get_icon_path(r"util_unlock_trs.svg")
-    util_convert_joint_mesh = get_icon_path(r"util_convert_joint_mesh.svg")
-    util_convert_loc = get_icon_path(r"util_convert_loc.svg")
-    util_ref_import = get_icon_path(r"util_ref_import.svg")
-    util_ref_remove = get_icon_path(r"util_ref_remove.svg")
-    util_pivot_top = get_icon_path(r"util_pivot_top.svg")
-    util_pivot_bottom = get_icon_path(r"util_pivot_bottom.svg")
-    util_move_origin = get_icon_path(r"util_move_origin.svg")
-    util_reset_transforms = get_icon_path(r"util_reset_transforms.svg")
-    util_reset_jnt_display = get_icon_path(r"util_reset_jnt_display.svg")
-    util_reset_persp = get_icon_path(r"util_reset_persp.svg")
-    util_delete_custom_attr = get_icon_path(r"util_delete_custom_attr.svg")
-    util_delete_ns = get_icon_path(r"util_delete_ns.svg")
-    util_delete_display_layers = get_icon_path(r"util_delete_display_layers.svg")
-    util_delete_unused_nodes = get_icon_path(r"util_delete_unused_nodes.svg")
-    util_delete_nucleus_nodes = get_icon_path(r"util_delete_nucleus_nodes.svg")
-    util_delete_keyframes = get_icon_path(r"util_delete_keyframes.svg")
-    util_rivet = get_icon_path(r"util_rivet.svg")
+    util_reload_file = LazyResource(get_icon_path, r"util_reload_file.svg")
+    util_open_dir = LazyResource(get_icon_path, r"util_open_dir.svg")
+    util_hud_toggle = LazyResource(get_icon_path, r"util_hud_toggle.svg")
+    util_sel_non_unique = LazyResource(get_icon_path, r"util_sel_non_unique.svg")
+    util_joint_to_label = LazyResource(get_icon_path, r"util_joint_to_label.svg")
+    util_lra_toggle = LazyResource(get_icon_path, r"util_lra_toggle.svg")
+    util_joint_label_toggle = LazyResource(get_icon_path, r"util_joint_label_toggle.svg")
+    util_unhide_trs = LazyResource(get_icon_path, r"util_unhide_trs.svg")
+    util_unlock_trs = LazyResource(get_icon_path, r"util_unlock_trs.svg")
+    util_convert_joint_mesh = LazyResource(get_icon_path, r"util_convert_joint_mesh.svg")
+    util_convert_loc = LazyResource(get_icon_path, r"util_convert_loc.svg")
+    util_ref_import = LazyResource(get_icon_path, r"util_ref_import.svg")
+    util_ref_remove = LazyResource(get_icon_path, r"util_ref_remove.svg")
+    util_pivot_top = LazyResource(get_icon_path, r"util_pivot_top.svg")
+    util_pivot_bottom = LazyResource(get_icon_path, r"util_pivot_bottom.svg")
+    util_move_origin = LazyResource(get_icon_path, r"util_move_origin.svg")
+    util_reset_transforms = LazyResource(get_icon_path, r"util_reset_transforms.svg")
+    util_reset_jnt_display = LazyResource(get_icon_path, r"util_reset_jnt_display.svg")
+    util_reset_persp = LazyResource(get_icon_path, r"util_reset_persp.svg")
+    util_delete_custom_attr = LazyResource(get_icon_path, r"util_delete_custom_attr.svg")
+    util_delete_ns = LazyResource(get_icon_path, r"util_delete_ns.svg")
+    util_delete_display_layers = LazyResource(get_icon_path, r"util_delete_display_layers.svg")
+    util_delete_unused_nodes = LazyResource(get_icon_path, r"util_delete_unused_nodes.svg")
+    util_delete_nucleus_nodes = LazyResource(get_icon_path, r"util_delete_nucleus_nodes.svg")
+    util_delete_keyframes = LazyResource(get_icon_path, r"util_delete_keyframes.svg")
+    util_rivet = LazyResource(get_icon_path, r"util_rivet.svg")
     # Misc
-    tool_maya_to_discord = get_icon_path(r"tool_maya_to_discord.svg")
-    tool_fspy_importer = get_icon_path(r"tool_fspy_importer.svg")
-    tool_render_calculator = get_icon_path(r"tool_render_calculator.svg")
-    tool_startup_booster = get_icon_path(r"tool_startup_booster.svg")
+    tool_maya_to_discord = LazyResource(get_icon_path, r"tool_maya_to_discord.svg")
+    tool_fspy_importer = LazyResource(get_icon_path, r"tool_fspy_importer.svg")
+    tool_render_calculator = LazyResource(get_icon_path, r"tool_render_calculator.svg")
+    tool_startup_booster = LazyResource(get_icon_path, r"tool_startup_booster.svg")
     # Help
-    tool_package_updater = get_icon_path(r"tool_check_for_updates.svg")
-    misc_rebuild_menu = get_icon_path(r"misc_rebuild_menu.svg")
-    misc_about = get_icon_path(r"misc_about.svg")
-    misc_current_version = get_icon_path(r"misc_current_version.svg")
+    tool_package_updater = LazyResource(get_icon_path, r"tool_check_for_updates.svg")
+    misc_rebuild_menu = LazyResource(get_icon_path, r"misc_rebuild_menu.svg")
+    misc_about = LazyResource(get_icon_path, r"misc_about.svg")
+    misc_current_version = LazyResource(get_icon_path, r"misc_current_version.svg")
     # Dev
-    tool_resource_library = get_icon_path(r"tool_resource_library.svg")
-    dev_brain = get_icon_path(r"dev_brain.svg")
-    dev_parameters = get_icon_path(r"dev_parameters.svg")
-    dev_git_fork = get_icon_path(r"dev_git_fork.svg")
-    dev_git_pull_request = get_icon_path(r"dev_git_pull_request.svg")
-    dev_binary = get_icon_path(r"dev_binary.svg")
-    dev_scalpel = get_icon_path(r"dev_scalpel.svg")
-    dev_wash_bottle = get_icon_path(r"dev_wash_bottle.svg")
-    dev_trash = get_icon_path(r"dev_trash.svg")
-    dev_tongs = get_icon_path(r"dev_tongs.svg")
-    dev_tweezer = get_icon_path(r"dev_tweezer.svg")
-    dev_spray = get_icon_path(r"dev_spray.svg")
-    dev_filter = get_icon_path(r"dev_filter.svg")
-    dev_chainsaw = get_icon_path(r"dev_chainsaw.svg")
-    dev_trowel = get_icon_path(r"dev_trowel.svg")
-    dev_ruler = get_icon_path(r"dev_ruler.svg")
-    dev_pliers = get_icon_path(r"dev_pliers.svg")
-    dev_picker = get_icon_path(r"dev_picker.svg")
-    dev_lab_flask = get_icon_path(r"dev_lab_flask.svg")
-    dev_hammer = get_icon_path(r"dev_hammer.svg")
-    dev_screwdriver = get_icon_path(r"dev_screwdriver.svg")
-    dev_code = get_icon_path(r"dev_code.svg")
+    tool_resource_library = LazyResource(get_icon_path, r"tool_resource_library.svg")
+    dev_brain = LazyResource(get_icon_path, r"dev_brain.svg")
+    dev_parameters = LazyResource(get_icon_path, r"dev_parameters.svg")
+    dev_git_fork = LazyResource(get_icon_path, r"dev_git_fork.svg")
+    dev_git_pull_request = LazyResource(get_icon_path, r"dev_git_pull_request.svg")
+    dev_binary = LazyResource(get_icon_path, r"dev_binary.svg")
+    dev_scalpel = LazyResource(get_icon_path, r"dev_scalpel.svg")
+    dev_wash_bottle = LazyResource(get_icon_path, r"dev_wash_bottle.svg")
+    dev_trash = LazyResource(get_icon_path, r"dev_trash.svg")
+    dev_tongs = LazyResource(get_icon_path, r"dev_tongs.svg")
+    dev_tweezer = LazyResource(get_icon_path, r"dev_tweezer.svg")
+    dev_spray = LazyResource(get_icon_path, r"dev_spray.svg")
+    dev_filter = LazyResource(get_icon_path, r"dev_filter.svg")
+    dev_chainsaw = LazyResource(get_icon_path, r"dev_chainsaw.svg")
+    dev_trowel = LazyResource(get_icon_path, r"dev_trowel.svg")
+    dev_ruler = LazyResource(get_icon_path, r"dev_ruler.svg")
+    dev_pliers = LazyResource(get_icon_path, r"dev_pliers.svg")
+    dev_picker = LazyResource(get_icon_path, r"dev_picker.svg")
+    dev_lab_flask = LazyResource(get_icon_path, r"dev_lab_flask.svg")
+    dev_hammer = LazyResource(get_icon_path, r"dev_hammer.svg")
+    dev_screwdriver = LazyResource(get_icon_path, r"dev_screwdriver.svg")
+    dev_code = LazyResource(get_icon_path, r"dev_code.svg")
     # Other
-    package_logo = get_icon_path(r"package_logo.svg")
-    package_icon = get_icon_path(r"package_icon.svg")
-    abr_create_proxy = get_icon_path(r"abr_create_proxy.svg")
-    abr_create_rig = get_icon_path(r"abr_create_rig.svg")
-    misc_cog = get_icon_path(r"misc_cog.svg")
-    setup_install = get_icon_path(r"setup_install.svg")
-    setup_uninstall = get_icon_path(r"setup_uninstall.svg")
-    setup_run_only = get_icon_path(r"setup_run_only.svg")
-    setup_close = get_icon_path(r"setup_close.svg")
-    curve_library_base_curve = get_icon_path(r"curve_library_base_curve.svg")
-    curve_library_user_curve = get_icon_path(r"curve_library_user_curve.svg")
-    curve_library_control = get_icon_path(r"curve_library_control.svg")
-    mesh_library_base = get_icon_path(r"mesh_library_base.svg")
-    mesh_library_user = get_icon_path(r"mesh_library_user.svg")
-    mesh_library_param = get_icon_path(r"mesh_library_param.svg")
-    library_missing_file = get_icon_path(r"library_missing_file.svg")
-    library_parameters = get_icon_path(r"library_parameters.svg")
-    library_build = get_icon_path(r"library_build.svg")
-    library_edit = get_icon_path(r"library_edit.svg")
-    library_snapshot = get_icon_path(r"library_snapshot.svg")
-    library_remove = get_icon_path(r"library_remove.svg")
-    library_add = get_icon_path(r"library_add.svg")
-    library_shelf = get_icon_path(r"library_shelf.svg")
+    package_logo = LazyResource(get_icon_path, r"package_logo.svg")
+    package_icon = LazyResource(get_icon_path, r"package_icon.svg")
+    abr_create_proxy = LazyResource(get_icon_path, r"abr_create_proxy.svg")
+    abr_create_rig = LazyResource(get_icon_path, r"abr_create_rig.svg")
+    misc_cog = LazyResource(get_icon_path, r"misc_cog.svg")
+    setup_install = LazyResource(get_icon_path, r"setup_install.svg")
+    setup_uninstall = LazyResource(get_icon_path, r"setup_uninstall.svg")
+    setup_run_only = LazyResource(get_icon_path, r"setup_run_only.svg")
+    setup_close = LazyResource(get_icon_path, r"setup_close.svg")
+    curve_library_base_curve = LazyResource(get_icon_path, r"curve_library_base_curve.svg")
+    curve_library_user_curve = LazyResource(get_icon_path, r"curve_library_user_curve.svg")
+    curve_library_control = LazyResource(get_icon_path, r"curve_library_control.svg")
+    mesh_library_base = LazyResource(get_icon_path, r"mesh_library_base.svg")
+    mesh_library_user = LazyResource(get_icon_path, r"mesh_library_user.svg")
+    mesh_library_param = LazyResource(get_icon_path, r"mesh_library_param.svg")
+    library_missing_file = LazyResource(get_icon_path, r"library_missing_file.svg")
+    library_parameters = LazyResource(get_icon_path, r"library_parameters.svg")
+    library_build = LazyResource(get_icon_path, r"library_build.svg")
+    library_edit = LazyResource(get_icon_path, r"library_edit.svg")
+    library_snapshot = LazyResource(get_icon_path, r"library_snapshot.svg")
+    library_remove = LazyResource(get_icon_path, r"library_remove.svg")
+    library_add = LazyResource(get_icon_path, r"library_add.svg")
+    library_shelf = LazyResource(get_icon_path, r"library_shelf.svg")
     # Auto Rigger
-    rigger_proxy = get_icon_path(r"rigger_proxy.svg")
-    rigger_project = get_icon_path(r"rigger_project.svg")
-    rigger_module_generic = get_icon_path(r"rigger_module_generic.svg")
-    rigger_dict = get_icon_path(r"rigger_dict.svg")
-    rigger_module_biped_arm = get_icon_path(r"rigger_module_biped_arm.svg")
-    rigger_module_biped_fingers = get_icon_path(r"rigger_module_biped_fingers.svg")
-    rigger_module_biped_leg = get_icon_path(r"rigger_module_biped_leg.svg")
-    rigger_module_root = get_icon_path(r"rigger_module_root.svg")
-    rigger_module_spine = get_icon_path(r"rigger_module_spine.svg")
-    rigger_module_head = get_icon_path(r"rigger_module_head.svg")
-    rigger_template_biped = get_icon_path(r"rigger_template_biped.svg")
-    rigger_module_util = get_icon_path(r"rigger_module_util.svg")
-    rigger_module_skin_weights = get_icon_path(r"rigger_module_skin_weights.svg")
-    rigger_module_new_scene = get_icon_path(r"rigger_module_new_scene.svg")
-    rigger_module_save_scene = get_icon_path(r"rigger_module_save_scene.svg")
-    rigger_module_python = get_icon_path(r"rigger_module_python.svg")
-    rigger_module_export_sk = get_icon_path(r"rigger_module_export_sk.svg")
-    rigger_module_attr_hub = get_icon_path(r"rigger_module_attr_hub.svg")
-    rigger_module_import_file = get_icon_path(r"rigger_module_import_file.svg")
-    rigger_module_socket = get_icon_path(r"rigger_module_socket.svg")
-    rigger_module_facial_mh = get_icon_path(r"rigger_module_facial_mh.svg")
+    rigger_proxy = LazyResource(get_icon_path, r"rigger_proxy.svg")
+    rigger_project = LazyResource(get_icon_path, r"rigger_project.svg")
+    rigger_module_generic = LazyResource(get_icon_path, r"rigger_module_generic.svg")
+    rigger_dict = LazyResource(get_icon_path, r"rigger_dict.svg")
+    rigger_module_biped_arm = LazyResource(get_icon_path, r"rigger_module_biped_arm.svg")
+    rigger_module_biped_fingers = LazyResource(get_icon_path, r"rigger_module_biped_fingers.svg")
+    rigger_module_biped_leg = LazyResource(get_icon_path, r"rigger_module_biped_leg.svg")
+    rigger_module_root = LazyResource(get_icon_path, r"rigger_module_root.svg")
+    rigger_module_spine = LazyResource(get_icon_path, r"rigger_module_spine.svg")
+    rigger_module_head = LazyResource(get_icon_path, r"rigger_module_head.svg")
+    rigger_template_biped = LazyResource(get_icon_path, r"rigger_template_biped.svg")
+    rigger_module_util = LazyResource(get_icon_path, r"rigger_module_util.svg")
+    rigger_module_skin_weights = LazyResource(get_icon_path, r"rigger_module_skin_weights.svg")
+    rigger_module_new_scene = LazyResource(get_icon_path, r"rigger_module_new_scene.svg")
+    rigger_module_save_scene = LazyResource(get_icon_path, r"rigger_module_save_scene.svg")
+    rigger_module_python = LazyResource(get_icon_path, r"rigger_module_python.svg")
+    rigger_module_export_sk = LazyResource(get_icon_path, r"rigger_module_export_sk.svg")
+    rigger_module_attr_hub = LazyResource(get_icon_path, r"rigger_module_attr_hub.svg")
+    rigger_module_import_file = LazyResource(get_icon_path, r"rigger_module_import_file.svg")
+    rigger_module_socket = LazyResource(get_icon_path, r"rigger_module_socket.svg")
+    rigger_module_facial_mh = LazyResource(get_icon_path, r"rigger_module_facial_mh.svg")
     # User Interface
-    ui_add = get_icon_path(r"ui_add.svg")
-    ui_arrow_up = get_icon_path(r"ui_arrow_up.svg")
-    ui_arrow_down = get_icon_path(r"ui_arrow_down.svg")
-    ui_arrow_left = get_icon_path(r"ui_arrow_left.svg")
-    ui_arrow_right = get_icon_path(r"ui_arrow_right.svg")
-    ui_exclamation = get_icon_path(r"ui_exclamation.svg")
-    ui_checkbox_checked = get_icon_path(r"ui_checkbox_checked.svg")
-    ui_checkbox_unchecked = get_icon_path(r"ui_checkbox_unchecked.svg")
-    ui_checkbox_checked_disabled = get_icon_path(r"ui_checkbox_checked_disabled.svg")
-    ui_checkbox_unchecked_disabled = get_icon_path(r"ui_checkbox_unchecked_disabled.svg")
-    ui_toggle_enabled = get_icon_path(r"ui_toggle_enabled.svg")
-    ui_toggle_disabled = get_icon_path(r"ui_toggle_disabled.svg")
-    ui_edit = get_icon_path(r"ui_edit.svg")
-    ui_delete = get_icon_path(r"ui_delete.svg")
-    ui_trash = get_icon_path(r"ui_trash.svg")
-    ui_new = get_icon_path(r"ui_new.svg")
-    ui_open = get_icon_path(r"ui_open.svg")
-    ui_save = get_icon_path(r"ui_save.svg")
-    ui_templates = get_icon_path(r"ui_templates.svg")
+    ui_add = LazyResource(get_icon_path, r"ui_add.svg")
+    ui_arrow_up = LazyResource(get_icon_path, r"ui_arrow_up.svg")
+    ui_arrow_down = LazyResource(get_icon_path, r"ui_arrow_down.svg")
+    ui_arrow_left = LazyResource(get_icon_path, r"ui_arrow_left.svg")
+    ui_arrow_right = LazyResource(get_icon_path, r"ui_arrow_right.svg")
+    ui_exclamation = LazyResource(get_icon_path, r"ui_exclamation.svg")
+    ui_checkbox_checked = LazyResource(get_icon_path, r"ui_checkbox_checked.svg")
+    ui_checkbox_unchecked = LazyResource(get_icon_path, r"ui_checkbox_unchecked.svg")
+    ui_checkbox_checked_disabled = LazyResource(get_icon_path, r"ui_checkbox_checked_disabled.svg")
+    ui_checkbox_unchecked_disabled = LazyResource(get_icon_path, r"ui_checkbox_unchecked_disabled.svg")
+    ui_toggle_enabled = LazyResource(get_icon_path, r"ui_toggle_enabled.svg")
+    ui_toggle_disabled = LazyResource(get_icon_path, r"ui_toggle_disabled.svg")
+    ui_edit = LazyResource(get_icon_path, r"ui_edit.svg")
+    ui_delete = LazyResource(get_icon_path, r"ui_delete.svg")
+    ui_trash = LazyResource(get_icon_path, r"ui_trash.svg")
+    ui_new = LazyResource(get_icon_path, r"ui_new.svg")
+    ui_open = LazyResource(get_icon_path, r"ui_open.svg")
+    ui_save = LazyResource(get_icon_path, r"ui_save.svg")
+    ui_templates = LazyResource(get_icon_path, r"ui_templates.svg")
     # Branch/Hierarchy Lines
-    ui_branch_closed = get_icon_path(r"ui_branch_closed.svg")
-    ui_branch_end = get_icon_path(r"ui_branch_end.svg")
-    ui_branch_line = get_icon_path(r"ui_branch_line.svg")
-    ui_branch_more = get_icon_path(r"ui_branch_more.svg")
-    ui_branch_open = get_icon_path(r"ui_branch_open.svg")
-    ui_branch_root_closed = get_icon_path(r"ui_branch_root_closed.svg")
-    ui_branch_root_open = get_icon_path(r"ui_branch_root_open.svg")
-    ui_branch_single = get_icon_path(r"ui_branch_single.svg")
+    ui_branch_closed = LazyResource(get_icon_path, r"ui_branch_closed.svg")
+    ui_branch_end = LazyResource(get_icon_path, r"ui_branch_end.svg")
+    ui_branch_line = LazyResource(get_icon_path, r"ui_branch_line.svg")
+    ui_branch_more = LazyResource(get_icon_path, r"ui_branch_more.svg")
+    ui_branch_open = LazyResource(get_icon_path, r"ui_branch_open.svg")
+    ui_branch_root_closed = LazyResource(get_icon_path, r"ui_branch_root_closed.svg")
+    ui_branch_root_open = LazyResource(get_icon_path, r"ui_branch_root_open.svg")
+    ui_branch_single = LazyResource(get_icon_path, r"ui_branch_single.svg")
 
 
 class Color:
@@ -1053,72 +1150,106 @@ class Stylesheet:
         """
 
     # Stylesheets Without Variations
-    maya_dialog_base = get_stylesheet_content(
-        stylesheet_name="maya_dialog_base", stylesheet_variables=StylesheetVariables.maya_basic
+    maya_dialog_base = LazyResource(
+        get_stylesheet_content, stylesheet_name="maya_dialog_base", stylesheet_variables=StylesheetVariables.maya_basic
+    )
+    progress_bar_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="progress_bar_base",
+        stylesheet_variables=StylesheetVariables.progress_bar_base,
     )
-    progress_bar_base = get_stylesheet_content(
-        stylesheet_name="progress_bar_base", stylesheet_variables=StylesheetVariables.progress_bar_base
+    scroll_bar_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="scroll_bar_base",
+        stylesheet_variables=StylesheetVariables.scroll_bar_base,
     )
-    scroll_bar_base = get_stylesheet_content(
-        stylesheet_name="scroll_bar_base", stylesheet_variables=StylesheetVariables.scroll_bar_base
+    list_widget_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="list_widget_base",
+        stylesheet_variables=StylesheetVariables.list_widget_base,
     )
-    list_widget_base = get_stylesheet_content(
-        stylesheet_name="list_widget_base", stylesheet_variables=StylesheetVariables.list_widget_base
+    text_edit_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="text_edit_base",
+        stylesheet_variables=StylesheetVariables.text_edit_base,
     )
-    text_edit_base = get_stylesheet_content(
-        stylesheet_name="text_edit_base", stylesheet_variables=StylesheetVariables.text_edit_base
+    combobox_base = LazyResource(
+        get_stylesheet_content, stylesheet_name="combobox_base", stylesheet_variables=StylesheetVariables.combobox_base
     )
-    combobox_base = get_stylesheet_content(
-        stylesheet_name="combobox_base", stylesheet_variables=StylesheetVariables.combobox_base
+    combobox_rounded = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="combobox_base",
+        stylesheet_variables=StylesheetVariables.combobox_rounded,
     )
-    combobox_rounded = get_stylesheet_content(
-        stylesheet_name="combobox_base", stylesheet_variables=StylesheetVariables.combobox_rounded
+    checkbox_base = LazyResource(
+        get_stylesheet_content, stylesheet_name="checkbox_base", stylesheet_variables=StylesheetVariables.checkbox_base
     )
-    checkbox_base = get_stylesheet_content(
-        stylesheet_name="checkbox_base", stylesheet_variables=StylesheetVariables.checkbox_base
+    tree_widget_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="tree_widget_base",
+        stylesheet_variables=StylesheetVariables.tree_widget_base,
     )
-    tree_widget_base = get_stylesheet_content(
-        stylesheet_name="tree_widget_base", stylesheet_variables=StylesheetVariables.tree_widget_base
+    table_widget_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="table_widget_base",
+        stylesheet_variables=StylesheetVariables.table_widget_base,
     )
-    table_widget_base = get_stylesheet_content(
-        stylesheet_name="table_widget_base", stylesheet_variables=StylesheetVariables.table_widget_base
+    line_edit_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="line_edit_base",
+        stylesheet_variables=StylesheetVariables.line_edit_base,
     )
-    line_edit_base = get_stylesheet_content(
-        stylesheet_name="line_edit_base", stylesheet_variables=StylesheetVariables.line_edit_base
+    menu_base = LazyResource(
+        get_stylesheet_content, stylesheet_name="menu_base", stylesheet_variables=StylesheetVariables.menu_base
     )
-    menu_base = get_stylesheet_content(stylesheet_name="menu_base", stylesheet_variables=StylesheetVariables.menu_base)
-    group_box_base = get_stylesheet_content(
-        stylesheet_name="group_box_base", stylesheet_variables=StylesheetVariables.group_box_base
+    group_box_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="group_box_base",
+        stylesheet_variables=StylesheetVariables.group_box_base,
     )
-    scroll_area_base = get_stylesheet_content(
-        stylesheet_name="scroll_area_base", stylesheet_variables=StylesheetVariables.scroll_area_base
+    scroll_area_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="scroll_area_base",
+        stylesheet_variables=StylesheetVariables.scroll_area_base,
     )
-    spin_box_base = get_stylesheet_content(
-        stylesheet_name="spin_box_base", stylesheet_variables=StylesheetVariables.spin_box_base
+    spin_box_base = LazyResource(
+        get_stylesheet_content, stylesheet_name="spin_box_base", stylesheet_variables=StylesheetVariables.spin_box_base
     )
 
     # --------------------------------------------- Buttons ---------------------------------------------
-    btn_push_base = get_stylesheet_content(
-        stylesheet_name="btn_push_base", stylesheet_variables=StylesheetVariables.btn_push_base
+    btn_push_base = LazyResource(
+        get_stylesheet_content, stylesheet_name="btn_push_base", stylesheet_variables=StylesheetVariables.btn_push_base
     )
-    btn_push_bright = get_stylesheet_content(
-        stylesheet_name="btn_push_base", stylesheet_variables=StylesheetVariables.btn_push_bright
+    btn_push_bright = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="btn_push_base",
+        stylesheet_variables=StylesheetVariables.btn_push_bright,
     )
-    btn_radio_base = get_stylesheet_content(
-        stylesheet_name="btn_radio_base", stylesheet_variables=StylesheetVariables.btn_radio_base
+    btn_radio_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="btn_radio_base",
+        stylesheet_variables=StylesheetVariables.btn_radio_base,
     )
     # Metro Tool Button
-    btn_tool_metro_base = get_stylesheet_content(
-        stylesheet_name="btn_tool_metro_base", stylesheet_variables=StylesheetVariables.btn_tool_metro_base
+    btn_tool_metro_base = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="btn_tool_metro_base",
+        stylesheet_variables=StylesheetVariables.btn_tool_metro_base,
     )
-    btn_tool_metro_red = get_stylesheet_content(
-        stylesheet_name="btn_tool_metro_base", stylesheet_variables=StylesheetVariables.btn_tool_metro_red
+    btn_tool_metro_red = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="btn_tool_metro_base",
+        stylesheet_variables=StylesheetVariables.btn_tool_metro_red,
     )
-    btn_tool_metro_blue = get_stylesheet_content(
-        stylesheet_name="btn_tool_metro_base", stylesheet_variables=StylesheetVariables.btn_tool_metro_blue
+    btn_tool_metro_blue = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="btn_tool_metro_base",
+        stylesheet_variables=StylesheetVariables.btn_tool_metro_blue,
     )
-    btn_tool_metro_green = get_stylesheet_content(
-        stylesheet_name="btn_tool_metro_base", stylesheet_variables=StylesheetVariables.btn_tool_metro_green
+    btn_tool_metro_green = LazyResource(
+        get_stylesheet_content,
+        stylesheet_name="btn_tool_metro_base",
+        stylesheet_variables=StylesheetVariables.btn_tool_metro_green,
     )
 
 
@@ -1131,8 +1262,8 @@ class Font:
         """
         self.kb = None
 
-    roboto = get_font_path("Roboto-Regular.ttf")
-    inter = get_font_path("Inter-Regular.ttf")
+    roboto = LazyResource(get_font_path, "Roboto-Regular.ttf")
+    inter = LazyResource(get_font_path, "Inter-Regular.ttf")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,352 @@
+"""
+Thumbnail Cache - Shared cache for preview images with background decoding.
+
+Images are kept in two tiers: an in-memory LRU of QPixmaps and an on-disk folder of pre-scaled PNG files.
+Disk entries are keyed by source path, modification time, file size and thumbnail size, so editing a preview
+image automatically invalidates its cached thumbnail. Decoding and scaling happen in a QThreadPool worker
+(using QImage, which is safe outside the UI thread) and the result is delivered back to the UI thread.
+
+Code Namespace:
+    ui_thumb_cache  # import gt.ui.thumbnail_cache as ui_thumb_cache
+"""
+
+from collections import OrderedDict
+import gt.ui.qt_import as ui_qt
+import hashlib
+import logging
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_THUMBNAIL_SIZE = 512
+DEFAULT_MEMORY_LIMIT = 64
+THUMBNAIL_CACHE_FOLDER = "thumbnails"
+THUMBNAIL_FORMAT = "png"
+
+_shared_thumbnail_cache = None
+
+
+def is_qt_resource_path(source_path):
+    """
+    Checks if the provided path points to a Qt resource (e.g. ":/fileOpen.png" or ":polyCube.png")
+    Qt resources live in memory, so they don't have a modification time and are never cached on disk.
+
+    Args:
+        source_path (str): Path to check.
+
+    Returns:
+        bool: True if it's a Qt resource path, False otherwise.
+    """
+    return isinstance(source_path, str) and source_path.startswith(":")
+
+
+def get_thumbnail_key(source_path, size=DEFAULT_THUMBNAIL_SIZE):
+    """
+    Gets a unique key for the thumbnail of an image.
+    The key uses the source path, its modification time and file size, as well as the thumbnail size.
+
+    Args:
+        source_path (str): Path to the source image file.
+        size (int, optional): Maximum width and height of the thumbnail.
+
+    Returns:
+        str or None: A hexadecimal key for the thumbnail, or None if the source file doesn't exist.
+    """
+    if not source_path:
+        return None
+    if is_qt_resource_path(source_path):
+        key_source = f"{source_path}|{size}"
+    else:
+        try:
+            file_stat = os.stat(source_path)
+        except OSError:
+            return None
+        normalized_path = os.path.normcase(os.path.abspath(source_path))
+        key_source = f"{normalized_path}|{file_stat.st_mtime_ns}|{file_stat.st_size}|{size}"
+    return hashlib.sha1(key_source.encode("utf-8")).hexdigest()
+
+
+def get_default_thumbnail_cache_dir():
+    """
+    Gets the default folder used to store thumbnails on disk. ("<package-cache>/thumbnails")
+
+    Returns:
+        str or None: Path to the thumbnails folder (not created by this function), None if it can't be determined.
+    """
+    try:
+        from gt.core.prefs import PackageCache
+
+        return os.path.join(PackageCache().cache_dir, THUMBNAIL_CACHE_FOLDER)
+    except Exception as e:
+        logger.debug(f"Unable to determine thumbnail cache directory. Issue: {e}")
+
+
+def scale_thumbnail_image(image, size=DEFAULT_THUMBNAIL_SIZE):
+    """
+    Scales an image so it fits a square of the provided size while keeping its aspect ratio.
+    Large images are scaled down using smooth transformation, small images (icons) are scaled up without filtering,
+    so their pixels stay sharp when displayed.
+
+    Args:
+        image (QImage): Image to scale.
+        size (int, optional): Maximum width and height of the scaled image.
+
+    Returns:
+        QImage: The scaled image. If the image is empty or already has the requested size, it is returned as is.
+    """
+    if image.isNull() or not size:
+        return image
+    width = image.width()
+    height = image.height()
+    largest_side = max(width, height)
+    if largest_side == size:
+        return image
+    scale = size / largest_side
+    new_width = max(1, int(round(width * scale)))
+    new_height = max(1, int(round(height * scale)))
+    mode = ui_qt.QtLib.TransformationMode.SmoothTransformation
+    if scale > 1:
+        mode = ui_qt.QtLib.TransformationMode.FastTransformation
+    return image.scaled(new_width, new_height, mode=mode)
+
+
+def read_source_image(source_path, size=DEFAULT_THUMBNAIL_SIZE):
+    """
+    Reads (decodes) a source image. Vector images (SVG) are rendered directly at the thumbnail size,
+    so they stay sharp instead of being scaled from their default size.
+
+    Args:
+        source_path (str): Path to the source image file.
+        size (int, optional): Maximum width and height used when rendering vector images.
+
+    Returns:
+        QImage: The decoded image. An empty (null) QImage if it couldn't be read.
+    """
+    reader = ui_qt.QtGui.QImageReader(source_path)
+    if size and source_path.lower().endswith(".svg"):
+        source_size = reader.size()
+        largest_side = max(source_size.width(), source_size.height())
+        if largest_side > 0:
+            scale = size / largest_side
+            scaled_width = max(1, int(round(source_size.width() * scale)))
+            scaled_height = max(1, int(round(source_size.height() * scale)))
+            reader.setScaledSize(ui_qt.QtCore.QSize(scaled_width, scaled_height))
+    return reader.read()
+
+
+def load_thumbnail_image(source_path, size=DEFAULT_THUMBNAIL_SIZE, cache_dir=None):
+    """
+    Loads the thumbnail image of a source image file. If a pre-scaled thumbnail exists in the cache directory,
+    it's loaded instead of the source. Otherwise, the source is decoded, scaled and written to the cache directory.
+    Only QImage is used here, so it's safe to call this function outside the UI thread.
+
+    Args:
+        source_path (str): Path to the source image file.
+        size (int, optional): Maximum width and height of the thumbnail.
+        cache_dir (str, optional): Folder where pre-scaled thumbnails are stored. If not provided, disk is skipped.
+
+    Returns:
+        QImage: The thumbnail image. An empty (null) QImage if the source couldn't be loaded.
+    """
+    key = get_thumbnail_key(source_path, size=size)
+    if not key:
+        return ui_qt.QtGui.QImage()
+
+    thumbnail_path = None
+    if cache_dir and not is_qt_resource_path(source_path):
+        thumbnail_path = os.path.join(cache_dir, f"{key}.{THUMBNAIL_FORMAT}")
+        if os.path.isfile(thumbnail_path):
+            image = ui_qt.QtGui.QImage(thumbnail_path)
+            if not image.isNull():
+                return image
+
+    image = read_source_image(source_path, size=size)
+    if image.isNull():
+        logger.debug(f'Unable to decode image: "{source_path}"')
+        return image
+    image = scale_thumbnail_image(image, size=size)
+
+    if thumbnail_path:
+        # Written to a temporary file first, so other workers never read a partially written thumbnail
+        temp_path = f"{thumbnail_path}.{os.getpid()}.{id(image)}.tmp"
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, exist_ok=True)
+            if image.save(temp_path, THUMBNAIL_FORMAT.upper()):
+                os.replace(temp_path, thumbnail_path)
+        except Exception as e:
+            logger.debug(f'Unable to write thumbnail cache for "{source_path}". Issue: {e}')
+        finally:
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+    return image
+
+
+class ThumbnailLoader(ui_qt.QtCore.QRunnable):
+    def __init__(self, cache, key, source_path):
+        """
+        Background task that loads a thumbnail and hands it back to the ThumbnailCache.
+
+        Args:
+            cache (ThumbnailCache): Cache that receives the loaded image (through its "ThumbnailLoaded" signal)
+            key (str): Thumbnail key. See "get_thumbnail_key"
+            source_path (str): Path to the source image file.
+        """
+        super().__init__()
+        self.cache = cache
+        self.key = key
+        self.source_path = source_path
+
+    def run(self):
+        """Loads the thumbnail image and emits it. Signals are queued, so the slot runs in the UI thread."""
+        try:
+            image = load_thumbnail_image(self.source_path, size=self.cache.size, cache_dir=self.cache.cache_dir)
+        except Exception as e:
+            logger.debug(f'Unable to load thumbnail for "{self.source_path}". Issue: {e}')
+            image = ui_qt.QtGui.QImage()
+        self.cache.ThumbnailLoaded.emit(self.key, image)
+
+
+class ThumbnailCache(ui_qt.QtCore.QObject):
+    ThumbnailLoaded = ui_qt.QtCore.Signal(object, object)  # Key, QImage
+
+    def __init__(
+        self,
+        size=DEFAULT_THUMBNAIL_SIZE,
+        memory_limit=DEFAULT_MEMORY_LIMIT,
+        cache_dir=None,
+        thread_pool=None,
+        parent=None,
+    ):
+        """
+        Initializes a ThumbnailCache object.
+
+        Args:
+            size (int, optional): Maximum width and height of the thumbnails.
+            memory_limit (int, optional): Maximum number of thumbnails kept in memory. (Least recently used go first)
+            cache_dir (str, optional): Folder used to store pre-scaled thumbnails. If not provided, only memory is used.
+            thread_pool (QThreadPool, optional): Pool used to decode images. Defaults to the global instance.
+            parent (QObject, optional): Parent object.
+        """
+        super().__init__(parent)
+        self.size = size
+        self.memory_limit = memory_limit
+        self.cache_dir = cache_dir
+        self.thread_pool = thread_pool or ui_qt.QtCore.QThreadPool.globalInstance()
+        self._memory_cache = OrderedDict()  # Key: QPixmap
+        self._pending = {}  # Key: list of (source_path, callback)
+        self.ThumbnailLoaded.connect(self._on_thumbnail_loaded)
+
+    def get_cached_pixmap(self, source_path):
+        """
+        Gets a thumbnail from the memory tier without loading anything.
+
+        Args:
+            source_path (str): Path to the source image file.
+
+        Returns:
+            QPixmap or None: The cached thumbnail, or None if it's not in memory.
+        """
+        key = get_thumbnail_key(source_path, size=self.size)
+        if not key or key not in self._memory_cache:
+            return None
+        self._memory_cache.move_to_end(key)
+        return self._memory_cache.get(key)
+
+    def request_thumbnail(self, source_path, callback):
+        """
+        Requests the thumbnail of an image. If it's already in memory, the callback is called right away.
+        Otherwise, the image is loaded in the thread pool and the callback is called (in the UI thread) once ready.
+        Multiple requests for the same thumbnail share a single background task.
+
+        Args:
+            source_path (str): Path to the source image file.
+            callback (callable): Function called with "(source_path, pixmap)". "pixmap" is a null QPixmap
+                                 when the image couldn't be loaded.
+
+        Returns:
+            bool: True if the thumbnail was available in memory (callback already called), False otherwise.
+        """
+        key = get_thumbnail_key(source_path, size=self.size)
+        if not key:
+            callback(source_path, ui_qt.QtGui.QPixmap())
+            return False
+        pixmap = self.get_cached_pixmap(source_path)
+        if pixmap is not None:
+            callback(source_path, pixmap)
+            return True
+        if key in self._pending:
+            self._pending[key].append((source_path, callback))
+            return False
+        self._pending[key] = [(source_path, callback)]
+        self.thread_pool.start(ThumbnailLoader(cache=self, key=key, source_path=source_path))
+        return False
+
+    def add_to_memory(self, key, pixmap):
+        """
+        Adds a thumbnail to the memory tier, discarding the least recently used ones when over the limit.
+
+        Args:
+            key (str): Thumbnail key. See "get_thumbnail_key"
+            pixmap (QPixmap): Thumbnail to store.
+        """
+        self._memory_cache[key] = pixmap
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > max(self.memory_limit, 0):
+            self._memory_cache.popitem(last=False)
+
+    def clear_memory(self):
+        """Removes all thumbnails from the memory tier. (Disk tier is not affected)"""
+        self._memory_cache.clear()
+
+    def get_memory_count(self):
+        """
+        Gets the number of thumbnails stored in memory.
+
+        Returns:
+            int: Number of thumbnails in the memory tier.
+        """
+        return len(self._memory_cache)
+
+    def _on_thumbnail_loaded(self, key, image):
+        """
+        Receives loaded images (UI thread), converts them to QPixmap and calls the pending callbacks.
+
+        Args:
+            key (str): Thumbnail key. See "get_thumbnail_key"
+            image (QImage): Loaded image. Null if it couldn't be loaded.
+        """
+        if image is None or image.isNull():
+            pixmap = ui_qt.QtGui.QPixmap()
+        else:
+            pixmap = ui_qt.QtGui.QPixmap.fromImage(image)
+            self.add_to_memory(key, pixmap)
+        for source_path, callback in self._pending.pop(key, []):
+            try:
+                callback(source_path, pixmap)
+            except Exception as e:
+                logger.debug(f'Thumbnail callback failed for "{source_path}". Issue: {e}')
+
+
+def get_thumbnail_cache():
+    """
+    Gets the thumbnail cache shared by all library views. It's created when first requested.
+    A QApplication must exist before calling this function.
+
+    Returns:
+        ThumbnailCache: The shared thumbnail cache.
+    """
+    global _shared_thumbnail_cache
+    if _shared_thumbnail_cache is None:
+        _shared_thumbnail_cache = ThumbnailCache(cache_dir=get_default_thumbnail_cache_dir())
+    return _shared_thumbnail_cache
+
+
+if __name__ == "__main__":
+    logger.setLevel(logging.DEBUG)
@@ -10,8 +10,13 @@ Code Namespace:
 from gt.core.str import remove_strings_from_string
 import http.client as http_client
 import urllib.request
+import urllib.error
 import webbrowser
+import hashlib
 import logging
+import time
+import os
+import re
 
 # Logging Setup
 logging.basicConfig()
@@ -196,6 +201,177 @@ def download_file(url, destination, chunk_size=8192, callback=None):
             callback(100)
 
 
+class ThrottledCallback:
+    """
+    Wraps a progress callback so it's called at most once per interval (in seconds).
+    Used to avoid updating a UI for every downloaded chunk or extracted file.
+    The last value is always delivered when calling it with "force=True" or by calling "flush".
+    """
+
+    def __init__(self, callback, interval=0.1):
+        """
+        Initializes a ThrottledCallback object.
+        Args:
+            callback (callable): Function to call with the progress arguments.
+            interval (float, optional): Minimum time in seconds between two calls. Default is 0.1 (10 calls per second)
+        """
+        self.callback = callback
+        self.interval = interval
+        self.last_call_time = None
+        self.pending_args = None
+
+    def __call__(self, *args, force=False):
+        """
+        Calls the callback if the interval has passed since the last call, otherwise stores the arguments.
+        Args:
+            *args: Arguments sent to the callback.
+            force (bool, optional): If active, the callback is called regardless of the interval.
+        """
+        current_time = time.perf_counter()
+        if force or self.last_call_time is None or current_time - self.last_call_time >= self.interval:
+            self.last_call_time = current_time
+            self.pending_args = None
+            self.callback(*args)
+        else:
+            self.pending_args = args
+
+    def flush(self):
+        """
+        Calls the callback with the last stored (skipped) arguments, if any.
+        """
+        if self.pending_args is not None:
+            self.__call__(*self.pending_args, force=True)
+
+
+def get_file_checksum(file_path, algorithm="sha256", chunk_size=65536):
+    """
+    Gets the checksum (hex digest) of a file. The file is read in chunks.
+    Args:
+        file_path (str): Path to the file.
+        algorithm (str, optional): Name of the "hashlib" algorithm. e.g. "sha256", "md5"
+        chunk_size (int, optional): The size of each read chunk in bytes.
+    Returns:
+        str: The hexadecimal checksum of the file.
+    """
+    file_hash = hashlib.new(algorithm)
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _get_response_total_size(response, resumed_size):
+    """
+    Gets the total size of the file being downloaded using the response headers.
+    Args:
+        response (http.client.HTTPResponse): Response of the request.
+        resumed_size (int): Number of bytes already downloaded (when resuming). Zero for a full download.
+    Returns:
+        int or None: Total size in bytes or None if not provided by the server.
+    """
+    headers = response.info()
+    content_range = headers.get("Content-Range", "")
+    match = re.match(r"bytes\s+\d+-\d+/(\d+)", content_range)
+    if match:
+        return int(match.group(1))
+    content_length = headers.get("Content-Length")
+    if content_length is not None and content_length.isdigit():
+        return int(content_length) + resumed_size
+    return None
+
+
+def download_file_resumable(
+    url,
+    destination,
+    chunk_size=65536,
+    callback=None,
+    callback_interval=0.1,
+    expected_size=None,
+    expected_checksum=None,
+    checksum_algorithm="sha256",
+    timeout=30,
+):
+    """
+    Downloads a file from a given URL into a partial file ("<destination>.part"), resuming it when possible.
+    If a partial file from a previous (interrupted) attempt exists, an HTTP range request is used to only
+    download the missing bytes. If the server ignores the range, the download restarts from the beginning.
+    Once complete, the size and (optionally) the checksum are verified before moving it to the destination.
+
+    Args:
+        url (str): The URL of the file to download.
+        destination (str): The local path where the downloaded file will be saved.
+        chunk_size (int, optional): The size of each download chunk in bytes. Defaults to 65536.
+        callback (callable, optional): A function that accepts a progress value (0-100). It's called at most once
+                                       every "callback_interval" seconds, and always once at the end (100).
+        callback_interval (float, optional): Minimum time in seconds between two progress callbacks.
+        expected_size (int, optional): Expected size in bytes. If not provided, the size sent by the server is used.
+        expected_checksum (str, optional): Expected hex digest of the file. If provided, it's verified at the end.
+        checksum_algorithm (str, optional): The "hashlib" algorithm used for the checksum. Default is "sha256".
+        timeout (int, optional): Timeout in seconds for the connection.
+
+    Returns:
+        str: Path to the downloaded file. (The destination)
+
+    Raises:
+        IOError: If the downloaded file doesn't match the expected size or checksum. (The partial file is deleted)
+    """
+    partial_path = f"{destination}.part"
+    resumed_size = os.path.getsize(partial_path) if os.path.isfile(partial_path) else 0
+    throttled_callback = ThrottledCallback(callback, interval=callback_interval) if callback else None
+
+    request = urllib.request.Request(url)
+    if resumed_size:
+        request.add_header("Range", f"bytes={resumed_size}-")
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code != 416 or not resumed_size:  # 416: Range Not Satisfiable (Partial file could be already complete)
+            raise
+        response = None
+
+    file_hash = hashlib.new(checksum_algorithm) if expected_checksum else None
+    total_size = resumed_size
+    if response is not None:
+        with response:
+            if response.status != 206:  # Range ignored (or not requested), start from the beginning
+                resumed_size = 0
+            total_size = _get_response_total_size(response, resumed_size)
+            if file_hash and resumed_size:
+                with open(partial_path, "rb") as partial_file:
+                    for chunk in iter(lambda: partial_file.read(chunk_size), b""):
+                        file_hash.update(chunk)
+            downloaded = resumed_size
+            with open(partial_path, "ab" if resumed_size else "wb") as file:
+                while True:
+                    data = response.read(chunk_size)
+                    if not data:
+                        break
+                    file.write(data)
+                    if file_hash:
+                        file_hash.update(data)
+                    downloaded += len(data)
+                    if total_size and throttled_callback:
+                        throttled_callback((downloaded / total_size) * 100)
+    else:  # Nothing left to download, checksum is read from the partial file
+        file_hash = None
+
+    # Validate Download
+    downloaded_size = os.path.getsize(partial_path)
+    expected_size = expected_size or total_size
+    if expected_size and downloaded_size != expected_size:
+        os.remove(partial_path)
+        raise IOError(f"Downloaded file size mismatch. Expected {expected_size} bytes, but got {downloaded_size}.")
+    if expected_checksum:
+        checksum = file_hash.hexdigest() if file_hash else get_file_checksum(partial_path, checksum_algorithm)
+        if checksum.lower() != expected_checksum.lower():
+            os.remove(partial_path)
+            raise IOError(f'Downloaded file checksum mismatch. Expected "{expected_checksum}", but got "{checksum}".')
+    os.replace(partial_path, destination)
+    if throttled_callback:
+        throttled_callback(100, force=True)
+    return destination
+
+
 def is_connected_to_internet(timeout_ms=1000, server="8.8.8.8", port=53):
     """
     Check if the device is connected to the internet using the provided server and port (default: Google DNS servers).
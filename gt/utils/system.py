@@ -6,6 +6,7 @@ github.com/TrevisanGMW/gt-tools
 
 from datetime import datetime
 import gt.core.io as core_io
+from contextlib import contextmanager
 from functools import wraps
 import subprocess
 import traceback
@@ -29,6 +30,8 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_active_time_profiler = None  # TimeProfiler currently recording sections (see "TimeProfiler.__enter__")
+
 
 def get_system():
     """
@@ -409,7 +412,7 @@ def process_launch_options(sys_args):
         else:
             import gt.core.setup as core_setup
 
-            core_setup.install_package(clean_install=False)
+            core_setup.install_package(clean_install=False, incremental=True)
         return True
     elif sys_args[1] == "-uninstall":
         import gt.core.setup as core_setup
@@ -584,7 +587,8 @@ def time_profiler(func):
             result = time_profiler_wrapper(10, arg2='test')
         """
         start_time = time.perf_counter()
-        result = func(*args, **kwargs)
+        with profile_section(name=func.__name__, category="function"):
+            result = func(*args, **kwargs)
         end_time = time.perf_counter()
         total_time = end_time - start_time
         print(f"Execution Time: {total_time:.4f} - Function: {func.__name__}{args} {kwargs}")
@@ -593,6 +597,225 @@ def time_profiler(func):
     return time_profiler_wrapper
 
 
+class TimeProfiler:
+    def __init__(self, name="profiler", counters=None):
+        """
+        Initializes a hierarchical time profiler.
+        While active (entered through a "with" statement), every "profile_section" records its wall time,
+        its nesting (parent sections) and the difference of the provided counters between its start and end.
+
+        Usage:
+            with TimeProfiler(counters={"nodes": lambda: len(cmds.ls())}) as profiler:
+                with profile_section("build_rig", category="phase"):
+                    ...
+            print(profiler.get_report())
+            profiler.write_chrome_trace("C:/temp/build_trace.json")  # Open it in "chrome://tracing" or Perfetto
+
+        Args:
+            name (str, optional): Name of the profiler. Used as the process name in the Chrome trace.
+            counters (dict, optional): A dictionary where the key is the counter name and the value is a function
+                                       that returns a number. e.g. {"nodes": lambda: len(cmds.ls())}
+                                       Counters are sampled when a section starts and ends.
+        """
+        self.name = name
+        self.counters = dict(counters or {})
+        self.events = []  # Finished sections, in the order they ended
+        self._stack = []  # Open sections
+        self._start_time = None
+        self._previous_profiler = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(name="{self.name}", events={len(self.events)})'
+
+    def __enter__(self):
+        global _active_time_profiler
+        self._previous_profiler = _active_time_profiler
+        _active_time_profiler = self
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active_time_profiler
+        _active_time_profiler = self._previous_profiler
+        self._previous_profiler = None
+
+    def _sample_counters(self):
+        """
+        Gets the current value of all counters. Counters that fail are ignored.
+        Returns:
+            dict: Counter name as key, current value as value.
+        """
+        values = {}
+        for counter_name, counter_func in self.counters.items():
+            try:
+                values[counter_name] = counter_func()
+            except Exception as e:
+                logger.debug(f'Unable to sample profiler counter "{counter_name}". Issue: {e}')
+        return values
+
+    @contextmanager
+    def section(self, name, category=None, **kwargs):
+        """
+        Records a section. Sections opened inside this one are stored as its children.
+        Args:
+            name (str): Name of the section. Sections with the same name are aggregated in the report.
+            category (str, optional): Category of the section. e.g. "phase", "module" or "code"
+            **kwargs: Extra information stored with the section. (Must be JSON serializable)
+        """
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        event = {
+            "name": name,
+            "category": category or "",
+            "depth": len(self._stack),
+            "parent": self._stack[-1].get("name") if self._stack else None,
+            "args": dict(kwargs),
+            "children_time": 0.0,
+        }
+        start_counters = self._sample_counters()
+        self._stack.append(event)
+        start_time = time.perf_counter()
+        try:
+            yield event
+        finally:
+            end_time = time.perf_counter()
+            self._stack.pop()
+            end_counters = self._sample_counters()
+            event["start"] = start_time - self._start_time
+            event["duration"] = end_time - start_time
+            event["self_time"] = max(event.get("duration") - event.pop("children_time"), 0.0)
+            event["counters"] = {
+                key: end_counters.get(key) - start_counters.get(key) for key in start_counters if key in end_counters
+            }
+            if self._stack:
+                self._stack[-1]["children_time"] += event.get("duration")
+            self.events.append(event)
+
+    def get_events(self):
+        """
+        Gets all recorded sections.
+        Returns:
+            list: A list of dictionaries, one per recorded section, sorted by start time.
+                  Keys: "name", "category", "depth", "parent", "args", "start", "duration", "self_time", "counters"
+        """
+        return sorted(self.events, key=lambda event: (event.get("start"), event.get("depth")))
+
+    def get_summary(self, sort_by="total_time", group_by="name"):
+        """
+        Aggregates the recorded sections.
+        Args:
+            sort_by (str, optional): Key used to sort the summary (descending).
+                                     e.g. "total_time", "self_time", "calls" or the name of a counter.
+            group_by (str, optional): Section key used to aggregate sections. e.g. "name" or "category"
+                                      Extra information keys (section kwargs) are also accepted. e.g. "module"
+        Returns:
+            list: A list of dictionaries with the keys: "name", "calls", "total_time", "self_time",
+                  "max_time" and one key per counter (sum of the counter differences).
+        """
+        summary = {}
+        for event in self.events:
+            key = event.get(group_by, event.get("args").get(group_by))
+            entry = summary.setdefault(
+                key, {"name": key, "calls": 0, "total_time": 0.0, "self_time": 0.0, "max_time": 0.0}
+            )
+            entry["calls"] += 1
+            entry["total_time"] += event.get("duration")
+            entry["self_time"] += event.get("self_time")
+            entry["max_time"] = max(entry.get("max_time"), event.get("duration"))
+            for counter_name, counter_value in event.get("counters").items():
+                entry[counter_name] = entry.get(counter_name, 0) + counter_value
+        return sorted(summary.values(), key=lambda item: item.get(sort_by, 0), reverse=True)
+
+    def get_report(self, sort_by="total_time", group_by="name"):
+        """
+        Gets a readable table with the aggregated sections. (See "get_summary")
+        Args:
+            sort_by (str, optional): Key used to sort the report (descending).
+            group_by (str, optional): Section key used to aggregate sections. e.g. "name" or "category"
+        Returns:
+            str: A report table. One line per aggregated section.
+        """
+        summary = self.get_summary(sort_by=sort_by, group_by=group_by)
+        counter_names = list(self.counters.keys())
+        name_width = max([len(str(entry.get("name"))) for entry in summary] + [len("Name")])
+        header = f"{'Name':<{name_width}}  {'Calls':>6}  {'Total (s)':>10}  {'Self (s)':>10}  {'Max (s)':>10}"
+        for counter_name in counter_names:
+            header += f"  {counter_name:>10}"
+        lines = [f'Profiler "{self.name}"', header, "-" * len(header)]
+        for entry in summary:
+            line = (
+                f"{str(entry.get('name')):<{name_width}}  {entry.get('calls'):>6}  "
+                f"{entry.get('total_time'):>10.4f}  {entry.get('self_time'):>10.4f}  {entry.get('max_time'):>10.4f}"
+            )
+            for counter_name in counter_names:
+                line += f"  {entry.get(counter_name, 0):>10}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def get_chrome_trace(self):
+        """
+        Gets the recorded sections as a Chrome trace-event dictionary.
+        Can be opened in "chrome://tracing" or "ui.perfetto.dev" after being saved as JSON.
+        Returns:
+            dict: Trace dictionary using "complete" events. e.g. {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        trace_events = [
+            {"name": "process_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": self.name}},
+        ]
+        for event in self.get_events():
+            args = dict(event.get("args"))
+            args.update(event.get("counters"))
+            trace_events.append(
+                {
+                    "name": event.get("name"),
+                    "cat": event.get("category"),
+                    "ph": "X",
+                    "ts": round(event.get("start") * 1e6, 3),
+                    "dur": round(event.get("duration") * 1e6, 3),
+                    "pid": 1,
+                    "tid": 1,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """
+        Writes the recorded sections to a Chrome trace-event JSON file. (See "get_chrome_trace")
+        Args:
+            path (str): Path to the JSON file.
+        Returns:
+            str or None: The path to the written file, None if it failed.
+        """
+        return core_io.write_json(path=path, data=self.get_chrome_trace())
+
+
+def get_active_time_profiler():
+    """
+    Gets the time profiler currently recording sections.
+    Returns:
+        TimeProfiler or None: The active profiler, None if profiling is disabled.
+    """
+    return _active_time_profiler
+
+
+@contextmanager
+def profile_section(name, category=None, **kwargs):
+    """
+    Records a section in the active TimeProfiler. Does nothing when no profiler is active.
+    Args:
+        name (str): Name of the section. e.g. "build_rig"
+        category (str, optional): Category of the section. e.g. "phase", "module" or "code"
+        **kwargs: Extra information stored with the section. (Must be JSON serializable)
+    """
+    if _active_time_profiler is None:
+        yield None
+        return
+    with _active_time_profiler.section(name, category=category, **kwargs) as event:
+        yield event
+
+
 def callback(callbacks, *args, **kwargs):
     """Execute a list of callback functions with the given arguments and keyword arguments.
 